@@ -16,19 +16,24 @@ from honeybee_energy.material.dictutil import dict_to_material, MATERIAL_TYPES
 from honeybee_energy.run import HB_OS_MSG
 
 from honeybee_energy.lib.materials import opaque_material_by_identifier, \
-    window_material_by_identifier, OPAQUE_MATERIALS, WINDOW_MATERIALS
+    window_material_by_identifier
 from honeybee_energy.lib.constructions import opaque_construction_by_identifier, \
     window_construction_by_identifier, shade_construction_by_identifier, \
-    OPAQUE_CONSTRUCTIONS, WINDOW_CONSTRUCTIONS, SHADE_CONSTRUCTIONS, \
     lib_dict_abridged_to_construction
 from honeybee_energy.lib.constructionsets import construction_set_by_identifier, \
-    CONSTRUCTION_SETS, lib_dict_abridged_to_construction_set
+    lib_dict_abridged_to_construction_set
 from honeybee_energy.lib.scheduletypelimits import schedule_type_limit_by_identifier, \
     SCHEDULE_TYPE_LIMITS
-from honeybee_energy.lib.schedules import schedule_by_identifier, SCHEDULES, \
+from honeybee_energy.lib.schedules import schedule_by_identifier, \
     lib_dict_abridged_to_schedule
-from honeybee_energy.lib.programtypes import program_type_by_identifier, PROGRAM_TYPES, \
+from honeybee_energy.lib.programtypes import program_type_by_identifier, \
     STANDARDS_REGISTRY, lib_dict_abridged_to_program_type
+# identifier tuples are accessed through the modules so they are only built when used
+import honeybee_energy.lib.materials as _m
+import honeybee_energy.lib.constructions as _c
+import honeybee_energy.lib.constructionsets as _cs
+import honeybee_energy.lib.schedules as _s
+import honeybee_energy.lib.programtypes as _p
 
 from honeybee_energy.lib._loadtypelimits import load_type_limits_from_folder, \
     _schedule_type_limits
@@ -118,9 +123,9 @@ def opaque_materials(
     if keyword:
         split_words = not join_words
         kwd = [keyword] if isinstance(keyword, str) else keyword
-        mat_ids = sorted(filter_array_by_keywords(OPAQUE_MATERIALS, kwd, split_words))
+        mat_ids = sorted(filter_array_by_keywords(_m.OPAQUE_MATERIALS, kwd, split_words))
     else:
-        mat_ids = OPAQUE_MATERIALS
+        mat_ids = _m.OPAQUE_MATERIALS
     if not include_generic:
         mat_ids = [m_id for m_id in mat_ids if not m_id.startswith('Generic ')]
     # output a list of identifiers or objects
@@ -199,9 +204,9 @@ def window_materials(
     if keyword:
         split_words = not join_words
         kwd = [keyword] if isinstance(keyword, str) else keyword
-        mat_ids = sorted(filter_array_by_keywords(WINDOW_MATERIALS, kwd, split_words))
+        mat_ids = sorted(filter_array_by_keywords(_m.WINDOW_MATERIALS, kwd, split_words))
     else:
-        mat_ids = WINDOW_MATERIALS
+        mat_ids = _m.WINDOW_MATERIALS
     if not include_generic:
         mat_ids = [m_id for m_id in mat_ids if not m_id.startswith('Generic ')]
     # output a list of identifiers or objects
@@ -283,9 +288,10 @@ def opaque_constructions(
     if keyword:
         split_words = not join_words
         kwd = [keyword] if isinstance(keyword, str) else keyword
-        con_ids = sorted(filter_array_by_keywords(OPAQUE_CONSTRUCTIONS, kwd, split_words))
+        con_ids = sorted(
+            filter_array_by_keywords(_c.OPAQUE_CONSTRUCTIONS, kwd, split_words))
     else:
-        con_ids = OPAQUE_CONSTRUCTIONS
+        con_ids = _c.OPAQUE_CONSTRUCTIONS
     if not include_generic:
         generic_cons = (
             'Ceiling Plenum Top',
@@ -373,9 +379,10 @@ def window_constructions(
     if keyword:
         split_words = not join_words
         kwd = [keyword] if isinstance(keyword, str) else keyword
-        con_ids = sorted(filter_array_by_keywords(WINDOW_CONSTRUCTIONS, kwd, split_words))
+        con_ids = sorted(
+            filter_array_by_keywords(_c.WINDOW_CONSTRUCTIONS, kwd, split_words))
     else:
-        con_ids = WINDOW_CONSTRUCTIONS
+        con_ids = _c.WINDOW_CONSTRUCTIONS
     if not include_generic:
         con_ids = [c_id for c_id in con_ids if not c_id.startswith('Generic ')]
     # output a list of identifiers or objects
@@ -456,9 +463,10 @@ def shade_constructions(
     if keyword:
         split_words = not join_words
         kwd = [keyword] if isinstance(keyword, str) else keyword
-        con_ids = sorted(filter_array_by_keywords(SHADE_CONSTRUCTIONS, kwd, split_words))
+        con_ids = sorted(
+            filter_array_by_keywords(_c.SHADE_CONSTRUCTIONS, kwd, split_words))
     else:
-        con_ids = SHADE_CONSTRUCTIONS
+        con_ids = _c.SHADE_CONSTRUCTIONS
     if not include_generic:
         con_ids = [c_id for c_id in con_ids if not c_id.startswith('Generic ')]
     # output a list of identifiers or objects
@@ -578,9 +586,9 @@ def construction_sets(
             '{}'.format(construction_type, '\n'.join(CONSTRUCTION_TYPES))
         base_str = '{}{}'.format(base_str, construction_type)
     if base_str:
-        con_ids = sorted(filter_array_by_keywords(CONSTRUCTION_SETS, [base_str]))
+        con_ids = sorted(filter_array_by_keywords(_cs.CONSTRUCTION_SETS, [base_str]))
     else:
-        con_ids = CONSTRUCTION_SETS
+        con_ids = _cs.CONSTRUCTION_SETS
     # filter the objects by keywords
     if keyword:
         split_words = not join_words
@@ -723,9 +731,9 @@ def schedules(
     if keyword:
         split_words = not join_words
         kwd = [keyword] if isinstance(keyword, str) else keyword
-        sch_ids = sorted(filter_array_by_keywords(SCHEDULES, kwd, split_words))
+        sch_ids = sorted(filter_array_by_keywords(_s.SCHEDULES, kwd, split_words))
     else:
-        sch_ids = SCHEDULES
+        sch_ids = _s.SCHEDULES
     # output a list of identifiers or objects
     if json_objects:
         sch_objs = [schedule_by_identifier(t) for t in sch_ids]
@@ -820,9 +828,9 @@ def program_types(
                 '{}'.format(building_type, '\n'.join(STANDARDS_REGISTRY['2019']))
             base_str = '{}{}'.format(base_str, building_type)
     if base_str:
-        prog_ids = sorted(filter_array_by_keywords(PROGRAM_TYPES, [base_str]))
+        prog_ids = sorted(filter_array_by_keywords(_p.PROGRAM_TYPES, [base_str]))
     else:
-        prog_ids = PROGRAM_TYPES
+        prog_ids = _p.PROGRAM_TYPES
     if building_type == 'Residential':
         filter_prog_ids = []
         for prog_id in prog_ids:
@@ -1756,7 +1764,7 @@ def add_to_lib(properties_file, standards_folder, log_file):
         if 'schedules' in data and data['schedules'] is not None:
             for sch in data['schedules']:
                 msg = _object_message('Schedule', sch)
-                if sch['identifier'] in SCHEDULES:
+                if sch['identifier'] in _s.SCHEDULES:
                     dup_id_objects.append(msg)
                 else:
                     try:
@@ -1775,7 +1783,7 @@ def add_to_lib(properties_file, standards_folder, log_file):
         if 'program_types' in data and data['program_types'] is not None:
             for prog in data['program_types']:
                 msg = _object_message('Program', prog)
-                if prog['identifier'] in PROGRAM_TYPES:
+                if prog['identifier'] in _p.PROGRAM_TYPES:
                     dup_id_objects.append(msg)
                 else:
                     try:
@@ -1793,7 +1801,7 @@ def add_to_lib(properties_file, standards_folder, log_file):
         mats = {}
         if 'materials' in data and data['materials'] is not None and \
                 len(data['materials']) != 0:
-            all_mats = OPAQUE_MATERIALS + WINDOW_MATERIALS
+            all_mats = _m.OPAQUE_MATERIALS + _m.WINDOW_MATERIALS
             for mat_obj in data['materials']:
                 msg = _object_message('Material', mat_obj)
                 if mat_obj['identifier'] in all_mats:
@@ -1813,7 +1821,8 @@ def add_to_lib(properties_file, standards_folder, log_file):
         cons = {}
         if 'constructions' in data and data['constructions'] is not None and \
                 len(data['constructions']) != 0:
-            all_cons = OPAQUE_CONSTRUCTIONS + WINDOW_CONSTRUCTIONS + SHADE_CONSTRUCTIONS
+            all_cons = _c.OPAQUE_CONSTRUCTIONS + _c.WINDOW_CONSTRUCTIONS + \
+                _c.SHADE_CONSTRUCTIONS
             for con in data['constructions']:
                 msg = _object_message('Construction', con)
                 if con['identifier'] in all_cons:
@@ -1840,7 +1849,7 @@ def add_to_lib(properties_file, standards_folder, log_file):
         if 'construction_sets' in data and data['construction_sets'] is not None:
             for cs in data['construction_sets']:
                 msg = _object_message('Construction Set', cs)
-                if cs['identifier'] in CONSTRUCTION_SETS:
+                if cs['identifier'] in _cs.CONSTRUCTION_SETS:
                     dup_id_objects.append(msg)
                 else:
                     try:
@@ -4,23 +4,30 @@ import sys
 import logging
 import os
 import json
+import gzip
+import sqlite3
+from collections import namedtuple
 
 from honeybee.model import Model
 from honeybee.face import Face
 from ladybug.datacollection import HourlyContinuousCollection, DailyCollection, \
     MonthlyCollection
 from ladybug.sql import SQLiteResult
+from ladybug.header import Header
+from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.dt import Date
 from ladybug.datatype.area import Area
 from ladybug.datatype.energyintensity import EnergyIntensity
 from ladybug.datatype.energy import Energy
+from ladybug.futil import preparedir
 
-from honeybee_energy.result.match import match_rooms_to_data, match_faces_to_data
+from honeybee_energy.result.match import ResultIndex
 from honeybee_energy.result.eui import eui_from_sql
 from honeybee_energy.result.generation import generation_summary_from_sql, \
     generation_data_from_sql
 from honeybee_energy.result.emissions import emissions_from_sql
 from honeybee_energy.result.loadbalance import LoadBalance
+from honeybee_energy.result._columnar import write_npz, write_parquet
 
 _logger = logging.getLogger(__name__)
 
@@ -198,10 +205,15 @@ def all_available_info(result_sql, output_file):
               'is still energy use to be evaluated.', default=True, show_default=True)
 @click.option('--si/--ip', help='Flag to note whether the EUI should be in '
               'SI (kWh/m2) or IP (kBtu/ft2) units.', default=True, show_default=True)
+@click.option('--workers', '-w', help='An integer for the number of processes across '
+              'which the SQL files will be read. This can speed up the aggregation '
+              'of many SQL files. Files that fail to be read are reported under '
+              'an "errors" key instead of stopping the whole aggregation.',
+              type=int, default=1, show_default=True)
 @click.option('--output-file', '-f', help='Optional file to output the result of the '
               'EUI calculation. By default, it will be printed to stdout',
               type=click.File('w'), default='-', show_default=True)
-def energy_use_intensity(result_paths, intensity, si, output_file):
+def energy_use_intensity(result_paths, intensity, si, workers, output_file):
     """Get information about energy use intensity and an EUI breakdown by end use.
 
     \b
@@ -214,7 +226,7 @@ def energy_use_intensity(result_paths, intensity, si, output_file):
     try:
         # assemble all of the eui results into a dictionary
         absolute = not intensity
-        result_dict = eui_from_sql(result_paths, absolute)
+        result_dict = eui_from_sql(result_paths, absolute, workers)
 
         # convert data to IP if requested
         if not si:
@@ -254,10 +266,16 @@ def energy_use_intensity(result_paths, intensity, si, output_file):
 @click.option('--electricity-emissions', '-e', help='A number for the electric '
               'grid carbon emissions in kg CO2 per MWh.',
               type=float, default=400, show_default=True)
+@click.option('--workers', '-w', help='An integer for the number of processes across '
+              'which the SQL files will be read. This can speed up the aggregation '
+              'of many SQL files. Files that fail to be read are reported under '
+              'an "errors" key instead of stopping the whole aggregation.',
+              type=int, default=1, show_default=True)
 @click.option('--output-file', '-f', help='Optional file to output the result of the '
               'EUI calculation. By default, it will be printed to stdout',
               type=click.File('w'), default='-', show_default=True)
-def carbon_emission_intensity(result_paths, electricity_emissions, output_file):
+def carbon_emission_intensity(result_paths, electricity_emissions, workers,
+                              output_file):
     """Get information about energy use intensity and an EUI breakdown by end use.
 
     \b
@@ -269,7 +287,8 @@ def carbon_emission_intensity(result_paths, electricity_emissions, output_file):
     """
     try:
         # assemble all of the eui results into a dictionary
-        result_dict = emissions_from_sql(result_paths, electricity_emissions)
+        result_dict = emissions_from_sql(
+            result_paths, electricity_emissions, workers)
         # write everything into the output file
         output_file.write(json.dumps(result_dict, indent=4))
     except Exception as e:
@@ -282,10 +301,15 @@ def carbon_emission_intensity(result_paths, electricity_emissions, output_file):
 @result.command('generation-summary')
 @click.argument('result-paths', nargs=-1, required=True, type=click.Path(
     exists=True, file_okay=True, dir_okay=True, resolve_path=True))
+@click.option('--workers', '-w', help='An integer for the number of processes across '
+              'which the SQL files will be read. This can speed up the aggregation '
+              'of many SQL files. Files that fail to be read are reported under '
+              'an "errors" key instead of stopping the whole aggregation.',
+              type=int, default=1, show_default=True)
 @click.option('--output-file', '-f', help='Optional file to output the result of the '
               'EUI calculation. By default, it will be printed to stdout',
               type=click.File('w'), default='-', show_default=True)
-def generation_summary(result_paths, output_file):
+def generation_summary(result_paths, workers, output_file):
     """Get a summary about electricity generation and usage.
 
     \b
@@ -297,7 +321,7 @@ def generation_summary(result_paths, output_file):
     """
     try:
         # assemble all of the eui results into a dictionary
-        result_dict = generation_summary_from_sql(result_paths)
+        result_dict = generation_summary_from_sql(result_paths, workers)
         # write everything into the output file
         output_file.write(json.dumps(result_dict, indent=4))
     except Exception as e:
@@ -557,11 +581,19 @@ def output_csv(result_sql, output_names, output_file):
               'files will be written. If None, the files will be output in the'
               'same location as the result_sql.', default=None, show_default=True,
               type=click.Path(file_okay=False, dir_okay=True, resolve_path=True))
+@click.option('--stream/--no-stream', ' /-ns', help='Flag to note whether the CSV '
+              'rows should be written one timestep at a time as they are read from '
+              'the SQLite file. Streaming keeps memory use low for large models and '
+              'sub-hourly results but the rows of the CSV are ordered by timestep '
+              'instead of by Room/Face.', default=False, show_default=True)
+@click.option('--gzip/--no-gzip', ' /-ng', 'compress', help='Flag to note whether the '
+              'CSV files should be compressed with gzip, in which case they will '
+              'have a .csv.gz extension.', default=False, show_default=True)
 @click.option('--log-file', '-log', help='Optional file to output the names of the '
               'columns within the CSV. By default, it will be printed to stdout',
               type=click.File('w'), default='-', show_default=True)
 def output_csv_queryable(result_sql, model_json, run_period_name, output_names,
-                         si, normalize, folder, log_file):
+                         si, normalize, folder, stream, compress, log_file):
     """Get CSV of outputs resembling a SQLite table that is easily queryable.
 
     \b
@@ -580,26 +612,15 @@ def output_csv_queryable(result_sql, model_json, run_period_name, output_names,
         per_names, per_indices = sql_obj.run_period_names, sql_obj.run_period_indices
         per_i = per_indices[per_names.index(run_period_name)]
 
-        # get the data collections for each output
-        data_colls = []
+        # get the names of all of the requested outputs
+        all_names = []
         for output_name in output_names:
             output_name = str(output_name)
             if output_name.startswith('['):
-                output_names = tuple(outp.replace('"', '').strip()
-                                     for outp in output_name.strip('[]').split(','))
-                for outp in output_names:
-                    col = sql_obj.data_collections_by_output_name_run_period(outp, per_i)
-                    data_colls.append(col)
+                all_names.extend(outp.replace('"', '').strip()
+                                 for outp in output_name.strip('[]').split(','))
             else:
-                col = sql_obj.data_collections_by_output_name_run_period(
-                    output_name, per_i)
-                data_colls.append(col)
-
-        # convert the data to IP if it was requested
-        if not si:
-            for colls in data_colls:
-                for data in colls:
-                    data.convert_to_ip()
+                all_names.append(output_name)
 
         # re-serialize the Model to Python and ensure it's in correct SI/IP units
         with open(model_json) as json_file:
@@ -610,121 +631,631 @@ def output_csv_queryable(result_sql, model_json, run_period_name, output_names,
         else:
             model.convert_to_units('Feet')
 
-        # match the objects in the Model to the data collections
-        room_csv_data = []
-        face_csv_data = []
-        faces = None
+        # determine the output folder location
+        if folder is None:
+            folder = os.path.dirname(result_sql)
+        else:
+            preparedir(folder, remove_content=False)
+
+        # write the data into the output CSVs
+        if stream:
+            col_names_dict = _stream_csv_queryable(
+                result_sql, per_i, all_names, model, si, normalize, folder, compress)
+        else:
+            col_names_dict = _write_csv_queryable(
+                sql_obj, per_i, all_names, model, si, normalize, folder, compress)
+
+        # write the column names into the output file
+        log_file.write(json.dumps(col_names_dict))
+    except Exception as e:
+        _logger.exception('Failed to write queryable csv from sql file.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+# a key of an EnergyPlus output with a data collection header but no values
+_ReportKey = namedtuple('_ReportKey', ('header', 'index'))
+
+
+def _open_csv_queryable(folder, file_name, compress=False):
+    """Open a CSV file for writing, which is compressed with gzip if requested."""
+    if compress:
+        return gzip.open(os.path.join(folder, '{}.csv.gz'.format(file_name)), 'wt')
+    return open(os.path.join(folder, '{}.csv'.format(file_name)), 'w')
+
+
+def _write_csv_queryable(sql_obj, run_period_index, output_names, model, si,
+                         normalize, folder, compress=False):
+    """Write queryable CSVs of outputs using data collections loaded from an SQLite file.
+
+    Args:
+        sql_obj: A ladybug SQLiteResult object for the SQLite file.
+        run_period_index: An integer for the index of the run period to be written.
+        output_names: A list of the names of EnergyPlus outputs to be written.
+        model: A honeybee Model to be matched with the results, which should
+            already be in Meters if si is True or Feet if it is False.
+        si: Boolean to note whether the data should be in SI or IP units.
+        normalize: Boolean to note whether the data should be normalized by
+            floor area or surface area.
+        folder: Folder into which the CSV files will be written.
+        compress: Boolean to note whether the CSV files should be compressed.
+
+    Returns:
+        A dictionary with the names of the columns in each CSV file that was written.
+    """
+    room_csv_data, face_csv_data, date_times = _queryable_data(
+        sql_obj, run_period_index, output_names, model, si, normalize)
+    date_times = [[str(v) for v in dat_t] for dat_t in date_times]
+
+    # write everything into the output CSVs
+    def write_rows(csv_file, datas, identifier):
+        data_rows = [row[:] for row in date_times]  # copy datetimes
+        for row in data_rows:
+            row.append(identifier)
+        for data in datas:
+            for i, val in enumerate(data.values):
+                data_rows[i].append(str(val))
+        for row in data_rows:
+            csv_file.write(','.join(row) + '\n')
+
+    col_names_dict = {}
+    if len(room_csv_data) != 0:
+        col_names_dict['eplusout_room'] = \
+            ['year', 'month', 'day', 'hour', 'minute', 'identifier'] + \
+            [data[0][1].header.metadata['type'].replace(' ', '_').lower()
+             for data in room_csv_data]
+        with _open_csv_queryable(folder, 'eplusout_room', compress) as rm_file:
+            rm_file.write(','.join(col_names_dict['eplusout_room']) + '\n')
+            for outp_tups in zip(*room_csv_data):
+                datas = [tup[1] for tup in outp_tups]
+                identifier = outp_tups[0][0].identifier
+                write_rows(rm_file, datas, identifier)
+    if len(face_csv_data) != 0:
+        col_names_dict['eplusout_face'] = \
+            ['year', 'month', 'day', 'hour', 'minute', 'identifier'] + \
+            [data[0][1].header.metadata['type'].replace(' ', '_').lower()
+             for data in face_csv_data]
+        with _open_csv_queryable(folder, 'eplusout_face', compress) as f_file:
+            f_file.write(','.join(col_names_dict['eplusout_face']) + '\n')
+            for outp_tups in zip(*face_csv_data):
+                datas = [tup[1] for tup in outp_tups]
+                identifier = outp_tups[0][0].identifier
+                write_rows(f_file, datas, identifier)
+    return col_names_dict
+
+
+def _queryable_data(sql_obj, run_period_index, output_names, model, si, normalize):
+    """Get data collections of outputs matched to a Model for queryable tables.
+
+    Args:
+        sql_obj: A ladybug SQLiteResult object for the SQLite file.
+        run_period_index: An integer for the index of the run period to be written.
+        output_names: A list of the names of EnergyPlus outputs to be written.
+        model: A honeybee Model to be matched with the results, which should
+            already be in Meters if si is True or Feet if it is False.
+        si: Boolean to note whether the data should be in SI or IP units.
+        normalize: Boolean to note whether the data should be normalized by
+            floor area or surface area.
+
+    Returns:
+        A tuple with three items.
+
+        -   room_data -- A list with the output of ResultIndex.match_rooms
+            for each output that was matched to Rooms. The values of the
+            data collections are divided by the matched multiplier.
+
+        -   face_data -- A list with the output of ResultIndex.match_faces
+            for each output that was matched to Faces.
+
+        -   date_times -- A list with the year, month, day, hour and minute
+            integers of each timestep of the data.
+    """
+    # get the data collections for each output
+    data_colls = [
+        sql_obj.data_collections_by_output_name_run_period(outp, run_period_index)
+        for outp in output_names]
+
+    # convert the data to IP if it was requested
+    if not si:
         for colls in data_colls:
-            if len(colls) == 0:
+            for data in colls:
+                data.convert_to_ip()
+
+    # match the objects in the Model to the data collections
+    room_csv_data = []
+    face_csv_data = []
+    result_index = ResultIndex.from_model(model)
+    for colls in data_colls:
+        if len(colls) == 0:
+            continue
+        if 'Surface' in colls[0].header.metadata:
+            match_data = result_index.match_faces(colls)
+            if len(match_data) != 0:
+                face_csv_data.append(match_data)
+        elif 'Zone' in colls[0].header.metadata \
+                or 'System' in colls[0].header.metadata:
+            match_data = result_index.match_rooms(colls)
+            if len(match_data) != 0:
+                room_csv_data.append(match_data)
+    assert len(room_csv_data) != 0 or len(face_csv_data) != 0, \
+        'None of the requested outputs could be matched to the model_json.'
+
+    # normalize the data if this was requested
+    if normalize:
+        for matched_data in face_csv_data:  # normalize face data
+            if matched_data[0][1].header.data_type.normalized_type is not None:
+                for matched_tup in matched_data:
+                    area = matched_tup[0].area if not isinstance(matched_tup, Face) \
+                        else matched_tup[0].punched_geometry.area
+                    matched_tup[1].values = \
+                        [val / area for val in matched_tup[1].values]
+    for matched_data in room_csv_data:  # normalize room data
+        if normalize and matched_data[0][1].header.data_type.normalized_type \
+                is not None:
+            for matched_tup in matched_data:
+                area = matched_tup[0].floor_area
+                try:
+                    matched_tup[1].values = [val / (area * matched_tup[2])
+                                             for val in matched_tup[1].values]
+                except ZeroDivisionError:  # no floor area for room
+                    matched_tup[1].values = [0] * len(matched_tup[1])
+        else:  # we should still account for room multipliers
+            for matched_tup in matched_data:
+                matched_tup[1].values = \
+                    [val / matched_tup[2] for val in matched_tup[1].values]
+
+    # create the datetime columns
+    base_coll = room_csv_data[0][0][1] if len(room_csv_data) != 0 else \
+        face_csv_data[0][0][1]
+    year = 2016 if base_coll.header.analysis_period.is_leap_year else 2017
+    date_times = []
+    if isinstance(base_coll, HourlyContinuousCollection):
+        for dat_t in base_coll.datetimes:
+            date_times.append(
+                [year, dat_t.month, dat_t.day, dat_t.hour, dat_t.minute])
+    elif isinstance(base_coll, DailyCollection):
+        for dat_t in base_coll.datetimes:
+            date_obj = Date.from_doy(dat_t)
+            date_times.append([year, date_obj.month, date_obj.day, 0, 0])
+    elif isinstance(base_coll, MonthlyCollection):
+        for dat_t in base_coll.datetimes:
+            date_times.append([year, dat_t, 1, 0, 0])
+
+    return room_csv_data, face_csv_data, date_times
+
+
+def _stream_csv_queryable(result_sql, run_period_index, output_names, model, si,
+                          normalize, folder, compress=False):
+    """Write queryable CSVs of outputs one timestep at a time from an SQLite file.
+
+    The values are read from the ReportData table with a single cursor and
+    the rows of each timestep are written as soon as the timestep has been read.
+    So, unlike _write_csv_queryable, the data collections of the outputs are
+    never loaded into memory and the memory used stays roughly constant
+    regardless of the size of the model and the number of timesteps.
+
+    Args:
+        result_sql: Full path to an SQLite file that was generated by EnergyPlus.
+        run_period_index: An integer for the index of the run period to be written.
+        output_names: A list of the names of EnergyPlus outputs to be written.
+        model: A honeybee Model to be matched with the results, which should
+            already be in Meters if si is True or Feet if it is False.
+        si: Boolean to note whether the data should be in SI or IP units.
+        normalize: Boolean to note whether the data should be normalized by
+            floor area or surface area.
+        folder: Folder into which the CSV files will be written.
+        compress: Boolean to note whether the CSV files should be compressed.
+
+    Returns:
+        A dictionary with the names of the columns in each CSV file that was written.
+    """
+    # get the run period and the data type of each output from the SQLiteResult
+    sql_obj = SQLiteResult(result_sql)
+    base_period = sql_obj.run_periods[sql_obj.run_period_indices.index(run_period_index)]
+    out_types = {}
+    for out_info in sql_obj.available_outputs_info:
+        out_types[out_info['output_name']] = (out_info['data_type'], out_info['units'])
+
+    conn = sqlite3.connect(result_sql)
+    try:
+        # get the keys of each output and the frequency at which they are reported
+        c = conn.cursor()
+        out_keys, run_period, report_frequency = [], None, None
+        time_query = 'SELECT Time.Interval FROM ReportData ' \
+            'INNER JOIN Time ON ReportData.TimeIndex=Time.TimeIndex ' \
+            'WHERE ReportData.ReportDataDictionaryIndex=? AND ' \
+            'Time.EnvironmentPeriodIndex=? LIMIT 1'
+        for output_name in output_names:
+            c.execute(
+                'SELECT ReportDataDictionaryIndex, IndexGroup, KeyValue, Name, '
+                'ReportingFrequency FROM ReportDataDictionary WHERE Name=?',
+                (output_name,))
+            rows = c.fetchall()
+            if len(rows) == 0:
+                continue
+            rows = [row for row in rows if row[4] == rows[0][4]]
+            c.execute(time_query, (rows[0][0], run_period_index))
+            interval = c.fetchone()
+            if interval is None:  # no data for the run period
                 continue
-            if 'Surface' in colls[0].header.metadata:
-                if faces is None:
-                    faces = []
-                    for room in model.rooms:
-                        faces.extend(room.faces)
-                match_data = match_faces_to_data(colls, faces)
+            if 'Timestep' in rows[0][4]:  # get the timesteps per hour
+                out_frequency = int(60 / interval[0])
+            elif rows[0][4] in ('Hourly', 'Daily', 'Monthly'):
+                out_frequency = rows[0][4]
+            else:
+                raise ValueError(
+                    'Annual output "{}" cannot be written to a queryable CSV.'.format(
+                        output_name))
+            if report_frequency is None:
+                report_frequency = out_frequency
+                run_period = base_period if not isinstance(out_frequency, int) else \
+                    AnalysisPeriod(
+                        base_period.st_month, base_period.st_day, 0,
+                        base_period.end_month, base_period.end_day, 23,
+                        out_frequency, base_period.is_leap_year)
+            elif out_frequency != report_frequency:
+                raise ValueError(
+                    'All outputs must have the same reporting frequency to be '
+                    'streamed into a queryable CSV.\n"{}" is reported {} while other '
+                    'outputs are reported {}.'.format(
+                        output_name, out_frequency, report_frequency))
+            data_type, units = out_types[output_name]
+            keys = []
+            for row in rows:
+                obj_type = row[1] if 'Surface' not in output_name else 'Surface'
+                m_data = {'type': row[3], obj_type: row[2]}
+                keys.append(_ReportKey(Header(data_type, units, run_period, m_data),
+                                       row[0]))
+            out_keys.append(keys)
+
+        # match the objects in the Model to the output keys
+        room_csv_data, face_csv_data = [], []
+        result_index = ResultIndex.from_model(model)
+        for keys in out_keys:
+            if 'Surface' in keys[0].header.metadata:
+                match_data = result_index.match_faces(keys, merge_triangulated=False)
                 if len(match_data) != 0:
                     face_csv_data.append(match_data)
-            elif 'Zone' in colls[0].header.metadata \
-                    or 'System' in colls[0].header.metadata:
-                match_data = match_rooms_to_data(colls, model.rooms)
+            elif 'Zone' in keys[0].header.metadata \
+                    or 'System' in keys[0].header.metadata:
+                match_data = result_index.match_rooms(keys)
                 if len(match_data) != 0:
                     room_csv_data.append(match_data)
         assert len(room_csv_data) != 0 or len(face_csv_data) != 0, \
             'None of the requested outputs could be matched to the model_json.'
 
-        # normalize the data if this was requested
-        if normalize:
-            for matched_data in face_csv_data:  # normalize face data
-                if matched_data[0][1].header.data_type.normalized_type is not None:
-                    for matched_tup in matched_data:
-                        area = matched_tup[0].area if not isinstance(matched_tup, Face) \
-                            else matched_tup[0].punched_geometry.area
-                        matched_tup[1].values = \
-                            [val / area for val in matched_tup[1].values]
-        for matched_data in room_csv_data:  # normalize room data
-            if normalize and matched_data[0][1].header.data_type.normalized_type \
-                    is not None:
-                for matched_tup in matched_data:
-                    area = matched_tup[0].floor_area
-                    try:
-                        matched_tup[1].values = [val / (area * matched_tup[2])
-                                                 for val in matched_tup[1].values]
-                    except ZeroDivisionError:  # no floor area for room
-                        matched_tup[1].values = [0] * len(matched_tup[1])
-            else:  # we should still account for room multipliers
-                matched_tup[1].values = \
-                    [val / matched_tup[2] for val in matched_tup[1].values]
+        # get the keys of each output and the numbers by which values are divided
+        def output_info(match_data, is_room):
+            obj_keys = [tup[1] if isinstance(tup[1], list) else [tup[1]]
+                        for tup in match_data]
+            header = obj_keys[0][0].header
+            norm = normalize and header.data_type.normalized_type is not None
+            objs = []
+            for tup, keys in zip(match_data, obj_keys):
+                if is_room:
+                    divisor = tup[0].floor_area * tup[2] if norm else tup[2]
+                else:
+                    divisor = tup[0].area if norm else None
+                objs.append(([key.index for key in keys], divisor))
+            indices = [key.index for keys in obj_keys for key in keys]
+            return header, indices, objs
+
+        csv_files = []  # list of CSV files with info about what is written to them
+        col_names_dict = {}
+        for csv_data, file_name, is_room in \
+                ((room_csv_data, 'eplusout_room', True),
+                 (face_csv_data, 'eplusout_face', False)):
+            if len(csv_data) == 0:
+                continue
+            outputs_info = [output_info(m_data, is_room) for m_data in csv_data]
+            col_names_dict[file_name] = \
+                ['year', 'month', 'day', 'hour', 'minute', 'identifier'] + \
+                [out_info[0].metadata['type'].replace(' ', '_').lower()
+                 for out_info in outputs_info]
+            identifiers = [tup[0].identifier for tup in csv_data[0]]
+            csv_files.append((file_name, identifiers, outputs_info))
+
+        # write the values of each timestep into the CSV files
+        all_indices = set(i for csv_f in csv_files
+                          for out_info in csv_f[2] for i in out_info[1])
+        date_times = _csv_queryable_date_times(run_period, report_frequency)
+        open_files = []
+        try:
+            for file_name, _, _ in csv_files:
+                csv_file = _open_csv_queryable(folder, file_name, compress)
+                open_files.append(csv_file)
+                csv_file.write(','.join(col_names_dict[file_name]) + '\n')
+            c.execute(
+                'SELECT ReportData.TimeIndex, ReportData.ReportDataDictionaryIndex, '
+                'ReportData.Value FROM ReportData '
+                'INNER JOIN Time ON ReportData.TimeIndex=Time.TimeIndex '
+                'WHERE ReportData.ReportDataDictionaryIndex IN ({}) AND '
+                'Time.EnvironmentPeriodIndex=? ORDER BY ReportData.TimeIndex'.format(
+                    ', '.join(str(i) for i in sorted(all_indices))),
+                (run_period_index,))
+            step_index, step_values = None, {}
+            for time_index, data_index, value in c:
+                if time_index != step_index and step_index is not None:
+                    date_time = next(date_times)
+                    for csv_file, csv_f in zip(open_files, csv_files):
+                        _write_csv_queryable_step(
+                            csv_file, csv_f[1], csv_f[2], step_values, date_time, si)
+                    step_values = {}
+                step_index = time_index
+                step_values[data_index] = value
+            if step_index is not None:  # write the last timestep
+                date_time = next(date_times)
+                for csv_file, csv_f in zip(open_files, csv_files):
+                    _write_csv_queryable_step(
+                        csv_file, csv_f[1], csv_f[2], step_values, date_time, si)
+        finally:
+            for csv_file in open_files:
+                csv_file.close()
+    finally:
+        conn.close()  # ensure connection is always closed
+    return col_names_dict
+
+
+def _csv_queryable_date_times(run_period, report_frequency):
+    """Get a generator of the date and time columns for each timestep of a run period.
+    """
+    year = '2016' if run_period.is_leap_year else '2017'
+    if report_frequency == 'Daily':
+        for doy in run_period.doys_int:
+            date_obj = Date.from_doy(doy)
+            yield [year, str(date_obj.month), str(date_obj.day), '0', '0']
+    elif report_frequency == 'Monthly':
+        for month in run_period.months_int:
+            yield [year, str(month), '1', '0', '0']
+    else:  # hourly or sub-hourly data
+        for dat_t in run_period.datetimes:
+            yield [year, str(dat_t.month), str(dat_t.day), str(dat_t.hour),
+                   str(dat_t.minute)]
+
+
+def _write_csv_queryable_step(csv_file, identifiers, outputs_info, step_values,
+                              date_time, si):
+    """Write the rows of a single timestep into a queryable CSV file.
+
+    Args:
+        csv_file: The CSV file into which the rows will be written.
+        identifiers: A list with the identifier of each Room or Face in the CSV.
+        outputs_info: A list with a tuple for each output in the CSV. Each tuple
+            contains the header of the output, a list of the ReportDataDictionary
+            indices of the output and a list with a tuple for each Room or Face.
+            These contain the indices of the Room or Face data (multiple if it
+            is triangulated) and a number by which the values are divided.
+        step_values: A dictionary with the ReportDataDictionary indices as keys
+            and the values of the timestep as values.
+        date_time: A list of text for the date and time columns of the timestep.
+        si: Boolean to note whether the data should be in SI or IP units.
+    """
+    out_values = []
+    for header, indices, objs in outputs_info:
+        # convert the values to the units of the output
+        vals = [step_values[i] for i in indices]
+        if header.unit == 'kWh':
+            vals = [val / 3600000. for val in vals]
+        if not si:
+            vals = header.data_type.to_ip(vals, header.unit)[0]
+        index_vals = dict(zip(indices, vals))
+        # get the value of each object, merging triangulated pieces
+        obj_vals = []
+        for obj_indices, divisor in objs:
+            val = index_vals[obj_indices[0]]
+            if len(obj_indices) > 1:
+                for i in obj_indices[1:]:
+                    val = val + index_vals[i]
+                if not header.data_type.cumulative:
+                    val = val / len(obj_indices)
+            if divisor is not None:
+                try:
+                    val = val / divisor
+                except ZeroDivisionError:  # no floor area for room
+                    val = 0
+            obj_vals.append(str(val))
+        out_values.append(obj_vals)
+    for identifier, obj_vals in zip(identifiers, zip(*out_values)):
+        csv_file.write(','.join(date_time + [identifier] + list(obj_vals)) + '\n')
 
-        # create the datetime columns
-        base_coll = room_csv_data[0][0][1] if len(room_csv_data) != 0 else \
-            face_csv_data[0][0][1]
-        year = '2016' if base_coll.header.analysis_period.is_leap_year else '2017'
-        date_times = []
-        if isinstance(base_coll, HourlyContinuousCollection):
-            for dat_t in base_coll.datetimes:
-                date_times.append(
-                    [year, str(dat_t.month), str(dat_t.day), str(dat_t.hour),
-                     str(dat_t.minute)])
-        elif isinstance(base_coll, DailyCollection):
-            for dat_t in base_coll.datetimes:
-                date_obj = Date.from_doy(dat_t)
-                date_times.append(
-                    [year, str(date_obj.month), str(date_obj.day), '0', '0'])
-        elif isinstance(base_coll, MonthlyCollection):
-            for dat_t in base_coll.datetimes:
-                date_times.append([year, str(dat_t), '1', '0', '0'])
+
+@result.command('output-columnar')
+@click.argument('result-sql', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.argument('model-json', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.argument('run-period-name', type=str)
+@click.argument('output-names', type=str, nargs=-1)
+@click.option('--si/--ip', help='Flag to note whether the data in the resulting files '
+              'should be in SI or IP units.', default=True, show_default=True)
+@click.option('--normalize/--no-normalize', ' /-nn', help='Flag to note whether the '
+              'data in the resulting files should be normalized by floor area (in the '
+              'case of Zone/System data) or surface area (in the case of Surface data). '
+              'This flag has no effect if the requested data is not normalizable',
+              default=True, show_default=True)
+@click.option('--format', '-fmt', 'file_format', help='Text for the format of the '
+              'output files. Choose from: Parquet, NPZ. If unspecified, Parquet files '
+              'will be written if the pyarrow package is installed and NumPy NPZ files '
+              'will be written otherwise.', type=str, default=None)
+@click.option('--folder', '-f', help='Folder on this computer, into which the '
+              'files will be written. If None, the files will be output in the'
+              'same location as the result_sql.', default=None, show_default=True,
+              type=click.Path(file_okay=False, dir_okay=True, resolve_path=True))
+@click.option('--log-file', '-log', help='Optional file to output the names of the '
+              'columns within the files. By default, it will be printed to stdout',
+              type=click.File('w'), default='-', show_default=True)
+def output_columnar(result_sql, model_json, run_period_name, output_names,
+                    si, normalize, file_format, folder, log_file):
+    """Get columnar binary files of outputs matched to the Rooms and Faces of a Model.
+
+    The files contain the same table as output-csv-queryable with one row for
+    each timestep of each Room or Face. However, the values are stored by
+    column in a binary format such that they can be read without parsing text
+    and any one column can be read without reading the others. Alongside the
+    year, month, day, hour, minute and identifier columns, the eplusout_room
+    file has zone, multiplier and floor_area columns and the eplusout_face
+    file has room and area columns. These are followed by one float column
+    for each output.
+
+    \b
+    Parquet files can be read with pyarrow or pandas. NPZ files are zip
+    archives with one .npy array per column, which can be read with
+    numpy.load(). In both cases, the datetime and multiplier columns are
+    32-bit integers, the identifier columns are text and all other columns are
+    64-bit floats. Areas are in square meters for SI and square feet for IP.
+
+    \b
+    Args:
+        result_sql: Full path to an SQLite file that was generated by EnergyPlus.
+        model_json: Full path to a Model JSON that will be matched with the results.
+        run_period_name: The name of the run period from which the data will
+            be selected (eg. "BOSTON LOGAN INTL ARPT ANN CLG .4% CONDNS DB=>MWB").
+        output_names: The name of an EnergyPlus output to be retrieved from
+            the SQLite result file. This can also be several output names
+            for which all data collections should be retrieved.
+    """
+    try:
+        # determine the format of the files to be written
+        if file_format is None:
+            try:
+                import pyarrow  # noqa: F401
+                file_format = 'parquet'
+            except ImportError:  # pyarrow is not installed
+                file_format = 'npz'
+        file_format = file_format.lower()
+        assert file_format in ('parquet', 'npz'), 'File format "{}" is not ' \
+            'recognized. Choose from: Parquet, NPZ.'.format(file_format)
+
+        # figure out the index of the run period
+        sql_obj = SQLiteResult(result_sql)
+        per_names, per_indices = sql_obj.run_period_names, sql_obj.run_period_indices
+        per_i = per_indices[per_names.index(run_period_name)]
+
+        # get the names of all of the requested outputs
+        all_names = []
+        for output_name in output_names:
+            output_name = str(output_name)
+            if output_name.startswith('['):
+                all_names.extend(outp.replace('"', '').strip()
+                                 for outp in output_name.strip('[]').split(','))
+            else:
+                all_names.append(output_name)
+
+        # re-serialize the Model to Python and ensure it's in correct SI/IP units
+        with open(model_json) as json_file:
+            data = json.load(json_file)
+        model = Model.from_dict(data)
+        if si:
+            model.convert_to_units('Meters')
+        else:
+            model.convert_to_units('Feet')
 
         # determine the output folder location
         if folder is None:
             folder = os.path.dirname(result_sql)
+        else:
+            preparedir(folder, remove_content=False)
 
-        # write everything into the output CSVs
-        def write_rows(csv_file, datas, identifier):
-            data_rows = [row[:] for row in date_times]  # copy datetimes
-            for row in data_rows:
-                row.append(identifier)
-            for data in datas:
-                for i, val in enumerate(data.values):
-                    data_rows[i].append(str(val))
-            for row in data_rows:
-                csv_file.write(','.join(row) + '\n')
-
-        col_names_dict = {}
-        if len(room_csv_data) != 0:
-            room_file = os.path.join(folder, 'eplusout_room.csv')
-            col_names_dict['eplusout_room'] = \
-                ['year', 'month', 'day', 'hour', 'minute', 'identifier'] + \
-                [data[0][1].header.metadata['type'].replace(' ', '_').lower()
-                 for data in room_csv_data]
-            with open(room_file, 'w') as rm_file:
-                rm_file.write(','.join(col_names_dict['eplusout_room']) + '\n')
-                for outp_tups in zip(*room_csv_data):
-                    datas = [tup[1] for tup in outp_tups]
-                    identifier = outp_tups[0][0].identifier
-                    write_rows(rm_file, datas, identifier)
-        if len(face_csv_data) != 0:
-            room_file = os.path.join(folder, 'eplusout_face.csv')
-            col_names_dict['eplusout_face'] = \
-                ['year', 'month', 'day', 'hour', 'minute', 'identifier'] + \
-                [data[0][1].header.metadata['type'].replace(' ', '_').lower()
-                 for data in face_csv_data]
-            with open(room_file, 'w') as f_file:
-                f_file.write(','.join(col_names_dict['eplusout_face']) + '\n')
-                for outp_tups in zip(*face_csv_data):
-                    datas = [tup[1] for tup in outp_tups]
-                    identifier = outp_tups[0][0].identifier
-                    write_rows(f_file, datas, identifier)
+        # write the data into the output files
+        col_names_dict = _write_columnar(
+            sql_obj, per_i, all_names, model, si, normalize, folder, file_format)
 
         # write the column names into the output file
         log_file.write(json.dumps(col_names_dict))
     except Exception as e:
-        _logger.exception('Failed to write queryable csv from sql file.\n{}'.format(e))
+        _logger.exception('Failed to write columnar files from sql file.\n{}'.format(e))
         sys.exit(1)
     else:
         sys.exit(0)
 
 
+def _write_columnar(sql_obj, run_period_index, output_names, model, si,
+                    normalize, folder, file_format):
+    """Write columnar files of outputs using data collections loaded from an SQLite file.
+
+    Args:
+        sql_obj: A ladybug SQLiteResult object for the SQLite file.
+        run_period_index: An integer for the index of the run period to be written.
+        output_names: A list of the names of EnergyPlus outputs to be written.
+        model: A honeybee Model to be matched with the results, which should
+            already be in Meters if si is True or Feet if it is False.
+        si: Boolean to note whether the data should be in SI or IP units.
+        normalize: Boolean to note whether the data should be normalized by
+            floor area or surface area.
+        folder: Folder into which the files will be written.
+        file_format: Text for the format of the files. Either parquet or npz.
+
+    Returns:
+        A dictionary with the names of the columns in each file that was written.
+    """
+    room_data, face_data, date_times = _queryable_data(
+        sql_obj, run_period_index, output_names, model, si, normalize)
+    write_func = write_parquet if file_format == 'parquet' else write_npz
+    step_count = len(date_times)
+
+    def table_objects(matched_data):
+        """Get a list of all objects matched to any of the outputs."""
+        objs, obj_ids = [], set()
+        for matched_tups in matched_data:
+            for tup in matched_tups:
+                if tup[0].identifier not in obj_ids:
+                    obj_ids.add(tup[0].identifier)
+                    objs.append(tup[0])
+        return objs
+
+    def table_columns(objs, matched_data, meta_columns):
+        """Get the columns of a table with one row per timestep of each object."""
+        columns = []
+        for i, col_name in enumerate(('year', 'month', 'day', 'hour', 'minute')):
+            col_vals = [dat_t[i] for dat_t in date_times]
+            columns.append((col_name, 'int', col_vals * len(objs)))
+        for col_name, col_type, obj_vals in meta_columns:
+            col_vals = [val for val in obj_vals for _ in range(step_count)]
+            columns.append((col_name, col_type, col_vals))
+        nan_vals = [float('nan')] * step_count  # for objects without the output
+        for matched_tups in matched_data:
+            obj_data = {tup[0].identifier: tup[1] for tup in matched_tups}
+            col_vals = []
+            for obj in objs:
+                try:
+                    col_vals.extend(float(v) for v in obj_data[obj.identifier].values)
+                except KeyError:  # the object was not matched with the output
+                    col_vals.extend(nan_vals)
+            col_name = matched_tups[0][1].header.metadata['type']
+            columns.append((col_name.replace(' ', '_').lower(), 'float', col_vals))
+        return columns
+
+    col_names_dict = {}
+    if len(room_data) != 0:
+        rooms = table_objects(room_data)
+        meta_columns = [
+            ('identifier', 'str', [room.identifier for room in rooms]),
+            ('zone', 'str', [room.zone for room in rooms]),
+            ('multiplier', 'int', [room.multiplier for room in rooms]),
+            ('floor_area', 'float', [room.floor_area for room in rooms])
+        ]
+        columns = table_columns(rooms, room_data, meta_columns)
+        file_path = os.path.join(folder, 'eplusout_room.{}'.format(file_format))
+        write_func(file_path, columns)
+        col_names_dict['eplusout_room'] = [col[0] for col in columns]
+    if len(face_data) != 0:
+        faces = table_objects(face_data)
+        parents = [face.parent if isinstance(face, Face) else face.top_level_parent
+                   for face in faces]
+        meta_columns = [
+            ('identifier', 'str', [face.identifier for face in faces]),
+            ('room', 'str', [prt.identifier if prt is not None else ''
+                             for prt in parents]),
+            ('area', 'float', [face.area for face in faces])
+        ]
+        columns = table_columns(faces, face_data, meta_columns)
+        file_path = os.path.join(folder, 'eplusout_face.{}'.format(file_format))
+        write_func(file_path, columns)
+        col_names_dict['eplusout_face'] = [col[0] for col in columns]
+    return col_names_dict
+
+
 @result.command('zone-sizes')
 @click.argument('result-sql', type=click.Path(
     exists=True, file_okay=True, dir_okay=False, resolve_path=True))
@@ -15,7 +15,8 @@ from honeybee.config import folders
 
 from honeybee_energy.simulation.parameter import SimulationParameter
 from honeybee_energy.run import to_openstudio_sim_folder, \
-    run_osw, run_idf, output_energyplus_files, _parse_os_cli_failure, HB_OS_MSG
+    run_osw, run_idf, run_idf_batch, run_orientation_study, output_energyplus_files, \
+    _parse_os_cli_failure, HB_OS_MSG
 from honeybee_energy.result.err import Err
 
 _logger = logging.getLogger(__name__)
@@ -421,6 +422,169 @@ def simulate_idf(idf_file, epw_file, folder, log_file):
         sys.exit(0)
 
 
+@simulate.command('batch')
+@click.argument('jobs-file', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.option('--workers', '-w', help='An integer for the maximum number of '
+              'simulations to run at once. If unspecified, this will be the '
+              'number of CPUs on the machine.', type=int, default=None)
+@click.option('--retries', '-r', help='An integer for the number of times that a '
+              'failed simulation will be re-run before it is reported as failed.',
+              type=int, default=1, show_default=True)
+@click.option('--quiet/--progress', ' /-p', help='Flag to note whether the progress '
+              'of the batch should be reported to stderr as each simulation '
+              'finishes.', default=True, show_default=True)
+@click.option('--log-file', '-log', help='Optional log file to output a JSON array '
+              'that summarizes each simulation, including the paths to the result '
+              'files (sql, zsz, rdd, html, err), whether it succeeded and the '
+              'errors found in the .err file. By default this will be printed '
+              'out to stdout', type=click.File('w'), default='-', show_default=True)
+def simulate_batch(jobs_file, workers, retries, quiet, log_file):
+    """Simulate several IDF files in EnergyPlus at once.
+
+    \b
+    Args:
+        jobs_file: Full path to a JSON file with an array of the simulations to
+            run. Each item of the array is an object with an "idf" key for the
+            path to a simulate-able .idf file and an "epw" key for the path to
+            an .epw file. An optional "folder" key can be used to specify the
+            directory into which the IDF will be copied and run. Otherwise,
+            each IDF is run in its own folder or in a sub-folder named after
+            the IDF if its folder is shared with other jobs.
+    """
+    try:
+        # load the jobs from the JSON file
+        with open(jobs_file) as inf:
+            data = json.load(inf)
+        base_dir = os.path.dirname(jobs_file)
+        jobs = []
+        for job in data:
+            job_files = [job['idf'], job.get('epw'), job.get('folder')]
+            job_files = [os.path.join(base_dir, f) if f is not None else None
+                         for f in job_files]  # relative paths are from the JSON
+            jobs.append(job_files)
+
+        # run the jobs through EnergyPlus
+        def report_progress(count, total, job_result):
+            status = 'succeeded' if job_result['success'] else 'FAILED'
+            click.echo('[{}/{}] {} {}'.format(
+                count, total, job_result['idf'], status), err=True)
+        progress = None if quiet else report_progress
+        results = run_idf_batch(jobs, workers, retries=retries,
+                                progress_callback=progress)
+        for res in results:  # try to finish E+'s cleanup
+            if res['sql'] is not None and os.path.isfile('{}-journal'.format(res['sql'])):
+                try:
+                    os.remove('{}-journal'.format(res['sql']))
+                except Exception:  # maybe the file is inaccessible
+                    pass
+        log_file.write(json.dumps(results, indent=4))
+        failed = [res['idf'] for res in results if not res['success']]
+        if len(failed) != 0:
+            raise Exception('The following simulations failed:\n{}'.format(
+                '\n'.join(failed)))
+    except Exception as e:
+        _logger.exception('Batch IDF simulation failed.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+@simulate.command('orientation-study')
+@click.argument('model-file', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.argument('epw-file', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.argument('north-angles', nargs=-1, type=float)
+@click.option('--sim-par-json', '-sp', help='Full path to a honeybee energy '
+              'SimulationParameter JSON that describes all of the settings for '
+              'the simulations. The north_angle of these parameters will be '
+              'replaced by each of the north-angles. If unspecified, default '
+              'parameters will be used.', default=None, show_default=True,
+              type=click.Path(exists=True, file_okay=True, dir_okay=False,
+                              resolve_path=True))
+@click.option('--start-north', '-n', default=0, type=float, show_default=True,
+              help='Number from -360 to 360 for the starting north angle. This will be '
+              'added to the north-angles in order to shift all norths. The shifted '
+              'north angles are wrapped into the range from 0 to 360.')
+@click.option('--folder', '-f', help='Folder on this computer, into which the IDF '
+              'and result files of each north angle will be written. If None, the '
+              'files will be output to the honeybee default simulation folder and '
+              'placed in a project folder with the same name as the model-file.',
+              default=None, show_default=True,
+              type=click.Path(file_okay=False, dir_okay=True, resolve_path=True))
+@click.option('--workers', '-w', help='An integer for the maximum number of '
+              'simulations to run at once. If unspecified, this will be the '
+              'number of CPUs on the machine.', type=int, default=None)
+@click.option('--retries', '-r', help='An integer for the number of times that a '
+              'failed simulation will be re-run before it is reported as failed.',
+              type=int, default=1, show_default=True)
+@click.option('--quiet/--progress', ' /-p', help='Flag to note whether the progress '
+              'of the study should be reported to stderr as each simulation '
+              'finishes.', default=True, show_default=True)
+@click.option('--log-file', '-log', help='Optional log file to output a JSON array '
+              'that summarizes the simulation of each north angle, including the '
+              'paths to the result files (sql, zsz, rdd, html, err) and whether '
+              'it succeeded. By default this will be printed out to stdout',
+              type=click.File('w'), default='-', show_default=True)
+def simulate_orientation_study(
+        model_file, epw_file, north_angles, sim_par_json, start_north, folder,
+        workers, retries, quiet, log_file):
+    """Simulate a Model at several north angles, translating it to IDF only once.
+
+    The Model is translated with the direct-to-idf methods and so it should not
+    have detailed HVAC systems or use the Airflow Network.
+
+    \b
+    Args:
+        model_file: Full path to a Model file as a HBJSON or HBpkl.
+        epw_file: Full path to an .epw file.
+        north_angles: Any number of values between -360 and 360 for the counterclockwise
+            difference between the North and the positive Y-axis in degrees. 90 is
+            West and 270 is East.
+    """
+    try:
+        # load the model and the simulation parameters
+        model = Model.from_file(model_file)
+        sim_par = None
+        if sim_par_json is not None:
+            with open(sim_par_json) as json_file:
+                data = json.load(json_file)
+            sim_par = SimulationParameter.from_dict(data)
+        if folder is None:
+            proj_name = os.path.splitext(os.path.basename(model_file))[0]
+            folder = os.path.join(
+                folders.default_simulation_folder, proj_name, 'orientation_study')
+        # shift the north angles and wrap them back into the range of 0 to 360
+        north_angles = [(angle + start_north) % 360 for angle in north_angles]
+
+        # run the simulation of each north angle through EnergyPlus
+        def report_progress(count, total, job_result):
+            status = 'succeeded' if job_result['success'] else 'FAILED'
+            click.echo('[{}/{}] north {} {}'.format(
+                count, total, job_result['north_angle'], status), err=True)
+        progress = None if quiet else report_progress
+        results = run_orientation_study(
+            model, north_angles, folder, epw_file, sim_par, workers,
+            retries=retries, progress_callback=progress)
+        for res in results:  # try to finish E+'s cleanup
+            if res['sql'] is not None and os.path.isfile('{}-journal'.format(res['sql'])):
+                try:
+                    os.remove('{}-journal'.format(res['sql']))
+                except Exception:  # maybe the file is inaccessible
+                    pass
+        log_file.write(json.dumps(results, indent=4))
+        failed = [str(res['north_angle']) for res in results if not res['success']]
+        if len(failed) != 0:
+            raise Exception('The simulations of the following north angles '
+                            'failed:\n{}'.format('\n'.join(failed)))
+    except Exception as e:
+        _logger.exception('Orientation study failed.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
 def _sense_input_file_type(model_file):
     """Sense whether an input model_file is a HBJSON, OSM, or IDF.
 
@@ -2,9 +2,12 @@
 import click
 import sys
 import os
+import io
 import logging
 import json
+import pickle
 import tempfile
+from contextlib import contextmanager
 
 from ladybug.commandutil import process_content_to_output
 from ladybug.analysisperiod import AnalysisPeriod
@@ -24,7 +27,8 @@ from honeybee_energy.schedule.ruleset import ScheduleRuleset
 from honeybee_energy.run import to_openstudio_sim_folder, run_osw, from_osm_osw, \
     _parse_os_cli_failure, HB_OS_MSG
 from honeybee_energy.run import empty_osm as create_empty_osm
-from honeybee_energy.writer import energyplus_idf_version, _preprocess_model_for_trace_3dplus
+from honeybee_energy.writer import energyplus_idf_version, model_to_idf_stream, \
+    model_to_gbxml_stream, _preprocess_model_for_trace_3dplus
 from honeybee_energy.config import folders
 
 _logger = logging.getLogger(__name__)
@@ -442,11 +446,17 @@ def model_to_osm(
               'from non-unique names will be resolved by adding integers to the ends '
               'of the new IDs that are derived from the name.',
               default=True, show_default=True)
+@click.option('--workers', '-w', help='An integer for the number of processes across '
+              'which the translation of the Room geometry will be split. This can '
+              'speed up the translation of large models but it is usually slower '
+              'for small models. The resulting IDF is identical regardless of the '
+              'number of workers.', type=int, default=1, show_default=True)
 @click.option('--output-file', '-f', help='Optional IDF file to output the IDF string '
               'of the translation. By default this will be printed out to stdout',
               type=click.File('w'), default='-', show_default=True)
 def model_to_idf_cli(model_file, sim_par_json, additional_str, compact_schedules,
-                     hvac_to_ideal_air, geometry_ids, resource_ids, output_file):
+                     hvac_to_ideal_air, geometry_ids, resource_ids, workers,
+                     output_file):
     """Translate a Model (HBJSON) file to a simplified IDF using direct-to-idf methods.
 
     The direct-to-idf methods are faster than those that translate the model
@@ -463,7 +473,7 @@ def model_to_idf_cli(model_file, sim_par_json, additional_str, compact_schedules
         res_names = not resource_ids
         model_to_idf(
             model_file, sim_par_json, additional_str, csv_schedules,
-            hvac_check, geo_names, res_names, output_file)
+            hvac_check, geo_names, res_names, output_file, workers=workers)
     except Exception as e:
         _logger.exception('Model translation failed.\n{}'.format(e))
         sys.exit(1)
@@ -474,7 +484,8 @@ def model_to_idf_cli(model_file, sim_par_json, additional_str, compact_schedules
 def model_to_idf(
     model_file, sim_par_json=None, additional_str='', csv_schedules=False,
     hvac_check=False, geometry_names=False, resource_names=False, output_file=None,
-    compact_schedules=True, hvac_to_ideal_air=True, geometry_ids=True, resource_ids=True
+    compact_schedules=True, hvac_to_ideal_air=True, geometry_ids=True,
+    resource_ids=True, workers=1
 ):
     """Translate a Honeybee Model file to a simplified IDF using direct-to-idf methods.
 
@@ -515,7 +526,11 @@ def model_to_idf(
             names will be resolved by adding integers to the ends of the new IDs
             that are derived from the name. (Default: False).
         output_file: Optional IDF file to output the IDF string of the translation.
+            When specified, the IDF objects are streamed into the file as they
+            are generated such that the full IDF string is never held in memory.
             By default this string will be returned from this method.
+        workers: An integer for the number of processes across which the
+            translation of the Room geometry will be split. (Default: 1).
     """
     # load simulation parameters or generate default ones
     if sim_par_json is not None:
@@ -552,13 +567,22 @@ def model_to_idf(
         is not None else ''
     sim_par_str = sim_par.to_idf()
     hvac_to_ideal = not hvac_check
-    model_str = model.to.idf(
-        model, schedule_directory=sch_directory,
-        use_ideal_air_equivalent=hvac_to_ideal)
-    idf_str = '\n\n'.join([ver_str, sim_par_str, model_str, additional_str])
+    if output_file is None:
+        model_str = model.to.idf(
+            model, schedule_directory=sch_directory,
+            use_ideal_air_equivalent=hvac_to_ideal, workers=workers)
+        return '\n\n'.join([ver_str, sim_par_str, model_str, additional_str])
 
-    # write out the IDF file
-    return process_content_to_output(idf_str, output_file)
+    # stream the IDF into the output file so the whole string is never in memory
+    def _write_idf(idf_file):
+        idf_file.write('\n\n'.join([ver_str, sim_par_str, '']))
+        model_to_idf_stream(
+            model, idf_file, schedule_directory=sch_directory,
+            use_ideal_air_equivalent=hvac_to_ideal, workers=workers)
+        idf_file.write('\n\n{}'.format(additional_str))
+
+    with _open_output_file(output_file) as of:
+        _write_idf(of)
 
 
 @translate.command('model-to-gbxml')
@@ -671,6 +695,10 @@ def model_to_idf(
               'version of the gbXML schema that is specified in the XML header '
               '(eg. "5.00"). If unspecified, this will default to the latest version.',
               type=str, default=None, show_default=True)
+@click.option('--indent/--no-indent', ' /-ni', help='Flag to note whether the '
+              'gbXML should be indented to make it read-able. Not indenting the '
+              'gbXML results in a smaller file that is faster to write.',
+              default=True, show_default=True)
 @click.option('--output-file', '-f', help='Optional gbXML file to output the string '
               'of the translation. By default it printed out to stdout',
               type=click.File('w'), default='-', show_default=True)
@@ -679,7 +707,7 @@ def model_to_gbxml_cli(
     interior_face_type, ground_face_type, face_rename_format, subface_rename_format,
     keep_geometry_ids, keep_resource_ids, default_subfaces, triangulate_non_planar,
     rect_geo_format, collapsed_holes, total_ventilation,
-    program_name, program_version, gbxml_schema_version, output_file
+    program_name, program_version, gbxml_schema_version, indent, output_file
 ):
     """Translate a Honeybee Model (HBJSON) to a gbXML file.
 
@@ -706,7 +734,8 @@ def model_to_gbxml_cli(
             reset_geometry_ids, reset_resource_ids,
             triangulate_subfaces, permit_non_planar, rect_geo_format, explicit_holes,
             ventilation_components,
-            program_name, program_version, gbxml_schema_version, output_file
+            program_name, program_version, gbxml_schema_version, output_file,
+            indent=indent
         )
     except Exception as e:
         _logger.exception('Model translation failed.\n{}'.format(e))
@@ -728,7 +757,7 @@ def model_to_gbxml(
     si_units=True, minimal=True, exclude_shell_geometry=True, exclude_space_boundaries=True,
     keep_geometry_ids=True, keep_resource_ids=True,
     default_subfaces=True, triangulate_non_planar=True, collapsed_holes=True,
-    total_ventilation=True
+    total_ventilation=True, indent=True
 ):
     """Translate a Honeybee Model file to a gbXML file.
 
@@ -842,7 +871,11 @@ def model_to_gbxml(
             that is specified in the XML header (eg. "5.00"). If None, this
             will default to the latest version.
         output_file: Optional gbXML file to output the string of the translation.
+            When specified, the gbXML elements are streamed into the file as
+            they are generated such that the full gbXML is never held in memory.
             By default it will be returned from this method.
+        indent: Boolean to note whether the gbXML should be indented to make it
+            read-able. (Default: True).
     """
     # load the model and translate it to a gbXML string
     triangulate_non_planar = not permit_non_planar
@@ -850,7 +883,7 @@ def model_to_gbxml(
     if full_geometry:
         include_shell_geometry, include_space_boundaries = True, True
     model = Model.from_file(model_file)
-    gbxml_str = model.to_gbxml(
+    gbxml_kwargs = dict(
         ip_units=ip_units, include_shell_geometry=include_shell_geometry,
         include_space_boundaries=include_space_boundaries,
         interior_face_type=interior_face_type, ground_face_type=ground_face_type,
@@ -861,11 +894,14 @@ def model_to_gbxml(
         rect_geo_format=rect_geo_format, explicit_holes=explicit_holes,
         total_ventilation=total_ventilation,
         program_name=program_name, program_version=program_version,
-        gbxml_schema_version=gbxml_schema_version
+        gbxml_schema_version=gbxml_schema_version, indent=indent
     )
+    if output_file is None:
+        return model.to_gbxml(**gbxml_kwargs)
 
-    # write out the gbXML file
-    return process_content_to_output(gbxml_str, output_file)
+    # stream the gbXML into the output file so the whole model is never in memory
+    with _open_output_file(output_file) as of:
+        model_to_gbxml_stream(model, of, **gbxml_kwargs)
 
 
 @translate.command('model-to-trace-gbxml')
@@ -1875,8 +1911,8 @@ def model_occ_schedules(model_file, threshold, period, output_file):
         model_file: Full path to a Model JSON or Pkl file.
     """
     try:
-        # re-serialize the Model
-        model = Model.from_file(model_file)
+        # re-serialize the Model, only loading the resources assigned to objects
+        model = _load_model_lazily(model_file)
 
         # loop through the rooms and collect all unique occupancy schedules
         scheds, room_occupancy = [], {}
@@ -1937,8 +1973,8 @@ def model_trans_schedules(model_file, period, output_file):
         model_file: Full path to a Model JSON or Pkl file.
     """
     try:
-        # re-serialize the Model
-        model = Model.from_file(model_file)
+        # re-serialize the Model, only loading the resources assigned to objects
+        model = _load_model_lazily(model_file)
 
         # loop through the rooms and collect all unique occupancy schedules
         scheds = []
@@ -1971,6 +2007,61 @@ def model_trans_schedules(model_file, period, output_file):
         sys.exit(0)
 
 
+@contextmanager
+def _open_output_file(output_file):
+    """Open an output file path or file object for writing, creating its folder.
+
+    Args:
+        output_file: Either the path to a file to be written with UTF-8 encoding
+            or a file object that is already open for writing (eg. stdout).
+            File paths are closed when the context exits while file objects
+            are left open.
+    """
+    if isinstance(output_file, str):
+        dir_name = os.path.dirname(os.path.abspath(output_file))
+        if not os.path.isdir(dir_name):
+            os.makedirs(dir_name)
+        if (sys.version_info < (3, 0)):
+            with open(output_file, 'w') as of:
+                yield of
+        else:
+            with open(output_file, 'w', encoding='utf-8') as of:
+                yield of
+    else:
+        if 'stdout' not in str(output_file):
+            dir_name = os.path.dirname(os.path.abspath(output_file.name))
+            if not os.path.isdir(dir_name):
+                os.makedirs(dir_name)
+        yield output_file
+
+
+def _load_model_lazily(model_file):
+    """Load a Model from a HBJSON or HBpkl file while lazily loading energy resources.
+
+    Only the energy resources that are assigned to the Model's objects are loaded
+    so this is intended for commands that query a few energy properties. Invalid
+    resources that are not assigned to any object will not be reported.
+    """
+    # sense the file type from the first bytes, allowing for a byte order mark
+    with open(model_file, 'rb') as inf:
+        first_bytes = inf.read(4)
+    if b'{' in first_bytes:
+        with io.open(model_file, encoding='utf-8-sig') as inf:
+            data = json.load(inf)
+    else:
+        with open(model_file, 'rb') as inf:
+            data = pickle.load(inf)
+    # load the Model without energy properties and then apply them lazily
+    assert data.get('type') == 'Model', 'Expected Model dictionary. ' \
+        'Got {}.'.format(data.get('type'))
+    model_data = dict(data)
+    model_data['properties'] = dict(data['properties'])
+    model_data['properties']['energy'] = None
+    model = Model.from_dict(model_data)
+    model.properties.energy.apply_properties_from_dict(data, lazy=True)
+    return model
+
+
 def _run_translation_osw(osw, out_path):
     """Generic function used by all import methods that run OpenStudio CLI."""
     # run the measure to translate the model JSON to an openstudio measure
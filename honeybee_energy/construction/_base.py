@@ -10,6 +10,10 @@ from ..material.gas import EnergyWindowMaterialGas
 from ..writer import generate_idf_string
 from ..units import convert_r_value, convert_u_value
 
+# cache of indoor film coefficients, which are recomputed many times by solvers
+_IN_H_CACHE = {}
+_IN_H_CACHE_SIZE = 50000
+
 
 @lockable
 class _ConstructionBase(object):
@@ -277,6 +281,12 @@ class _ConstructionBase(object):
             pressure: The average pressure in Pa.
                 Default is 101325 Pa for standard pressure at sea level.
         """
+        emissivity = self.inside_emissivity
+        key = (emissivity, t_kelvin, delta_t, height, angle, pressure)
+        try:  # see if the coefficient has already been computed for these conditions
+            return _IN_H_CACHE[key]
+        except KeyError:
+            pass
         _ray_numerator = (self._air.density_at_temperature(t_kelvin, pressure) ** 2) * \
             (height ** 3) * 9.81 * self._air.specific_heat_at_temperature(t_kelvin) \
             * delta_t
@@ -304,7 +314,10 @@ class _ConstructionBase(object):
             _conv_h = nusselt * (a_cond / height)
         except ZeroDivisionError:  # completely horizontal face
             _conv_h = nusselt * a_cond
-        _rad_h = 4 * 5.6697e-8 * self.inside_emissivity * (t_kelvin ** 3)
+        _rad_h = 4 * 5.6697e-8 * emissivity * (t_kelvin ** 3)
+        if len(_IN_H_CACHE) >= _IN_H_CACHE_SIZE:
+            _IN_H_CACHE.clear()
+        _IN_H_CACHE[key] = _conv_h + _rad_h
         return _conv_h + _rad_h
 
     def lock(self):
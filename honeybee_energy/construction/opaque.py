@@ -2,7 +2,6 @@
 """Opaque Construction."""
 from __future__ import division
 
-import re
 import xml.etree.ElementTree as ET
 from honeybee._lockable import lockable
 from honeybee.typing import clean_xml_tag_string
@@ -12,7 +11,7 @@ from ..material.dictutil import dict_to_material
 from ..material._base import _EnergyMaterialOpaqueBase
 from ..material.opaque import EnergyMaterial, EnergyMaterialNoMass, \
     EnergyMaterialVegetation
-from ..reader import parse_idf_string, clean_idf_file_contents
+from ..reader import parse_idf_string, idf_objects_by_type, idf_objects_of_type
 from ..properties.extension import OpaqueConstructionProperties
 
 
@@ -498,22 +497,17 @@ class OpaqueConstruction(_ConstructionBase):
             -   materials: A list of all opaque materials in the IDF file as
                 honeybee_energy EnergyMaterial objects.
         """
-        # read the file and remove lines of comments
-        file_contents = clean_idf_file_contents(idf_file)
+        # parse all of the objects in the file
+        idf_objects = idf_objects_by_type(idf_file)
         # extract all of the opaque material objects
-        mat_pattern1 = re.compile(r"(?i)(Material,[\s\S]*?;)")
-        mat_pattern2 = re.compile(r"(?i)(Material:NoMass,[\s\S]*?;)")
-        mat_pattern3 = re.compile(r"(?i)(Material:AirGap,[\s\S]*?;)")
-        mat_pattern4 = re.compile(r"(?i)(Material:RoofVegetation,[\s\S]*?;)")
-        material_str = mat_pattern1.findall(file_contents) + \
-            mat_pattern2.findall(file_contents) + mat_pattern3.findall(file_contents) + \
-            mat_pattern4.findall(file_contents)
+        material_str = idf_objects_of_type(
+            idf_objects, ('Material', 'Material:NoMass', 'Material:AirGap',
+                          'Material:RoofVegetation'))
         materials_dict = OpaqueConstruction._idf_materials_dictionary(material_str)
         materials = list(materials_dict.values())
         # extract all of the construction objects
-        constr_pattern = re.compile(r"(?i)(Construction,[\s\S]*?;)")
-        constr_props = tuple(parse_idf_string(idf_string) for
-                             idf_string in constr_pattern.findall(file_contents))
+        constr_props = tuple(parse_idf_string(idf_string) for idf_string in
+                             idf_objects_of_type(idf_objects, ('Construction',)))
         constructions = []
         for constr in constr_props:
             try:
@@ -0,0 +1,137 @@
+# coding=utf-8
+"""Utilities to evaluate the thermal properties of many constructions at once."""
+from __future__ import division
+
+from .opaque import OpaqueConstruction
+from .window import WindowConstruction
+from .windowshade import WindowConstructionShade
+from .dynamic import WindowConstructionDynamic
+from .shade import ShadeConstruction
+from .air import AirBoundaryConstruction
+
+# NFRC 100-2010 winter conditions used when no conditions are specified
+DEFAULT_CONDITIONS = ((-18, 21, 6.7, 0, 1.0, 90.0, 101325),)
+
+
+def thermal_properties_batch(constructions, conditions=None):
+    """Get the thermal properties of many constructions under several conditions.
+
+    Constructions with the same material layers (and frame) are only evaluated
+    once, even if they have different identifiers. The film coefficients and
+    gas cavity U-values that are computed along the way are cached such that
+    they are shared between the constructions and the conditions. This makes
+    this function suitable for screening whole construction libraries.
+
+    Args:
+        constructions: A list of OpaqueConstructions, WindowConstructions,
+            WindowConstructionShades and/or WindowConstructionDynamics for which
+            thermal properties will be computed. ShadeConstructions and
+            AirBoundaryConstructions are also accepted such that whole
+            construction libraries can be input but all of their thermal
+            properties will be None since they are not layered constructions.
+        conditions: An optional list of boundary conditions under which the
+            U-factor of each construction will be computed. Each condition is
+            a list of values in the same order as the arguments of the
+            temperature_profile method of the constructions. Values at the end
+            of each list can be omitted to use the default values of the
+            temperature_profile method. The order is as follows.
+
+            -   outside_temperature -- The outside temperature [C].
+
+            -   inside_temperature -- The inside temperature [C].
+
+            -   wind_speed -- The average outdoor wind speed [m/s].
+
+            -   solar_irradiance -- The solar irradiance incident on the
+                exterior of the construction [W/m2].
+
+            -   height -- The height of the surface [m].
+
+            -   angle -- An angle in degrees between 0 and 180 for the
+                orientation of the surface.
+
+            -   pressure -- The average air pressure [Pa].
+
+            If None, the U-factor will be computed for NFRC 100-2010 winter
+            conditions. (Default: None).
+
+    Returns:
+        A list with one dictionary for each input construction. Each dictionary
+        has the following keys.
+
+        -   identifier -- The identifier of the construction.
+
+        -   u_factor -- The U-factor of the construction including standard
+            air films [W/m2-K], which is the same as its u_factor property.
+
+        -   shgc -- The solar heat gain coefficient of the construction. Will be
+            None for opaque constructions.
+
+        -   visible_transmittance -- The visible transmittance of the construction.
+            Will be None for opaque constructions.
+
+        -   thickness -- The thickness of the construction [m].
+
+        -   condition_u_factors -- A list of U-factors [W/m2-K] for each of the
+            conditions. These include air films that are computed for the
+            condition. Note that the frames of window constructions are excluded
+            from these values. Will be a list of None for WindowConstructionShades
+            and WindowConstructionDynamics.
+    """
+    conditions = DEFAULT_CONDITIONS if conditions is None else \
+        [tuple(cond) for cond in conditions]
+    solved_props = {}  # properties of the constructions that have been evaluated
+    results = []
+    for constr in constructions:
+        key = _construction_key(constr)
+        try:
+            props = solved_props[key]
+        except KeyError:  # construction has not yet been evaluated
+            props = _thermal_properties(constr, conditions)
+            solved_props[key] = props
+        constr_props = {'identifier': constr.identifier}
+        constr_props.update(props)
+        constr_props['condition_u_factors'] = list(props['condition_u_factors'])
+        results.append(constr_props)
+    return results
+
+
+def _construction_key(construction):
+    """Get a key for a construction that is the same for constructions with equal layers.
+    """
+    if isinstance(construction, OpaqueConstruction):
+        return ('Opaque',) + tuple(construction.materials)
+    elif isinstance(construction, WindowConstruction):
+        return ('Window', construction.frame) + tuple(construction.materials)
+    elif isinstance(construction, (WindowConstructionShade, WindowConstructionDynamic)):
+        return (construction.__class__.__name__, id(construction))
+    elif isinstance(construction, (ShadeConstruction, AirBoundaryConstruction)):
+        return ('NoThermalProperties',)
+    raise ValueError(
+        'Expected OpaqueConstruction, WindowConstruction, WindowConstructionShade, '
+        'WindowConstructionDynamic, ShadeConstruction or AirBoundaryConstruction '
+        'for thermal_properties_batch. Got {}.'.format(type(construction)))
+
+
+def _thermal_properties(construction, conditions):
+    """Get a dictionary of thermal properties for a single construction."""
+    if isinstance(construction, (ShadeConstruction, AirBoundaryConstruction)):
+        return {
+            'u_factor': None, 'shgc': None, 'visible_transmittance': None,
+            'thickness': None, 'condition_u_factors': [None] * len(conditions)
+        }
+    props = {
+        'u_factor': construction.u_factor,
+        'thickness': construction.thickness
+    }
+    if isinstance(construction, OpaqueConstruction):
+        props['shgc'], props['visible_transmittance'] = None, None
+    else:
+        props['shgc'] = construction.shgc
+        props['visible_transmittance'] = construction.visible_transmittance
+    if isinstance(construction, (OpaqueConstruction, WindowConstruction)):
+        props['condition_u_factors'] = \
+            [1 / sum(construction.temperature_profile(*cond)[1]) for cond in conditions]
+    else:
+        props['condition_u_factors'] = [None] * len(conditions)
+    return props
@@ -2,7 +2,6 @@
 """Window Construction."""
 from __future__ import division
 
-import re
 import xml.etree.ElementTree as ET
 from ladybug.datatype.uvalue import UValue
 from honeybee._lockable import lockable
@@ -17,10 +16,35 @@ from ..material.gas import _EnergyWindowMaterialGasBase, EnergyWindowMaterialGas
     EnergyWindowMaterialGasMixture, EnergyWindowMaterialGasCustom
 from ..material.shade import EnergyWindowMaterialShade, EnergyWindowMaterialBlind
 from ..material.frame import EnergyWindowFrame
-from ..reader import parse_idf_string, clean_idf_file_contents
+from ..reader import parse_idf_string, idf_objects_by_type, idf_objects_of_type
 from ..properties.extension import WindowConstructionProperties
 
 
+def _cached_while_locked(solve_func):
+    """Decorator to cache the result of a window solver while the construction is locked.
+
+    When the construction is unlocked, the decorated method is evaluated every
+    time that it is called. Otherwise, the result for a given set of inputs is
+    only computed once and a copy of it is returned for each call. The cache is
+    cleared whenever the construction is locked or unlocked.
+    """
+    def cached_solve_func(self, *args, **kwargs):
+        if not self._locked:
+            return solve_func(self, *args, **kwargs)
+        key = (solve_func.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            result = self._solver_cache[key]
+        except KeyError:
+            result = solve_func(self, *args, **kwargs)
+            self._solver_cache[key] = result
+        if isinstance(result, tuple):  # copy the lists so the cache is not edited
+            return tuple(list(r) if isinstance(r, list) else r for r in result)
+        return result
+    cached_solve_func.__name__ = solve_func.__name__
+    cached_solve_func.__doc__ = solve_func.__doc__
+    return cached_solve_func
+
+
 @lockable
 class WindowConstruction(_ConstructionBase):
     """Window energy construction.
@@ -73,13 +97,14 @@ class WindowConstruction(_ConstructionBase):
         * user_data
         * properties
     """
-    __slots__ = ('_frame',)
+    __slots__ = ('_frame', '_solver_cache')
 
     COG_AREA = 0.76
     EDGE_AREA = 0.24
 
     def __init__(self, identifier, materials, frame=None):
         """Initialize window construction."""
+        self._solver_cache = {}
         _ConstructionBase.__init__(self, identifier, materials)
         self.frame = frame
         self._properties = WindowConstructionProperties(self)
@@ -170,6 +195,7 @@ class WindowConstruction(_ConstructionBase):
         self._frame = value
 
     @property
+    @_cached_while_locked
     def r_factor(self):
         """Construction R-factor [m2-K/W] (including standard resistances for air films).
 
@@ -200,6 +226,7 @@ class WindowConstruction(_ConstructionBase):
         return 1 / total_u
 
     @property
+    @_cached_while_locked
     def r_value(self):
         """R-value of the construction [m2-K/W] (excluding air films).
 
@@ -278,6 +305,7 @@ class WindowConstruction(_ConstructionBase):
         return sum(self.visible_optical_properties()[2])
 
     @property
+    @_cached_while_locked
     def shgc(self):
         """Get the solar heat gain coefficient (SHGC) of the construction.
 
@@ -490,6 +518,7 @@ class WindowConstruction(_ConstructionBase):
             trans = incident * mat.visible_transmittance
         return trans, reflect, absorb
 
+    @_cached_while_locked
     def temperature_profile(
         self, outside_temperature=-18, inside_temperature=21,
         wind_speed=6.7, solar_irradiance=0,
@@ -573,6 +602,7 @@ class WindowConstruction(_ConstructionBase):
             r_values, outside_temperature, inside_temperature, heat_gen)
         return temperatures, r_values
 
+    @_cached_while_locked
     def temperature_profile_frame(
         self, outside_temperature=-18, inside_temperature=21,
         outside_wind_speed=6.7, solar_irradiance=0,
@@ -980,17 +1010,15 @@ class WindowConstruction(_ConstructionBase):
             -   materials: A list of all window materials in the IDF file as
                 honeybee_energy Material objects.
         """
-        # read the file and remove lines of comments
-        file_contents = clean_idf_file_contents(idf_file)
+        # parse all of the objects in the file
+        idf_objects = idf_objects_by_type(idf_file)
         # extract all material objects
-        mat_pattern = re.compile(r"(?i)(WindowMaterial:[\s\S]*?;)")
-        material_str = mat_pattern.findall(file_contents)
+        material_str = idf_objects_of_type(idf_objects, ('WindowMaterial:',))
         materials_dict = WindowConstruction._idf_materials_dictionary(material_str)
         materials = list(materials_dict.values())
         # extract all of the construction objects
-        constr_pattern = re.compile(r"(?i)(Construction,[\s\S]*?;)")
-        constr_props = tuple(parse_idf_string(idf_string) for
-                             idf_string in constr_pattern.findall(file_contents))
+        constr_props = tuple(parse_idf_string(idf_string) for idf_string in
+                             idf_objects_of_type(idf_objects, ('Construction',)))
         constructions = []
         for constr in constr_props:
             try:
@@ -1002,8 +1030,8 @@ class WindowConstruction(_ConstructionBase):
             except KeyError:
                 pass  # it's an opaque construction or window shaded construction
         # extract all of the frame objects
-        frame_pattern = re.compile(r"(?i)(WindowProperty:FrameAndDivider,[\s\S]*?;)")
-        frame_strings = frame_pattern.findall(file_contents)
+        frame_strings = idf_objects_of_type(
+            idf_objects, ('WindowProperty:FrameAndDivider',))
         frame_materials = []
         for fr_str in frame_strings:
             try:
@@ -1019,7 +1047,12 @@ class WindowConstruction(_ConstructionBase):
         return constructions, materials + frame_materials
 
     def lock(self):
-        """The lock() method will also lock the materials."""
+        """The lock() method will also lock the materials.
+
+        While the construction is locked, the results of the R-value, SHGC and
+        temperature profile calculations are cached on the construction.
+        """
+        self._solver_cache.clear()
         self._locked = True
         for mat in self.materials:
             mat.lock()
@@ -1028,6 +1061,7 @@ class WindowConstruction(_ConstructionBase):
 
     def unlock(self):
         """The unlock() method will also unlock the materials."""
+        self._solver_cache.clear()
         self._locked = False
         for mat in self.materials:
             mat.unlock()
@@ -10,9 +10,9 @@ from honeybee_energy.construction.dictutil import dict_abridged_to_construction,
 
 from ._loadmaterials import _opaque_materials, _window_materials, _default_mats
 from ._loadschedules import _schedules
+from ._loadutil import LazyStandardsDict, load_json_file
 
 import os
-import json
 
 
 # dictionary of all materials loaded from JSON
@@ -31,8 +31,7 @@ _win_types = (WindowConstruction, WindowConstructionShade, WindowConstructionDyn
 
 
 # first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['constructions']
+default_data = load_json_file(folders.defaults_file)['constructions']
 for con_dict in default_data:
     constr = dict_abridged_to_construction(con_dict, _all_materials, _schedules, False)
     constr.lock()
@@ -48,24 +47,21 @@ _default_constrs = set(
 
 
 # then load honeybee extension data into a dictionary but don't make the objects yet
-_opaque_constr_standards_dict = {}
-_window_constr_standards_dict = {}
-_shade_constr_standards_dict = {}
+_opaque_constr_standards_dict = LazyStandardsDict()
+_window_constr_standards_dict = LazyStandardsDict()
+_shade_constr_standards_dict = LazyStandardsDict()
 
 for ext_folder in folders.standards_extension_folders:
     _data_dir = os.path.join(ext_folder, 'constructions')
     _opaque_dir = os.path.join(_data_dir, 'opaque_construction.json')
     if os.path.isfile(_opaque_dir):
-        with open(_opaque_dir, 'r') as f:
-            _opaque_constr_standards_dict.update(json.load(f))
+        _opaque_constr_standards_dict.add_file(_opaque_dir)
     _window_dir = os.path.join(_data_dir, 'window_construction.json')
     if os.path.isfile(_window_dir):
-        with open(_window_dir, 'r') as f:
-            _window_constr_standards_dict.update(json.load(f))
+        _window_constr_standards_dict.add_file(_window_dir)
     _shade_dir = os.path.join(_data_dir, 'shade_construction.json')
     if os.path.isfile(_shade_dir):
-        with open(_shade_dir, 'r') as f:
-            _shade_constr_standards_dict.update(json.load(f))
+        _shade_constr_standards_dict.add_file(_shade_dir)
 
 
 # then load materials and constructions from the user-supplied files
@@ -170,8 +166,7 @@ def load_constructions_from_folder(
                     lock_and_check_construction(cnstr)
                     window_cons[cnstr.identifier] = cnstr
             if f_path.endswith('.json'):
-                with open(f_path) as json_file:
-                    data = json.load(json_file)
+                data = load_json_file(f_path)
                 if 'type' in data:  # single object
                     load_construction_object(
                         data, loaded_materials, loaded_schedules,
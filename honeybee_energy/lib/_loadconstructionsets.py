@@ -4,9 +4,9 @@ from honeybee_energy.constructionset import ConstructionSet
 
 from ._loadconstructions import _opaque_constructions, _window_constructions, \
     _shade_constructions
+from ._loadutil import LazyStandardsDict, load_json_file
 
 import os
-import json
 
 
 # make a dictionary of all constructions loaded from JSON
@@ -19,8 +19,7 @@ _construction_sets = {}
 
 
 # first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['construction_sets']
+default_data = load_json_file(folders.defaults_file)['construction_sets']
 for cset_dict in default_data:
     constructionset = ConstructionSet.from_dict_abridged(cset_dict, _all_constructions)
     constructionset.lock()
@@ -29,15 +28,14 @@ _default_sets = set(list(_construction_sets.keys()))
 
 
 # then load honeybee extension data into a dictionary but don't make the objects yet
-_construction_set_standards_dict = {}
+_construction_set_standards_dict = LazyStandardsDict()
 
 for ext_folder in folders.standards_extension_folders:
     _data_dir = os.path.join(ext_folder, 'constructionsets')
     for _c_set_json in os.listdir(_data_dir):
         if _c_set_json.endswith('.json'):
             _c_set_dir = os.path.join(_data_dir, _c_set_json)
-            with open(_c_set_dir, 'r') as f:
-                _construction_set_standards_dict.update(json.load(f))
+            _construction_set_standards_dict.add_file(_c_set_dir)
 
 
 # then load construction sets from the user-supplied files
@@ -100,8 +98,7 @@ def load_constructionsets_from_folder(constructionset_lib_folder, loaded_constru
     for f in os.listdir(constructionset_lib_folder):
         f_path = os.path.join(constructionset_lib_folder, f)
         if os.path.isfile(f_path) and f_path.endswith('.json'):
-            with open(f_path, 'r') as json_file:
-                c_dict = json.load(json_file)
+            c_dict = load_json_file(f_path)
             if 'type' in c_dict:  # single object
                 load_construction_set_object(
                     c_dict, loaded_constructions, con_sets, misc_cons)
@@ -2,8 +2,9 @@
 from honeybee_energy.config import folders
 from honeybee_energy.material.dictutil import dict_to_material
 
+from ._loadutil import LazyStandardsDict, load_json_file
+
 import os
-import json
 
 
 # empty dictionaries to hold loaded materials
@@ -12,8 +13,7 @@ _window_materials = {}
 
 
 # first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['materials']
+default_data = load_json_file(folders.defaults_file)['materials']
 for mat_dict in default_data:
     mat_obj = dict_to_material(mat_dict, False)
     mat_obj.lock()
@@ -25,19 +25,17 @@ _default_mats = set(list(_opaque_materials.keys()) + list(_window_materials.keys
 
 
 # then load honeybee extension data into a dictionary but don't make the objects yet
-_opaque_mat_standards_dict = {}
-_window_mat_standards_dict = {}
+_opaque_mat_standards_dict = LazyStandardsDict()
+_window_mat_standards_dict = LazyStandardsDict()
 
 for ext_folder in folders.standards_extension_folders:
     _data_dir = os.path.join(ext_folder, 'constructions')
     _opaque_dir = os.path.join(_data_dir, 'opaque_material.json')
     if os.path.isfile(_opaque_dir):
-        with open(_opaque_dir, 'r') as f:
-            _opaque_mat_standards_dict.update(json.load(f))
+        _opaque_mat_standards_dict.add_file(_opaque_dir)
     _window_dir = os.path.join(_data_dir, 'window_material.json')
     if os.path.isfile(_window_dir):
-        with open(_window_dir, 'r') as f:
-            _window_mat_standards_dict.update(json.load(f))
+        _window_mat_standards_dict.add_file(_window_dir)
 
 
 # then load material JSONs from the default and user-supplied files
@@ -68,8 +66,7 @@ def load_materials_from_folder(construction_lib_folder):
     for f in os.listdir(construction_lib_folder):
         f_path = os.path.join(construction_lib_folder, f)
         if os.path.isfile(f_path) and f_path.endswith('.json'):
-            with open(f_path) as json_file:
-                data = json.load(json_file)
+            data = load_json_file(f_path)
             if 'type' in data:  # single object
                 load_material_object(data, opaque_mats, window_mats)
             else:  # a collection of several objects
@@ -3,9 +3,9 @@ from honeybee_energy.config import folders
 from honeybee_energy.programtype import ProgramType
 
 from ._loadschedules import _schedules
+from ._loadutil import LazyStandardsDict, load_json_file
 
 import os
-import json
 
 
 # empty dictionary to hold loaded program types
@@ -13,8 +13,7 @@ _program_types = {}
 
 
 # first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['program_types']
+default_data = load_json_file(folders.defaults_file)['program_types']
 for pro_dict in default_data:
     program = ProgramType.from_dict_abridged(pro_dict, _schedules)
     program.lock()
@@ -33,7 +32,7 @@ def _add_schedule(scheds, p_type_dict, load_id, sch_id):
 
 
 # then load honeybee extension data into a dictionary but don't make the objects yet
-_program_types_standards_dict = {}
+_program_types_standards_dict = LazyStandardsDict()
 _program_types_standards_registry = {}
 _building_programs_dict = {}
 
@@ -42,8 +41,7 @@ for ext_folder in folders.standards_extension_folders:
     for _p_type_json in os.listdir(_data_dir):
         if _p_type_json.endswith('.json'):
             _p_type_dir = os.path.join(_data_dir, _p_type_json)
-            with open(_p_type_dir, 'r') as f:
-                _program_types_standards_dict.update(json.load(f))
+            _program_types_standards_dict.add_file(_p_type_dir)
     _data_dir = os.path.join(ext_folder, 'programtypes_registry')
     if os.path.isdir(_data_dir):
         for _p_type_json in os.listdir(_data_dir):
@@ -51,14 +49,13 @@ for ext_folder in folders.standards_extension_folders:
                 _p_type_dir = os.path.join(_data_dir, _p_type_json)
                 vintage = _p_type_json.split('_registry.json')[0]
                 try:
-                    with open(_p_type_dir, 'r') as f:
-                        _program_types_standards_registry[vintage] = json.load(f)
+                    _program_types_standards_registry[vintage] = \
+                        load_json_file(_p_type_dir)
                 except FileNotFoundError:
                     pass
     _bld_file = os.path.join(ext_folder, 'building_mix.json')
     if os.path.isfile(_bld_file):
-        with open(_bld_file, 'r') as f:
-            _building_programs_dict.update(json.load(f))
+        _building_programs_dict.update(load_json_file(_bld_file))
 
 
 # then load program types from the user-supplied files
@@ -109,8 +106,7 @@ def load_programtypes_from_folder(programtypes_lib_folder, loaded_schedules):
     for f in os.listdir(programtypes_lib_folder):
         f_path = os.path.join(programtypes_lib_folder, f)
         if os.path.isfile(f_path) and f_path.endswith('.json'):
-            with open(f_path, 'r') as json_file:
-                p_dict = json.load(json_file)
+            p_dict = load_json_file(f_path)
             if 'type' in p_dict:  # single object
                 load_program_object(p_dict, loaded_schedules, p_types, misc_scheds)
             else:  # a collection of several objects
@@ -5,9 +5,9 @@ from honeybee_energy.schedule.dictutil import dict_abridged_to_schedule, \
     dict_to_schedule
 
 from ._loadtypelimits import _schedule_type_limits
+from ._loadutil import LazyStandardsDict, load_json_file
 
 import os
-import json
 
 
 # empty dictionary to hold loaded schedules
@@ -15,8 +15,7 @@ _schedules = {}
 
 
 # first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['schedules']
+default_data = load_json_file(folders.defaults_file)['schedules']
 for sch_dict in default_data:
     sch_obj = dict_abridged_to_schedule(sch_dict, _schedule_type_limits, False)
     sch_obj.lock()
@@ -25,13 +24,12 @@ _default_schedules = set(list(_schedules.keys()))
 
 
 # then load honeybee extension data into a dictionary but don't make the objects yet
-_schedule_standards_dict = {}
+_schedule_standards_dict = LazyStandardsDict()
 
 for ext_folder in folders.standards_extension_folders:
     _data_dir = os.path.join(ext_folder, 'schedules', 'schedule.json')
     if os.path.isfile(_data_dir):
-        with open(_data_dir, 'r') as f:
-            _schedule_standards_dict.update(json.load(f))
+        _schedule_standards_dict.add_file(_data_dir)
 
 
 # then load schedules from the user-supplied files
@@ -74,8 +72,7 @@ def load_schedules_from_folder(schedule_lib_folder, loaded_type_limits):
                     lock_and_check_schedule(sch)
                     scheds[sch.identifier] = sch
             elif f_path.endswith('.json'):  # parse as a honeybee JSON
-                with open(f_path) as json_file:
-                    data = json.load(json_file)
+                data = load_json_file(f_path)
                 if 'type' in data:  # single object
                     load_schedule_object(data, loaded_type_limits, scheds)
                 for sch_id in data:  # a collection of several objects
@@ -2,8 +2,9 @@
 from honeybee_energy.config import folders
 from honeybee_energy.schedule.typelimit import ScheduleTypeLimit
 
+from ._loadutil import load_json_file
+
 import os
-import json
 
 
 # empty dictionary to hold loaded schedule type limits
@@ -11,8 +12,7 @@ _schedule_type_limits = {}
 
 
 # first load the honeybee defaults
-with open(folders.defaults_file) as json_file:
-    default_data = json.load(json_file)['schedule_type_limits']
+default_data = load_json_file(folders.defaults_file)['schedule_type_limits']
 for stl_dict in default_data:
     stl_obj = ScheduleTypeLimit.from_dict(stl_dict)
     _schedule_type_limits[stl_dict['identifier']] = stl_obj
@@ -43,8 +43,7 @@ def load_type_limits_from_folder(schedule_lib_folder):
                 for typ in schedule_type_limits:
                     check_and_add_schedule_type_limit(typ, type_limits)
             elif f_path.endswith('.json'):
-                with open(f_path) as json_file:
-                    data = json.load(json_file)
+                data = load_json_file(f_path)
                 if 'type' in data and data['type'] == 'ScheduleTypeLimit':  # single object
                     check_and_add_schedule_type_limit(
                         ScheduleTypeLimit.from_dict(data), type_limits)
@@ -0,0 +1,165 @@
+"""Utilities for loading the standards library only when it is needed."""
+import sys
+import gc
+import json
+
+# module-level __getattr__ is needed to defer building the identifier tuples
+LAZY_LIBRARY = sys.version_info >= (3, 7)
+
+
+class LazyStandardsDict(dict):
+    """Dictionary of standards library data that is only parsed from JSON when used.
+
+    The JSON files are not read until an item of the dictionary is first requested,
+    after which the object behaves like a normal dictionary.
+
+    Args:
+        json_files: An optional list of paths to JSON files, which each contain
+            a dictionary of objects that should be loaded into this dictionary.
+    """
+    __slots__ = ('_json_files', '_loaded')
+
+    def __init__(self, json_files=None):
+        dict.__init__(self)
+        self._json_files = list(json_files) if json_files is not None else []
+        self._loaded = False
+
+    @property
+    def json_files(self):
+        """Get a tuple of the JSON files that are loaded into this dictionary."""
+        return tuple(self._json_files)
+
+    @property
+    def loaded(self):
+        """Get a boolean for whether the JSON files have been parsed."""
+        return self._loaded
+
+    def add_file(self, json_file):
+        """Add a JSON file to be loaded into this dictionary.
+
+        Args:
+            json_file: Path to a JSON file containing a dictionary of objects.
+        """
+        if self._loaded:
+            self._update_from_file(json_file)
+        self._json_files.append(json_file)
+
+    def load(self):
+        """Parse all JSON files into the dictionary if they have not been loaded."""
+        if not self._loaded:
+            self._loaded = True
+            for json_file in self._json_files:
+                self._update_from_file(json_file)
+
+    def keys(self):
+        self.load()
+        return dict.keys(self)
+
+    def values(self):
+        self.load()
+        return dict.values(self)
+
+    def items(self):
+        self.load()
+        return dict.items(self)
+
+    def get(self, key, default=None):
+        self.load()
+        return dict.get(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self.load()
+        dict.update(self, *args, **kwargs)
+
+    def copy(self):
+        self.load()
+        return dict(dict.items(self))
+
+    def _update_from_file(self, json_file):
+        """Update this dictionary with the contents of a JSON file."""
+        dict.update(self, load_json_file(json_file))
+
+    def __getitem__(self, key):
+        self.load()
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        self.load()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self.load()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.load()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self.load()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        if not self._loaded:
+            return 'LazyStandardsDict: [{} unloaded files]'.format(
+                len(self._json_files))
+        return dict.__repr__(self)
+
+
+def lazy_module_attributes(module_globals, attr_builders):
+    """Get a module __getattr__ function that builds attributes on first access.
+
+    When LAZY_LIBRARY is False (eg. in Python < 3.7), all of the attributes are
+    built immediately and assigned to the module.
+
+    Args:
+        module_globals: The globals() dictionary of the module.
+        attr_builders: A dictionary where the keys are the names of module
+            attributes and the values are functions with no arguments that
+            return the value of the attribute.
+
+    Returns:
+        A function to be assigned to __getattr__ of the module or None if the
+        attributes have already been built.
+    """
+    if not LAZY_LIBRARY:
+        for attr_name, builder in attr_builders.items():
+            module_globals[attr_name] = builder()
+        return None
+
+    def __getattr__(name):
+        try:
+            builder = attr_builders[name]
+        except KeyError:
+            raise AttributeError('module {} has no attribute {}'.format(
+                module_globals['__name__'], name))
+        value = module_globals[name] = builder()
+        return value
+    return __getattr__
+
+
+def load_json_file(json_file):
+    """Load a JSON file of the library as quickly as possible.
+
+    The garbage collector is paused while the file is parsed since it otherwise
+    dominates the time to build the many small dictionaries of the library.
+
+    Args:
+        json_file: Path to a JSON file to be loaded.
+
+    Returns:
+        The parsed contents of the JSON file.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(json_file, 'r') as f:
+            return json.load(f)
+    finally:
+        if gc_enabled:
+            gc.enable()
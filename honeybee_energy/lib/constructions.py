@@ -8,6 +8,7 @@ from honeybee_energy.construction.air import AirBoundaryConstruction
 from ._loadconstructions import _opaque_constructions, _window_constructions, \
     _shade_constructions, _opaque_constr_standards_dict, _window_constr_standards_dict, \
     _shade_constr_standards_dict
+from ._loadutil import lazy_module_attributes
 
 import honeybee_energy.lib.materials as _m
 import honeybee_energy.lib.schedules as _s
@@ -39,12 +40,15 @@ except KeyError:  # older version of honeybee-standards
     floor_plenum_top = OpaqueConstruction('Floor Plenum Top', [_m.wood])
 
 # make lists of construction identifiers to look up items in the library
-OPAQUE_CONSTRUCTIONS = tuple(_opaque_constructions.keys()) + \
-    tuple(_opaque_constr_standards_dict.keys())
-WINDOW_CONSTRUCTIONS = tuple(_window_constructions.keys()) + \
-    tuple(_window_constr_standards_dict.keys())
-SHADE_CONSTRUCTIONS = tuple(_shade_constructions.keys()) + \
+# these are only built when first requested to avoid parsing the standards JSONs
+__getattr__ = lazy_module_attributes(globals(), {
+    'OPAQUE_CONSTRUCTIONS': lambda: tuple(_opaque_constructions.keys()) +
+    tuple(_opaque_constr_standards_dict.keys()),
+    'WINDOW_CONSTRUCTIONS': lambda: tuple(_window_constructions.keys()) +
+    tuple(_window_constr_standards_dict.keys()),
+    'SHADE_CONSTRUCTIONS': lambda: tuple(_shade_constructions.keys()) +
     tuple(_shade_constr_standards_dict.keys())
+})
 
 
 def opaque_construction_by_identifier(construction_identifier):
@@ -1,6 +1,7 @@
 """Collection of construction sets."""
 from honeybee_energy.constructionset import ConstructionSet
 from ._loadconstructionsets import _construction_sets, _construction_set_standards_dict
+from ._loadutil import lazy_module_attributes
 
 import honeybee_energy.lib.constructions as _c
 
@@ -10,8 +11,11 @@ generic_construction_set = _construction_sets['Default Generic Construction Set'
 
 
 # make lists of program types to look up items in the library
-CONSTRUCTION_SETS = tuple(_construction_sets.keys()) + \
+# these are only built when first requested to avoid parsing the standards JSONs
+__getattr__ = lazy_module_attributes(globals(), {
+    'CONSTRUCTION_SETS': lambda: tuple(_construction_sets.keys()) +
     tuple(_construction_set_standards_dict.keys())
+})
 
 
 def construction_set_by_identifier(construction_set_identifier):
@@ -3,6 +3,7 @@ from honeybee_energy.material.dictutil import dict_to_material
 
 from ._loadconstructions import _opaque_materials, _window_materials
 from ._loadmaterials import _opaque_mat_standards_dict, _window_mat_standards_dict
+from ._loadutil import lazy_module_attributes
 
 
 # establish variables for the default materials used across the library
@@ -25,10 +26,13 @@ argon_gap = _window_materials['Generic Window Argon Gap']
 
 
 # make lists of material identifiers to look up items in the library
-OPAQUE_MATERIALS = tuple(_opaque_materials.keys()) + \
-    tuple(_opaque_mat_standards_dict.keys())
-WINDOW_MATERIALS = tuple(_window_materials.keys()) + \
+# these are only built when first requested to avoid parsing the standards JSONs
+__getattr__ = lazy_module_attributes(globals(), {
+    'OPAQUE_MATERIALS': lambda: tuple(_opaque_materials.keys()) +
+    tuple(_opaque_mat_standards_dict.keys()),
+    'WINDOW_MATERIALS': lambda: tuple(_window_materials.keys()) +
     tuple(_window_mat_standards_dict.keys())
+})
 
 
 def opaque_material_by_identifier(material_identifier):
@@ -3,6 +3,7 @@ from honeybee_energy.programtype import ProgramType
 
 from ._loadprogramtypes import _program_types, _program_types_standards_dict, \
     _program_types_standards_registry, _building_programs_dict
+from ._loadutil import lazy_module_attributes
 import honeybee_energy.lib.schedules as _s
 
 
@@ -12,10 +13,13 @@ office_program = _program_types['Generic Office Program']
 
 
 # make lists of program types to look up items in the library
-PROGRAM_TYPES = tuple(_program_types.keys()) + \
-    tuple(_program_types_standards_dict.keys())
 STANDARDS_REGISTRY = _program_types_standards_registry
 BUILDING_TYPES = tuple(_building_programs_dict.keys())
+# these are only built when first requested to avoid parsing the standards JSONs
+__getattr__ = lazy_module_attributes(globals(), {
+    'PROGRAM_TYPES': lambda: tuple(_program_types.keys()) +
+    tuple(_program_types_standards_dict.keys())
+})
 
 
 def program_type_by_identifier(program_type_identifier):
@@ -1,6 +1,7 @@
 """Establish the default schedule types within the honeybee_energy library."""
 from honeybee_energy.schedule.dictutil import dict_abridged_to_schedule
 from ._loadschedules import _schedules, _schedule_standards_dict
+from ._loadutil import lazy_module_attributes
 
 import honeybee_energy.lib.scheduletypelimits as _stl
 
@@ -17,7 +18,11 @@ generic_office_cooling = _schedules['Generic Office Cooling']
 
 
 # make lists of schedules to look up items in the library
-SCHEDULES = tuple(_schedules.keys()) + tuple(_schedule_standards_dict.keys())
+# these are only built when first requested to avoid parsing the standards JSONs
+__getattr__ = lazy_module_attributes(globals(), {
+    'SCHEDULES': lambda: tuple(_schedules.keys()) +
+    tuple(_schedule_standards_dict.keys())
+})
 IMMUTABLE_SCHEDULES = (
     'Always On', 'Seated Adult Activity', 'HumidNoLimit', 'DeHumidNoLimit'
 )
@@ -20,6 +20,10 @@ from honeybee.typing import float_positive, float_in_range, tuple_with_length
 
 import math
 
+# cache of gas cavity U-values, which are recomputed many times by window solvers
+_U_VALUE_CACHE = {}
+_U_VALUE_CACHE_SIZE = 50000
+
 
 @lockable
 class _EnergyWindowMaterialGasBase(_EnergyMaterialWindowBase):
@@ -282,8 +286,15 @@ class _EnergyWindowMaterialGasBase(_EnergyMaterialWindowBase):
             pressure: The average pressure of the gas cavity in Pa.
                 Default is 101325 Pa for standard pressure at sea level.
         """
-        return self.convective_conductance(delta_t, height, t_kelvin, pressure) + \
+        key = (self._gas_key(), self.thickness, delta_t, emissivity_1, emissivity_2,
+               height, None, t_kelvin, pressure)
+        try:  # see if the U-value has already been computed for these conditions
+            return _U_VALUE_CACHE[key]
+        except KeyError:
+            pass
+        u_val = self.convective_conductance(delta_t, height, t_kelvin, pressure) + \
             self.radiative_conductance(emissivity_1, emissivity_2, t_kelvin)
+        return _cache_u_value(key, u_val)
 
     def u_value_at_angle(self, delta_t=15, emissivity_1=0.84, emissivity_2=0.84,
                          height=1.0, angle=90, t_kelvin=273.15, pressure=101325):
@@ -308,9 +319,24 @@ class _EnergyWindowMaterialGasBase(_EnergyMaterialWindowBase):
             pressure: The average pressure of the gas cavity in Pa.
                 Default is 101325 Pa for standard pressure at sea level.
         """
-        return self.convective_conductance_at_angle(
+        key = (self._gas_key(), self.thickness, delta_t, emissivity_1, emissivity_2,
+               height, angle, t_kelvin, pressure)
+        try:  # see if the U-value has already been computed for these conditions
+            return _U_VALUE_CACHE[key]
+        except KeyError:
+            pass
+        u_val = self.convective_conductance_at_angle(
             delta_t, height, angle, t_kelvin, pressure) + \
             self.radiative_conductance(emissivity_1, emissivity_2, t_kelvin)
+        return _cache_u_value(key, u_val)
+
+    def _gas_key(self):
+        """A tuple of the properties that determine the thermal behavior of the gas.
+
+        This excludes the thickness and is used to cache gas cavity U-values.
+        """
+        raise NotImplementedError(
+            '{} must implement _gas_key.'.format(self.__class__.__name__))
 
 
 @lockable
@@ -456,6 +482,10 @@ class EnergyWindowMaterialGas(_EnergyWindowMaterialGasBase):
             dictionary[self._gas_type][1] * t_kelvin + \
             dictionary[self._gas_type][2] * t_kelvin ** 2
 
+    def _gas_key(self):
+        """A tuple of the properties that determine the thermal behavior of the gas."""
+        return ('Gas', self._gas_type)
+
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
         return (self.identifier, self.thickness, self.gas_type)
@@ -676,6 +706,10 @@ class EnergyWindowMaterialGasMixture(_EnergyWindowMaterialGasBase):
                             dictionary[gas][2] * t_kelvin ** 2)
         return sum(tuple(pr * frac for pr, frac in zip(property, self._gas_fractions)))
 
+    def _gas_key(self):
+        """A tuple of the properties that determine the thermal behavior of the gas."""
+        return ('Mixture', self._gas_types, self._gas_fractions)
+
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
         return (self.identifier, self.thickness, self.gas_types, self.gas_fractions)
@@ -1051,6 +1085,14 @@ class EnergyWindowMaterialGasCustom(_EnergyWindowMaterialGasBase):
             base['properties'] = prop_dict
         return base
 
+    def _gas_key(self):
+        """A tuple of the properties that determine the thermal behavior of the gas."""
+        return ('Custom', self.conductivity_coeff_a, self.viscosity_coeff_a,
+                self.specific_heat_coeff_a, self.conductivity_coeff_b,
+                self.viscosity_coeff_b, self.specific_heat_coeff_b,
+                self.conductivity_coeff_c, self.viscosity_coeff_c,
+                self.specific_heat_coeff_c, self.molecular_weight)
+
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
         return (self.identifier, self.thickness, self.conductivity_coeff_a,
@@ -1085,3 +1127,11 @@ class EnergyWindowMaterialGasCustom(_EnergyWindowMaterialGasBase):
         new_obj._user_data = None if self._user_data is None else self._user_data.copy()
         new_obj._properties._duplicate_extension_attr(self._properties)
         return new_obj
+
+
+def _cache_u_value(key, u_value):
+    """Add a gas cavity U-value to the cache, clearing the cache if it is full."""
+    if len(_U_VALUE_CACHE) >= _U_VALUE_CACHE_SIZE:
+        _U_VALUE_CACHE.clear()
+    _U_VALUE_CACHE[key] = u_value
+    return u_value
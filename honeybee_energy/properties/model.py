@@ -4,6 +4,7 @@ try:
     from itertools import izip as zip  # python 2
 except ImportError:
     pass   # python 3
+import math
 
 from ladybug_geometry.geometry2d import Vector2D
 from ladybug_geometry.geometry3d import Point3D
@@ -33,6 +34,8 @@ from ..schedule.ruleset import ScheduleRuleset
 from ..schedule.dictutil import SCHEDULE_TYPES, dict_to_schedule, \
     dict_abridged_to_schedule
 from ..programtype import ProgramType
+from ..load.setpoint import Setpoint
+from ..load.ventilation import Ventilation
 from ..hvac.detailed import DetailedHVAC
 from ..hvac import HVAC_TYPES_DICT
 from ..shw import SHWSystem
@@ -46,6 +49,27 @@ from ..lib.schedules import always_on, IMMUTABLE_SCHEDULES
 from ..lib.scheduletypelimits import fractional
 
 
+def _cached_resources(collect_func):
+    """Decorator to cache a list of Model resources while resource caching is active.
+
+    When the ModelEnergyProperties resource cache is inactive (the default), the
+    decorated method is evaluated every time that it is called. Otherwise, the
+    list is only collected once and a copy of it is returned for each call.
+    """
+    def cached_collect_func(self):
+        if self._resource_cache is None:
+            return collect_func(self)
+        try:
+            resources = self._resource_cache[collect_func.__name__]
+        except KeyError:
+            resources = collect_func(self)
+            self._resource_cache[collect_func.__name__] = resources
+        return list(resources) if isinstance(resources, list) else resources
+    cached_collect_func.__name__ = collect_func.__name__
+    cached_collect_func.__doc__ = collect_func.__doc__
+    return cached_collect_func
+
+
 class ModelEnergyProperties(object):
     """Energy Properties for Honeybee Model.
 
@@ -103,6 +127,7 @@ class ModelEnergyProperties(object):
             self, host, ventilation_simulation_control=None, electric_load_center=None):
         """Initialize Model energy properties."""
         self._host = host
+        self._resource_cache = None
         self.ventilation_simulation_control = ventilation_simulation_control
         self.electric_load_center = electric_load_center
 
@@ -112,6 +137,7 @@ class ModelEnergyProperties(object):
         return self._host
 
     @property
+    @_cached_resources
     def materials(self):
         """Get a list of all unique materials contained within the model.
 
@@ -135,6 +161,7 @@ class ModelEnergyProperties(object):
         return list(set(materials))
 
     @property
+    @_cached_resources
     def constructions(self):
         """Get a list of all unique constructions in the model.
 
@@ -147,6 +174,7 @@ class ModelEnergyProperties(object):
         return list(set(all_constrs))
 
     @property
+    @_cached_resources
     def room_constructions(self):
         """Get a list of all unique constructions assigned to Room ConstructionSets.
 
@@ -155,49 +183,27 @@ class ModelEnergyProperties(object):
         room_constrs = []
         for cnstr_set in self.construction_sets:
             room_constrs.extend(cnstr_set.modified_constructions_unique)
-        for room in self.host.rooms:
-            for int_mass in room.properties.energy._internal_masses:
-                constr = int_mass.construction
-                if not self._instance_in_array(constr, room_constrs):
-                    room_constrs.append(constr)
+        room_constrs.extend(self._room_resources()['mass_constructions'])
         return list(set(room_constrs))
 
     @property
+    @_cached_resources
     def face_constructions(self):
         """Get a list of all unique constructions assigned to Faces, Apertures and Doors.
         """
-        constructions = []
-        for face in self.host.faces:
-            self._check_and_add_obj_construction(face, constructions)
-            for ap in face.apertures:
-                self._check_and_add_obj_construction(ap, constructions)
-            for dr in face.doors:
-                self._check_and_add_obj_construction(dr, constructions)
-        for ap in self.host.orphaned_apertures:
-            self._check_and_add_obj_construction(ap, constructions)
-        for dr in self.host.orphaned_doors:
-            self._check_and_add_obj_construction(dr, constructions)
-        return list(set(constructions))
+        return list(set(self._geometry_resources()['face_constructions']))
 
     @property
+    @_cached_resources
     def shade_constructions(self):
         """Get a list of all unique constructions assigned to Shades in the model."""
-        constructions = []
-        for shade in self.host.shades:
-            self._check_and_add_obj_construction(shade, constructions)
-        for sm in self.host.shade_meshes:  # check all ShadeMesh modifiers
-            self._check_and_add_obj_construction(sm, constructions)
-        return list(set(constructions))
+        return list(set(self._geometry_resources()['shade_constructions']))
 
     @property
+    @_cached_resources
     def construction_sets(self):
         """Get a list of all unique Room-Assigned ConstructionSets in the Model."""
-        construction_sets = []
-        for room in self.host.rooms:
-            if room.properties.energy._construction_set is not None:
-                if not self._instance_in_array(room.properties.energy._construction_set,
-                                               construction_sets):
-                    construction_sets.append(room.properties.energy._construction_set)
+        construction_sets = self._room_resources()['construction_sets']
         return list(set(construction_sets))  # catch equivalent construction sets
 
     @property
@@ -211,19 +217,21 @@ class ModelEnergyProperties(object):
         return generic_construction_set
 
     @property
+    @_cached_resources
     def schedule_type_limits(self):
         """Get a list of all unique schedule type limits contained within the model.
 
         This includes schedules across all Shades and Rooms.
         """
-        type_limits = []
+        type_limits = {}
         for sched in self.schedules:
             t_lim = sched.schedule_type_limit
-            if t_lim is not None and not self._instance_in_array(t_lim, type_limits):
-                type_limits.append(t_lim)
-        return list(set(type_limits))
+            if t_lim is not None:
+                type_limits[id(t_lim)] = t_lim
+        return list(set(type_limits.values()))
 
     @property
+    @_cached_resources
     def schedules(self):
         """Get a list of all unique schedules directly assigned to objects in the model.
 
@@ -237,6 +245,7 @@ class ModelEnergyProperties(object):
         return list(set(all_scheds))
 
     @property
+    @_cached_resources
     def construction_schedules(self):
         """Get a list of all unique schedules assigned to constructions in the model.
 
@@ -245,106 +254,47 @@ class ModelEnergyProperties(object):
         schedules = []
         for constr in self.constructions:
             if isinstance(constr, AirBoundaryConstruction):
-                self._check_and_add_schedule(constr.air_mixing_schedule, schedules)
+                schedules.append(constr.air_mixing_schedule)
             elif isinstance(constr, WindowConstructionShade):
                 if constr.schedule is not None:
-                    self._check_and_add_schedule(constr.schedule, schedules)
+                    schedules.append(constr.schedule)
             elif isinstance(constr, WindowConstructionDynamic):
-                self._check_and_add_schedule(constr.schedule, schedules)
+                schedules.append(constr.schedule)
         return list(set(schedules))
 
     @property
+    @_cached_resources
     def shade_schedules(self):
         """Get a list of unique transmittance schedules assigned to Shades in the model.
         """
-        schedules = []
-        for shade in self.host.orphaned_shades:
-            self._check_and_add_shade_schedule(shade, schedules)
-        for room in self.host.rooms:  # check all Room Shade schedules
-            for shade in room.shades:
-                self._check_and_add_shade_schedule(shade, schedules)
-            for face in room.faces:  # check all Face Shade schedules
-                for shade in face.shades:
-                    self._check_and_add_shade_schedule(shade, schedules)
-                for ap in face.apertures:  # check all Aperture Shade schedules
-                    for shade in ap.shades:
-                        self._check_and_add_shade_schedule(shade, schedules)
-                for dr in face.doors:  # check all Door Shade schedules
-                    for shade in dr.shades:
-                        self._check_and_add_shade_schedule(shade, schedules)
-        for sm in self.host.shade_meshes:
-            self._check_and_add_shade_schedule(sm, schedules)
-        return list(set(schedules))
+        return list(set(self._geometry_resources()['shade_schedules']))
 
     @property
+    @_cached_resources
     def room_schedules(self):
         """Get a list of all unique schedules assigned directly to Rooms in the model.
 
         Note that this does not include schedules from ProgramTypes assigned to the
         rooms. For this, use the program_type_schedules property.
         """
-        scheds = []
-        for room in self.host.rooms:
-            people = room.properties.energy._people
-            lighting = room.properties.energy._lighting
-            electric_equipment = room.properties.energy._electric_equipment
-            gas_equipment = room.properties.energy._gas_equipment
-            shw = room.properties.energy._service_hot_water
-            infiltration = room.properties.energy._infiltration
-            ventilation = room.properties.energy._ventilation
-            setpoint = room.properties.energy._setpoint
-            window_vent = room.properties.energy._window_vent_control
-            processes = room.properties.energy._process_loads
-            fans = room.properties.energy._fans
-            if people is not None:
-                self._check_and_add_schedule(people.occupancy_schedule, scheds)
-                self._check_and_add_schedule(people.activity_schedule, scheds)
-            if lighting is not None:
-                self._check_and_add_schedule(lighting.schedule, scheds)
-            if electric_equipment is not None:
-                self._check_and_add_schedule(electric_equipment.schedule, scheds)
-            if gas_equipment is not None:
-                self._check_and_add_schedule(gas_equipment.schedule, scheds)
-            if shw is not None:
-                self._check_and_add_schedule(shw.schedule, scheds)
-            if infiltration is not None:
-                self._check_and_add_schedule(infiltration.schedule, scheds)
-            if ventilation is not None and ventilation._schedule is not None:
-                self._check_and_add_schedule(ventilation._schedule, scheds)
-            if setpoint is not None:
-                self._check_and_add_schedule(setpoint.heating_schedule, scheds)
-                self._check_and_add_schedule(setpoint.cooling_schedule, scheds)
-                if setpoint.humidifying_schedule is not None:
-                    self._check_and_add_schedule(
-                        setpoint.humidifying_schedule, scheds)
-                    self._check_and_add_schedule(
-                        setpoint.dehumidifying_schedule, scheds)
-            if window_vent is not None:
-                self._check_and_add_schedule(window_vent.schedule, scheds)
-            if len(processes) != 0:
-                for process in processes:
-                    self._check_and_add_schedule(process.schedule, scheds)
-            if len(fans) != 0:
-                for fan in fans:
-                    self._check_and_add_schedule(fan.control.schedule, scheds)
-        return list(set(scheds))
+        return list(set(self._room_resources()['schedules']))
 
     @property
+    @_cached_resources
     def program_type_schedules(self):
         """Get a list of all unique schedules assigned to ProgramTypes in the model."""
         schedules = []
         for p_type in self.program_types:
-            for sched in p_type.schedules:
-                self._check_and_add_schedule(sched, schedules)
+            schedules.extend(p_type.schedules)
         return list(set(schedules))
 
     @property
+    @_cached_resources
     def hvac_schedules(self):
         """Get a list of all unique HVAC-assigned schedules in the model."""
         schedules = []
         for hvac in self.hvacs:
-            for sched in hvac.schedules:
-                self._check_and_add_schedule(sched, schedules)
+            schedules.extend(hvac.schedules)
         return list(set(schedules))
 
     @property
@@ -377,35 +327,23 @@ class ModelEnergyProperties(object):
         return schedules
 
     @property
+    @_cached_resources
     def program_types(self):
         """Get a list of all unique ProgramTypes in the Model."""
-        program_types = []
-        for room in self.host.rooms:
-            if room.properties.energy._program_type is not None:
-                if not self._instance_in_array(room.properties.energy._program_type,
-                                               program_types):
-                    program_types.append(room.properties.energy._program_type)
+        program_types = self._room_resources()['program_types']
         return list(set(program_types))  # catch equivalent program types
 
     @property
+    @_cached_resources
     def hvacs(self):
         """Get a list of all unique HVAC systems in the Model."""
-        hvacs = []
-        for room in self.host.rooms:
-            if room.properties.energy._hvac is not None:
-                if not self._instance_in_array(room.properties.energy._hvac, hvacs):
-                    hvacs.append(room.properties.energy._hvac)
-        return hvacs
+        return list(self._room_resources()['hvacs'])
 
     @property
+    @_cached_resources
     def shws(self):
         """Get a list of all unique SHW systems in the Model."""
-        shws = []
-        for room in self.host.rooms:
-            if room.properties.energy._shw is not None:
-                if not self._instance_in_array(room.properties.energy._shw, shws):
-                    shws.append(room.properties.energy._shw)
-        return shws
+        return list(self._room_resources()['shws'])
 
     @property
     def electric_load_center(self):
@@ -771,38 +709,43 @@ class ModelEnergyProperties(object):
         # set up defaults to ensure the method runs correctly
         detailed = False if raise_exception else detailed
         msgs = []
-        tol = self.host.tolerance
-        ang_tol = self.host.angle_tolerance
-        e_tol = parse_distance_string('1cm', self.host.units)
-
-        # perform checks for duplicate identifiers, which might mess with other checks
-        msgs.append(self.host.check_all_duplicate_identifiers(False, detailed))
-
-        # perform several checks for the Honeybee schema geometry rules
-        msgs.append(self.host.check_planar(tol, False, detailed))
-        msgs.append(self.host.check_self_intersecting(tol, False, detailed))
-        msgs.append(self.host.check_degenerate_rooms(e_tol, False, detailed))
-
-        # perform geometry checks related to parent-child relationships
-        msgs.append(self.host.check_sub_faces_valid(tol, ang_tol, False, detailed))
-        msgs.append(self.host.check_sub_faces_overlapping(tol, False, detailed))
-        msgs.append(self.host.check_rooms_solid(tol, ang_tol, False, detailed))
-        msgs.append(self.host.check_upside_down_faces(ang_tol, False, detailed))
-
-        # perform checks related to adjacency relationships
-        msgs.append(self.host.check_room_volume_collisions(tol, False, detailed))
-        msgs.append(self.host.check_missing_adjacencies(False, detailed))
-        msgs.append(self.host.check_matching_adjacent_areas(tol, False, detailed))
-        msgs.append(self.host.check_all_air_boundaries_adjacent(False, detailed))
-
-        # perform checks for specific energy simulation rules
-        msgs.append(self.check_all_zones_have_one_hvac(False, detailed))
-        msgs.append(self.check_detailed_hvac_rooms(False, detailed))
-        msgs.append(self.check_shw_rooms_in_model(False, detailed))
-        msgs.append(self.check_maximum_elevation(1000, False, detailed))
-        msgs.append(self.check_all_air_boundaries_with_window(False, detailed))
-        msgs.append(self.check_one_vegetation_material(False, detailed))
-        msgs.append(self.check_interior_constructions_reversed(False, detailed))
+        started_cache = self._start_resource_cache()
+        try:
+            tol = self.host.tolerance
+            ang_tol = self.host.angle_tolerance
+            e_tol = parse_distance_string('1cm', self.host.units)
+
+            # perform checks for duplicate identifiers, which might mess with other checks
+            msgs.append(self.host.check_all_duplicate_identifiers(False, detailed))
+
+            # perform several checks for the Honeybee schema geometry rules
+            msgs.append(self.host.check_planar(tol, False, detailed))
+            msgs.append(self.host.check_self_intersecting(tol, False, detailed))
+            msgs.append(self.host.check_degenerate_rooms(e_tol, False, detailed))
+
+            # perform geometry checks related to parent-child relationships
+            msgs.append(self.host.check_sub_faces_valid(tol, ang_tol, False, detailed))
+            msgs.append(self.host.check_sub_faces_overlapping(tol, False, detailed))
+            msgs.append(self.host.check_rooms_solid(tol, ang_tol, False, detailed))
+            msgs.append(self.host.check_upside_down_faces(ang_tol, False, detailed))
+
+            # perform checks related to adjacency relationships
+            msgs.append(self.host.check_room_volume_collisions(tol, False, detailed))
+            msgs.append(self.host.check_missing_adjacencies(False, detailed))
+            msgs.append(self.host.check_matching_adjacent_areas(tol, False, detailed))
+            msgs.append(self.host.check_all_air_boundaries_adjacent(False, detailed))
+
+            # perform checks for specific energy simulation rules
+            msgs.append(self.check_all_zones_have_one_hvac(False, detailed))
+            msgs.append(self.check_detailed_hvac_rooms(False, detailed))
+            msgs.append(self.check_shw_rooms_in_model(False, detailed))
+            msgs.append(self.check_maximum_elevation(1000, False, detailed))
+            msgs.append(self.check_all_air_boundaries_with_window(False, detailed))
+            msgs.append(self.check_one_vegetation_material(False, detailed))
+            msgs.append(self.check_interior_constructions_reversed(False, detailed))
+        finally:
+            if started_cache:
+                self._stop_resource_cache()
 
         # output a final report of errors or raise an exception
         full_msgs = [msg for msg in msgs if msg]
@@ -835,14 +778,20 @@ class ModelEnergyProperties(object):
         # set up defaults to ensure the method runs correctly
         detailed = False if raise_exception else detailed
         msgs = []
-        # perform checks for specific energy simulation rules
-        msgs.append(self.check_all_zones_have_one_hvac(False, detailed))
-        msgs.append(self.check_detailed_hvac_rooms(False, detailed))
-        msgs.append(self.check_shw_rooms_in_model(False, detailed))
-        msgs.append(self.check_maximum_elevation(1000, False, detailed))
-        msgs.append(self.check_all_air_boundaries_with_window(False, detailed))
-        msgs.append(self.check_one_vegetation_material(False, detailed))
-        msgs.append(self.check_interior_constructions_reversed(False, detailed))
+        started_cache = self._start_resource_cache()
+        try:
+            # perform checks for specific energy simulation rules
+            msgs.append(self.check_all_zones_have_one_hvac(False, detailed))
+            msgs.append(self.check_detailed_hvac_rooms(False, detailed))
+            msgs.append(self.check_shw_rooms_in_model(False, detailed))
+            msgs.append(self.check_maximum_elevation(1000, False, detailed))
+            msgs.append(self.check_all_air_boundaries_with_window(False, detailed))
+            msgs.append(self.check_one_vegetation_material(False, detailed))
+            msgs.append(self.check_interior_constructions_reversed(False, detailed))
+        finally:
+            if started_cache:
+                self._stop_resource_cache()
+
         # output a final report of errors or raise an exception
         full_msgs = [msg for msg in msgs if msg]
         if detailed:
@@ -869,16 +818,22 @@ class ModelEnergyProperties(object):
         # set up defaults to ensure the method runs correctly
         detailed = False if raise_exception else detailed
         msgs = []
-        # perform checks for duplicate identifiers
-        msgs.append(self.check_all_duplicate_identifiers(False, detailed))
-        # perform checks for specific energy simulation rules
-        msgs.append(self.check_all_zones_have_one_hvac(False, detailed))
-        msgs.append(self.check_detailed_hvac_rooms(False, detailed))
-        msgs.append(self.check_shw_rooms_in_model(False, detailed))
-        msgs.append(self.check_maximum_elevation(1000, False, detailed))
-        msgs.append(self.check_all_air_boundaries_with_window(False, detailed))
-        msgs.append(self.check_one_vegetation_material(False, detailed))
-        msgs.append(self.check_interior_constructions_reversed(False, detailed))
+        started_cache = self._start_resource_cache()
+        try:
+            # perform checks for duplicate identifiers
+            msgs.append(self.check_all_duplicate_identifiers(False, detailed))
+            # perform checks for specific energy simulation rules
+            msgs.append(self.check_all_zones_have_one_hvac(False, detailed))
+            msgs.append(self.check_detailed_hvac_rooms(False, detailed))
+            msgs.append(self.check_shw_rooms_in_model(False, detailed))
+            msgs.append(self.check_maximum_elevation(1000, False, detailed))
+            msgs.append(self.check_all_air_boundaries_with_window(False, detailed))
+            msgs.append(self.check_one_vegetation_material(False, detailed))
+            msgs.append(self.check_interior_constructions_reversed(False, detailed))
+        finally:
+            if started_cache:
+                self._stop_resource_cache()
+
         # output a final report of errors or raise an exception
         full_msgs = [msg for msg in msgs if msg]
         if detailed:
@@ -908,16 +863,22 @@ class ModelEnergyProperties(object):
         # set up defaults to ensure the method runs correctly
         detailed = False if raise_exception else detailed
         msgs = []
-        # perform checks for duplicate identifiers
-        msgs.append(self.check_duplicate_material_identifiers(False, detailed))
-        msgs.append(self.check_duplicate_construction_identifiers(False, detailed))
-        msgs.append(self.check_duplicate_construction_set_identifiers(False, detailed))
-        stl_msgs = self.check_duplicate_schedule_type_limit_identifiers(False, detailed)
-        msgs.append(stl_msgs)
-        msgs.append(self.check_duplicate_schedule_identifiers(False, detailed))
-        msgs.append(self.check_duplicate_program_type_identifiers(False, detailed))
-        msgs.append(self.check_duplicate_hvac_identifiers(False, detailed))
-        msgs.append(self.check_duplicate_shw_identifiers(False, detailed))
+        started_cache = self._start_resource_cache()
+        try:
+            # perform checks for duplicate identifiers
+            msgs.append(self.check_duplicate_material_identifiers(False, detailed))
+            msgs.append(self.check_duplicate_construction_identifiers(False, detailed))
+            msgs.append(self.check_duplicate_construction_set_identifiers(False, detailed))
+            stl_msgs = self.check_duplicate_schedule_type_limit_identifiers(False, detailed)
+            msgs.append(stl_msgs)
+            msgs.append(self.check_duplicate_schedule_identifiers(False, detailed))
+            msgs.append(self.check_duplicate_program_type_identifiers(False, detailed))
+            msgs.append(self.check_duplicate_hvac_identifiers(False, detailed))
+            msgs.append(self.check_duplicate_shw_identifiers(False, detailed))
+        finally:
+            if started_cache:
+                self._stop_resource_cache()
+
         # output a final report of errors or raise an exception
         full_msgs = [msg for msg in msgs if msg]
         if detailed:
@@ -1591,7 +1552,7 @@ class ModelEnergyProperties(object):
                             except KeyError:  # missing adjacency
                                 pass
 
-    def resolve_zones(self):
+    def resolve_zones(self, workers=None):
         """Resolve properties of Rooms across each zone such that E+ can simulate them.
 
         This method is intended as a pre-step before translating the model to EnergyPlus
@@ -1625,6 +1586,18 @@ class ModelEnergyProperties(object):
         zones from the ones that have included floor area, which will retain the
         original zone name.
 
+        Note that zones made of the same set of setpoints share a single strictest
+        Setpoint object, which is named after the first of these zones. Similarly,
+        zones with Rooms of the same ventilations, floor areas and volumes share a
+        single combined Ventilation object. So each unique zone composition is only
+        resolved once.
+
+        Args:
+            workers: An optional integer for the number of processes across which
+                the unique zone compositions will be resolved. This is only used
+                on platforms that can fork processes. If None or 1, the zones
+                are resolved in the current process. (Default: None).
+
         Returns:
             A tuple with two elements.
 
@@ -1641,6 +1614,9 @@ class ModelEnergyProperties(object):
         # set up variables to be returned from this method
         single_zones, zone_dict = [], {}
         zone_ids = {}
+        # set up variables to track the unique compositions of multi-room zones
+        zones_to_resolve = []  # zones with setpoints or ventilation to be resolved
+        setpt_tasks, vent_tasks = {}, {}  # unique setpoints and ventilations to resolve
 
         # adjust setpoints, ventilation, multipliers and exclude_floor_area
         for zone_name, rooms in self.host.zone_dict.items():
@@ -1681,6 +1657,7 @@ class ModelEnergyProperties(object):
                 flr_area = sum(r.floor_area for r in rooms)
                 z_prop = (mult, ceil_hgt, vol, flr_area, inc_flr)
                 # determine the setpoint
+                set_key = None
                 setpoints = [r.properties.energy.setpoint for r in rooms]
                 setpoints = [s for s in setpoints if s is not None]
                 if len(setpoints) == 0:
@@ -1691,33 +1668,56 @@ class ModelEnergyProperties(object):
                     setpoints = list(set(setpoints))
                     if len(setpoints) == 1:
                         set_pt = setpoints[0]  # no need to create a new setpoint object
-                    else:
-                        set_pt = setpoints[0].strictest(
-                            '{}_SetPt'.format(zone_id), setpoints)
+                    else:  # the strictest setpoint must be resolved
+                        set_pt, set_key = None, frozenset(id(s) for s in setpoints)
+                        if set_key not in setpt_tasks:
+                            setpt_tasks[set_key] = ('{}_SetPt'.format(zone_id), setpoints)
                 # determine the ventilation
-                new_vent = False
+                vent_key = None
                 vents = [r.properties.energy.ventilation for r in rooms]
                 if all(v is None for v in vents):
                     vent = None
                 elif len(set(vents)) == 1 and vents[0].flow_per_zone == 0.0:
                     vent = vents[0]  # no need to make a new custom ventilation object
-                else:
-                    new_vent = True
-                    v_obj = [v for v in vents if v is not None][0]
-                    vent = v_obj.combine_room_ventilations(
-                        '{}_Vent'.format(zone_id), rooms)
-                # edit the rooms so that the setpoint and ventilation are consistent
+                else:  # the combined ventilation must be resolved
+                    vent, vent_key = None, tuple(
+                        (id(v), r.floor_area, r.volume) for v, r in zip(vents, rooms))
+                    if vent_key not in vent_tasks:
+                        vent_tasks[vent_key] = ('{}_Vent'.format(zone_id), rooms)
+                # edit the rooms so that they are a part of the zone
                 for i, room in enumerate(rooms):
                     room.zone = zone_id
                     room.properties.energy.setpoint = set_pt
-                    if new_vent:
-                        room.properties.energy.ventilation = vent
                     if room.identifier == zone_id:
                         room.identifier = '{}_Space{}'.format(room.identifier, i)
+                if set_key is not None or vent_key is not None:
+                    zones_to_resolve.append((zone_id, set_key, vent_key))
 
             # add to the dictionary of zone objects to be created
             zone_dict[zone_id] = (rooms, z_prop, set_pt, vent)
 
+        # resolve the setpoints and ventilations of each unique zone composition
+        set_keys, vent_keys = list(setpt_tasks.keys()), list(vent_tasks.keys())
+        tasks = [(_strictest_setpoint, setpt_tasks[k]) for k in set_keys] + \
+            [(_combined_ventilation, vent_tasks[k]) for k in vent_keys]
+        results = _resolve_zone_tasks(tasks, workers)
+        set_results = dict(zip(set_keys, results[:len(set_keys)]))
+        vent_results = dict(zip(vent_keys, results[len(set_keys):]))
+
+        # edit the rooms so that the setpoint and ventilation are consistent
+        for zone_id, set_key, vent_key in zones_to_resolve:
+            rooms, z_prop, set_pt, vent = zone_dict[zone_id]
+            if set_key is not None:
+                set_pt = set_results[set_key]
+            if vent_key is not None:
+                vent = vent_results[vent_key]
+            for room in rooms:
+                if set_key is not None:
+                    room.properties.energy.setpoint = set_pt
+                if vent_key is not None:
+                    room.properties.energy.ventilation = vent
+            zone_dict[zone_id] = (rooms, z_prop, set_pt, vent)
+
         # return the list of single zones and the zone_dict
         return single_zones, zone_dict
 
@@ -1885,18 +1885,24 @@ class ModelEnergyProperties(object):
             res_obj.identifier = orignal_id
             res_obj.lock()
 
-    def apply_properties_from_dict(self, data):
+    def apply_properties_from_dict(self, data, lazy=False):
         """Apply the energy properties of a dictionary to the host Model of this object.
 
         Args:
             data: A dictionary representation of an entire honeybee-core Model.
                 Note that this dictionary must have ModelEnergyProperties in order
                 for this method to successfully apply the energy properties.
+            lazy: A boolean to note whether only the resource objects that are
+                assigned to the Model's objects should be loaded from the
+                dictionary (True) as opposed to loading all of them (False).
+                This is useful when only a few energy properties of a large
+                Model are needed. However, invalid resources that are not
+                assigned to any object will not be reported. (Default: False).
         """
         assert 'energy' in data['properties'], \
             'Dictionary possesses no ModelEnergyProperties.'
         _, constructions, construction_sets, _, schedules, program_types, hvacs, shws = \
-            self.load_properties_from_dict(data)
+            self.load_properties_from_dict(data, lazy=lazy)
 
         # collect lists of energy property dictionaries
         room_e_dicts, face_e_dicts, shd_e_dicts, ap_e_dicts, dr_e_dicts = \
@@ -1941,12 +1947,15 @@ class ModelEnergyProperties(object):
     def to_dict(self):
         """Return Model energy properties as a dictionary."""
         base = {'energy': {'type': 'ModelEnergyProperties'}}
-
-        # add all materials, constructions and construction sets to the dictionary
-        schs = self._add_constr_type_objs_to_dict(base)
-
-        # add all schedule type limits, schedules, program types, hvacs, shws to the dict
-        self._add_sched_type_objs_to_dict(base, schs)
+        started_cache = self._start_resource_cache()
+        try:
+            # add all materials, constructions and construction sets to the dictionary
+            schs = self._add_constr_type_objs_to_dict(base)
+            # add all schedule type limits, schedules, program types, hvacs, shws
+            self._add_sched_type_objs_to_dict(base, schs)
+        finally:
+            if started_cache:
+                self._stop_resource_cache()
 
         # add ventilation_simulation_control
         base['energy']['ventilation_simulation_control'] = \
@@ -2112,7 +2121,8 @@ class ModelEnergyProperties(object):
             self.electric_load_center.duplicate())
 
     @staticmethod
-    def load_properties_from_dict(data, skip_invalid=False, prioritize_abridged=False):
+    def load_properties_from_dict(data, skip_invalid=False, prioritize_abridged=False,
+                                  lazy=False):
         """Load model energy properties of a dictionary to Python objects.
 
         Loaded objects include Materials, Constructions, ConstructionSets,
@@ -2134,6 +2144,16 @@ class ModelEnergyProperties(object):
                 under the energy properties (eg. ModelEnergyProperties.schedules)
                 as opposed to using the child objects underneath their unabridged
                 specification. (Default: False).
+            lazy: A boolean to note whether the objects should only be loaded from
+                their dictionaries the first time that they are accessed (True)
+                as opposed to loading all of them upfront (False). When True,
+                each of the returned dictionaries keeps the dictionaries of the
+                objects indexed by identifier and loads an object when it is first
+                looked up, along with any objects that it references. So this is
+                much faster when only some of the objects are needed. However,
+                invalid objects are only reported when they are accessed.
+                Iterating over a dictionary or getting its length loads all of
+                its objects. (Default: False).
 
         Returns:
             A tuple with eight elements
@@ -2164,122 +2184,69 @@ class ModelEnergyProperties(object):
         """
         assert 'energy' in data['properties'], \
             'Dictionary possesses no ModelEnergyProperties.'
+        energy_dict = data['properties']['energy']
+
+        def resource_dicts(key):
+            """Get a list of resource dictionaries from the energy properties."""
+            res_dicts = energy_dict.get(key)
+            return res_dicts if res_dicts is not None else []
 
         # process all schedule type limits in the ModelEnergyProperties dictionary
-        schedule_type_limits = {}
-        if 'schedule_type_limits' in data['properties']['energy'] and \
-                data['properties']['energy']['schedule_type_limits'] is not None:
-            for t_lim in data['properties']['energy']['schedule_type_limits']:
-                try:
-                    schedule_type_limits[t_lim['identifier']] = \
-                        ScheduleTypeLimit.from_dict(t_lim)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(t_lim, e)
+        schedule_type_limits = _load_resources(
+            resource_dicts('schedule_type_limits'), ScheduleTypeLimit.from_dict,
+            skip_invalid, lazy)
         a_stls = schedule_type_limits if prioritize_abridged else None
 
         # process all schedules in the ModelEnergyProperties dictionary
-        schedules = {}
-        if 'schedules' in data['properties']['energy'] and \
-                data['properties']['energy']['schedules'] is not None:
-            for sched in data['properties']['energy']['schedules']:
-                try:
-                    if sched['type'] in SCHEDULE_TYPES:
-                        schedules[sched['identifier']] = \
-                            dict_to_schedule(sched, schedule_type_limits=a_stls)
-                    else:
-                        schedules[sched['identifier']] = \
-                            dict_abridged_to_schedule(sched, schedule_type_limits)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(sched, e)
+        def load_schedule(sched):
+            if sched['type'] in SCHEDULE_TYPES:
+                return dict_to_schedule(sched, schedule_type_limits=a_stls)
+            return dict_abridged_to_schedule(sched, schedule_type_limits)
+        schedules = _load_resources(
+            resource_dicts('schedules'), load_schedule, skip_invalid, lazy)
         a_schedules = schedules if prioritize_abridged else None
 
         # process all materials in the ModelEnergyProperties dictionary
-        materials = {}
-        if 'materials' in data['properties']['energy'] and \
-                data['properties']['energy']['materials'] is not None:
-            for mat in data['properties']['energy']['materials']:
-                try:
-                    materials[mat['identifier']] = dict_to_material(mat)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(mat, e)
+        materials = _load_resources(
+            resource_dicts('materials'), dict_to_material, skip_invalid, lazy)
         a_materials = materials if prioritize_abridged else None
 
         # process all constructions in the ModelEnergyProperties dictionary
-        constructions = {}
-        if 'constructions' in data['properties']['energy'] and \
-                data['properties']['energy']['constructions'] is not None:
-            for cnstr in data['properties']['energy']['constructions']:
-                try:
-                    if cnstr['type'] in CONSTRUCTION_TYPES:
-                        constructions[cnstr['identifier']] = \
-                            dict_to_construction(cnstr, materials=a_materials,
-                                                 schedules=a_schedules)
-                    else:
-                        constructions[cnstr['identifier']] = \
-                            dict_abridged_to_construction(cnstr, materials, schedules)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(cnstr, e)
+        def load_construction(cnstr):
+            if cnstr['type'] in CONSTRUCTION_TYPES:
+                return dict_to_construction(
+                    cnstr, materials=a_materials, schedules=a_schedules)
+            return dict_abridged_to_construction(cnstr, materials, schedules)
+        constructions = _load_resources(
+            resource_dicts('constructions'), load_construction, skip_invalid, lazy)
         a_constructions = constructions if prioritize_abridged else None
 
         # process all construction sets in the ModelEnergyProperties dictionary
-        construction_sets = {}
-        if 'construction_sets' in data['properties']['energy'] and \
-                data['properties']['energy']['construction_sets'] is not None:
-            for c_set in data['properties']['energy']['construction_sets']:
-                try:
-                    if c_set['type'] == 'ConstructionSet':
-                        construction_sets[c_set['identifier']] = \
-                            ConstructionSet.from_dict(c_set, a_constructions)
-                    else:
-                        construction_sets[c_set['identifier']] = \
-                            ConstructionSet.from_dict_abridged(c_set, constructions)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(c_set, e)
+        def load_construction_set(c_set):
+            if c_set['type'] == 'ConstructionSet':
+                return ConstructionSet.from_dict(c_set, a_constructions)
+            return ConstructionSet.from_dict_abridged(c_set, constructions)
+        construction_sets = _load_resources(
+            resource_dicts('construction_sets'), load_construction_set,
+            skip_invalid, lazy)
 
         # process all ProgramType in the ModelEnergyProperties dictionary
-        program_types = {}
-        if 'program_types' in data['properties']['energy'] and \
-                data['properties']['energy']['program_types'] is not None:
-            for p_typ in data['properties']['energy']['program_types']:
-                try:
-                    if p_typ['type'] == 'ProgramType':
-                        program_types[p_typ['identifier']] = \
-                            ProgramType.from_dict(p_typ, schedules=a_schedules)
-                    else:
-                        program_types[p_typ['identifier']] = \
-                            ProgramType.from_dict_abridged(p_typ, schedules)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(p_typ, e)
+        def load_program_type(p_typ):
+            if p_typ['type'] == 'ProgramType':
+                return ProgramType.from_dict(p_typ, schedules=a_schedules)
+            return ProgramType.from_dict_abridged(p_typ, schedules)
+        program_types = _load_resources(
+            resource_dicts('program_types'), load_program_type, skip_invalid, lazy)
 
         # process all HVAC systems in the ModelEnergyProperties dictionary
-        hvacs = {}
-        if 'hvacs' in data['properties']['energy'] and \
-                data['properties']['energy']['hvacs'] is not None:
-            for hvac in data['properties']['energy']['hvacs']:
-                hvac_class = HVAC_TYPES_DICT[hvac['type'].replace('Abridged', '')]
-                try:
-                    hvacs[hvac['identifier']] = \
-                        hvac_class.from_dict_abridged(hvac, schedules)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(hvac, e)
+        def load_hvac(hvac):
+            hvac_class = HVAC_TYPES_DICT[hvac['type'].replace('Abridged', '')]
+            return hvac_class.from_dict_abridged(hvac, schedules)
+        hvacs = _load_resources(resource_dicts('hvacs'), load_hvac, skip_invalid, lazy)
 
         # process all SHW systems in the ModelEnergyProperties dictionary
-        shws = {}
-        if 'shws' in data['properties']['energy'] and \
-                data['properties']['energy']['shws'] is not None:
-            for shw in data['properties']['energy']['shws']:
-                try:
-                    shws[shw['identifier']] = SHWSystem.from_dict(shw)
-                except Exception as e:
-                    if not skip_invalid:
-                        invalid_dict_error(shw, e)
+        shws = _load_resources(
+            resource_dicts('shws'), SHWSystem.from_dict, skip_invalid, lazy)
 
         return materials, constructions, construction_sets, schedule_type_limits, \
             schedules, program_types, hvacs, shws
@@ -2692,58 +2659,22 @@ class ModelEnergyProperties(object):
         base['energy']['global_construction_set'] = gs
 
         # add all ConstructionSets to the dictionary
-        base['energy']['construction_sets'] = []
-        construction_sets = self.construction_sets
-        for cnstr_set in construction_sets:
-            base['energy']['construction_sets'].append(cnstr_set.to_dict(abridged=True))
+        base['energy']['construction_sets'] = \
+            [cnstr_set.to_dict(abridged=True) for cnstr_set in self.construction_sets]
 
         # add all unique Constructions to the dictionary
-        room_constrs = []
-        for cnstr_set in construction_sets:
-            room_constrs.extend(cnstr_set.modified_constructions_unique)
-        mass_constrs = []
-        for room in self.host.rooms:
-            for int_mass in room.properties.energy._internal_masses:
-                constr = int_mass.construction
-                if not self._instance_in_array(constr, mass_constrs):
-                    mass_constrs.append(constr)
-        all_constrs = room_constrs + mass_constrs + \
-            self.face_constructions + self.shade_constructions
-        constructions = list(set(all_constrs))
         base['energy']['constructions'] = []
-        for cnst in constructions:
+        for cnst in self.constructions:
             try:
                 base['energy']['constructions'].append(cnst.to_dict(abridged=True))
             except TypeError:  # ShadeConstruction
                 base['energy']['constructions'].append(cnst.to_dict())
 
         # add all unique Materials to the dictionary
-        materials = []
-        for cnstr in constructions:
-            try:
-                materials.extend(cnstr.materials)
-                if cnstr.has_frame:
-                    materials.append(cnstr.frame)
-                if isinstance(cnstr, WindowConstructionShade):
-                    if cnstr.is_switchable_glazing:
-                        materials.append(cnstr.switched_glass_material)
-                    if cnstr.shade_location == 'Between':
-                        materials.append(cnstr.window_construction.materials[-2])
-            except AttributeError:
-                pass  # ShadeConstruction
-        base['energy']['materials'] = [mat.to_dict() for mat in set(materials)]
+        base['energy']['materials'] = [mat.to_dict() for mat in self.materials]
 
         # extract all of the schedules from the constructions
-        schedules = []
-        for constr in constructions:
-            if isinstance(constr, AirBoundaryConstruction):
-                self._check_and_add_schedule(constr.air_mixing_schedule, schedules)
-            elif isinstance(constr, WindowConstructionShade):
-                if constr.schedule is not None:
-                    self._check_and_add_schedule(constr.schedule, schedules)
-            elif isinstance(constr, WindowConstructionDynamic):
-                self._check_and_add_schedule(constr.schedule, schedules)
-        return schedules
+        return self.construction_schedules
 
     def _add_sched_type_objs_to_dict(self, base, schs):
         """Add type limits, schedules, program types, hvacs, shws to a base dictionary.
@@ -2754,51 +2685,165 @@ class ModelEnergyProperties(object):
                 base dictionary.
         """
         # add all unique hvacs to the dictionary
-        hvacs = self.hvacs
-        base['energy']['hvacs'] = []
-        for hvac in hvacs:
-            base['energy']['hvacs'].append(hvac.to_dict(abridged=True))
+        base['energy']['hvacs'] = [hvac.to_dict(abridged=True) for hvac in self.hvacs]
 
         # add all unique shws to the dictionary
         base['energy']['shws'] = [shw.to_dict() for shw in self.shws]
 
         # add all unique program types to the dictionary
-        program_types = self.program_types
-        base['energy']['program_types'] = []
-        for p_type in program_types:
-            base['energy']['program_types'].append(p_type.to_dict(abridged=True))
+        base['energy']['program_types'] = \
+            [p_type.to_dict(abridged=True) for p_type in self.program_types]
 
         # add all unique Schedules to the dictionary
-        p_type_scheds = []
-        for p_type in program_types:
-            for sched in p_type.schedules:
-                self._check_and_add_schedule(sched, p_type_scheds)
-        hvac_scheds = []
-        for hvac in hvacs:
-            for sched in hvac.schedules:
-                self._check_and_add_schedule(sched, hvac_scheds)
-        all_scheds = hvac_scheds + p_type_scheds + self.room_schedules + \
-            self.shade_schedules + schs
+        all_scheds = self.program_type_schedules + self.hvac_schedules + \
+            self.room_schedules + self.shade_schedules + schs
         schedules = list(set(all_scheds))
-        base['energy']['schedules'] = []
-        for sched in schedules:
-            base['energy']['schedules'].append(sched.to_dict(abridged=True))
+        base['energy']['schedules'] = \
+            [sched.to_dict(abridged=True) for sched in schedules]
 
         # add all unique ScheduleTypeLimits to the dictionary
-        type_limits = []
+        type_limits = {}
         for sched in schedules:
             t_lim = sched.schedule_type_limit
-            if t_lim is not None and not self._instance_in_array(t_lim, type_limits):
-                type_limits.append(t_lim)
+            if t_lim is not None:
+                type_limits[id(t_lim)] = t_lim
         base['energy']['schedule_type_limits'] = \
-            [s_typ.to_dict() for s_typ in set(type_limits)]
+            [s_typ.to_dict() for s_typ in set(type_limits.values())]
 
-    def _check_and_add_obj_construction(self, obj, constructions):
-        """Check if a construction is assigned to an object and add it to a list."""
-        constr = obj.properties.energy._construction
-        if constr is not None:
-            if not self._instance_in_array(constr, constructions):
-                constructions.append(constr)
+    def _start_resource_cache(self):
+        """Start caching the resources collected from the Model objects.
+
+        While the cache is active, each of the resource properties (eg. materials,
+        constructions, schedules) is collected only once and all of the resources
+        assigned to Rooms and geometry are gathered with a single loop through
+        the Model. So the cache should only be active while the Model is not
+        being edited, such as when it is being serialized or validated.
+
+        Returns:
+            True if the cache was started by this call and False if it was
+            already active. Only the caller that started the cache should
+            stop it with _stop_resource_cache.
+        """
+        if self._resource_cache is not None:
+            return False
+        self._resource_cache = {}
+        return True
+
+    def _stop_resource_cache(self):
+        """Stop caching the resources collected from the Model objects."""
+        self._resource_cache = None
+
+    @_cached_resources
+    def _room_resources(self):
+        """Get a dictionary of the resources assigned directly to the Model Rooms.
+
+        All resources are gathered with one loop through the Rooms and each
+        value of the dictionary is a list of resources that are unique by instance.
+        The keys of the dictionary are construction_sets, program_types, hvacs,
+        shws, mass_constructions and schedules.
+        """
+        con_sets, programs, mass_cons, scheds = {}, {}, {}, {}
+        hvacs, shws, found_ids = [], [], set()  # hvacs and shws keep the room order
+        for room in self.host.rooms:
+            r_props = room.properties.energy
+            if r_props._construction_set is not None:
+                con_sets[id(r_props._construction_set)] = r_props._construction_set
+            if r_props._program_type is not None:
+                programs[id(r_props._program_type)] = r_props._program_type
+            for system, sys_list in ((r_props._hvac, hvacs), (r_props._shw, shws)):
+                if system is not None and id(system) not in found_ids:
+                    found_ids.add(id(system))
+                    sys_list.append(system)
+            for int_mass in r_props._internal_masses:
+                mass_cons[id(int_mass.construction)] = int_mass.construction
+            for sched in self._room_assigned_schedules(r_props):
+                scheds[id(sched)] = sched
+        return {
+            'construction_sets': list(con_sets.values()),
+            'program_types': list(programs.values()),
+            'hvacs': hvacs,
+            'shws': shws,
+            'mass_constructions': list(mass_cons.values()),
+            'schedules': list(scheds.values())
+        }
+
+    @staticmethod
+    def _room_assigned_schedules(room_props):
+        """Get a list of all schedules assigned directly to a RoomEnergyProperties."""
+        scheds = []
+        people = room_props._people
+        if people is not None:
+            scheds.extend((people.occupancy_schedule, people.activity_schedule))
+        for load in (room_props._lighting, room_props._electric_equipment,
+                     room_props._gas_equipment, room_props._service_hot_water,
+                     room_props._infiltration):
+            if load is not None:
+                scheds.append(load.schedule)
+        ventilation = room_props._ventilation
+        if ventilation is not None and ventilation._schedule is not None:
+            scheds.append(ventilation._schedule)
+        setpoint = room_props._setpoint
+        if setpoint is not None:
+            scheds.extend((setpoint.heating_schedule, setpoint.cooling_schedule))
+            if setpoint.humidifying_schedule is not None:
+                scheds.extend(
+                    (setpoint.humidifying_schedule, setpoint.dehumidifying_schedule))
+        if room_props._window_vent_control is not None:
+            scheds.append(room_props._window_vent_control.schedule)
+        for process in room_props._process_loads:
+            scheds.append(process.schedule)
+        for fan in room_props._fans:
+            scheds.append(fan.control.schedule)
+        return scheds
+
+    @_cached_resources
+    def _geometry_resources(self):
+        """Get a dictionary of the resources assigned directly to the Model geometry.
+
+        All resources are gathered with one loop through the Model geometry and
+        each value of the dictionary is a list of resources that are unique by
+        instance. The keys of the dictionary are face_constructions (including
+        those of Apertures and Doors), shade_constructions and shade_schedules.
+        """
+        face_cons, shade_cons, shade_scheds = {}, {}, {}
+
+        def add_construction(obj, constructions):
+            constr = obj.properties.energy._construction
+            if constr is not None:
+                constructions[id(constr)] = constr
+
+        def add_shades(shades, include_schedule=True):
+            for shade in shades:
+                add_construction(shade, shade_cons)
+                sched = shade.properties.energy._transmittance_schedule
+                if include_schedule and sched is not None:
+                    shade_scheds[id(sched)] = sched
+
+        def add_face(face, include_schedule=True):
+            add_construction(face, face_cons)
+            add_shades(face.shades, include_schedule)
+            for sub_f in face.apertures + face.doors:
+                add_construction(sub_f, face_cons)
+                add_shades(sub_f.shades, include_schedule)
+
+        host = self.host
+        for room in host.rooms:
+            add_shades(room.shades)
+            for face in room.faces:
+                add_face(face)
+        # transmittance schedules of orphaned sub-face shades are not included
+        for face in host.orphaned_faces:
+            add_face(face, False)
+        for sub_f in host.orphaned_apertures + host.orphaned_doors:
+            add_construction(sub_f, face_cons)
+            add_shades(sub_f.shades, False)
+        add_shades(host.orphaned_shades)
+        add_shades(host.shade_meshes)
+        return {
+            'face_constructions': list(face_cons.values()),
+            'shade_constructions': list(shade_cons.values()),
+            'shade_schedules': list(shade_scheds.values())
+        }
 
     def _check_and_add_obj_construction_inc_parent(self, obj, constructions):
         """Check if a construction is assigned to an object and add it to a list."""
@@ -2806,13 +2851,6 @@ class ModelEnergyProperties(object):
         if not self._instance_in_array(constr, constructions):
             constructions.append(constr)
 
-    def _check_and_add_shade_schedule(self, obj, schedules):
-        """Check if a schedule is assigned to a shade and add it to a list."""
-        sched = obj.properties.energy._transmittance_schedule
-        if sched is not None:
-            if not self._instance_in_array(sched, schedules):
-                schedules.append(sched)
-
     def _check_and_add_schedule(self, sched, schedules):
         """Check if a schedule is in a list and add it if not."""
         if not self._instance_in_array(sched, schedules):
@@ -2893,3 +2931,193 @@ class ModelEnergyProperties(object):
 
     def __repr__(self):
         return 'Model Energy Properties: [host: {}]'.format(self.host.display_name)
+
+
+def _load_resources(resource_dicts, load_function, skip_invalid=False, lazy=False):
+    """Load a list of resource dictionaries into a dictionary of resource objects.
+
+    Args:
+        resource_dicts: A list of resource dictionaries, each with an identifier.
+        load_function: A function that takes one of the resource_dicts and
+            returns the resource object.
+        skip_invalid: A boolean to note whether resources that cannot be loaded
+            should be ignored (True) or whether an exception should be raised
+            about the invalid resource (False). (Default: False).
+        lazy: A boolean to note whether each resource should only be loaded when
+            it is first accessed. (Default: False).
+
+    Returns:
+        A dictionary with resource identifiers as keys and resource objects
+        as values. This is a _LazyResourceDict when lazy is True.
+    """
+    if lazy:
+        return _LazyResourceDict(resource_dicts, load_function, skip_invalid)
+    resources = {}
+    for res_dict in resource_dicts:
+        try:
+            resources[res_dict['identifier']] = load_function(res_dict)
+        except Exception as e:
+            if not skip_invalid:
+                invalid_dict_error(res_dict, e)
+    return resources
+
+
+class _LazyResourceDict(dict):
+    """A dictionary of resource objects that are loaded when they are first accessed.
+
+    The resource dictionaries are indexed by identifier and each of them is only
+    loaded into a resource object the first time that its identifier is looked
+    up. Any methods that need all of the resources (eg. iterating over the
+    dictionary or getting its length) load all of the remaining resources first.
+
+    Args:
+        resource_dicts: A list of resource dictionaries, each with an identifier.
+        load_function: A function that takes one of the resource_dicts and
+            returns the resource object.
+        skip_invalid: A boolean to note whether resources that cannot be loaded
+            should be treated as if they are not in the dictionary (True) or
+            whether an exception should be raised about the invalid resource
+            (False). (Default: False).
+    """
+
+    def __init__(self, resource_dicts, load_function, skip_invalid=False):
+        dict.__init__(self)
+        self._res_dicts = {}
+        self._identifiers = []
+        for res_dict in resource_dicts:
+            res_id = res_dict['identifier']
+            if res_id not in self._res_dicts:
+                self._identifiers.append(res_id)
+            self._res_dicts[res_id] = res_dict
+        self._load_function = load_function
+        self._skip_invalid = skip_invalid
+
+    def __missing__(self, key):
+        res_dict = self._res_dicts.pop(key)  # raises KeyError for missing resources
+        try:
+            resource = self._load_function(res_dict)
+        except Exception as e:
+            if self._skip_invalid:
+                raise KeyError(key)
+            invalid_dict_error(res_dict, e)
+        dict.__setitem__(self, key, resource)
+        return resource
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        if key not in self._res_dicts:
+            return False
+        try:
+            self[key]
+        except KeyError:  # the resource is invalid
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _load_all(self):
+        """Load all of the remaining resources in their original order."""
+        if len(self._res_dicts) == 0:
+            return
+        for res_id in self._identifiers:
+            if res_id in self._res_dicts:
+                self.get(res_id)
+        resources = [(res_id, dict.__getitem__(self, res_id))
+                     for res_id in self._identifiers if dict.__contains__(self, res_id)]
+        dict.clear(self)
+        for res_id, resource in resources:
+            dict.__setitem__(self, res_id, resource)
+
+    def __iter__(self):
+        self._load_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+
+    def copy(self):
+        self._load_all()
+        return dict(dict.items(self))
+
+
+# the tasks shared with forked processes when resolving zones in parallel
+_WORKER_TASKS = None
+
+
+def _strictest_setpoint(identifier, setpoints):
+    """Get the strictest Setpoint for a zone with several setpoints."""
+    return setpoints[0].strictest(identifier, setpoints)
+
+
+def _combined_ventilation(identifier, rooms):
+    """Get the combined Ventilation for a zone with several rooms."""
+    vents = [r.properties.energy.ventilation for r in rooms]
+    v_obj = [v for v in vents if v is not None][0]
+    return v_obj.combine_room_ventilations(identifier, rooms)
+
+
+def _resolve_zone_task_dict(task_i):
+    """Get the dictionary of a resolved zone task in a worker process."""
+    function, args = _WORKER_TASKS[task_i]
+    return function(*args).to_dict()
+
+
+def _resolve_zone_tasks(tasks, workers=None):
+    """Get the objects resulting from a list of tasks to resolve zone properties.
+
+    When workers is greater than 1, the processes are forked from the current
+    one such that each of them has an exact copy of the tasks without needing
+    to serialize them. The resulting objects are sent back to the current
+    process as dictionaries. On platforms that cannot fork processes
+    (eg. Windows), the tasks are evaluated in the current process.
+
+    Args:
+        tasks: A list of tuples where each tuple has a module-level function
+            (either _strictest_setpoint or _combined_ventilation) and a tuple
+            of arguments for the function.
+        workers: An optional integer for the number of processes to use.
+            (Default: None).
+    """
+    global _WORKER_TASKS
+    if workers is None or workers <= 1 or len(tasks) <= 1:
+        return [function(*args) for function, args in tasks]
+    try:
+        import multiprocessing
+        fork_context = multiprocessing.get_context('fork')
+    except (ImportError, AttributeError, ValueError):  # forking is not available
+        return [function(*args) for function, args in tasks]
+
+    workers = min(workers, len(tasks))
+    chunk_size = int(math.ceil(len(tasks) / float(workers * 4)))
+    _WORKER_TASKS = tasks
+    try:
+        pool = fork_context.Pool(workers)
+    finally:
+        _WORKER_TASKS = None
+    try:
+        obj_dicts = pool.map(_resolve_zone_task_dict, range(len(tasks)), chunk_size)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    return [Setpoint.from_dict(obj_dict) if function is _strictest_setpoint
+            else Ventilation.from_dict(obj_dict)
+            for (function, _), obj_dict in zip(tasks, obj_dicts)]
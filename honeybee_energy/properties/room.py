@@ -978,22 +978,14 @@ class RoomEnergyProperties(object):
                 pressure difference described in the above formula. Default 4 represents
                 typical building pressures.
         """
-        # simplify parameters
-        ext_walls, ext_roofs, ext_floors, ext_apertures, ext_doors = exterior_face_groups
-        ext_faces = ext_walls + ext_roofs + ext_floors
-        ext_openings = ext_apertures + ext_doors
-        infil_flow = self.infiltration.flow_per_exterior_area
-
-        # derive normalized flow coefficient
-        flow_cof_per_area = self.solve_norm_area_flow_coefficient(
-            infil_flow, air_density=air_density, delta_pressure=delta_pressure)
+        (ext_faces, flow_cof_per_area, flow_exp), (ext_openings, closed_cof, closed_exp) \
+            = self._infiltration_afn_components(
+                exterior_face_groups, air_density, delta_pressure)
 
         # add exterior crack leakage components
         for ext_face in ext_faces:
-            # Note: this calculation includes opening areas to be consistent with
-            # assumption behind the Infiltration Flow per Exterior Area measure.
             flow_cof = flow_cof_per_area * ext_face.area
-            ext_face.properties.energy.vent_crack = AFNCrack(flow_cof)
+            ext_face.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
 
         # add exterior opening leakage components
         for ext_opening in ext_openings:
@@ -1003,13 +995,45 @@ class RoomEnergyProperties(object):
                 ext_opening.properties.energy.vent_opening = \
                     VentilationOpening(fraction_area_operable=0.0)
             vent_opening = ext_opening.properties.energy.vent_opening
-            # Note: can be calculated with solve_norm_perimeter_flow_coefficient
-            # but it adds an additional degree of freedom when attempting to calculate
-            # reference delta pressure from simulated delta pressure and infiltration
-            # data. Setting to zero simplifies assumptions by constraining infiltration
-            # to just area-based method.
-            vent_opening.flow_coefficient_closed = 0.0
-            vent_opening.flow_exponent_closed = 0.5
+            vent_opening.flow_coefficient_closed = closed_cof
+            vent_opening.flow_exponent_closed = closed_exp
+
+    def _infiltration_afn_components(self, exterior_face_groups, air_density=1.2041,
+                                     delta_pressure=4):
+        """Get the exterior AirflowNetwork leakage components of the room's infiltration.
+
+        Args:
+            exterior_face_groups: A tuple with five types of the exterior room
+                envelope, which is the first output of envelope_components_by_type.
+            air_density: Air density in kg/m3. (Default: 1.2041).
+            delta_pressure: Reference air pressure difference across the building
+                envelope orifice in Pascals. (Default: 4).
+
+        Returns:
+            A tuple with two items.
+
+            -   cracks - A tuple with the exterior Faces that get an AFNCrack,
+                their flow coefficient per unit area and their flow exponent.
+                The area of each Face includes the area of its openings.
+
+            -   openings - A tuple with the exterior Apertures and Doors that
+                get VentilationOpening leakage parameters, their flow coefficient
+                when closed and their flow exponent when closed.
+        """
+        ext_walls, ext_roofs, ext_floors, ext_apertures, ext_doors = exterior_face_groups
+        flow_cof_per_area = self.solve_norm_area_flow_coefficient(
+            self.infiltration.flow_per_exterior_area,
+            air_density=air_density, delta_pressure=delta_pressure)
+        # Note: the crack areas include opening areas to be consistent with
+        # assumption behind the Infiltration Flow per Exterior Area measure.
+        cracks = (ext_walls + ext_roofs + ext_floors, flow_cof_per_area, 0.65)
+        # Note: the closed openings can be calculated with
+        # solve_norm_perimeter_flow_coefficient but it adds an additional degree of
+        # freedom when attempting to calculate reference delta pressure from simulated
+        # delta pressure and infiltration data. Setting to zero simplifies assumptions
+        # by constraining infiltration to just area-based method.
+        openings = (ext_apertures + ext_doors, 0.0, 0.5)
+        return cracks, openings
 
     def envelope_components_by_type(self):
         """Get groups for room envelope components by boundary condition and type.
@@ -2,6 +2,10 @@
 import re
 import os
 
+# patterns used to remove comments from IDF text
+_COMMENT_PATTERN = re.compile(r'!.*\n')
+_INLINE_COMMENT_PATTERN = re.compile(r'!.*')
+
 
 def clean_idf_file_contents(idf_file):
     """Get the contents of an IDF file without any commented lines.
@@ -40,9 +44,68 @@ def parse_idf_string(idf_string, expected_type=None):
     if expected_type is not None:
         assert idf_string.startswith(expected_type), 'Expected EnergyPlus {} ' \
             'but received a different object: {}'.format(expected_type, idf_string)
-    idf_strings = idf_string.split(';')
-    assert len(idf_strings) == 2, 'Received more than one object in idf_string.'
-    idf_string = re.sub(r'!.*\n', '', idf_strings[0])
+    assert idf_string.count(';') == 1, 'Received more than one object in idf_string.'
+    idf_string = idf_string[:idf_string.index(';')]
+    if '!' in idf_string:  # remove any comments
+        idf_string = _COMMENT_PATTERN.sub('', idf_string)
     ep_fields = [e_str.strip() for e_str in idf_string.split(',')]
     ep_fields.pop(0)  # remove the EnergyPlus object name
     return ep_fields
+
+
+def idf_objects_by_type(idf_file):
+    """Get a dictionary of all objects in an IDF file organized by their type.
+
+    The file is parsed in a single pass such that the objects of several
+    different types can be extracted from the result without re-reading the
+    file for each type.
+
+    Args:
+        idf_file: A path to an IDF file containing objects to be parsed.
+
+    Returns:
+        A dictionary where the keys are the upper-case EnergyPlus object types
+        (ie. WINDOWMATERIAL:GLAZING) and the values are lists of IDF strings
+        for each object of that type in the order they appear in the file. All
+        comments are removed from the IDF strings.
+    """
+    assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
+    with open(idf_file, 'r') as ep_file:
+        file_contents = _INLINE_COMMENT_PATTERN.sub('', ep_file.read())
+    idf_objects = {}
+    for obj_str in file_contents.split(';'):
+        obj_str = obj_str.strip()
+        if not obj_str:
+            continue
+        obj_type = obj_str.split(',', 1)[0].strip().upper()
+        try:
+            idf_objects[obj_type].append(obj_str + ';')
+        except KeyError:
+            idf_objects[obj_type] = [obj_str + ';']
+    return idf_objects
+
+
+def idf_objects_of_type(idf_objects, object_types):
+    """Get a list of IDF strings for certain object types in a parsed IDF file.
+
+    Args:
+        idf_objects: A dictionary of IDF objects output from idf_objects_by_type.
+        object_types: A list of EnergyPlus object types for which IDF strings
+            will be returned (ie. Schedule:Day:Interval). The matching is
+            case-insensitive. Types ending with a colon (ie. WindowMaterial:)
+            will match all object types starting with that text.
+
+    Returns:
+        A list of IDF strings for all objects of the input types, grouped in
+        the order of the input object_types.
+    """
+    obj_strs = []
+    for obj_type in object_types:
+        obj_type = obj_type.upper()
+        if obj_type.endswith(':'):
+            for o_type, o_strs in idf_objects.items():
+                if o_type.startswith(obj_type):
+                    obj_strs.extend(o_strs)
+        else:
+            obj_strs.extend(idf_objects.get(obj_type, ()))
+    return obj_strs
@@ -0,0 +1,79 @@
+"""Utilities for writing tables of simulation results into columnar binary files.
+
+Each table is given as a list of columns where each column is a tuple with
+three items: the name of the column, the type of the column (either 'int',
+'float' or 'str') and a list of the values in the column.
+"""
+import sys
+import struct
+import zipfile
+from array import array
+
+# the NumPy array description of each column type
+_NPY_DESCR = {'int': '<i4', 'float': '<f8'}
+
+
+def write_npz(file_path, columns):
+    """Write a table into an uncompressed NumPy .npz file.
+
+    The file is written without NumPy such that it can be created in any
+    Python environment. Each column is written as a one-dimensional .npy array
+    under the name of the column, which means that the table can be loaded
+    with numpy.load(file_path) and that only the requested columns will be
+    read from the file.
+
+    Args:
+        file_path: The path to the .npz file to be written.
+        columns: A list of tuples for the columns of the table.
+    """
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_STORED) as npz_file:
+        for col_name, col_type, values in columns:
+            npz_file.writestr('{}.npy'.format(col_name), _npy_bytes(col_type, values))
+
+
+def write_parquet(file_path, columns):
+    """Write a table into a Parquet file.
+
+    Note that this method requires the pyarrow package to be installed.
+
+    Args:
+        file_path: The path to the .parquet file to be written.
+        columns: A list of tuples for the columns of the table.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError('pyarrow must be installed to write Parquet files. '
+                          'Write NPZ files instead. {}'.format(e))
+    pa_types = {
+        'int': pyarrow.int32(), 'float': pyarrow.float64(), 'str': pyarrow.string()
+    }
+    arrays = [pyarrow.array(values, type=pa_types[col_type])
+              for _, col_type, values in columns]
+    table = pyarrow.Table.from_arrays(arrays, names=[col[0] for col in columns])
+    pyarrow.parquet.write_table(table, file_path)
+
+
+def _npy_bytes(col_type, values):
+    """Get the bytes of a .npy file for a one-dimensional array of values."""
+    if col_type == 'str':
+        values = [str(val) for val in values]
+        width = max([len(val) for val in values] + [1])
+        descr = '<U{}'.format(width)
+        data = b''.join(val.encode('utf-32-le').ljust(width * 4, b'\0')
+                        for val in values)
+    else:
+        arr = array('i' if col_type == 'int' else 'd', values)
+        if sys.byteorder == 'big':
+            arr.byteswap()
+        descr = _NPY_DESCR[col_type]
+        data = arr.tobytes() if hasattr(arr, 'tobytes') else arr.tostring()
+
+    # build the header of version 1.0 of the .npy format
+    header = "{{'descr': '{}', 'fortran_order': False, 'shape': ({},), }}".format(
+        descr, len(values))
+    pad_count = -(10 + len(header) + 1) % 64
+    header = header + ' ' * pad_count + '\n'
+    magic = b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header))
+    return magic + header.encode('latin1') + data
@@ -0,0 +1,115 @@
+"""Utilities for processing many EnergyPlus SQL result files at once."""
+import os
+import math
+from functools import partial
+from collections import OrderedDict
+
+
+def sql_paths_from_results(sql_results):
+    """Get a list of SQL file paths from files or folders containing them.
+
+    Args:
+        sql_results: The file path of a SQL result file or a list of SQL result
+            files. This can also be a directory or list of directories, in
+            which case all files ending in .sql will be included.
+
+    Returns:
+        A list of paths to SQL files.
+    """
+    if not isinstance(sql_results, (list, tuple)):
+        sql_results = [sql_results]
+    sql_paths = []
+    for file_or_folder_path in sql_results:
+        if os.path.isdir(file_or_folder_path):
+            for file_path in os.listdir(file_or_folder_path):
+                if file_path.endswith('.sql'):
+                    sql_paths.append(os.path.join(file_or_folder_path, file_path))
+        else:
+            sql_paths.append(file_or_folder_path)
+    return sql_paths
+
+
+def map_sql_files(function, sql_paths, workers=None):
+    """Apply a function to several SQL files, optionally using a pool of processes.
+
+    Failing to process one of the files does not stop the others from being
+    processed. Instead, the error message is returned in place of the result
+    of the file. On platforms that cannot fork processes (eg. Windows), the
+    files are processed in the current process.
+
+    Args:
+        function: A module-level function that takes the path to a SQL file
+            as its only argument and returns the partial result of the file.
+        sql_paths: A list of paths to SQL files.
+        workers: An optional integer for the number of processes across which
+            the files will be processed. If None or 1, the files are processed
+            in the current process. (Default: None).
+
+    Returns:
+        A list with a tuple for each of the sql_paths, in the same order as
+        the input paths. Each tuple has two items.
+
+        -   result -- The result of the function for the file. Will be None
+            if the file failed to be processed.
+
+        -   error -- Text for the error that occurred while processing the file.
+            Will be None if the file was processed successfully.
+    """
+    safe_function = partial(_call_on_sql_file, function)
+    if workers is None or workers <= 1 or len(sql_paths) <= 1:
+        return [safe_function(sql_path) for sql_path in sql_paths]
+    try:
+        import multiprocessing
+        fork_context = multiprocessing.get_context('fork')
+    except (ImportError, AttributeError, ValueError):  # forking is not available
+        return [safe_function(sql_path) for sql_path in sql_paths]
+
+    workers = min(workers, len(sql_paths))
+    chunk_size = int(math.ceil(len(sql_paths) / float(workers * 4)))
+    pool = fork_context.Pool(workers)
+    try:
+        results = pool.map(safe_function, sql_paths, chunk_size)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    return results
+
+
+def split_sql_errors(sql_paths, sql_results):
+    """Split the output of map_sql_files into successful results and errors.
+
+    A ValueError is raised if all of the SQL files failed to be processed.
+
+    Args:
+        sql_paths: A list of paths to SQL files.
+        sql_results: The list of tuples output by map_sql_files.
+
+    Returns:
+        A tuple with two items.
+
+        -   results -- A list of the results of the SQL files that were
+            processed successfully.
+
+        -   errors -- An OrderedDict with the path to each SQL file that failed
+            to be processed and the error that occurred.
+    """
+    results, errors = [], OrderedDict()
+    for sql_path, (result, error) in zip(sql_paths, sql_results):
+        if error is None:
+            results.append(result)
+        else:
+            errors[sql_path] = error
+    if len(errors) != 0 and len(results) == 0:
+        msg = 'Failed to read all of the .sql files:\n{}'.format(
+            '\n'.join('{}: {}'.format(path, err) for path, err in errors.items()))
+        raise ValueError(msg)
+    return results, errors
+
+
+def _call_on_sql_file(function, sql_path):
+    """Get a tuple of the result of a function and an error message for a SQL file."""
+    try:
+        return function(sql_path), None
+    except Exception as e:
+        return None, '{}: {}'.format(e.__class__.__name__, e)
@@ -1,9 +1,11 @@
 """Module for converting EnergyPlus results into operational carbon emissions."""
-import os
 from collections import OrderedDict
+from functools import partial
 
 from ladybug.sql import SQLiteResult
 
+from ._sqlutil import sql_paths_from_results, map_sql_files, split_sql_errors
+
 
 def emissions_region(location):
     """Get the region of carbon emissions associated with a location.
@@ -142,7 +144,7 @@ def future_electricity_emissions(location, year=2030):
         return region_map[region_str[0]][yr_i]
 
 
-def emissions_from_sql(sql_results, electricity_emissions):
+def emissions_from_sql(sql_results, electricity_emissions, workers=None):
     """Get a dictionary of Carbon Emissions Intensity results from EnergyPlus SQLs.
 
     This input emissions of electricity will be used to compute carbon intensity
@@ -172,6 +174,11 @@ def emissions_from_sql(sql_results, electricity_emissions):
             * 100-200 kg/MWh - for grids with majority renewable/nuclear composition
             * 0-100 kg/MWh - for grids with renewables and storage
 
+        workers: An optional integer for the number of processes across which
+            the SQL files will be read. This is useful when there are many SQL
+            files to be aggregated. If None or 1, the files are read in the
+            current process. (Default: None).
+
     Returns:
         A dictionary with several keys.
 
@@ -194,61 +201,38 @@ def emissions_from_sql(sql_results, electricity_emissions):
 
         -   sources -- A dictionary with the carbon intensity for each of the energy
             sources of the building (eg. electricity, natural_gas, district_heat, etc.).
+
+        -   errors -- A dictionary with the path to each SQL file that failed to
+            be read and the error that occurred. Results are computed from
+            the other files. This key is only present when some files failed.
+            If all of the files failed, a ValueError is raised.
     """
-    # create a list of sql file path that were either passed directly or are
-    # contained within passed folders
-    if not isinstance(sql_results, (list, tuple)):
-        sql_results = [sql_results]
-    sql_paths = []
-    for file_or_folder_path in sql_results:
-        if os.path.isdir(file_or_folder_path):
-            for file_path in os.listdir(file_or_folder_path):
-                if file_path.endswith('.sql'):
-                    sql_paths.append(os.path.join(file_or_folder_path, file_path))
-        else:
-            sql_paths.append(file_or_folder_path)
-
-    # set initial values that will be computed based on results
+    # get the carbon emissions of each of the sql files that were either passed
+    # directly or are contained within passed folders
+    sql_paths = sql_paths_from_results(sql_results)
+    file_emissions = partial(_emissions_from_sql_file, electricity_emissions)
+    sql_carbs = map_sql_files(file_emissions, sql_paths, workers)
+    sql_carbs, errors = split_sql_errors(sql_paths, sql_carbs)
+
+    # add together the carbon emissions of all of the sql files
     total_floor_area, conditioned_floor_area = 0, 0
     tot_elec, tot_gas, tot_pro, tot_oil, tot_heat, tot_cool = 0, 0, 0, 0, 0, 0
     end_uses = OrderedDict()
-
-    # loop through the sql files and add the energy use
-    for sql_path in sql_paths:
-        # parse the SQL file
-        sql_obj = SQLiteResult(sql_path)
-        # get the total floor area of the model
-        area_dict = sql_obj.tabular_data_by_name('Building Area')
-        areas = tuple(area_dict.values())
-        total_floor_area += areas[0][0]
-        conditioned_floor_area += areas[1][0]
-        # get the energy use
-        eui_dict = sql_obj.tabular_data_by_name('End Uses By Subcategory')
-        for category, vals in eui_dict.items():
-            total_use = sum([val for val in vals[:12]])
-            if total_use != 0:
-                elec = (vals[0] * electricity_emissions) / 1000
-                gas = (vals[1] * 277.358) / 1000
-                pro = (vals[7] * 323.897) / 1000
-                oil = (vals[6] * 294.962) / 1000
-                heat = (vals[11] * 369.811) / 1000
-                cool = (vals[10] * (electricity_emissions / 3.5)) / 1000
-
-                tot_elec += elec
-                tot_gas += gas
-                tot_pro += pro
-                tot_oil += oil
-                tot_heat += heat
-                tot_cool += cool
-                carb = sum((elec, gas, pro, oil, heat, cool))
-
-                cat, sub_cat = category.split(':')
-                eu_cat = cat if sub_cat == 'General' or sub_cat == 'Other' \
-                    else sub_cat
-                try:
-                    end_uses[eu_cat] += carb
-                except KeyError:
-                    end_uses[eu_cat] = carb
+    for sql_carb in sql_carbs:
+        total_floor_area += sql_carb[0]
+        conditioned_floor_area += sql_carb[1]
+        elec, gas, pro, oil, heat, cool = sql_carb[2]
+        tot_elec += elec
+        tot_gas += gas
+        tot_pro += pro
+        tot_oil += oil
+        tot_heat += heat
+        tot_cool += cool
+        for eu_cat, carb in sql_carb[3].items():
+            try:
+                end_uses[eu_cat] += carb
+            except KeyError:
+                end_uses[eu_cat] = carb
 
     # compute the total carbon emissions
     sources = OrderedDict([
@@ -287,4 +271,59 @@ def emissions_from_sql(sql_results, electricity_emissions):
         result_dict['sources'] = OrderedDict(
             [(key, 0.0) for key, val in sources.items() if val != 0]
         )
+    if errors:
+        result_dict['errors'] = errors
     return result_dict
+
+
+def _emissions_from_sql_file(electricity_emissions, sql_path):
+    """Get the floor areas and carbon emissions of a single EnergyPlus SQL file.
+
+    Args:
+        electricity_emissions: A number for the electric grid carbon emissions
+            in kg CO2 per MWh.
+        sql_path: The file path of a SQL result file.
+
+    Returns:
+        A tuple with the total floor area, the conditioned floor area, a tuple
+        of the carbon emissions of each energy source and an OrderedDict of
+        the carbon emissions of each end use.
+    """
+    # parse the SQL file
+    sql_obj = SQLiteResult(sql_path)
+    # get the total floor area of the model
+    area_dict = sql_obj.tabular_data_by_name('Building Area')
+    areas = tuple(area_dict.values())
+    total_floor_area = areas[0][0]
+    conditioned_floor_area = areas[1][0]
+    # get the energy use
+    tot_elec, tot_gas, tot_pro, tot_oil, tot_heat, tot_cool = 0, 0, 0, 0, 0, 0
+    end_uses = OrderedDict()
+    eui_dict = sql_obj.tabular_data_by_name('End Uses By Subcategory')
+    for category, vals in eui_dict.items():
+        total_use = sum([val for val in vals[:12]])
+        if total_use != 0:
+            elec = (vals[0] * electricity_emissions) / 1000
+            gas = (vals[1] * 277.358) / 1000
+            pro = (vals[7] * 323.897) / 1000
+            oil = (vals[6] * 294.962) / 1000
+            heat = (vals[11] * 369.811) / 1000
+            cool = (vals[10] * (electricity_emissions / 3.5)) / 1000
+
+            tot_elec += elec
+            tot_gas += gas
+            tot_pro += pro
+            tot_oil += oil
+            tot_heat += heat
+            tot_cool += cool
+            carb = sum((elec, gas, pro, oil, heat, cool))
+
+            cat, sub_cat = category.split(':')
+            eu_cat = cat if sub_cat == 'General' or sub_cat == 'Other' \
+                else sub_cat
+            try:
+                end_uses[eu_cat] += carb
+            except KeyError:
+                end_uses[eu_cat] = carb
+    sources = (tot_elec, tot_gas, tot_pro, tot_oil, tot_heat, tot_cool)
+    return total_floor_area, conditioned_floor_area, sources, end_uses
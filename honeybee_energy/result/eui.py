@@ -1,11 +1,12 @@
 """Module to parse End Use Intensity (EUI) from EnergyPlus results."""
-import os
 from collections import OrderedDict
 
 from ladybug.sql import SQLiteResult
 
+from ._sqlutil import sql_paths_from_results, map_sql_files, split_sql_errors
 
-def eui_from_sql(sql_results, absolute=False):
+
+def eui_from_sql(sql_results, absolute=False, workers=None):
     """Get a dictionary of End Use Intensity (EUI) results from EnergyPlus SQLs.
 
     Args:
@@ -19,6 +20,10 @@ def eui_from_sql(sql_results, absolute=False):
             Setting this to "True" can be useful when the model contains no
             floor area for which an intensity metric can be computed but there
             is still energy use to be evaluated. (Default: False).
+        workers: An optional integer for the number of processes across which
+            the SQL files will be read. This is useful when there are many SQL
+            files to be aggregated. If None or 1, the files are read in the
+            current process. (Default: None).
 
     Returns:
         A dictionary with several keys.
@@ -40,50 +45,30 @@ def eui_from_sql(sql_results, absolute=False):
         -   end_uses -- A dictionary with the end use intensity for each of the end
             uses of the building (eg. heating, cooling, lighting, etc.). Units
             are kWh/m2 unless absolute is True in which case units are kWh.
+
+        -   errors -- A dictionary with the path to each SQL file that failed to
+            be read and the error that occurred. Results are computed from
+            the other files. This key is only present when some files failed.
+            If all of the files failed, a ValueError is raised.
     """
-    # set initial values that will be computed based on results
+    # get the energy use of each of the sql files that were either passed
+    # directly or are contained within passed folders
+    sql_paths = sql_paths_from_results(sql_results)
+    sql_euis = map_sql_files(_eui_from_sql_file, sql_paths, workers)
+    sql_euis, errors = split_sql_errors(sql_paths, sql_euis)
+
+    # add together the energy use of all of the sql files
     total_floor_area, conditioned_floor_area, total_energy = 0, 0, 0
     end_uses = OrderedDict()
-
-    # create a list of sql file path that were either passed directly or are
-    # contained within passed folders
-    if not isinstance(sql_results, (list, tuple)):
-        sql_results = [sql_results]
-    sql_paths = []
-    for file_or_folder_path in sql_results:
-        if os.path.isdir(file_or_folder_path):
-            for file_path in os.listdir(file_or_folder_path):
-                if file_path.endswith('.sql'):
-                    sql_paths.append(os.path.join(file_or_folder_path, file_path))
-        else:
-            sql_paths.append(file_or_folder_path)
-
-    # loop through the sql files and add the energy use
-    for sql_path in sql_paths:
-        # parse the SQL file
-        sql_obj = SQLiteResult(sql_path)
-        # get the total floor area of the model
-        area_dict = sql_obj.tabular_data_by_name('Building Area')
-        areas = tuple(area_dict.values())
-        try:
-            total_floor_area += areas[0][0]
-            conditioned_floor_area += areas[1][0]
-        except IndexError:
-            msg = 'Failed to find the "Building Area" table in the .sql file.'
-            raise ValueError(msg)
-        # get the energy use
-        eui_dict = sql_obj.tabular_data_by_name('End Uses By Subcategory')
-        for category, vals in eui_dict.items():
-            total_use = sum([val for val in vals[:12]])
-            if total_use != 0:
-                total_energy += total_use
-                cat, sub_cat = category.split(':')
-                eu_cat = cat if sub_cat == 'General' or sub_cat == 'Other' \
-                    else sub_cat
-                try:
-                    end_uses[eu_cat] += total_use
-                except KeyError:
-                    end_uses[eu_cat] = total_use
+    for sql_eui in sql_euis:
+        total_floor_area += sql_eui[0]
+        conditioned_floor_area += sql_eui[1]
+        total_energy += sql_eui[2]
+        for eu_cat, total_use in sql_eui[3].items():
+            try:
+                end_uses[eu_cat] += total_use
+            except KeyError:
+                end_uses[eu_cat] = total_use
 
     # assemble all of the results into a final dictionary
     if absolute:
@@ -114,4 +99,45 @@ def eui_from_sql(sql_results, absolute=False):
             'total_energy': round(total_energy, 3)
         }
         result_dict['end_uses'] = OrderedDict([(key, 0.0) for key in end_uses.keys()])
+    if errors:
+        result_dict['errors'] = errors
     return result_dict
+
+
+def _eui_from_sql_file(sql_path):
+    """Get the floor areas and energy use of a single EnergyPlus SQL file.
+
+    Args:
+        sql_path: The file path of a SQL result file.
+
+    Returns:
+        A tuple with the total floor area, the conditioned floor area, the
+        total energy and an OrderedDict of the energy of each end use.
+    """
+    # parse the SQL file
+    sql_obj = SQLiteResult(sql_path)
+    # get the total floor area of the model
+    area_dict = sql_obj.tabular_data_by_name('Building Area')
+    areas = tuple(area_dict.values())
+    try:
+        total_floor_area = areas[0][0]
+        conditioned_floor_area = areas[1][0]
+    except IndexError:
+        msg = 'Failed to find the "Building Area" table in the .sql file.'
+        raise ValueError(msg)
+    # get the energy use
+    total_energy = 0
+    end_uses = OrderedDict()
+    eui_dict = sql_obj.tabular_data_by_name('End Uses By Subcategory')
+    for category, vals in eui_dict.items():
+        total_use = sum([val for val in vals[:12]])
+        if total_use != 0:
+            total_energy += total_use
+            cat, sub_cat = category.split(':')
+            eu_cat = cat if sub_cat == 'General' or sub_cat == 'Other' \
+                else sub_cat
+            try:
+                end_uses[eu_cat] += total_use
+            except KeyError:
+                end_uses[eu_cat] = total_use
+    return total_floor_area, conditioned_floor_area, total_energy, end_uses
@@ -1,9 +1,10 @@
 """Module to parse on-site electricity generation from EnergyPlus results."""
-import os
 from ladybug.sql import SQLiteResult
 
+from ._sqlutil import sql_paths_from_results, map_sql_files, split_sql_errors
 
-def generation_summary_from_sql(sql_results):
+
+def generation_summary_from_sql(sql_results, workers=None):
     """Get a dictionary of electricity generation results from EnergyPlus SQLs.
 
     Args:
@@ -13,6 +14,10 @@ def generation_summary_from_sql(sql_results):
             Lastly, it can be a directory or list of directories containing results,
             in which case, electricity generation will be calculated form all files
             ending in .sql.
+        workers: An optional integer for the number of processes across which
+            the SQL files will be read. This is useful when there are many SQL
+            files to be aggregated. If None or 1, the files are read in the
+            current process. (Default: None).
 
     Returns:
         A dictionary with several keys.
@@ -33,39 +38,26 @@ def generation_summary_from_sql(sql_results):
         -   consumption_purchased -- A negative number for the total electricity
             that was purchased from the electric utility as there was no on-site
             power at the time to meet the energy consumption demand. Units are kWh.
+
+        -   errors -- A dictionary with the path to each SQL file that failed to
+            be read and the error that occurred. Results are computed from
+            the other files. This key is only present when some files failed.
+            If all of the files failed, a ValueError is raised.
     """
-    # set initial values that will be computed based on results
+    # get the electricity of each of the sql files that were either passed
+    # directly or are contained within passed folders
+    sql_paths = sql_paths_from_results(sql_results)
+    sql_gens = map_sql_files(_generation_from_sql_file, sql_paths, workers)
+    sql_gens, errors = split_sql_errors(sql_paths, sql_gens)
+
+    # add together the energy production / consumption of all of the sql files
     total_production, total_consumption = 0, 0
     production_surplus_sold, consumption_purchased = 0, 0
-
-    # create a list of sql file path that were either passed directly or are
-    # contained within passed folders
-    if not isinstance(sql_results, (list, tuple)):
-        sql_results = [sql_results]
-    sql_paths = []
-    for file_or_folder_path in sql_results:
-        if os.path.isdir(file_or_folder_path):
-            for file_path in os.listdir(file_or_folder_path):
-                if file_path.endswith('.sql'):
-                    sql_paths.append(os.path.join(file_or_folder_path, file_path))
-        else:
-            sql_paths.append(file_or_folder_path)
-
-    # loop through the sql files and add the energy production / consumption
-    for sql_path in sql_paths:
-        # parse the SQL file
-        sql_obj = SQLiteResult(sql_path)
-        # get the energy use
-        gen_dict = sql_obj.tabular_data_by_name('Electric Loads Satisfied')
-        for category, vals in gen_dict.items():
-            if category == 'Total On-Site Electric Sources':
-                total_production += vals[0]
-            elif category == 'Total Electricity End Uses':
-                total_consumption += vals[0]
-            elif category == 'Electricity Coming From Utility':
-                consumption_purchased += vals[0]
-            elif category == 'Surplus Electricity Going To Utility':
-                production_surplus_sold += vals[0]
+    for sql_gen in sql_gens:
+        total_production += sql_gen[0]
+        total_consumption += sql_gen[1]
+        consumption_purchased += sql_gen[2]
+        production_surplus_sold += sql_gen[3]
 
     # assemble all of the results into a final dictionary
     result_dict = {
@@ -75,9 +67,40 @@ def generation_summary_from_sql(sql_results):
         'production_surplus_sold': round(production_surplus_sold, 3),
         'consumption_purchased': round(-consumption_purchased, 3)
     }
+    if errors:
+        result_dict['errors'] = errors
     return result_dict
 
 
+def _generation_from_sql_file(sql_path):
+    """Get the electricity production and consumption of a single EnergyPlus SQL file.
+
+    Args:
+        sql_path: The file path of a SQL result file.
+
+    Returns:
+        A tuple with the total production, the total consumption, the consumption
+        purchased and the production surplus sold.
+    """
+    total_production, total_consumption = 0, 0
+    production_surplus_sold, consumption_purchased = 0, 0
+    # parse the SQL file
+    sql_obj = SQLiteResult(sql_path)
+    # get the energy use
+    gen_dict = sql_obj.tabular_data_by_name('Electric Loads Satisfied')
+    for category, vals in gen_dict.items():
+        if category == 'Total On-Site Electric Sources':
+            total_production += vals[0]
+        elif category == 'Total Electricity End Uses':
+            total_consumption += vals[0]
+        elif category == 'Electricity Coming From Utility':
+            consumption_purchased += vals[0]
+        elif category == 'Surplus Electricity Going To Utility':
+            production_surplus_sold += vals[0]
+    return total_production, total_consumption, \
+        consumption_purchased, production_surplus_sold
+
+
 def generation_data_from_sql(sql_results):
     """Get a data collections of electricity production and consumption.
 
@@ -104,16 +127,7 @@ def generation_data_from_sql(sql_results):
 
     # create a list of sql file path that were either passed directly or are
     # contained within passed folders
-    if not isinstance(sql_results, (list, tuple)):
-        sql_results = [sql_results]
-    sql_paths = []
-    for file_or_folder_path in sql_results:
-        if os.path.isdir(file_or_folder_path):
-            for file_path in os.listdir(file_or_folder_path):
-                if file_path.endswith('.sql'):
-                    sql_paths.append(os.path.join(file_or_folder_path, file_path))
-        else:
-            sql_paths.append(file_or_folder_path)
+    sql_paths = sql_paths_from_results(sql_results)
 
     # loop through the sql files and add the energy production / consumption
     for sql_path in sql_paths:
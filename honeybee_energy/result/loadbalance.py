@@ -14,7 +14,7 @@ from honeybee.typing import float_positive
 from honeybee.boundarycondition import Outdoors, Ground, Surface
 
 from ..boundarycondition import Adiabatic, OtherSideTemperature
-from .match import match_rooms_to_data, match_faces_to_data
+from .match import match_rooms_to_data, match_faces_to_data, ResultIndex
 
 
 class LoadBalance(object):
@@ -245,8 +245,8 @@ class LoadBalance(object):
             self._match_face_input(surface_flow_data, rooms)
         if _win_f is not None and self._solar is not None:
             # compute just the conduction loss/gain from the windows
-            self._window_conduction = _win_f - self._solar
-            self._window_conduction.header.metadata['type'] = 'Window Conduction'
+            self._window_conduction = self._subtract_collection(
+                _win_f, self._solar, 'Window Conduction')
         # when using all of the rooms, reset the property
         if use_all_solar:
             self._rooms = rooms
@@ -398,8 +398,8 @@ class LoadBalance(object):
         """Get a data collection for all conduction loss/gain of the load balance."""
         if self._conduction is None:
             if self.window_conduction is not None and self.opaque_conduction is not None:
-                self._conduction = self.window_conduction + self.opaque_conduction
-                self._conduction.header.metadata['type'] = 'Conduction'
+                self._conduction = self._sum_collections(
+                    (self.window_conduction, self.opaque_conduction), 'Conduction')
         return self._conduction
 
     @property
@@ -413,10 +413,9 @@ class LoadBalance(object):
         if self._opaque_conduction is None:
             if self.wall_conduction is not None and self.roof_conduction is not None \
                     and self.floor_conduction is not None:
-                self._opaque_conduction = self.wall_conduction + \
-                    self.roof_conduction + self.floor_conduction
-                self._opaque_conduction = self._opaque_conduction.duplicate()
-                self._opaque_conduction.header.metadata['type'] = 'Opaque Conduction'
+                self._opaque_conduction = self._sum_collections(
+                    (self.wall_conduction, self.roof_conduction, self.floor_conduction),
+                    'Opaque Conduction')
         return self._opaque_conduction
 
     @property
@@ -441,11 +440,8 @@ class LoadBalance(object):
         if self._storage is None:
             other_terms = self.load_balance_terms()
             if len(other_terms) != 0:
-                _storage = other_terms[0]
-                for coll in other_terms[1:]:
-                    _storage = _storage + coll
-                self._storage = -_storage.duplicate()  # dup to avoid editing header
-                self._storage.header.metadata['type'] = 'Storage'
+                self._storage = self._sum_collections(
+                    other_terms, 'Storage', negate=True)
         return self._storage
 
     @property
@@ -490,11 +486,13 @@ class LoadBalance(object):
         if self._air_storage is None:
             air_storage = self.storage
             if air_storage is not None:
-                others = [self.wall_storage, self.floor_storage, self.window_storage]
-                for coll in others:
-                    air_storage = air_storage - coll
-                self._air_storage = air_storage.duplicate()  # dup to avoid editing header
-                self._air_storage.header.metadata['type'] = 'Air Storage'
+                values = [a - w - f - win for a, w, f, win in zip(
+                    air_storage.values, self.wall_storage.values,
+                    self.floor_storage.values, self.window_storage.values)]
+                head = air_storage.header.duplicate()  # dup to avoid editing header
+                head.metadata['type'] = 'Air Storage'
+                self._air_storage = \
+                    self._collection_from_values(air_storage, head, values)
         return self._air_storage
 
     @property
@@ -599,34 +597,28 @@ class LoadBalance(object):
         # create the SQL result parsing object
         sql_obj = SQLiteResult(sql_path)
 
-        # get all of the results relevant for gains and losses
-        cooling = sql_obj.data_collections_by_output_name(LoadBalance.COOLING)
-        heating = sql_obj.data_collections_by_output_name(LoadBalance.HEATING)
-        lighting = sql_obj.data_collections_by_output_name(LoadBalance.LIGHTING)
-        people_gain = sql_obj.data_collections_by_output_name(LoadBalance.PEOPLE_GAIN)
-        solar_gain = sql_obj.data_collections_by_output_name(LoadBalance.SOLAR_GAIN)
-        infil_gain = sql_obj.data_collections_by_output_name(LoadBalance.INFIL_GAIN)
-        infil_loss = sql_obj.data_collections_by_output_name(LoadBalance.INFIL_LOSS)
-        vent_loss = sql_obj.data_collections_by_output_name(LoadBalance.VENT_LOSS)
-        vent_gain = sql_obj.data_collections_by_output_name(LoadBalance.VENT_GAIN)
-        nat_vent_gain = \
-            sql_obj.data_collections_by_output_name(LoadBalance.NAT_VENT_GAIN)
-        nat_vent_loss = \
-            sql_obj.data_collections_by_output_name(LoadBalance.NAT_VENT_LOSS)
-
         # handle the case that both total elect/gas energy and zone gain are requested
-        electric_equip = \
-            sql_obj.data_collections_by_output_name(LoadBalance.ELECTRIC_EQUIP[1])
-        if len(electric_equip) == 0:
-            electric_equip = \
-                sql_obj.data_collections_by_output_name(LoadBalance.ELECTRIC_EQUIP)
-        gas_equip = sql_obj.data_collections_by_output_name(LoadBalance.GAS_EQUIP[1])
-        if len(gas_equip) == 0:
-            gas_equip = sql_obj.data_collections_by_output_name(LoadBalance.GAS_EQUIP)
-        process = sql_obj.data_collections_by_output_name(LoadBalance.PROCESS)
-        how_water = sql_obj.data_collections_by_output_name(LoadBalance.HOT_WATER[1])
-        if len(how_water) == 0:
-            how_water = sql_obj.data_collections_by_output_name(LoadBalance.HOT_WATER)
+        available = set(sql_obj.available_outputs)
+        elec_output = LoadBalance.ELECTRIC_EQUIP[1] \
+            if LoadBalance.ELECTRIC_EQUIP[1] in available else LoadBalance.ELECTRIC_EQUIP
+        gas_output = LoadBalance.GAS_EQUIP[1] \
+            if LoadBalance.GAS_EQUIP[1] in available else LoadBalance.GAS_EQUIP
+        hot_water_output = LoadBalance.HOT_WATER[1] \
+            if LoadBalance.HOT_WATER[1] in available else LoadBalance.HOT_WATER
+
+        # get all of the results relevant for gains and losses in one pass
+        cooling, heating, lighting, people_gain, solar_gain, infil_gain, infil_loss, \
+            vent_loss, vent_gain, nat_vent_gain, nat_vent_loss, electric_equip, \
+            gas_equip, process, how_water, opaque_flow, window_loss, window_gain = \
+            LoadBalance._data_collections_by_output_names(sql_obj, (
+                LoadBalance.COOLING, LoadBalance.HEATING, LoadBalance.LIGHTING,
+                LoadBalance.PEOPLE_GAIN, LoadBalance.SOLAR_GAIN,
+                LoadBalance.INFIL_GAIN, LoadBalance.INFIL_LOSS,
+                LoadBalance.VENT_LOSS, LoadBalance.VENT_GAIN,
+                LoadBalance.NAT_VENT_GAIN, LoadBalance.NAT_VENT_LOSS,
+                elec_output, gas_output, LoadBalance.PROCESS, hot_water_output,
+                LoadBalance.OPAQUE_ENERGY_FLOW, LoadBalance.WINDOW_LOSS,
+                LoadBalance.WINDOW_GAIN))
 
         # subtract losses from gains
         infiltration = None
@@ -641,10 +633,6 @@ class LoadBalance(object):
             nat_vent = LoadBalance.subtract_loss_from_gain(nat_vent_gain, nat_vent_loss)
 
         # get the surface energy flow
-        opaque_flow = \
-            sql_obj.data_collections_by_output_name(LoadBalance.OPAQUE_ENERGY_FLOW)
-        window_loss = sql_obj.data_collections_by_output_name(LoadBalance.WINDOW_LOSS)
-        window_gain = sql_obj.data_collections_by_output_name(LoadBalance.WINDOW_GAIN)
         window_flow = []
         if len(window_gain) == len(window_loss):
             window_flow = LoadBalance.subtract_loss_from_gain(window_gain, window_loss)
@@ -654,6 +642,64 @@ class LoadBalance(object):
             how_water, people_gain, solar_gain, infiltration, mech_vent, nat_vent, \
             face_energy_flow
 
+    @staticmethod
+    def _data_collections_by_output_names(sql_obj, output_names):
+        """Get data collections for several outputs with a single scan of ReportData.
+
+        The result for each item of output_names is the same as that of the
+        SQLiteResult.data_collections_by_output_name method but all outputs that
+        share the same units are requested together such that the ReportData
+        table, which can be very large for hourly surface-level results, is only
+        queried once for all of them.
+
+        Args:
+            sql_obj: A ladybug SQLiteResult object for the SQL file.
+            output_names: A list where each item is the name of an EnergyPlus
+                output or a tuple of output names for which data collections
+                will be returned.
+
+        Returns:
+            A list with one list of data collections for each item of output_names.
+            A list will be empty if no output of the requested name was found.
+        """
+        # get the available outputs that are requested and check they share units
+        out_groups = [(out,) if isinstance(out, str) else tuple(out)
+                      for out in output_names]
+        out_units = {}
+        for out_info in sql_obj.available_outputs_info:
+            out_units.setdefault(out_info['output_name'], set()).add(out_info['units'])
+        all_names = []
+        for group in out_groups:
+            for name in group:
+                if name in out_units and name not in all_names:
+                    all_names.append(name)
+        units = set(u for name in all_names for u in out_units[name])
+        if len(all_names) == 0 or len(units) != 1 or \
+                sql_obj.reporting_frequency == 'Annual':
+            return [sql_obj.data_collections_by_output_name(out)
+                    for out in output_names]
+
+        # get all of the data collections with one request
+        all_colls = sql_obj.data_collections_by_output_name(all_names)
+        found_names = set(data.header.metadata['type'] for data in all_colls)
+        if len(found_names) != len(all_names):  # outputs of a different frequency
+            return [sql_obj.data_collections_by_output_name(out)
+                    for out in output_names]
+
+        # group the data collections in the same way as the output_names
+        all_data = []
+        for output_name, group in zip(output_names, out_groups):
+            data_colls = [data for data in all_colls
+                          if data.header.metadata['type'] in group]
+            if 'Surface' in output_name:  # key the metadata by Surface
+                for data in data_colls:
+                    meta = data.header.metadata
+                    data.header.metadata = {
+                        key if key == 'type' else 'Surface': val
+                        for key, val in meta.items()}
+            all_data.append(data_colls)
+        return all_data
+
     @staticmethod
     def subtract_loss_from_gain(load_gain, load_loss):
         """Subtract an array of load loss data collections from load gain collections.
@@ -667,10 +713,8 @@ class LoadBalance(object):
         """
         total_loads = []
         for gain, loss in zip(load_gain, load_loss):
-            total_load = gain - loss
-            total_load.header.metadata['type'] = \
-                total_load.header.metadata['type'].replace('Gain ', '')
-            total_loads.append(total_load)
+            total_loads.append(LoadBalance._subtract_collection(
+                gain, loss, gain.header.metadata['type'].replace('Gain ', '')))
         return total_loads
 
     @staticmethod
@@ -685,12 +729,9 @@ class LoadBalance(object):
         """
         mech_vent_loss = LoadBalance.subtract_loss_from_gain(heating, zone_heating)
         mech_vent_gain = LoadBalance.subtract_loss_from_gain(cooling, zone_cooling)
-        total_load = LoadBalance.subtract_loss_from_gain(mech_vent_gain, mech_vent_loss)
-        mech_vent_load = [data.duplicate() for data in total_load]
-        for load in mech_vent_load:
-            load.header.metadata['type'] = \
-                'Zone Ideal Loads Ventilation Heat Energy'
-        return mech_vent_load
+        return [LoadBalance._subtract_collection(
+                gain, loss, 'Zone Ideal Loads Ventilation Heat Energy')
+                for gain, loss in zip(mech_vent_gain, mech_vent_loss)]
 
     def _match_room_input(self, data_collections, rooms, data_type,
                           type_check_text=None, negate=False, use_all=False,
@@ -734,12 +775,14 @@ class LoadBalance(object):
                     coll_dict[coll.header.metadata['type']].append(coll)
                 except KeyError:
                     coll_dict[coll.header.metadata['type']] = [coll]
-            all_match = [match_rooms_to_data(val, rooms, use_mult, space_based)
+            room_index = ResultIndex(rooms)
+            all_match = [room_index.match_rooms(val, use_mult, space_based)
                          for val in coll_dict.values()]
             matched_objs = [list(tup) for tup in all_match[0]]
-            for other_tups in all_match[1:]:
-                for i, tup in enumerate(other_tups):
-                    matched_objs[i][1] += tup[1]
+            if len(all_match) > 1:
+                for i, obj in enumerate(matched_objs):
+                    obj[1] = self._sum_collections(
+                        [obj[1]] + [other_tups[i][1] for other_tups in all_match[1:]])
         else:
             matched_objs = match_rooms_to_data(
                 data_collections, rooms, use_mult, space_based)
@@ -756,10 +799,9 @@ class LoadBalance(object):
                 '\n{}'.format(data_type, base_data.header.metadata['type'])
 
         # compute the total values of the load
-        values = [0 for val in range(len(base_data))]
-        for obj in matched_objs:
-            for i, val in enumerate(obj[1].values):
-                values[i] += val * obj[2]
+        values = self._sum_values(
+            [obj[1].values for obj in matched_objs], [obj[2] for obj in matched_objs],
+            len(base_data))
         if negate:
             values = [-val for val in values]
 
@@ -770,10 +812,7 @@ class LoadBalance(object):
         elif 'System' in new_header.metadata:
             del new_header.metadata['System']
         new_header.metadata['type'] = data_type
-        if isinstance(base_data, HourlyContinuousCollection):
-            return HourlyContinuousCollection(new_header, values)
-        else:  # it's one of the data collections that needs datetimes
-            return base_data.__class__(new_header, values, base_data.datetimes)
+        return self._collection_from_values(base_data, new_header, values)
 
     def _match_face_input(self, surface_flow_data, rooms):
         """Match a an array of input data collections to input rooms.
@@ -787,38 +826,44 @@ class LoadBalance(object):
         if surface_flow_data is None or len(surface_flow_data) == 0:
             return [None] * 7
         base_data = surface_flow_data[0]
-        values = [0] * len(base_data)
 
-        # compute the total values of the load
-        window_vals, wall_vals, roof_vals, floor_vals = (values[:] for i in range(4))
-        int_win_vals, int_wall_vals, int_floor_vals = (values[:] for i in range(3))
+        # sort the values of each face into the terms of the load balance
+        # window, wall, roof, floor, int_window, int_wall, int_floor
+        term_values = [[] for _ in range(7)]
+        term_mults = [[] for _ in range(7)]
+        faces, face_mults = [], {}
         for room in rooms:
-            mult = room.multiplier
-            match_objs = match_faces_to_data(surface_flow_data, room.faces)
-            for obj in match_objs:
-                if isinstance(obj[0].boundary_condition, self.EXTERIOR_BCS):
-                    if isinstance(obj[0], (Aperture, Door)):
-                        for i, val in enumerate(obj[1].values):
-                            window_vals[i] += val * mult
-                    elif isinstance(obj[0].type, Wall):
-                        for i, val in enumerate(obj[1].values):
-                            wall_vals[i] += val * mult
-                    elif isinstance(obj[0].type, RoofCeiling):
-                        for i, val in enumerate(obj[1].values):
-                            roof_vals[i] += val * mult
-                    elif isinstance(obj[0].type, Floor):
-                        for i, val in enumerate(obj[1].values):
-                            floor_vals[i] += val * mult
-                elif isinstance(obj[0].boundary_condition, self.INTERIOR_BCS):
-                    if isinstance(obj[0], (Aperture, Door)):
-                        for i, val in enumerate(obj[1].values):
-                            int_win_vals[i] += val * mult
-                    elif isinstance(obj[0].type, (Wall, AirBoundary)):
-                        for i, val in enumerate(obj[1].values):
-                            int_wall_vals[i] += val * mult
-                    elif isinstance(obj[0].type, (Floor, RoofCeiling)):
-                        for i, val in enumerate(obj[1].values):
-                            int_floor_vals[i] += val * mult
+            for face in room.faces:
+                faces.append(face)
+                for f_obj in (face,) + face.apertures + face.doors:
+                    face_mults[id(f_obj)] = room.multiplier
+        for obj in match_faces_to_data(surface_flow_data, faces):
+            term_i = None
+            if isinstance(obj[0].boundary_condition, self.EXTERIOR_BCS):
+                if isinstance(obj[0], (Aperture, Door)):
+                    term_i = 0
+                elif isinstance(obj[0].type, Wall):
+                    term_i = 1
+                elif isinstance(obj[0].type, RoofCeiling):
+                    term_i = 2
+                elif isinstance(obj[0].type, Floor):
+                    term_i = 3
+            elif isinstance(obj[0].boundary_condition, self.INTERIOR_BCS):
+                if isinstance(obj[0], (Aperture, Door)):
+                    term_i = 4
+                elif isinstance(obj[0].type, (Wall, AirBoundary)):
+                    term_i = 5
+                elif isinstance(obj[0].type, (Floor, RoofCeiling)):
+                    term_i = 6
+            if term_i is not None:
+                term_values[term_i].append(obj[1].values)
+                term_mults[term_i].append(face_mults[id(obj[0])])
+
+        # compute the total values of the load
+        window_vals, wall_vals, roof_vals, floor_vals, \
+            int_win_vals, int_wall_vals, int_floor_vals = \
+            (self._sum_values(vals, mults, len(base_data))
+             for vals, mults in zip(term_values, term_mults))
 
         # create the new totalled data collection
         new_header = base_data.header.duplicate()
@@ -838,13 +883,8 @@ class LoadBalance(object):
             [i_win_head, i_wall_head, i_floor_head]
         all_values = [window_vals, wall_vals, roof_vals, floor_vals] + \
             [int_win_vals, int_wall_vals, int_floor_vals]
-        all_data = []
-        for head, vals in zip(all_headers, all_values):
-            if isinstance(base_data, HourlyContinuousCollection):
-                all_data.append(HourlyContinuousCollection(head, vals))
-            else:  # it's one of the data collections that needs datetimes
-                all_data.append(base_data.__class__(head, vals, base_data.datetimes))
-        return all_data
+        return [self._collection_from_values(base_data, head, vals)
+                for head, vals in zip(all_headers, all_values)]
 
     def _area_as_meters_feet(self, base_area):
         """Convert a base area to meters or feet depending on the the assigned units."""
@@ -871,10 +911,79 @@ class LoadBalance(object):
         new_unit = '{}/m2'.format(head.unit) if not is_ip else '{}/ft2'.format(head.unit)
         new_header = Header(
             EnergyIntensity(), new_unit, head.analysis_period, head.metadata)
-        if isinstance(collection, HourlyContinuousCollection):
-            return HourlyContinuousCollection(new_header, new_vals)
+        return LoadBalance._collection_from_values(collection, new_header, new_vals)
+
+    @staticmethod
+    def _sum_values(values_lists, multipliers=None, length=0):
+        """Sum several lists of values together in a single pass.
+
+        Args:
+            values_lists: A list of lists of values, all of the same length.
+            multipliers: An optional list of numbers with one value for each
+                list of values, which will be multiplied by the values before
+                they are summed.
+            length: An integer for the length of the result, which is used when
+                values_lists is empty. (Default: 0).
+        """
+        if len(values_lists) == 0:
+            return [0] * length
+        if multipliers is not None:
+            values_lists = [vals if mult == 1 else [v * mult for v in vals]
+                            for vals, mult in zip(values_lists, multipliers)]
+        return [sum(vals) for vals in zip(*values_lists)]
+
+    @staticmethod
+    def _sum_collections(collections, data_type=None, negate=False):
+        """Sum several matching data collections together into a new data collection.
+
+        Args:
+            collections: A list of data collections to be summed together. The
+                header of the first collection will be used for the result.
+            data_type: Optional text for the type to be written into the metadata
+                of the resulting collection.
+            negate: Boolean to note whether the summed values should be negated.
+        """
+        base_data = collections[0]
+        for coll in collections[1:]:
+            assert len(coll) == len(base_data), 'Length of DataCollections must ' \
+                'match in order to add them together. {} != {}'.format(
+                    len(coll), len(base_data))
+        values = LoadBalance._sum_values([coll.values for coll in collections])
+        if negate:
+            values = [-val for val in values]
+        new_header = base_data.header.duplicate()
+        if data_type is not None:
+            new_header.metadata['type'] = data_type
+        return LoadBalance._collection_from_values(base_data, new_header, values)
+
+    @staticmethod
+    def _subtract_collection(collection, other, data_type):
+        """Subtract one data collection from another to get a new data collection.
+
+        Args:
+            collection: A data collection from which the other will be subtracted.
+                Its header will be used for the result.
+            other: A data collection to be subtracted.
+            data_type: Text for the type to be written into the metadata of the
+                resulting collection.
+        """
+        assert len(collection) == len(other), 'Length of DataCollections must ' \
+            'match to subtract one from the other. {} != {}'.format(
+                len(collection), len(other))
+        values = [v_1 - v_2 for v_1, v_2 in zip(collection.values, other.values)]
+        new_header = collection.header.duplicate()
+        new_header.metadata['type'] = data_type
+        return LoadBalance._collection_from_values(collection, new_header, values)
+
+    @staticmethod
+    def _collection_from_values(base_data, header, values):
+        """Create a data collection of the same type as a base collection."""
+        if isinstance(base_data, HourlyContinuousCollection):
+            new_data = HourlyContinuousCollection(header, values)
         else:  # it's one of the data collections that needs datetimes
-            return collection.__class__(new_header, new_vals, collection.datetimes)
+            new_data = base_data.__class__(header, values, base_data.datetimes)
+        new_data._validated_a_period = base_data._validated_a_period
+        return new_data
 
     @staticmethod
     def _check_data_matching(rooms, data):
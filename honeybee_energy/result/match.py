@@ -9,6 +9,10 @@ from honeybee.door import Door
 from honeybee.aperture import Aperture
 from honeybee.face import Face
 
+# patterns for the identifiers of triangulated apertures and doors
+_TRI_PATTERN = re.compile(r".*\.\.\d")
+_TRI_SUFFIX_PATTERN = re.compile(r'(\.\.\d*)')
+
 
 def match_rooms_to_data(
         data_collections, rooms, invert_multiplier=False, space_based=False,
@@ -56,54 +60,8 @@ def match_rooms_to_data(
         -   multiplier -- An integer for the Room multiplier, which may be useful
             for calculating total results.
     """
-    # extract the zone identifier from each of the data collections
-    zone_ids = []
-    use_mult = False
-    for data in data_collections:
-        if 'Zone' in data.header.metadata:
-            zone_ids.append(data.header.metadata['Zone'])
-        else:  # it's HVAC system data and we need to see if it's matchable
-            hvac_id = data.header.metadata['System']
-            use_mult = True
-            if ' IDEAL LOADS AIR SYSTEM' in hvac_id:  # convention of E+ HVAC Templates
-                zone_ids.append(hvac_id.split(' IDEAL LOADS AIR SYSTEM')[0])
-            elif '..' in hvac_id:  # convention used for service hot water
-                zone_ids.append(hvac_id.split('..')[-1])
-                use_mult = False if 'Gain' in data.header.metadata['type'] else True
-            else:
-                use_mult = False
-                zone_ids.append(hvac_id)
-    if invert_multiplier:
-        use_mult = not use_mult
-    if space_based:
-        zone_ids = [zid.replace('_SPACE', '') for zid in zone_ids]
-
-    # count the number of rooms in each zone to zone-correct the multiplier
-    if not space_based and zone_correct_mult:
-        zone_counter = {}
-        for room in rooms:
-            z_id = clean_ep_string(room.zone)
-            try:
-                zone_counter[z_id] += 1
-            except KeyError:  # first room found in the zone
-                zone_counter[z_id] = 1
-
-    # loop through the rooms and match the data to them
-    matched_tuples = []  # list of matched rooms and data collections
-    for room in rooms:
-        if space_based:
-            rm_id, zc = room.identifier.upper(), 1
-        else:
-            z_id = clean_ep_string(room.zone)
-            rm_id = z_id.upper()
-            zc = zone_counter[z_id] if zone_correct_mult else 1
-        for i, data_id in enumerate(zone_ids):
-            if data_id == rm_id:
-                mult = 1 if not use_mult else room.multiplier
-                matched_tuples.append((room, data_collections[i], mult / zc))
-                break
-
-    return matched_tuples
+    return ResultIndex(rooms=rooms).match_rooms(
+        data_collections, invert_multiplier, space_based, zone_correct_mult)
 
 
 def match_faces_to_data(data_collections, faces):
@@ -131,51 +89,198 @@ def match_faces_to_data(data_collections, faces):
         -   data_collection -- A data collection that matches the Face,
             Aperture, or Door.
     """
-    matched_tuples = []  # list of matched faces and data collections
-
-    flat_f = []  # flatten the list of nested apertures and doors in the faces
-    for face in faces:
-        if isinstance(face, Face):
-            flat_f.append(face)
-            for ap in face.apertures:
-                flat_f.append(ap)
-            for dr in face.doors:
-                flat_f.append(dr)
-        elif isinstance(face, (Aperture, Door)):
-            flat_f.append(face)
-        else:
-            raise ValueError('Expected honeybee Face, Aperture, Door or Shade '
-                             'for match_faces_to_data. Got {}.'.format(type(face)))
-
-    # extract the surface id from each of the data collections
-    srf_ids = []
-    tri_srf_ids = {}  # track data collections from triangulated apertures/doors
-    tri_pattern = re.compile(r".*\.\.\d")
-    for data in data_collections:
-        if 'Surface' in data.header.metadata:
-            srf_ids.append(data.header.metadata['Surface'])
-            if tri_pattern.match(data.header.metadata['Surface']) is not None:
-                base_name = re.sub(r'(\.\.\d*)', '', data.header.metadata['Surface'])
-                try:
-                    tri_srf_ids[base_name].append(data)
-                except KeyError:  # first triangulated piece found
-                    tri_srf_ids[base_name] = [data]
-
-    # loop through the faces and match the data to them
-    for face in flat_f:
-        f_id = face.identifier.upper()
-        for i, data_id in enumerate(srf_ids):
-            if data_id == f_id:
-                matched_tuples.append((face, data_collections[i]))
-                break
-        else:  # check to see if it's a triangulated sub-face
+    return ResultIndex(faces=faces).match_faces(data_collections)
+
+
+class ResultIndex(object):
+    """A reusable index of honeybee Rooms and Faces to be matched with results.
+
+    The index computes the EnergyPlus identifiers of all Rooms and Faces once
+    such that many different sets of data collections can be matched to the
+    same objects quickly. Data collections are matched through a dictionary
+    keyed by identifier so the time to match scales with the number of objects
+    plus the number of data collections (instead of the product of the two).
+    Note that the index does not update if the objects are edited after
+    it is created.
+
+    Args:
+        rooms: An optional array of honeybee Rooms to be matched to Zone-level
+            data collections. (Default: None).
+        faces: An optional array of honeybee Faces, Apertures, and/or Doors to
+            be matched to Surface-level data collections. Note that a given input
+            Face should NOT have its child Apertures or Doors as a separate
+            item. (Default: None).
+
+    Properties:
+        * rooms
+        * faces
+    """
+    __slots__ = ('_rooms', '_faces', '_room_zones', '_zone_counter',
+                 '_flat_faces', '_face_ids')
+
+    def __init__(self, rooms=None, faces=None):
+        # index the rooms by their zone identifiers
+        self._rooms = tuple(rooms) if rooms is not None else ()
+        self._room_zones = [clean_ep_string(room.zone) for room in self._rooms]
+        self._zone_counter = {}
+        for z_id in self._room_zones:
             try:
-                data_colls = tri_srf_ids[f_id]
-                matched_tuples.append(
-                    (face, _merge_collections(data_colls, f_id)))
-            except KeyError:
-                pass  # the face could not be matched with any data
-    return matched_tuples
+                self._zone_counter[z_id] += 1
+            except KeyError:  # first room found in the zone
+                self._zone_counter[z_id] = 1
+
+        # flatten the list of nested apertures and doors in the faces
+        self._faces = tuple(faces) if faces is not None else ()
+        self._flat_faces = []
+        for face in self._faces:
+            if isinstance(face, Face):
+                self._flat_faces.append(face)
+                self._flat_faces.extend(face.apertures)
+                self._flat_faces.extend(face.doors)
+            elif isinstance(face, (Aperture, Door)):
+                self._flat_faces.append(face)
+            else:
+                raise ValueError('Expected honeybee Face, Aperture, Door or Shade '
+                                 'for match_faces_to_data. Got {}.'.format(type(face)))
+        self._face_ids = [face.identifier.upper() for face in self._flat_faces]
+
+    @classmethod
+    def from_model(cls, model):
+        """Create a ResultIndex for all of the Rooms and Room Faces of a Model.
+
+        Args:
+            model: A honeybee Model, which should already be in the units of
+                the data to be matched.
+        """
+        faces = [face for room in model.rooms for face in room.faces]
+        return cls(model.rooms, faces)
+
+    @property
+    def rooms(self):
+        """Get a tuple of the honeybee Rooms in the index."""
+        return self._rooms
+
+    @property
+    def faces(self):
+        """Get a tuple of the honeybee Faces, Apertures and Doors in the index."""
+        return self._faces
+
+    def match_rooms(self, data_collections, invert_multiplier=False,
+                    space_based=False, zone_correct_mult=True):
+        """Match the Rooms of the index to Zone-level data collections.
+
+        Args:
+            data_collections: An array of data collections with headers that have
+                metadata dictionaries with 'Zone' or 'System' keys.
+            invert_multiplier: Boolean to note whether the output room multiplier
+                should be included when the data type values already account for
+                the multiplier (False) or when they do not (True). (Default: False).
+            space_based: Boolean to note whether the result is reported on the
+                EnergyPlus Space level instead of the Zone level. (Default: False).
+            zone_correct_mult: Boolean to note whether the multiplier in the
+                returned result should be divided by the number of Rooms within
+                each zone when space_based is False. (Default: True).
+
+        Returns:
+            An array of tuples with a honeybee Room, a data collection and
+            a multiplier, which is the same as the output of match_rooms_to_data.
+        """
+        # map the zone identifier of each of the data collections to the data
+        zone_data, use_mult = {}, False
+        for data in data_collections:
+            if 'Zone' in data.header.metadata:
+                data_id = data.header.metadata['Zone']
+            else:  # it's HVAC system data and we need to see if it's matchable
+                hvac_id = data.header.metadata['System']
+                use_mult = True
+                if ' IDEAL LOADS AIR SYSTEM' in hvac_id:  # E+ HVAC Template convention
+                    data_id = hvac_id.split(' IDEAL LOADS AIR SYSTEM')[0]
+                elif '..' in hvac_id:  # convention used for service hot water
+                    data_id = hvac_id.split('..')[-1]
+                    use_mult = False if 'Gain' in data.header.metadata['type'] else True
+                else:
+                    use_mult = False
+                    data_id = hvac_id
+            if space_based:
+                data_id = data_id.replace('_SPACE', '')
+            if data_id not in zone_data:  # the first matching data is used
+                zone_data[data_id] = data
+        if invert_multiplier:
+            use_mult = not use_mult
+
+        # loop through the rooms and match the data to them
+        matched_tuples = []  # list of matched rooms and data collections
+        for room, z_id in zip(self._rooms, self._room_zones):
+            if space_based:
+                rm_id, zc = room.identifier.upper(), 1
+            else:
+                rm_id = z_id.upper()
+                zc = self._zone_counter[z_id] if zone_correct_mult else 1
+            try:
+                data = zone_data[rm_id]
+            except KeyError:  # the room could not be matched with any data
+                continue
+            mult = 1 if not use_mult else room.multiplier
+            matched_tuples.append((room, data, mult / zc))
+        return matched_tuples
+
+    def match_faces(self, data_collections, merge_triangulated=True):
+        """Match the Faces of the index to Surface-level data collections.
+
+        Triangulated apertures and doors are matched with a merged version of
+        the relevant data collections.
+
+        Args:
+            data_collections: An array of data collections with headers that have
+                metadata dictionaries with 'Surface' keys.
+            merge_triangulated: Boolean to note whether the data collections of
+                the pieces of triangulated apertures and doors should be merged
+                into one data collection. If False, the list of data collections
+                for the pieces is returned in place of a single collection, which
+                is useful when the values are not loaded into the collections.
+                (Default: True).
+
+        Returns:
+            An array of tuples with a honeybee Face, Aperture, or Door and a
+            data collection, which is the same as the output of match_faces_to_data.
+        """
+        # map the surface id of each of the data collections to the data
+        srf_data = {}
+        tri_srf_data = {}  # track data collections from triangulated apertures/doors
+        for data in data_collections:
+            if 'Surface' in data.header.metadata:
+                srf_id = data.header.metadata['Surface']
+                if srf_id not in srf_data:  # the first matching data is used
+                    srf_data[srf_id] = data
+                if _TRI_PATTERN.match(srf_id) is not None:
+                    base_name = _TRI_SUFFIX_PATTERN.sub('', srf_id)
+                    try:
+                        tri_srf_data[base_name].append(data)
+                    except KeyError:  # first triangulated piece found
+                        tri_srf_data[base_name] = [data]
+
+        # loop through the faces and match the data to them
+        matched_tuples = []  # list of matched faces and data collections
+        for face, f_id in zip(self._flat_faces, self._face_ids):
+            try:
+                matched_tuples.append((face, srf_data[f_id]))
+            except KeyError:  # check to see if it's a triangulated sub-face
+                try:
+                    data_colls = tri_srf_data[f_id]
+                    if merge_triangulated:
+                        data_colls = _merge_collections(data_colls, f_id)
+                    matched_tuples.append((face, data_colls))
+                except KeyError:
+                    pass  # the face could not be matched with any data
+        return matched_tuples
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'ResultIndex: [{} rooms] [{} faces]'.format(
+            len(self._rooms), len(self._flat_faces))
 
 
 def _merge_collections(data_collections, surface_id):
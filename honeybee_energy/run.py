@@ -7,6 +7,8 @@ import sys
 import json
 import shutil
 import subprocess
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 if (sys.version_info < (3, 0)):
     readmode = 'rb'
@@ -22,7 +24,9 @@ from ladybug.stat import STAT
 from .config import folders
 from .measure import Measure
 from .result.osw import OSW
+from .result.err import Err
 from .simulation.parameter import SimulationParameter
+from .writer import energyplus_idf_version
 
 HB_OS_MSG = 'Honeybee-openstudio is not installed. Translation to OpenStudio cannot ' \
     'be performed.\nRun pip install honeybee-energy[openstudio] to get all ' \
@@ -348,28 +352,8 @@ def empty_osm(sim_par=None, epw_file=None, osm_file=None, idf_file=None):
         sim_par = sim_par.duplicate()  # ensure input is not edited
 
     # use any specified EPW files to assign design days and the climate zone
-    def ddy_from_epw(epw_file, sim_par):
-        """Produce a DDY from an EPW file."""
-        epw_obj = EPW(epw_file)
-        des_days = [epw_obj.approximate_design_day('WinterDesignDay'),
-                    epw_obj.approximate_design_day('SummerDesignDay')]
-        sim_par.sizing_parameter.design_days = des_days
-
     if epw_file is not None:
-        epw_folder, epw_file_name = os.path.split(epw_file)
-        ddy_file = os.path.join(epw_folder, epw_file_name.replace('.epw', '.ddy'))
-        stat_file = os.path.join(epw_folder, epw_file_name.replace('.epw', '.stat'))
-        if len(sim_par.sizing_parameter.design_days) == 0 and \
-                os.path.isfile(ddy_file):
-            try:
-                sim_par.sizing_parameter.add_from_ddy_996_004(ddy_file)
-            except AssertionError:  # no design days within the DDY file
-                ddy_from_epw(epw_file, sim_par)
-        elif len(sim_par.sizing_parameter.design_days) == 0:
-            ddy_from_epw(epw_file, sim_par)
-        if sim_par.sizing_parameter.climate_zone is None and os.path.isfile(stat_file):
-            stat_obj = STAT(stat_file)
-            sim_par.sizing_parameter.climate_zone = stat_obj.ashrae_climate_zone
+        _assign_epw_sizing(sim_par, epw_file)
         set_cz = True if sim_par.sizing_parameter.climate_zone is None else False
         assign_epw_to_model(epw_file, os_model, set_cz)
 
@@ -507,18 +491,7 @@ def run_idf(idf_file_path, epw_file_path=None, expand_objects=True, silent=False
             simulation. Will be None if no file exists.
     """
     # rename the stat file to ensure EnergyPlus does not find it and error
-    stat_file, renamed_stat = None, None
-    if epw_file_path is not None:
-        epw_folder = os.path.dirname(epw_file_path)
-        for wf in os.listdir(epw_folder):
-            if wf.endswith('.stat'):
-                stat_file = os.path.join(epw_folder, wf)
-                renamed_stat = os.path.join(epw_folder, wf.replace('.stat', '.hide'))
-                try:
-                    os.rename(stat_file, renamed_stat)
-                except Exception:  # STAT file in restricted location (Program Files)
-                    stat_file = None  # hope that it is not a OneBuilding EPW
-                break
+    stat_file, renamed_stat = _hide_stat_file(epw_file_path)
 
     # run the simulation
     if os.name == 'nt':  # we are on Windows
@@ -535,6 +508,208 @@ def run_idf(idf_file_path, epw_file_path=None, expand_objects=True, silent=False
     return output_energyplus_files(directory)
 
 
+def run_idf_batch(jobs, max_workers=None, expand_objects=True, retries=1,
+                  silent=True, progress_callback=None):
+    """Run several IDF files through EnergyPlus at once using a pool of workers.
+
+    Each job is run in its own directory so that simultaneous simulations do
+    not overwrite one another's files. When a job has a directory specified,
+    its IDF is copied into that directory as in.idf. Otherwise, the IDF is run
+    in the folder where it exists unless another job in the batch uses the same
+    folder, in which case it is copied into a sub-folder named after the IDF.
+
+    Args:
+        jobs: A list of jobs to be simulated. Each job is a tuple or list with
+            the full path to an IDF file, the full path to an EPW file and,
+            optionally, the path to a directory in which the job will be run.
+            The EPW can be None if the simulation is only for design days.
+        max_workers: An integer for the maximum number of simulations to run
+            at once. If None, this will be the number of CPUs on the
+            machine. (Default: None).
+        expand_objects: If True, each IDF run will include the expansion of any
+            HVAC Template objects in the file before beginning the
+            simulation. (Default: True).
+        retries: An integer for the number of times that a failed job will be
+            re-run before it is reported as failed. A job is considered failed
+            if EnergyPlus did not produce an .err file or if the .err file
+            contains fatal errors. (Default: 1).
+        silent: Boolean to note whether the simulations should be run silently.
+            This only has an effect on Windows simulations. (Default: True).
+        progress_callback: An optional function to be called each time that
+            a job finishes. The function will be passed three arguments: the
+            number of finished jobs, the total number of jobs and the summary
+            dictionary of the finished job. (Default: None).
+
+    Returns:
+        A list of dictionaries summarizing each job, in the same order as the
+        input jobs. Each dictionary has the following keys.
+
+        -   idf -- Path to the input IDF of the job. Note that an IDF that is
+            run in its own folder is renamed to in.idf by the simulation.
+
+        -   in_idf -- Path to the in.idf file that was simulated.
+
+        -   epw -- Path to the EPW used in the simulation.
+
+        -   directory -- Path to the folder out of which the job was run.
+
+        -   sql, zsz, rdd, html, err -- Paths to the simulation output
+            files. Each will be None if the file does not exist.
+
+        -   success -- Boolean for whether EnergyPlus completed without fatal errors.
+
+        -   attempts -- Integer for the number of times the job was run.
+
+        -   fatal_errors -- List of fatal error messages in the .err file.
+
+        -   severe_errors -- List of severe error messages in the .err file.
+
+        -   warnings -- Integer for the number of warnings in the .err file.
+
+        -   exception -- Text for an exception that stopped the job from
+            running or None if no exception occurred.
+    """
+    # check the energyplus directory and the number of workers
+    if not folders.energyplus_path:
+        raise OSError('No EnergyPlus installation was found on this machine.\n'
+                      'Install EnergyPlus to run energy simulations.')
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = max(1, min(int(max_workers), len(jobs)))
+
+    # prepare the IDF of each job in an isolated directory
+    batch_jobs = []
+    for i, input_idf, idf_file_path, epw_file_path in _batch_job_files(jobs):
+        batch_jobs.append((i, input_idf, idf_file_path, epw_file_path,
+                           expand_objects, retries, silent))
+
+    # rename the stat files of all EPWs once so that jobs do not race to rename them
+    hidden_stats, epw_folders = [], {}
+    for job in batch_jobs:
+        if job[3] is not None:
+            epw_folders[os.path.dirname(job[3])] = job[3]
+    for epw_file_path in epw_folders.values():
+        stat_file, renamed_stat = _hide_stat_file(epw_file_path)
+        if stat_file is not None:
+            hidden_stats.append((stat_file, renamed_stat))
+
+    # run the jobs in a pool of threads; each one waits on an EnergyPlus process
+    results = [None] * len(batch_jobs)
+    pool = ThreadPool(max_workers)
+    try:
+        for count, (i, job_result) in \
+                enumerate(pool.imap_unordered(_run_batch_job, batch_jobs)):
+            results[i] = job_result
+            if progress_callback is not None:
+                progress_callback(count + 1, len(batch_jobs), job_result)
+    finally:
+        pool.close()
+        pool.join()
+        for stat_file, renamed_stat in hidden_stats:  # put back the .stat files
+            os.rename(renamed_stat, stat_file)
+    return results
+
+
+def run_orientation_study(
+        model, north_angles, directory, epw_file_path=None, sim_par=None,
+        max_workers=None, expand_objects=True, retries=1, silent=True,
+        progress_callback=None):
+    """Simulate a Model at several north angles, translating it to IDF only once.
+
+    The Model is translated to IDF with the direct-to-idf methods a single time
+    and the IDF of each north angle is written by changing only the Building
+    object of the simulation parameters. All of the IDFs are then simulated
+    at once with run_idf_batch.
+
+    Args:
+        model: A honeybee Model to be simulated. Note that the Model must be
+            translate-able to IDF with the direct-to-idf methods (eg. it should
+            not have detailed HVAC systems or use the Airflow Network).
+        north_angles: A list of numbers between -360 and 360 for the north angle
+            of each simulation in degrees. Each one will be assigned to the
+            north_angle of the SimulationParameter. An exception will be raised
+            if two of the angles are equivalent (eg. -90 and 270).
+        directory: The directory into which the simulations will be written.
+            Each north angle is simulated in a sub-folder named after the
+            angle (eg. north_90).
+        epw_file_path: The full path to an EPW file. This will also be used to
+            assign design days to the SimulationParameter if it has none. If
+            None, the simulations will be for design days only. (Default: None).
+        sim_par: A SimulationParameter object that describes all of the settings
+            for the simulations. If None, default parameters that request energy
+            use outputs will be generated. (Default: None).
+        max_workers: An integer for the maximum number of simulations to run
+            at once. If None, this will be the number of CPUs on the
+            machine. (Default: None).
+        expand_objects: If True, each IDF run will include the expansion of any
+            HVAC Template objects in the file before beginning the
+            simulation. (Default: True).
+        retries: An integer for the number of times that a failed simulation will
+            be re-run before it is reported as failed. (Default: 1).
+        silent: Boolean to note whether the simulations should be run silently.
+            This only has an effect on Windows simulations. (Default: True).
+        progress_callback: An optional function to be called each time that
+            a simulation finishes. The function will be passed three arguments:
+            the number of finished simulations, the total number of simulations
+            and the summary dictionary of the finished simulation. (Default: None).
+
+    Returns:
+        A list of dictionaries summarizing each simulation, in the same order
+        as the input north_angles. The dictionaries are the same as those
+        output from run_idf_batch with an added north_angle key.
+    """
+    # check that each north angle gets its own simulation folder
+    dir_names, unique_angles = [], set()
+    for angle in north_angles:
+        dir_name = 'north_{:g}'.format(angle)
+        if dir_name in dir_names or angle % 360 in unique_angles:
+            raise ValueError(
+                'North angle {} is equivalent to another one of the input '
+                'north_angles.'.format(angle))
+        dir_names.append(dir_name)
+        unique_angles.add(angle % 360)
+
+    # check the simulation parameters and use the EPW to assign design days
+    if sim_par is None:
+        sim_par = SimulationParameter()
+        sim_par.output.add_zone_energy_use()
+        sim_par.output.add_hvac_energy_use()
+    else:
+        sim_par = sim_par.duplicate()  # ensure input is not edited
+    if epw_file_path is not None:
+        epw_file_path = os.path.abspath(epw_file_path)
+        _assign_epw_sizing(sim_par, epw_file_path)
+
+    # translate the model and the parameters that do not change to IDF once
+    ver_str = energyplus_idf_version() if folders.energyplus_version \
+        is not None else ''
+    settings_str = sim_par._settings_idf()
+    water_mains_str = sim_par.water_mains_idf()
+    model_str = model.to.idf(model)
+
+    # write an IDF for each north angle with only the Building object changed
+    jobs, dir_angles = [], {}
+    for angle, dir_name in zip(north_angles, dir_names):
+        sim_par.north_angle = angle
+        idf_dir = os.path.join(os.path.abspath(directory), dir_name)
+        dir_angles[idf_dir] = angle
+        if not os.path.isdir(idf_dir):
+            os.makedirs(idf_dir)
+        idf_file_path = os.path.join(idf_dir, 'in.idf')
+        idf_str = '\n\n'.join([ver_str, settings_str, sim_par.building_idf(),
+                               water_mains_str, model_str])
+        write_to_file(idf_file_path, idf_str, True)
+        jobs.append((idf_file_path, epw_file_path))
+
+    # run all of the IDFs through EnergyPlus
+    def add_north_angle(count, total, job_result):
+        job_result['north_angle'] = dir_angles[job_result['directory']]
+        if progress_callback is not None:
+            progress_callback(count, total, job_result)
+    return run_idf_batch(jobs, max_workers, expand_objects, retries, silent,
+                         add_north_angle)
+
+
 def output_energyplus_files(directory):
     """Get the paths to the EnergyPlus simulation output files given the idf directory.
 
@@ -577,6 +752,160 @@ def output_energyplus_files(directory):
     return sql, zsz, rdd, html, err
 
 
+def _assign_epw_sizing(sim_par, epw_file):
+    """Assign design days and a climate zone to a SimulationParameter from an EPW.
+
+    Design days are taken from the .ddy file next to the EPW or approximated
+    from the EPW data if there is no .ddy file. They are only assigned if the
+    SimulationParameter has no design days. The climate zone is only assigned
+    if it is not already set and there is a .stat file next to the EPW.
+
+    Args:
+        sim_par: A SimulationParameter object, which will be edited.
+        epw_file: The full path to an EPW file.
+    """
+    def ddy_from_epw(epw_file, sim_par):
+        """Produce a DDY from an EPW file."""
+        epw_obj = EPW(epw_file)
+        des_days = [epw_obj.approximate_design_day('WinterDesignDay'),
+                    epw_obj.approximate_design_day('SummerDesignDay')]
+        sim_par.sizing_parameter.design_days = des_days
+
+    epw_folder, epw_file_name = os.path.split(epw_file)
+    ddy_file = os.path.join(epw_folder, epw_file_name.replace('.epw', '.ddy'))
+    stat_file = os.path.join(epw_folder, epw_file_name.replace('.epw', '.stat'))
+    if len(sim_par.sizing_parameter.design_days) == 0 and \
+            os.path.isfile(ddy_file):
+        try:
+            sim_par.sizing_parameter.add_from_ddy_996_004(ddy_file)
+        except AssertionError:  # no design days within the DDY file
+            ddy_from_epw(epw_file, sim_par)
+    elif len(sim_par.sizing_parameter.design_days) == 0:
+        ddy_from_epw(epw_file, sim_par)
+    if sim_par.sizing_parameter.climate_zone is None and os.path.isfile(stat_file):
+        stat_obj = STAT(stat_file)
+        sim_par.sizing_parameter.climate_zone = stat_obj.ashrae_climate_zone
+
+
+def _hide_stat_file(epw_file_path):
+    """Rename any .stat file next to an EPW so that EnergyPlus does not find it.
+
+    Args:
+        epw_file_path: The full path to an EPW file. Can be None.
+
+    Returns:
+        A tuple with the original path to the .stat file and the path to which it
+        was renamed. Both will be None if no .stat file was renamed.
+    """
+    stat_file, renamed_stat = None, None
+    if epw_file_path is not None:
+        epw_folder = os.path.dirname(epw_file_path)
+        for wf in os.listdir(epw_folder):
+            if wf.endswith('.stat'):
+                stat_file = os.path.join(epw_folder, wf)
+                renamed_stat = os.path.join(epw_folder, wf.replace('.stat', '.hide'))
+                try:
+                    os.rename(stat_file, renamed_stat)
+                except Exception:  # STAT file in restricted location (Program Files)
+                    stat_file = None  # hope that it is not a OneBuilding EPW
+                break
+    return stat_file, renamed_stat
+
+
+def _batch_job_files(jobs):
+    """Get the IDF and EPW of each batch job with the IDF in an isolated directory.
+
+    Args:
+        jobs: A list of jobs, each with an IDF path, an EPW path and an
+            optional directory.
+
+    Returns:
+        A list of tuples with the index of the job, the path to the input IDF,
+        the path to the IDF to be run and the path to the job's EPW.
+    """
+    # determine which directories are shared by several jobs
+    idf_dirs = {}
+    for job in jobs:
+        if len(job) < 3 or job[2] is None:
+            idf_dir = os.path.dirname(os.path.abspath(job[0]))
+            idf_dirs[idf_dir] = idf_dirs.get(idf_dir, 0) + 1
+
+    # copy the IDF files into their own directories where necessary
+    job_files, used_dirs = [], set()
+    for i, job in enumerate(jobs):
+        input_idf = idf_file_path = os.path.abspath(job[0])
+        epw_file_path = os.path.abspath(job[1]) if job[1] is not None else None
+        assert os.path.isfile(idf_file_path), \
+            'No IDF file found at {}.'.format(idf_file_path)
+        idf_dir = os.path.dirname(idf_file_path)
+        if len(job) >= 3 and job[2] is not None:
+            directory = os.path.abspath(job[2])
+        elif idf_dirs[idf_dir] > 1:  # directory is shared; use a sub-folder
+            idf_name = os.path.splitext(os.path.basename(idf_file_path))[0]
+            directory = os.path.join(idf_dir, idf_name)
+        else:
+            directory = idf_dir
+        assert directory not in used_dirs, 'More than one job in the batch is ' \
+            'set to run in the directory {}.'.format(directory)
+        used_dirs.add(directory)
+        if directory != idf_dir:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            new_idf = os.path.join(directory, 'in.idf')
+            shutil.copy(idf_file_path, new_idf)
+            idf_file_path = new_idf
+        job_files.append((i, input_idf, idf_file_path, epw_file_path))
+    return job_files
+
+
+def _run_batch_job(batch_job):
+    """Run a single job of run_idf_batch, including any retries of failed runs.
+
+    Args:
+        batch_job: A tuple with the index of the job, the input IDF path, the
+            path of the IDF to run, the EPW path, expand_objects, the number of
+            retries and silent.
+
+    Returns:
+        A tuple with the index of the job and the summary dictionary of the job.
+    """
+    i, input_idf, idf_file_path, epw_file_path, expand_objects, retries, silent = \
+        batch_job
+    directory = os.path.dirname(idf_file_path)
+    summary = {'idf': input_idf, 'in_idf': os.path.join(directory, 'in.idf'),
+               'epw': epw_file_path, 'directory': directory}
+    attempts = 0
+    while True:
+        attempts += 1
+        exception, fatal_errors, severe_errors, warnings = None, [], [], 0
+        err_file = os.path.join(directory, 'eplusout.err')
+        if os.path.isfile(err_file):  # remove any .err file from a previous run
+            os.remove(err_file)
+        try:
+            if os.name == 'nt':  # we are on Windows
+                _run_idf_windows(idf_file_path, epw_file_path, expand_objects, silent)
+            else:  # we are on Mac, Linux, or some other unix-based system
+                _run_idf_unix(idf_file_path, epw_file_path, expand_objects)
+        except Exception as e:
+            exception = str(e)
+        idf_file_path = summary['in_idf']  # the IDF has been renamed to in.idf
+        sql, zsz, rdd, html, err = output_energyplus_files(directory)
+        if err is not None:
+            err_obj = Err(err)
+            fatal_errors = err_obj.fatal_errors
+            severe_errors = err_obj.severe_errors
+            warnings = len(err_obj.warnings)
+        success = exception is None and err is not None and len(fatal_errors) == 0
+        if success or attempts > retries:
+            break
+    summary.update({
+        'sql': sql, 'zsz': zsz, 'rdd': rdd, 'html': html, 'err': err,
+        'success': success, 'attempts': attempts, 'fatal_errors': fatal_errors,
+        'severe_errors': severe_errors, 'warnings': warnings, 'exception': exception
+    })
+    return i, summary
+
+
 def _check_osw(osw_json):
     """Prepare an OSW file to be run through OpenStudio CLI.
 
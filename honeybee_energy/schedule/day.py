@@ -60,7 +60,7 @@ class ScheduleDay(object):
         * is_constant
     """
     __slots__ = ('_identifier', '_display_name', '_values', '_times',
-                 '_interpolate', '_parent', '_locked')
+                 '_interpolate', '_parent', '_locked', '_values_cache')
 
     _start_of_day = Time(0, 0)
     VALIDTIMESTEPS = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
@@ -69,6 +69,7 @@ class ScheduleDay(object):
         """Initialize Schedule Day."""
         self._locked = False  # unlocked by default
         self._parent = None  # no parent ScheduleRuleset by default
+        self._values_cache = {}  # values_at_timestep results keyed by timestep
         self.identifier = identifier
         self._display_name = None
 
@@ -132,6 +133,7 @@ class ScheduleDay(object):
     @values.setter
     def values(self, values):
         self._values = self._check_values(values)
+        self._values_cache.clear()
 
     @property
     def times(self):
@@ -141,6 +143,7 @@ class ScheduleDay(object):
     @times.setter
     def times(self, times):
         self._times = self._check_times(times)
+        self._values_cache.clear()
 
     @property
     def interpolate(self):
@@ -150,6 +153,7 @@ class ScheduleDay(object):
     @interpolate.setter
     def interpolate(self, interpolate):
         self._interpolate = bool(interpolate)
+        self._values_cache.clear()
 
     @property
     def is_constant(self):
@@ -170,6 +174,7 @@ class ScheduleDay(object):
         self._values = self._values + (value,)
         if self._times[-1] < self._times[-2]:  # ensure times are chronological
             self._times, self._values = zip(*sorted(zip(self._times, self._values)))
+        self._values_cache.clear()
 
     def remove_value(self, value_index):
         """Remove a value from the schedule by its index.
@@ -183,6 +188,7 @@ class ScheduleDay(object):
             value_index = len(self._values) + value_index
         self._values = tuple(x for i, x in enumerate(self._values) if i != value_index)
         self._times = tuple(x for i, x in enumerate(self._times) if i != value_index)
+        self._values_cache.clear()
 
     def remove_value_by_time(self, time):
         """Remove a value from the schedule by its time in the times property.
@@ -202,6 +208,7 @@ class ScheduleDay(object):
         val_list = list(self._values)
         val_list[value_index] = self._check_value(new_value)
         self._values = tuple(val_list)
+        self._values_cache.clear()
 
     def replace_value_by_time(self, time, new_value):
         """Replace an existing value in the schedule using its time.
@@ -239,6 +246,10 @@ class ScheduleDay(object):
             timestep: An integer for the number of steps per hour at which to return
                 the resulting values.
         """
+        try:  # see if the values have already been computed for this timestep
+            return list(self._values_cache[timestep])
+        except KeyError:
+            pass
         assert timestep in self.VALIDTIMESTEPS, 'ScheduleDay timestep "{}" is invalid.' \
             ' Must be one of the following:\n{}'.format(timestep, self.VALIDTIMESTEPS)
         values = []
@@ -270,6 +281,7 @@ class ScheduleDay(object):
                 mod += minute_delta
             del values[0]  # delete first value, which is makes interpolation off by one
             values.append(self._values[-1])  # add the final value that is reached
+        self._values_cache[timestep] = tuple(values)
         return values
 
     def data_collection(self, date=Date(1, 1), schedule_type_limit=None, timestep=1):
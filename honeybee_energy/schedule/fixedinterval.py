@@ -3,7 +3,6 @@
 from __future__ import division
 
 import os
-import re
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
@@ -25,7 +24,7 @@ from honeybee.typing import valid_ep_string, float_in_range, int_in_range, \
     tuple_with_length
 
 from .typelimit import ScheduleTypeLimit
-from ..reader import parse_idf_string, clean_idf_file_contents
+from ..reader import parse_idf_string, idf_objects_by_type, idf_objects_of_type
 from ..writer import generate_idf_string
 from ..properties.extension import ScheduleFixedIntervalProperties
 
@@ -791,16 +790,14 @@ class ScheduleFixedInterval(object):
             A list of all Schedule:File objects in the IDF file as honeybee_energy
             ScheduleFixedInterval objects.
         """
-        # read the file and remove lines of comments
-        file_contents = clean_idf_file_contents(idf_file)
+        # parse all of the objects in the file
+        idf_objects = idf_objects_by_type(idf_file)
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        sch_type_str = type_pattern.findall(file_contents)
+        sch_type_str = idf_objects_of_type(idf_objects, ('ScheduleTypeLimits',))
         sch_type_dict = ScheduleFixedInterval._idf_schedule_type_dictionary(sch_type_str)
         # extract all of the Schedule:File objects and convert to Schedule
         schedules = []
-        sch_pattern = re.compile(r"(?i)(Schedule:File,[\s\S]*?;)")
-        for sch_string in sch_pattern.findall(file_contents):
+        for sch_string in idf_objects_of_type(idf_objects, ('Schedule:File',)):
             schedule = ScheduleFixedInterval.from_idf(sch_string)
             sch_props = parse_idf_string(sch_string)
             if sch_props[1] != '':
@@ -2,7 +2,10 @@
 """Complete annual schedule object built from ScheduleDay and rules for applying them."""
 from __future__ import division
 
-import re
+try:  # numpy is an optional dependency that speeds up annual value generation
+    import numpy as np
+except ImportError:
+    np = None
 
 from honeybee._lockable import lockable
 from honeybee.typing import tuple_with_length, valid_ep_string
@@ -12,7 +15,7 @@ from ladybug.datatype.generic import GenericType
 from ladybug.dt import Date, Time
 from ladybug.header import Header
 
-from ..reader import parse_idf_string, clean_idf_file_contents
+from ..reader import parse_idf_string, idf_objects_by_type, idf_objects_of_type
 from ..writer import generate_idf_string
 from ..properties.extension import ScheduleRulesetProperties
 from .day import ScheduleDay
@@ -60,7 +63,7 @@ class ScheduleRuleset(object):
     __slots__ = ('_identifier', '_display_name', '_default_day_schedule',
                  '_schedule_rules', '_holiday_schedule', '_summer_designday_schedule',
                  '_winter_designday_schedule', '_schedule_type_limit',
-                 '_locked', '_properties', '_user_data')
+                 '_locked', '_properties', '_user_data', '_rule_index_cache')
     _dow_text_to_int = {'sunday': 1, 'monday': 2, 'tuesday': 3, 'wednesday': 4,
                         'thursday': 5, 'friday': 6, 'saturday': 7}
     _schedule_week_comments = (
@@ -73,6 +76,7 @@ class ScheduleRuleset(object):
                  summer_designday_schedule=None, winter_designday_schedule=None):
         """Initialize Schedule Ruleset."""
         self._locked = False  # unlocked by default
+        self._rule_index_cache = None  # last rule indices computed by values()
         self.identifier = identifier
         self._display_name = None
         self.default_day_schedule = default_day_schedule
@@ -369,12 +373,11 @@ class ScheduleRuleset(object):
         # process the start_dow into an integer.
         dow = self._dow_text_to_int[start_dow.lower()]
         # generate the full list of annual values
-        if not leap_year:
-            return self._get_sch_values(
-                sch_day_vals, dow, start_date, end_date, hol_doy, hol_vals)
-        else:
-            return self._get_sch_values_leap_year(
-                sch_day_vals, dow, start_date, end_date, hol_doy, hol_vals)
+        if hol_vals is not None:
+            sch_day_vals.append(hol_vals)
+        rule_indices = self._get_rule_indices(
+            dow, start_date.doy, end_date.doy, hol_doy, hol_vals is not None, leap_year)
+        return self._get_sch_values(sch_day_vals, rule_indices)
 
     def data_collection(self, timestep=1, start_date=Date(1, 1), end_date=Date(12, 31),
                         start_dow='Sunday', holidays=None, leap_year=False):
@@ -1080,40 +1083,33 @@ class ScheduleRuleset(object):
             A list of all Schedule:Year objects in the IDF file as honeybee_energy
             ScheduleRuleset objects.
         """
-        # read the file and remove lines of comments
-        file_contents = clean_idf_file_contents(idf_file)
+        # parse all of the objects in the file
+        idf_objects = idf_objects_by_type(idf_file)
         # extract all of the ScheduleDay objects
-        day_pattern1 = re.compile(r"(?i)(Schedule:Day:Interval,[\s\S]*?;)")
-        day_pattern2 = re.compile(r"(?i)(Schedule:Day:Hourly,[\s\S]*?;)")
-        day_pattern3 = re.compile(r"(?i)(Schedule:Day:List,[\s\S]*?;)")
-        day_sch_str = day_pattern1.findall(file_contents) + \
-            day_pattern2.findall(file_contents) + day_pattern3.findall(file_contents)
+        day_sch_str = idf_objects_of_type(
+            idf_objects,
+            ('Schedule:Day:Interval', 'Schedule:Day:Hourly', 'Schedule:Day:List'))
         day_schedule_dict = ScheduleRuleset._idf_day_schedule_dictionary(day_sch_str)
         # extract all of the Schedule:Week objects
-        week_pattern_1 = re.compile(r"(?i)(Schedule:Week:Daily,[\s\S]*?;)")
-        week_pattern_2 = re.compile(r"(?i)(Schedule:Week:Compact,[\s\S]*?;)")
-        week_sch_str = week_pattern_1.findall(file_contents) + \
-            week_pattern_2.findall(file_contents)
+        week_sch_str = idf_objects_of_type(
+            idf_objects, ('Schedule:Week:Daily', 'Schedule:Week:Compact'))
         week_sch_dict, week_dd_dict = ScheduleRuleset._idf_week_schedule_dictionary(
             week_sch_str, day_schedule_dict)
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        sch_type_str = type_pattern.findall(file_contents)
+        sch_type_str = idf_objects_of_type(idf_objects, ('ScheduleTypeLimits',))
         sch_type_dict = ScheduleRuleset._idf_schedule_type_dictionary(sch_type_str)
         # extract all of the Schedule:Year objects and convert to ScheduleRuleset
-        year_pattern = re.compile(r"(?i)(Schedule:Year,[\s\S]*?;)")
-        year_props = tuple(parse_idf_string(idf_string) for
-                           idf_string in year_pattern.findall(file_contents))
+        year_props = tuple(parse_idf_string(idf_string) for idf_string in
+                           idf_objects_of_type(idf_objects, ('Schedule:Year',)))
         # extract all of the Schedule:Constant objects and convert to ScheduleRuleset
-        constant_pattern = re.compile(r"(?i)(Schedule:Constant,[\s\S]*?;)")
-        constant_props = tuple(parse_idf_string(idf_string) for
-                               idf_string in constant_pattern.findall(file_contents))
+        constant_props = tuple(
+            parse_idf_string(idf_string) for idf_string in
+            idf_objects_of_type(idf_objects, ('Schedule:Constant',)))
         # extract all of the Schedule:Compact objects and convert to ScheduleRuleset
-        conpact_pattern = re.compile(r"(?i)(Schedule:Compact,[\s\S]*?;)")
         compact_props = (
             tuple(
-                parse_idf_string(idf_string)
-                for idf_string in conpact_pattern.findall(file_contents)
+                parse_idf_string(idf_string) for idf_string in
+                idf_objects_of_type(idf_objects, ('Schedule:Compact',))
             )
             if import_compact  # only if user chooses so.
             else []
@@ -1343,40 +1339,8 @@ class ScheduleRuleset(object):
             assert abs(sum(weights) - 1.0) <= 1e-9, 'Average schedule weights must ' \
                 'sum to 1. Got {}.'.format(sum(weights))
 
-        # if all input schedules are single week, the averaging process is a lot simpler
-        if all([sched.is_single_week for sched in schedules]):
-            rule_indices = [range(len(sched)) for sched in schedules]
-            return ScheduleRuleset._get_avg_week(
-                identifier, schedules, weights, timestep_resolution, rule_indices)
-        else:
-            # loop through 365 days of the year to find unique combinations of rules
-            rules_each_day = []
-            for doy in range(1, 366):
-                rules_on_doy = tuple(tuple(
-                    i for i, rule in enumerate(sched._schedule_rules)
-                    if rule._start_doy <= doy <= rule._end_doy)
-                    for sched in schedules)
-                rules_each_day.append(rules_on_doy)
-            unique_rule_sets = set(rules_each_day)
-            # create the average week schedules from the unique combinations of rules
-            week_schedules = []
-            for i, rule_indices in enumerate(unique_rule_sets):
-                week_identifier = '{}_{}'.format(identifier, i)
-                week_sched = ScheduleRuleset._get_avg_week(
-                    week_identifier, schedules, weights,
-                    timestep_resolution, rule_indices
-                )
-                week_schedules.append(week_sched)
-            # combine the week schedules into rules
-            final_rules, holiday_sch, summer_dd_sch, winter_dd_sch = \
-                ScheduleRuleset._combine_week_schedules(
-                    unique_rule_sets, week_schedules, rules_each_day)
-            # add all rules to a final ScheduleRuleset
-            default_day_schedule = final_rules[0].schedule_day
-            schedule_type = schedules[0].schedule_type_limit
-            return ScheduleRuleset(
-                identifier, default_day_schedule, final_rules[1:], schedule_type,
-                holiday_sch, summer_dd_sch, winter_dd_sch)
+        return ScheduleRuleset._combine_schedules(
+            identifier, schedules, timestep_resolution, weights=weights)
 
     @staticmethod
     def max_schedules(identifier, schedules, timestep_resolution=1):
@@ -1401,40 +1365,8 @@ class ScheduleRuleset(object):
         assert isinstance(schedules, (list, tuple)), 'Expected a list of ' \
             'ScheduleRuleset objects for max_schedules. Got {}.'.format(type(schedules))
 
-        # if all input schedules are single week, the process is a lot simpler
-        if all([sched.is_single_week for sched in schedules]):
-            rule_indices = [range(len(sched)) for sched in schedules]
-            return ScheduleRuleset._get_ext_week(
-                identifier, schedules, max, timestep_resolution, rule_indices)
-        else:
-            # loop through 365 days of the year to find unique combinations of rules
-            rules_each_day = []
-            for doy in range(1, 366):
-                rules_on_doy = tuple(tuple(
-                    i for i, rule in enumerate(sched._schedule_rules)
-                    if rule._start_doy <= doy <= rule._end_doy)
-                    for sched in schedules)
-                rules_each_day.append(rules_on_doy)
-            unique_rule_sets = set(rules_each_day)
-            # create the combined week schedules from the unique combinations of rules
-            week_schedules = []
-            for i, rule_indices in enumerate(unique_rule_sets):
-                week_identifier = '{}_{}'.format(identifier, i)
-                week_sched = ScheduleRuleset._get_ext_week(
-                    week_identifier, schedules, max,
-                    timestep_resolution, rule_indices
-                )
-                week_schedules.append(week_sched)
-            # combine the week schedules into rules
-            final_rules, holiday_sch, summer_dd_sch, winter_dd_sch = \
-                ScheduleRuleset._combine_week_schedules(
-                    unique_rule_sets, week_schedules, rules_each_day)
-            # add all rules to a final ScheduleRuleset
-            default_day_schedule = final_rules[0].schedule_day
-            schedule_type = schedules[0].schedule_type_limit
-            return ScheduleRuleset(
-                identifier, default_day_schedule, final_rules[1:], schedule_type,
-                holiday_sch, summer_dd_sch, winter_dd_sch)
+        return ScheduleRuleset._combine_schedules(
+            identifier, schedules, timestep_resolution, operator=max)
 
     @staticmethod
     def min_schedules(identifier, schedules, timestep_resolution=1):
@@ -1459,83 +1391,75 @@ class ScheduleRuleset(object):
         assert isinstance(schedules, (list, tuple)), 'Expected a list of ' \
             'ScheduleRuleset objects for min_schedules. Got {}.'.format(type(schedules))
 
-        # if all input schedules are single week, the process is a lot simpler
-        if all([sched.is_single_week for sched in schedules]):
-            rule_indices = [range(len(sched)) for sched in schedules]
-            return ScheduleRuleset._get_ext_week(
-                identifier, schedules, min, timestep_resolution, rule_indices)
-        else:
-            # loop through 365 days of the year to find unique combinations of rules
-            rules_each_day = []
-            for doy in range(1, 366):
-                rules_on_doy = tuple(tuple(
-                    i for i, rule in enumerate(sched._schedule_rules)
-                    if rule._start_doy <= doy <= rule._end_doy)
-                    for sched in schedules)
-                rules_each_day.append(rules_on_doy)
-            unique_rule_sets = set(rules_each_day)
-            # create the combined week schedules from the unique combinations of rules
-            week_schedules = []
-            for i, rule_indices in enumerate(unique_rule_sets):
-                week_identifier = '{}_{}'.format(identifier, i)
-                week_sched = ScheduleRuleset._get_ext_week(
-                    week_identifier, schedules, min,
-                    timestep_resolution, rule_indices
-                )
-                week_schedules.append(week_sched)
-            # combine the week schedules into rules
-            final_rules, holiday_sch, summer_dd_sch, winter_dd_sch = \
-                ScheduleRuleset._combine_week_schedules(
-                    unique_rule_sets, week_schedules, rules_each_day)
-            # add all rules to a final ScheduleRuleset
-            default_day_schedule = final_rules[0].schedule_day
-            schedule_type = schedules[0].schedule_type_limit
-            return ScheduleRuleset(
-                identifier, default_day_schedule, final_rules[1:], schedule_type,
-                holiday_sch, summer_dd_sch, winter_dd_sch)
-
-    def _get_sch_values(self, sch_day_vals, dow, start_date, end_date,
-                        hol_doy, hol_vals):
-        """Get a list of values over a date range for a typical year."""
-        values = []
-        for doy in range(start_date.doy, end_date.doy + 1):
-            if dow > 7:  # reset the day of the week to sunday
-                dow = 1
-            if doy in hol_doy:
-                if hol_vals is not None:
-                    values.extend(hol_vals)
-                else:  # no holiday values; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            else:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.does_rule_apply(doy, dow):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            dow += 1
-        return values
+        return ScheduleRuleset._combine_schedules(
+            identifier, schedules, timestep_resolution, operator=min)
+
+    def _get_rule_indices(self, dow, start_doy, end_doy, hol_doy,
+                          use_holiday_schedule=False, leap_year=False):
+        """Get a list with the index of the ScheduleDay that applies on each day.
+
+        Indices refer to the schedule_rules followed by the default_day_schedule
+        and then the holiday_schedule (if use_holiday_schedule is True). The result
+        of the last call is cached on the ScheduleRuleset and is reused as long
+        as the inputs and the dates/days of the schedule_rules are unchanged.
+        """
+        rules = self._schedule_rules
+        rule_key = tuple((rule.start_date, rule.end_date, rule.week_apply_tuple)
+                         for rule in rules)
+        key = (dow, start_doy, end_doy, tuple(hol_doy), use_holiday_schedule,
+               leap_year, rule_key)
+        if self._rule_index_cache is not None and self._rule_index_cache[0] == key:
+            return self._rule_index_cache[1]
+
+        default_i = len(rules)
+        hol_i = default_i + 1 if use_holiday_schedule else default_i
+        if np is not None:  # assign rules to all days at once using numpy
+            doys = np.arange(start_doy, end_doy + 1)
+            dows = (np.arange(len(doys)) + (dow - 1)) % 7
+            rule_indices = np.full(len(doys), default_i, dtype=np.intp)
+            for i in range(len(rules) - 1, -1, -1):  # higher priority rules last
+                rule = rules[i]
+                st_doy, end_doy_r = rule._start_doy, rule._end_doy
+                if leap_year:
+                    st_doy = st_doy if rule.start_date.month <= 2 else st_doy + 1
+                    end_doy_r = end_doy_r if rule.end_date.month <= 2 else end_doy_r + 1
+                if rule.is_reversed:
+                    in_range = (doys <= end_doy_r) | (st_doy <= doys)
+                else:
+                    in_range = (st_doy <= doys) & (doys <= end_doy_r)
+                applies = in_range & np.array(rule.week_apply_tuple)[dows]
+                rule_indices[applies] = i
+            if len(hol_doy) != 0:
+                rule_indices[np.isin(doys, hol_doy)] = hol_i
+            rule_indices = rule_indices.tolist()
+        else:  # assign rules to each day in pure python
+            rule_indices = []
+            hol_doy = set(hol_doy)
+            for doy in range(start_doy, end_doy + 1):
+                if dow > 7:  # reset the day of the week to sunday
+                    dow = 1
+                if doy in hol_doy:
+                    rule_indices.append(hol_i)
+                else:
+                    for i, rule in enumerate(rules):  # see if rules apply
+                        applies = rule.does_rule_apply_leap_year(doy, dow) \
+                            if leap_year else rule.does_rule_apply(doy, dow)
+                        if applies:
+                            rule_indices.append(i)
+                            break
+                    else:  # no rule applies; use default_day_schedule.
+                        rule_indices.append(default_i)
+                dow += 1
+        # bypass the lock since the cache does not change the schedule
+        object.__setattr__(self, '_rule_index_cache', (key, rule_indices))
+        return rule_indices
 
-    def _get_sch_values_leap_year(self, sch_day_vals, dow, start_date, end_date,
-                                  hol_doy, hol_vals):
-        """Get a list of values over a date range for a leap year."""
+    @staticmethod
+    def _get_sch_values(sch_day_vals, rule_indices):
+        """Get a list of values from daily values and the index used on each day."""
         values = []
-        for doy in range(start_date.doy, end_date.doy + 1):
-            if dow > 7:  # reset the day of the week to sunday
-                dow = 1
-            if doy in hol_doy:
-                if hol_vals is not None:
-                    values.extend(hol_vals)
-                else:  # no holiday values; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            else:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.does_rule_apply_leap_year(doy, dow):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            dow += 1
+        for i in rule_indices:
+            values.extend(sch_day_vals[i])
         return values
 
     def _get_week_list(self, rule_indices):
@@ -1737,75 +1661,169 @@ class ScheduleRuleset(object):
         return final_rules, holiday_sch, summer_dd_sch, winter_dd_sch
 
     @staticmethod
-    def _get_avg_week(identifier, schedules, weights, timestep_resolution, rule_indices):
-        """Get an average week schedule across several schedules and rule_indices."""
-        # get matrix with each ruleset schedule in rows and each day of week in cols
-        val_mtx = ScheduleRuleset._sch_value_mtx(
-            schedules, timestep_resolution, rule_indices)
-        # transpose the matrix and compute weighted average values for each dow
-        avg_mtx = []
-        for dow_list in zip(*val_mtx):
-            sch_vals = [sum([val * weights[i] for i, val in enumerate(values)])
-                        for values in zip(*dow_list)]
-            avg_mtx.append(sch_vals)
-        # create the final ScheduleRuleset from the values
-        return ScheduleRuleset.from_week_daily_values(
-            identifier, avg_mtx[0], avg_mtx[1], avg_mtx[2], avg_mtx[3], avg_mtx[4],
-            avg_mtx[5], avg_mtx[6], avg_mtx[7], timestep_resolution,
-            schedules[0].schedule_type_limit, avg_mtx[8], avg_mtx[9])
+    def _combine_schedules(identifier, schedules, timestep_resolution,
+                           weights=None, operator=None):
+        """Combine several ScheduleRulesets into one with weights or an operator.
+
+        The values of each ScheduleDay across all of the input schedules are
+        computed only once and each unique combination of ScheduleDays is combined
+        only once, using NumPy when it is available.
+
+        Args:
+            identifier: Text for the identifier of the combined ScheduleRuleset.
+            schedules: A list of ScheduleRuleset objects to be combined.
+            timestep_resolution: Integer for the timestep resolution at which
+                the schedules will be combined.
+            weights: A list of weights for each of the schedules, which will be
+                used to compute a weighted average. Only used when the
+                operator is None.
+            operator: Either the native Python max or min function to note which
+                extreme value should be taken at each timestep. (Default: None).
+        """
+        # get the unique combinations of rules that apply over the year
+        if all([sched.is_single_week for sched in schedules]):
+            rules_each_day = None
+            unique_rule_sets = [tuple(tuple(range(len(sched))) for sched in schedules)]
+        else:
+            rules_each_day = ScheduleRuleset._rules_each_day(schedules)
+            unique_rule_sets = set(rules_each_day)
+
+        # get the values of each ScheduleDay that applies to a day of a week
+        day_values, day_map = [], {}  # values of each ScheduleDay that is used
+        week_combs, comb_map = [], {}  # index of the combination for each day
+        day_combs = []  # unique combinations of ScheduleDays across schedules
+        for rule_indices in unique_rule_sets:
+            sch_days = []
+            for sched, sch_rules in zip(schedules, rule_indices):
+                day_is = []
+                for day_sch in ScheduleRuleset._week_day_schedules(sched, sch_rules):
+                    try:
+                        day_is.append(day_map[id(day_sch)])
+                    except KeyError:  # first time the ScheduleDay is used
+                        day_map[id(day_sch)] = len(day_values)
+                        day_is.append(len(day_values))
+                        day_values.append(day_sch.values_at_timestep(timestep_resolution))
+                sch_days.append(day_is)
+            week_comb = []
+            for day_comb in zip(*sch_days):
+                try:
+                    week_comb.append(comb_map[day_comb])
+                except KeyError:  # first time the combination of ScheduleDays is used
+                    comb_map[day_comb] = len(day_combs)
+                    week_comb.append(len(day_combs))
+                    day_combs.append(day_comb)
+            week_combs.append(week_comb)
+        comb_values = ScheduleRuleset._combine_day_values(
+            day_values, day_combs, weights, operator)
+
+        # create the combined week schedules from the combined values
+        schedule_type = schedules[0].schedule_type_limit
+        week_schedules = []
+        for i, week_comb in enumerate(week_combs):
+            week_identifier = identifier if rules_each_day is None \
+                else '{}_{}'.format(identifier, i)
+            mtx = [comb_values[c_i] for c_i in week_comb]
+            week_sched = ScheduleRuleset.from_week_daily_values(
+                week_identifier, mtx[0], mtx[1], mtx[2], mtx[3], mtx[4], mtx[5],
+                mtx[6], mtx[7], timestep_resolution, schedule_type, mtx[8], mtx[9])
+            week_schedules.append(week_sched)
+        if rules_each_day is None:  # all input schedules are single week
+            return week_schedules[0]
+
+        # combine the week schedules into rules
+        final_rules, holiday_sch, summer_dd_sch, winter_dd_sch = \
+            ScheduleRuleset._combine_week_schedules(
+                unique_rule_sets, week_schedules, rules_each_day)
+        # add all rules to a final ScheduleRuleset
+        default_day_schedule = final_rules[0].schedule_day
+        return ScheduleRuleset(
+            identifier, default_day_schedule, final_rules[1:], schedule_type,
+            holiday_sch, summer_dd_sch, winter_dd_sch)
+
+    @staticmethod
+    def _rules_each_day(schedules):
+        """Get a list with the indices of the rules of each schedule for 365 days."""
+        sch_day_rules = []
+        for sched in schedules:
+            day_rules = [[] for _ in range(365)]
+            for i, rule in enumerate(sched._schedule_rules):
+                for doy in range(rule._start_doy, rule._end_doy + 1):
+                    day_rules[doy - 1].append(i)
+            sch_day_rules.append([tuple(rules) for rules in day_rules])
+        return list(zip(*sch_day_rules))
 
     @staticmethod
-    def _get_ext_week(identifier, schedules, operator, timestep_resolution, rule_indices):
-        """Get a max or min week schedule across several schedules and rule_indices.
+    def _combine_day_values(day_values, day_combs, weights, operator):
+        """Combine the values of ScheduleDays for each combination of ScheduleDays.
+
+        Weighted averages are summed in the order of the schedules such that the
+        result is the same with and without NumPy.
 
-        Note that the operator is expected to be either the native Python max
-        operator or the native Python min operator depending on the type of extreme
-        being requested.
+        Args:
+            day_values: A list with the values of each ScheduleDay at the timestep.
+            day_combs: A list of tuples with an index of day_values for each schedule.
+            weights: A list of weights for each schedule. Only used when the
+                operator is None.
+            operator: Either the native Python max or min function or None to
+                compute a weighted average.
         """
-        # get matrix with each ruleset schedule in rows and each day of week in cols
-        val_mtx = ScheduleRuleset._sch_value_mtx(
-            schedules, timestep_resolution, rule_indices)
-        # transpose the matrix and compute weighted average values for each dow
-        ext_mtx = []
-        for dow_list in zip(*val_mtx):
-            sch_vals = [operator(values) for values in zip(*dow_list)]
-            ext_mtx.append(sch_vals)
-        # create the final ScheduleRuleset from the values
-        return ScheduleRuleset.from_week_daily_values(
-            identifier, ext_mtx[0], ext_mtx[1], ext_mtx[2], ext_mtx[3], ext_mtx[4],
-            ext_mtx[5], ext_mtx[6], ext_mtx[7], timestep_resolution,
-            schedules[0].schedule_type_limit, ext_mtx[8], ext_mtx[9])
+        if np is not None:
+            val_array = np.array(day_values, dtype=float)[np.array(day_combs)]
+            if operator is max:
+                return val_array.max(axis=1).tolist()
+            elif operator is min:
+                return val_array.min(axis=1).tolist()
+            comb_array = np.zeros((len(day_combs), val_array.shape[2]))
+            for s_i, weight in enumerate(weights):
+                comb_array += val_array[:, s_i] * weight
+            return comb_array.tolist()
+
+        if operator is not None:
+            return [[operator(vals) for vals in zip(*[day_values[d_i] for d_i in comb])]
+                    for comb in day_combs]
+        weighted_values = {}  # weighted values of each ScheduleDay of each schedule
+        comb_values = []
+        for day_comb in day_combs:
+            sch_vals = []
+            for s_i, d_i in enumerate(day_comb):
+                try:
+                    sch_vals.append(weighted_values[(s_i, d_i)])
+                except KeyError:  # first time the ScheduleDay is used for the schedule
+                    w_vals = [val * weights[s_i] for val in day_values[d_i]]
+                    weighted_values[(s_i, d_i)] = w_vals
+                    sch_vals.append(w_vals)
+            comb_values.append([sum(vals) for vals in zip(*sch_vals)])
+        return comb_values
 
     @staticmethod
-    def _sch_value_mtx(schedules, timestep_resolution, rule_indices):
-        """Get a matrix with each ruleset schedule in rows and each day of week in cols.
+    def _week_day_schedules(schedule, rule_indices):
+        """Get the ScheduleDays of a ScheduleRuleset for the 7 days of the week.
+
+        The returned list also includes the holiday, summer design day and winter
+        design day schedules after the 7 days of the week.
+
+        Args:
+            schedule: A ScheduleRuleset.
+            rule_indices: The indices of the schedule_rules that apply for the week.
         """
-        # get matrix with each ruleset schedule in rows and each day of week in cols
-        val_mtx = []
-        for s_i, sched in enumerate(schedules):
-            week_list = []
-            for dow in range(7):
-                for i in rule_indices[s_i]:  # see if rules apply
-                    if sched[i].week_apply_tuple[dow]:
-                        week_list.append(sched[i].schedule_day)
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    week_list.append(sched.default_day_schedule)
-
-            # check the rules applied for holidays + summer and winter design days
-            holiday = sched.default_day_schedule if sched._holiday_schedule \
-                is None else sched._holiday_schedule
-            week_list.append(holiday)
-            summer = sched.default_day_schedule if sched._summer_designday_schedule \
-                is None else sched._summer_designday_schedule
-            week_list.append(summer)
-            winter = sched.default_day_schedule if sched._winter_designday_schedule \
-                is None else sched._winter_designday_schedule
-            week_list.append(winter)
-            # add all values to the matrix
-            val_mtx.append([day_sch.values_at_timestep(timestep_resolution)
-                            for day_sch in week_list])
-        return val_mtx
+        week_list = []
+        for dow in range(7):
+            for i in rule_indices:  # see if rules apply
+                if schedule[i].week_apply_tuple[dow]:
+                    week_list.append(schedule[i].schedule_day)
+                    break
+            else:  # no rule applies; use default_day_schedule.
+                week_list.append(schedule.default_day_schedule)
+
+        # check the rules applied for holidays + summer and winter design days
+        default = schedule.default_day_schedule
+        week_list.append(default if schedule._holiday_schedule is None
+                         else schedule._holiday_schedule)
+        week_list.append(default if schedule._summer_designday_schedule is None
+                         else schedule._summer_designday_schedule)
+        week_list.append(default if schedule._winter_designday_schedule is None
+                         else schedule._winter_designday_schedule)
+        return week_list
 
     @staticmethod
     def _instance_in_array(object_instance, object_array):
@@ -2,7 +2,7 @@
 """Schedule type definition."""
 from __future__ import division
 
-from ..reader import parse_idf_string, clean_idf_file_contents
+from ..reader import parse_idf_string, idf_objects_by_type, idf_objects_of_type
 from ..writer import generate_idf_string
 
 from honeybee.typing import valid_ep_string, valid_string, float_in_range
@@ -10,8 +10,6 @@ from honeybee.altnumber import no_limit
 from ladybug.datatype import fraction, temperature, temperaturedelta, power, \
     angle, speed, distance, uvalue
 
-import re
-
 
 class ScheduleTypeLimit(object):
     """Energy schedule type definition.
@@ -266,11 +264,10 @@ class ScheduleTypeLimit(object):
             schedule_type_limits -- A list of all ScheduleTypeLimits objects in the
                 IDF file as honeybee_energy ScheduleTypeLimit objects.
         """
-        # read the file and remove lines of comments
-        file_contents = clean_idf_file_contents(idf_file)
+        # parse all of the objects in the file
+        idf_objects = idf_objects_by_type(idf_file)
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        type_idf_strings = type_pattern.findall(file_contents)
+        type_idf_strings = idf_objects_of_type(idf_objects, ('ScheduleTypeLimits',))
         schedule_type_limits = []
         for type_str in type_idf_strings:
             type_str = type_str.strip()
@@ -512,6 +512,15 @@ class SimulationParameter(object):
                 CorrelationFromWeatherFile; !- calculation method
 
 
+        """
+        return '\n\n'.join((self._settings_idf(), self.building_idf(identifier),
+                            self.water_mains_idf()))
+
+    def _settings_idf(self):
+        """Get an IDF string of all simulation settings besides the Building objects.
+
+        This includes all of the IDF objects of the to_idf method except the
+        Building and the Site:WaterMainsTemperature, which are written after them.
         """
         sim_param_str = ['!-   ==========================================\n'
                          '!-   =========  SIMULATION PARAMETERS =========\n'
@@ -552,10 +561,6 @@ class SimulationParameter(object):
         # write the global geometry rules
         sim_param_str.append(self.global_geometry_rules)
 
-        # write the Building and water mains object
-        sim_param_str.append(self.building_idf(identifier))
-        sim_param_str.append(self.water_mains_idf())
-
         return '\n\n'.join(sim_param_str)
 
     def to_dict(self):
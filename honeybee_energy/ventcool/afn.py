@@ -4,6 +4,13 @@ from __future__ import division
 
 import math
 
+try:  # numpy is an optional dependency that speeds up bulk area calculation
+    import numpy as np
+except ImportError:
+    np = None
+
+from honeybee.aperture import Aperture
+
 from .crack import AFNCrack
 from .opening import VentilationOpening
 from ._crack_data import CRACK_TEMPLATE_DATA
@@ -69,49 +76,10 @@ def _interior_afn(interior_face_groups, int_cracks, air_density=1.2041):
             air density at a temperature of 20 C and 101325 Pa).
     """
 
-    # simplify parameters
-    int_walls, int_floorceilings, int_apertures, int_doors, int_air = interior_face_groups
-
-    # add interior crack leakage components for opaque building Faces
-    for int_wall in int_walls:
-        opening_area = sum([aper.area for aper in int_wall.apertures])
-        opening_area += sum([door.area for door in int_wall.doors])
-        face_area = int_wall.area - opening_area
-        flow_cof = int_cracks['wall_flow_cof'] * face_area
-        flow_exp = int_cracks['wall_flow_exp']
-        int_wall.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
-
-    for int_floorceiling in int_floorceilings:
-        opening_area = sum([aper.area for aper in int_floorceiling.apertures])
-        face_area = int_floorceiling.area - opening_area
-        flow_cof = int_cracks['floorceiling_flow_cof'] * face_area
-        flow_exp = int_cracks['floorceiling_flow_exp']
-        int_floorceiling.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
-
-    # add interior crack leakage for air boundary Faces
-    for int_ab in int_air:
-        # derive (large) flow coefficient from the orifice equation with 0.65 discharge
-        flow_cof = 0.65 * int_ab.area * math.sqrt(air_density * 2)
-        flow_exp = 0.5  # always use 0.5 exponent for a large hole-shaped opening
-        int_ab.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
-
-    # add interior opening leakage components
-    for int_aperture in int_apertures:
-        if int_aperture.properties.energy.vent_opening is None:
-            int_aperture.is_operable = True
-            int_aperture.properties.energy.vent_opening = \
-                VentilationOpening(fraction_area_operable=0)
-        vent_opening = int_aperture.properties.energy.vent_opening
-        vent_opening.flow_coefficient_closed = int_cracks['window_flow_cof']
-        vent_opening.flow_exponent_closed = int_cracks['window_flow_exp']
-
-    for int_door in int_doors:
-        if int_door.properties.energy.vent_opening is None:
-            int_door.properties.energy.vent_opening = \
-                VentilationOpening(fraction_area_operable=0)
-        vent_opening = int_door.properties.energy.vent_opening
-        vent_opening.flow_coefficient_closed = int_cracks['door_flow_cof']
-        vent_opening.flow_exponent_closed = int_cracks['door_flow_exp']
+    cracks, openings = _afn_components()
+    _add_interior_components(
+        cracks, openings, interior_face_groups, int_cracks, air_density)
+    _assign_afn_components(cracks, openings)
 
 
 def _exterior_afn(exterior_face_groups, ext_cracks):
@@ -157,48 +125,185 @@ def _exterior_afn(exterior_face_groups, ext_cracks):
             }
     """
 
-    # simplify parameters
+    cracks, openings = _afn_components()
+    _add_exterior_components(cracks, openings, exterior_face_groups, ext_cracks)
+    _assign_afn_components(cracks, openings)
+
+
+def _afn_components():
+    """Get empty containers for the leakage components of an Airflow Network.
+
+    Returns:
+        A tuple with two items.
+
+        -   cracks - A tuple with four parallel lists for the Faces that get an
+            AFNCrack, the Apertures and Doors that get subtracted from the area
+            of each Face, the flow coefficient per unit area of each Face and
+            the flow exponent of each Face.
+
+        -   openings - A tuple with three parallel lists for the Apertures and
+            Doors that get closed VentilationOpening parameters, their flow
+            coefficient when closed and their flow exponent when closed.
+    """
+    return ([], [], [], []), ([], [], [])
+
+
+def _add_cracks(cracks, faces, flow_cof, flow_exp, apertures=False, doors=False):
+    """Add a group of Faces with the same leakage parameters to the cracks."""
+    crack_faces, sub_faces, cofs, exps = cracks
+    crack_faces.extend(faces)
+    if apertures and doors:
+        sub_faces.extend([face.apertures + face.doors for face in faces])
+    elif apertures:
+        sub_faces.extend([face.apertures for face in faces])
+    else:
+        sub_faces.extend([()] * len(faces))
+    cofs.extend([flow_cof] * len(faces))
+    exps.extend([flow_exp] * len(faces))
+
+
+def _add_openings(openings, sub_faces, flow_cof, flow_exp):
+    """Add a group of Apertures or Doors with the same leakage parameters to openings.
+    """
+    open_faces, cofs, exps = openings
+    open_faces.extend(sub_faces)
+    cofs.extend([flow_cof] * len(sub_faces))
+    exps.extend([flow_exp] * len(sub_faces))
+
+
+def _add_interior_components(cracks, openings, interior_face_groups, int_cracks,
+                             air_density):
+    """Add the interior leakage components of a room to cracks and openings."""
+    int_walls, int_floorceilings, int_apertures, int_doors, int_air = interior_face_groups
+    _add_cracks(cracks, int_walls, int_cracks['wall_flow_cof'],
+                int_cracks['wall_flow_exp'], apertures=True, doors=True)
+    _add_cracks(cracks, int_floorceilings, int_cracks['floorceiling_flow_cof'],
+                int_cracks['floorceiling_flow_exp'], apertures=True)
+    # derive (large) flow coefficient from the orifice equation with 0.65 discharge
+    # and always use 0.5 exponent for a large hole-shaped opening
+    _add_cracks(cracks, int_air, 0.65 * math.sqrt(air_density * 2), 0.5)
+    _add_openings(openings, int_apertures, int_cracks['window_flow_cof'],
+                  int_cracks['window_flow_exp'])
+    _add_openings(openings, int_doors, int_cracks['door_flow_cof'],
+                  int_cracks['door_flow_exp'])
+
+
+def _add_exterior_components(cracks, openings, exterior_face_groups, ext_cracks):
+    """Add the exterior leakage components of a room to cracks and openings."""
     ext_walls, ext_roofs, ext_floors, ext_apertures, ext_doors = exterior_face_groups
+    _add_cracks(cracks, ext_walls, ext_cracks['wall_flow_cof'],
+                ext_cracks['wall_flow_exp'], apertures=True, doors=True)
+    _add_cracks(cracks, ext_roofs, ext_cracks['roof_flow_cof'],
+                ext_cracks['roof_flow_exp'], apertures=True)
+    _add_cracks(cracks, ext_floors, ext_cracks['floor_flow_cof'],
+                ext_cracks['floor_flow_exp'])
+    _add_openings(openings, ext_apertures, ext_cracks['window_flow_cof'],
+                  ext_cracks['window_flow_exp'])
+    _add_openings(openings, ext_doors, ext_cracks['door_flow_cof'],
+                  ext_cracks['door_flow_exp'])
+
+
+def _add_infiltration_components(cracks, openings, room, exterior_face_groups,
+                                 air_density, delta_pressure):
+    """Add exterior leakage components derived from a room's infiltration to cracks.
+
+    These are the same components that are assigned by the
+    exterior_afn_from_infiltration_load method of the RoomEnergyProperties.
+    """
+    (ext_faces, flow_cof, flow_exp), (ext_openings, closed_cof, closed_exp) = \
+        room.properties.energy._infiltration_afn_components(
+            exterior_face_groups, air_density, delta_pressure)
+    _add_cracks(cracks, ext_faces, flow_cof, flow_exp)
+    _add_openings(openings, ext_openings, closed_cof, closed_exp)
+
+
+def _face_areas(faces):
+    """Get the areas of many honeybee Faces, Apertures or Doors at once.
+
+    The areas are computed with Newell's method directly from the 3D vertices,
+    which avoids projecting each polygon into the 2D space of its plane. When
+    numpy is available, all areas are computed in a single vectorized step.
+
+    Args:
+        faces: A list of honeybee Faces, Apertures and/or Doors.
 
-    # add exterior crack leakage components
-    for ext_wall in ext_walls:
-        opening_area = sum([aper.area for aper in ext_wall.apertures])
-        opening_area += sum([door.area for door in ext_wall.doors])
-        face_area = ext_wall.area - opening_area
-        flow_cof = ext_cracks['wall_flow_cof'] * face_area
-        flow_exp = ext_cracks['wall_flow_exp']
-        ext_wall.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
-
-    for ext_roof in ext_roofs:
-        opening_area = sum([aper.area for aper in ext_roof.apertures])
-        face_area = ext_roof.area - opening_area
-        flow_cof = ext_cracks['roof_flow_cof'] * face_area
-        flow_exp = ext_cracks['roof_flow_exp']
-        ext_roof.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
-
-    for ext_floor in ext_floors:
-        face_area = ext_floor.area
-        flow_cof = ext_cracks['floor_flow_cof'] * face_area
-        flow_exp = ext_cracks['floor_flow_exp']
-        ext_floor.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
-
-    # add exterior opening leakage components
-    for ext_aperture in ext_apertures:
-        if ext_aperture.properties.energy.vent_opening is None:
-            ext_aperture.is_operable = True
-            ext_aperture.properties.energy.vent_opening = \
-                VentilationOpening(fraction_area_operable=0)
-        vent_opening = ext_aperture.properties.energy.vent_opening
-        vent_opening.flow_coefficient_closed = ext_cracks['window_flow_cof']
-        vent_opening.flow_exponent_closed = ext_cracks['window_flow_exp']
-
-    for ext_door in ext_doors:
-        if ext_door.properties.energy.vent_opening is None:
-            ext_door.properties.energy.vent_opening = \
-                VentilationOpening(fraction_area_operable=0)
-        vent_opening = ext_door.properties.energy.vent_opening
-        vent_opening.flow_coefficient_closed = ext_cracks['door_flow_cof']
-        vent_opening.flow_exponent_closed = ext_cracks['door_flow_exp']
+    Returns:
+        A list of numbers for the area of each of the input faces.
+    """
+    if len(faces) == 0:
+        return []
+    verts = [face.geometry.vertices for face in faces]
+    if np is None:  # sum the cross products of each loop one vertex at a time
+        areas = []
+        for pts in verts:
+            x = y = z = 0
+            p_pt = pts[-1]
+            for pt in pts:
+                x += p_pt.y * pt.z - p_pt.z * pt.y
+                y += p_pt.z * pt.x - p_pt.x * pt.z
+                z += p_pt.x * pt.y - p_pt.y * pt.x
+                p_pt = pt
+            areas.append(math.sqrt(x * x + y * y + z * z) / 2)
+    else:  # put all vertices in one array and sum the cross products of each loop
+        counts = np.array([len(pts) for pts in verts], dtype=np.intp)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        coords = np.array(
+            [(pt.x, pt.y, pt.z) for pts in verts for pt in pts], dtype=float)
+        next_i = np.arange(1, len(coords) + 1, dtype=np.intp)
+        next_i[ends - 1] = starts
+        normals = np.add.reduceat(np.cross(coords, coords[next_i]), starts, axis=0)
+        areas = (np.sqrt((normals * normals).sum(axis=1)) / 2).tolist()
+    return areas
+
+
+def _assign_afn_components(cracks, openings):
+    """Assign AFNCrack and VentilationOpening parameters to cracks and openings.
+
+    All crack areas are computed at once and then multiplied by the flow
+    coefficients per unit area before everything is assigned in a single pass.
+
+    Args:
+        cracks: A tuple with four parallel lists for the Faces that get an
+            AFNCrack, the Apertures and Doors that get subtracted from the area
+            of each Face, the flow coefficient per unit area of each Face and
+            the flow exponent of each Face.
+        openings: A tuple with three parallel lists for the Apertures and Doors
+            that get closed VentilationOpening parameters, their flow coefficient
+            when closed and their flow exponent when closed.
+    """
+    # compute the areas of all cracks and the openings subtracted from them
+    crack_faces, sub_faces, cofs, exps = cracks
+    sub_count = [len(subs) for subs in sub_faces]
+    all_areas = _face_areas(crack_faces + [s for subs in sub_faces for s in subs])
+    crack_count = len(crack_faces)
+    if np is not None and crack_count != 0:
+        areas = np.array(all_areas)
+        owners = np.repeat(np.arange(crack_count), sub_count)
+        net_areas = areas[:crack_count] - \
+            np.bincount(owners, weights=areas[crack_count:], minlength=crack_count)
+        flow_cofs = (net_areas * np.array(cofs)).tolist()
+    else:
+        flow_cofs, sub_i = [], crack_count
+        for area, count, cof in zip(all_areas, sub_count, cofs):
+            opening_area = sum(all_areas[sub_i:sub_i + count])
+            flow_cofs.append(cof * (area - opening_area))
+            sub_i += count
+
+    # assign the cracks to the faces
+    for face, flow_cof, flow_exp in zip(crack_faces, flow_cofs, exps):
+        face.properties.energy.vent_crack = AFNCrack(flow_cof, flow_exp)
+
+    # assign the closed leakage parameters to the openings
+    for sub_face, flow_cof, flow_exp in zip(*openings):
+        sub_energy = sub_face.properties.energy
+        if sub_energy.vent_opening is None:
+            if isinstance(sub_face, Aperture):
+                sub_face.is_operable = True
+            sub_energy.vent_opening = VentilationOpening(fraction_area_operable=0)
+        vent_opening = sub_energy.vent_opening
+        vent_opening.flow_coefficient_closed = flow_cof
+        vent_opening.flow_exponent_closed = flow_exp
 
 
 def generate(rooms, leakage_type='Medium', use_room_infiltration=True,
@@ -274,16 +379,17 @@ def generate(rooms, leakage_type='Medium', use_room_infiltration=True,
         raise AssertionError('leakage_type must be "Excellent", "Medium", '
                              'or "VeryPoor". Got: {}.'.format(leakage_type))
 
-    # generate the airflow newtwork
+    # gather the leakage components of all rooms
+    rho = _air_density_from_pressure(atmospheric_pressure)
+    cracks, openings = _afn_components()
     for room in rooms:
-        # get grouped faces by type that experience air flow leakage
         ext_faces, int_faces = room.properties.energy.envelope_components_by_type()
-
-        # mutate surfaces with AFN flow parameters
-        rho = _air_density_from_pressure(atmospheric_pressure)
         if use_room_infiltration and room.properties.energy.infiltration is not None:
-            room.properties.energy.exterior_afn_from_infiltration_load(
-                ext_faces, air_density=rho, delta_pressure=delta_pressure)
+            _add_infiltration_components(
+                cracks, openings, room, ext_faces, rho, delta_pressure)
         else:
-            _exterior_afn(ext_faces, ext_cracks)
-        _interior_afn(int_faces, int_cracks, rho)
+            _add_exterior_components(cracks, openings, ext_faces, ext_cracks)
+        _add_interior_components(cracks, openings, int_faces, int_cracks, rho)
+
+    # mutate the surfaces with AFN flow parameters in a single pass
+    _assign_afn_components(cracks, openings)
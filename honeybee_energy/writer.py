@@ -637,7 +637,7 @@ def room_to_idf(room):
 
 def model_to_idf(
     model, schedule_directory=None, use_ideal_air_equivalent=True,
-    patch_missing_adjacencies=False, timestep=6
+    patch_missing_adjacencies=False, timestep=6, workers=None
 ):
     r"""Generate an IDF string representation of a Model.
 
@@ -668,6 +668,16 @@ def model_to_idf(
             used to balance air boundary flows to ensure that there is never
             more air than the room volume mixed at a given simulation timestep.
             If None, no balancing of air boundary flows wil occur. (Default: 6).
+        workers: An optional integer for the number of processes across which
+            the translation of the Room geometry will be split. This can speed
+            up the translation of large models on machines with several CPUs.
+            The processes are forked from the current one so the Model is not
+            serialized but starting the pool of processes takes time, which
+            usually makes it slower for small models. The resulting IDF is
+            identical to that produced in a single process. If None or 1, all
+            geometry will be translated in the current process. Platforms that
+            cannot fork processes (eg. Windows) always use the current
+            process. (Default: None).
 
     Usage:
 
@@ -701,6 +711,89 @@ def model_to_idf(
         idf = os.path.join(folders.default_simulation_folder, 'test_file', 'in.idf')
         write_to_file(idf, idf_str, True)
     """
+    return '\n\n'.join(_model_to_idf_chunks(
+        model, schedule_directory, use_ideal_air_equivalent,
+        patch_missing_adjacencies, timestep, workers))
+
+
+def model_to_idf_stream(
+    model, file_obj, schedule_directory=None, use_ideal_air_equivalent=True,
+    patch_missing_adjacencies=False, timestep=6, workers=None
+):
+    """Write an IDF representation of a Model directly to a file object.
+
+    The text written to the file is identical to that returned from model_to_idf
+    but each IDF object is written to the file as soon as it is produced rather
+    than being collected into a single string. So this method is preferable
+    for large models where the memory needed to hold the whole IDF string
+    is significant.
+
+    Args:
+        model: A honeybee Model for which an IDF representation will be written.
+        file_obj: A writable file object (or any object with a write method that
+            accepts text) to which the IDF text will be written.
+        schedule_directory: An optional file directory to which all file-based
+            schedules should be written to. If None, all ScheduleFixedIntervals
+            will be translated to Schedule:Compact and written fully into the
+            IDF instead of to Schedule:File. (Default: None).
+        use_ideal_air_equivalent: Boolean to note whether any detailed HVAC system
+            templates should be converted to an equivalent IdealAirSystem upon export.
+            If False and the Model contains detailed systems, a ValueError will
+            be raised since this method does not support the translation of
+            detailed systems. (Default:True).
+        patch_missing_adjacencies: Boolean to note whether any missing adjacencies
+            in the model should be replaced with Adiabatic boundary conditions.
+            (Default: False).
+        timestep: An integer for the simulation timestep, which will be
+            used to balance air boundary flows. If None, no balancing of air
+            boundary flows wil occur. (Default: 6).
+        workers: An optional integer for the number of processes across which
+            the translation of the Room geometry will be split. This can speed
+            up the translation of large models on machines with several CPUs.
+            The processes are forked from the current one so the Model is not
+            serialized but starting the pool of processes takes time, which
+            usually makes it slower for small models. The resulting IDF is
+            identical to that produced in a single process. If None or 1, all
+            geometry will be translated in the current process. Platforms that
+            cannot fork processes (eg. Windows) always use the current
+            process. (Default: None).
+
+    Usage:
+
+    .. code-block:: python
+
+        from honeybee.model import Model
+        from honeybee.room import Room
+        from honeybee_energy.lib.programtypes import office_program
+        from honeybee_energy.writer import model_to_idf_stream
+
+        room = Room.from_box('Tiny House Zone', 5, 10, 3)
+        room.properties.energy.program_type = office_program
+        room.properties.energy.add_default_ideal_air()
+        model = Model('Tiny House', [room])
+
+        with open('C:/ladybug/in.idf', 'w') as idf_file:
+            model_to_idf_stream(model, idf_file)
+    """
+    idf_chunks = _model_to_idf_chunks(
+        model, schedule_directory, use_ideal_air_equivalent,
+        patch_missing_adjacencies, timestep, workers)
+    for i, idf_str in enumerate(idf_chunks):
+        if i != 0:
+            file_obj.write('\n\n')
+        file_obj.write(idf_str)
+
+
+def _model_to_idf_chunks(
+    model, schedule_directory=None, use_ideal_air_equivalent=True,
+    patch_missing_adjacencies=False, timestep=6, workers=None
+):
+    """Get a generator of IDF strings for a Model, which is used by model_to_idf.
+
+    Each yielded string is one IDF object or section header and the strings
+    are meant to be joined with double line breaks. See model_to_idf for
+    a description of the input arguments.
+    """
     # duplicate model to avoid mutating it as we edit it for energy simulation
     original_model = model
     model = model.duplicate()
@@ -734,17 +827,24 @@ def model_to_idf(
     single_zones, zone_dict = model.properties.energy.resolve_zones()
 
     # write the building object into the string
-    model_str = ['!-   =======================================\n'
-                 '!-   ================ MODEL ================\n'
-                 '!-   =======================================\n']
+    yield '!-   =======================================\n' \
+        '!-   ================ MODEL ================\n' \
+        '!-   =======================================\n'
 
     # write all of the schedules and type limits
     sched_strs = []
     type_limits = []
     used_day_sched_ids, used_day_count = {}, 1
     always_on_included = False
-    all_scheds = model.properties.energy.schedules + \
-        model.properties.energy.orphaned_trans_schedules
+    # collect the schedules and constructions with a single pass through the model
+    started_cache = model.properties.energy._start_resource_cache()
+    try:
+        all_scheds = model.properties.energy.schedules + \
+            model.properties.energy.orphaned_trans_schedules
+        model_constrs = model.properties.energy.constructions
+    finally:
+        if started_cache:
+            model.properties.energy._stop_resource_cache()
     for sched in all_scheds:
         if sched.identifier == 'Always On':
             always_on_included = True
@@ -779,10 +879,13 @@ def model_to_idf(
     if not always_on_included:
         always_schedule, _ = model.properties.energy._always_on_schedule().to_idf()
         sched_strs.append(always_schedule)
-    model_str.append('!-   ========= SCHEDULE TYPE LIMITS =========\n')
-    model_str.extend([type_limit.to_idf() for type_limit in set(type_limits)])
-    model_str.append('!-   ============== SCHEDULES ==============\n')
-    model_str.extend(sched_strs)
+    yield '!-   ========= SCHEDULE TYPE LIMITS =========\n'
+    for type_limit in set(type_limits):
+        yield type_limit.to_idf()
+    yield '!-   ============== SCHEDULES ==============\n'
+    for sched_str in sched_strs:
+        yield sched_str
+    sched_strs = None  # release the schedule strings before writing geometry
 
     # get the default generic construction set
     # must be imported here to avoid circular imports
@@ -792,8 +895,7 @@ def model_to_idf(
     materials = []
     construction_strs = []
     dynamic_cons = []
-    all_constrs = model.properties.energy.constructions + \
-        generic_construction_set.constructions_unique
+    all_constrs = model_constrs + generic_construction_set.constructions_unique
     for constr in set(all_constrs):
         try:
             materials.extend(constr.materials)
@@ -816,31 +918,34 @@ def model_to_idf(
                 construction_strs.append(constr.to_idf())  # AirBoundaryConstruction
             except TypeError:
                 pass  # ShadeConstruction; no need to write it
-    model_str.append('!-   ============== MATERIALS ==============\n')
-    model_str.extend([mat.to_idf() for mat in set(materials)])
-    model_str.append('!-   ============ CONSTRUCTIONS ============\n')
-    model_str.extend(construction_strs)
+    yield '!-   ============== MATERIALS ==============\n'
+    for mat in set(materials):
+        yield mat.to_idf()
+    yield '!-   ============ CONSTRUCTIONS ============\n'
+    for constr_str in construction_strs:
+        yield constr_str
+    construction_strs = None  # release the construction strings
 
     # write all of the HVAC systems for zones
-    model_str.append('!-   ============ HVAC SYSTEMS ============\n')
+    yield '!-   ============ HVAC SYSTEMS ============\n'
     for zone_id, zone_data in zone_dict.items():
         rooms, z_prop, set_pt, vent = zone_data
         mult, ceil_hgt, vol, flr_area, inc_flr = z_prop
-        model_str.append('!-   ________ZONE:{}________\n'.format(zone_id))
+        yield '!-   ________ZONE:{}________\n'.format(zone_id)
         zone_values = (zone_id, '', '', '', '', '', mult,
                        ceil_hgt, vol, flr_area, '', '', inc_flr)
         zone_comments = ('name', 'north', 'x', 'y', 'z', 'type', 'multiplier',
                          'ceiling height', 'volume', 'floor area', 'inside convection',
                          'outside convection', 'include floor area')
-        model_str.append(generate_idf_string('Zone', zone_values, zone_comments))
+        yield generate_idf_string('Zone', zone_values, zone_comments)
         if vent is not None:
-            model_str.append(vent.to_idf(zone_id))
+            yield vent.to_idf(zone_id)
         hvacs = [r.properties.energy.hvac for r in rooms
                  if r.properties.energy.hvac is not None]
         if set_pt is not None and len(hvacs) != 0:
-            model_str.append(set_pt.to_idf(zone_id))
+            yield set_pt.to_idf(zone_id)
             try:
-                model_str.append(hvacs[0].to_idf_zone(zone_id, set_pt, vent))
+                yield hvacs[0].to_idf_zone(zone_id, set_pt, vent)
             except AttributeError:
                 raise TypeError(
                     'HVAC system type "{}" does not support direct translation to IDF.\n'
@@ -851,58 +956,29 @@ def model_to_idf(
         if room.properties.energy.hvac is not None \
                 and room.properties.energy.setpoint is not None:
             try:
-                model_str.append(room.properties.energy.hvac.to_idf(room))
+                yield room.properties.energy.hvac.to_idf(room)
             except AttributeError:
                 raise TypeError(
                     'HVAC system type "{}" does not support direct translation to IDF.\n'
                     'Use the export to OpenStudio workflow instead.'.format(
                         room.properties.energy.hvac.__class__.__name__))
 
-    # get the default air boundary construction
-    # must be imported here to avoid circular imports
-    from .lib.constructions import air_boundary
-
     # write all of the room geometry
-    model_str.append('!-   ============ ROOM GEOMETRY ============\n')
+    yield '!-   ============ ROOM GEOMETRY ============\n'
+    mixing_faces = _air_boundary_mixing_faces(model.rooms)
     sf_objs = []
-    found_ab = []
     for room in model.rooms:
-        model_str.append(room.to.idf(room))
         for face in room.faces:
-            model_str.append(face.to.idf(face))
-            if isinstance(face.type, AirBoundary):  # write the air mixing objects
-                air_constr = face.properties.energy.construction
-                try:
-                    if face.identifier not in found_ab:
-                        adj_face = face.boundary_condition.boundary_condition_object
-                        adj_room = face.boundary_condition.boundary_condition_objects[-1]
-                        try:
-                            model_str.append(
-                                air_constr.to_cross_mixing_idf(face, adj_room))
-                        except AttributeError:  # opaque construction for air boundary
-                            model_str.append(
-                                air_boundary.to_cross_mixing_idf(face, adj_room))
-                        found_ab.append(adj_face)
-                except AttributeError as e:
-                    raise ValueError(
-                        'Face "{}" is an Air Boundary but lacks a Surface boundary '
-                        'condition.\n{}'.format(face.full_id, e))
-            for ap in face.apertures:
-                if len(ap.geometry) <= 4:  # ignore apertures to be triangulated
-                    model_str.append(ap.to.idf(ap))
-                    sf_objs.append(ap)
-                for shade in ap.outdoor_shades:
-                    model_str.append(shade.to.idf(shade))
-            for dr in face.doors:
-                if len(dr.geometry) <= 4:  # ignore doors to be triangulated
-                    model_str.append(dr.to.idf(dr))
-                    sf_objs.append(dr)
-                for shade in dr.outdoor_shades:
-                    model_str.append(shade.to.idf(shade))
-            for shade in face.outdoor_shades:
-                model_str.append(shade.to.idf(shade))
-        for shade in room.outdoor_shades:
-            model_str.append(shade.to.idf(shade))
+            for sub_f in face.apertures + face.doors:
+                if len(sub_f.geometry) <= 4:  # ignore sub-faces to be triangulated
+                    sf_objs.append(sub_f)
+    if workers is not None and workers > 1 and len(model.rooms) > 1:
+        room_strs = _rooms_to_idf_parallel(model, mixing_faces, workers)
+    else:
+        room_strs = (_room_geometry_to_idf(room, mixing_faces) for room in model.rooms)
+    for room_str in room_strs:
+        for geo_str in room_str:
+            yield geo_str
 
     # triangulate any apertures or doors with more than 4 vertices
     tri_apertures, _ = model.triangulated_apertures()
@@ -910,35 +986,35 @@ def model_to_idf(
         for i, ap in enumerate(tri_aps):
             if i != 0:
                 ap.properties.energy.vent_opening = None
-            model_str.append(ap.to.idf(ap))
+            yield ap.to.idf(ap)
             sf_objs.append(ap)
     tri_doors, _ = model.triangulated_doors()
     for tri_drs in tri_doors:
         for i, dr in enumerate(tri_drs):
             if i != 0:
                 dr.properties.energy.vent_opening = None
-            model_str.append(dr.to.idf(dr))
+            yield dr.to.idf(dr)
             sf_objs.append(dr)
 
     # write all context shade geometry
-    model_str.append('!-   ========== CONTEXT GEOMETRY ==========\n')
+    yield '!-   ========== CONTEXT GEOMETRY ==========\n'
     pv_objects = []
     for shade in model.orphaned_shades:
-        model_str.append(shade.to.idf(shade))
+        yield shade.to.idf(shade)
         if shade.properties.energy.pv_properties is not None:
             pv_objects.append(shade)
     for shade_mesh in model.shade_meshes:
-        model_str.append(shade_mesh.to.idf(shade_mesh))
+        yield shade_mesh.to.idf(shade_mesh)
     for face in model.orphaned_faces:
-        model_str.append(face_to_idf(face))
+        yield face_to_idf(face)
     for ap in model.orphaned_apertures:
-        model_str.append(aperture_to_idf(ap))
+        yield aperture_to_idf(ap)
     for dr in model.orphaned_doors:
-        model_str.append(door_to_idf(dr))
+        yield door_to_idf(dr)
 
     # write any EMS programs for dynamic constructions
     if len(dynamic_cons) != 0:
-        model_str.append('!-   ========== EMS PROGRAMS ==========\n')
+        yield '!-   ========== EMS PROGRAMS ==========\n'
         dyn_dict = {}
         for sf in sf_objs:
             con = sf.properties.energy.construction
@@ -947,17 +1023,16 @@ def model_to_idf(
             except KeyError:
                 dyn_dict[con.identifier] = [sf.identifier]
         for con in dynamic_cons:
-            model_str.append(con.to_program_idf(dyn_dict[con.identifier]))
-        model_str.append(dynamic_cons[0].idf_program_manager(dynamic_cons))
+            yield con.to_program_idf(dyn_dict[con.identifier])
+        yield dynamic_cons[0].idf_program_manager(dynamic_cons)
 
     # write any generator objects that were discovered in the model
     if len(pv_objects) != 0:
-        model_str.append('!-   ========== PHOTOVOLTAIC GENERATORS ==========\n')
+        yield '!-   ========== PHOTOVOLTAIC GENERATORS ==========\n'
         for shade in pv_objects:
-            model_str.append(shade.properties.energy.pv_properties.to_idf(shade))
-        model_str.extend(model.properties.energy.electric_load_center.to_idf(pv_objects))
-
-    return '\n\n'.join(model_str)
+            yield shade.properties.energy.pv_properties.to_idf(shade)
+        for lc_str in model.properties.energy.electric_load_center.to_idf(pv_objects):
+            yield lc_str
 
 
 def energyplus_idf_version(version_array=None):
@@ -994,6 +1069,129 @@ def _instance_in_array(object_instance, object_array):
     return False
 
 
+def _air_boundary_mixing_faces(rooms):
+    """Get the identifiers of air boundary Faces that write cross mixing objects.
+
+    Only one Face of each adjacent pair of air boundaries gets a cross mixing
+    object and this is the Face that comes first in the order of the input rooms.
+    Evaluating this before the room geometry is written allows each Room to be
+    translated independently of the others.
+
+    Args:
+        rooms: A list of honeybee Rooms in the order that they will be written.
+    """
+    mixing_faces, found_ab = set(), set()
+    for room in rooms:
+        for face in room.faces:
+            if isinstance(face.type, AirBoundary):
+                try:
+                    if face.identifier not in found_ab:
+                        adj_face = face.boundary_condition.boundary_condition_object
+                        mixing_faces.add(face.identifier)
+                        found_ab.add(adj_face)
+                except AttributeError as e:
+                    raise ValueError(
+                        'Face "{}" is an Air Boundary but lacks a Surface boundary '
+                        'condition.\n{}'.format(face.full_id, e))
+    return mixing_faces
+
+
+def _room_geometry_to_idf(room, mixing_faces):
+    """Get a list of IDF strings for the geometry of a Room and its children.
+
+    Args:
+        room: A honeybee Room for which IDF strings will be returned.
+        mixing_faces: A set of Face identifiers for which cross mixing objects
+            should be written. This should be the output of the
+            _air_boundary_mixing_faces function.
+    """
+    # get the default air boundary construction
+    # must be imported here to avoid circular imports
+    from .lib.constructions import air_boundary
+
+    room_str = [room.to.idf(room)]
+    for face in room.faces:
+        room_str.append(face.to.idf(face))
+        if face.identifier in mixing_faces:  # write the air mixing objects
+            air_constr = face.properties.energy.construction
+            adj_room = face.boundary_condition.boundary_condition_objects[-1]
+            try:
+                room_str.append(air_constr.to_cross_mixing_idf(face, adj_room))
+            except AttributeError:  # opaque construction for air boundary
+                room_str.append(air_boundary.to_cross_mixing_idf(face, adj_room))
+        for ap in face.apertures:
+            if len(ap.geometry) <= 4:  # ignore apertures to be triangulated
+                room_str.append(ap.to.idf(ap))
+            for shade in ap.outdoor_shades:
+                room_str.append(shade.to.idf(shade))
+        for dr in face.doors:
+            if len(dr.geometry) <= 4:  # ignore doors to be triangulated
+                room_str.append(dr.to.idf(dr))
+            for shade in dr.outdoor_shades:
+                room_str.append(shade.to.idf(shade))
+        for shade in face.outdoor_shades:
+            room_str.append(shade.to.idf(shade))
+    for shade in room.outdoor_shades:
+        room_str.append(shade.to.idf(shade))
+    return room_str
+
+
+# the rooms and mixing faces shared with forked processes during parallel translation
+_WORKER_ROOMS, _WORKER_MIXING_FACES = None, None
+
+
+def _room_geometry_chunk_to_idf(room_range):
+    """Get a list of IDF strings for a range of the Rooms in a worker process."""
+    chunk_strs = []
+    for room in _WORKER_ROOMS[room_range[0]:room_range[1]]:
+        chunk_strs.extend(_room_geometry_to_idf(room, _WORKER_MIXING_FACES))
+    return chunk_strs
+
+
+def _rooms_to_idf_parallel(model, mixing_faces, workers):
+    """Get a generator of IDF string lists for Model rooms using a pool of processes.
+
+    The processes are forked from the current one such that each of them has
+    an exact copy of the Model rooms without needing to serialize them. The
+    rooms are split into contiguous ranges, which are translated independently
+    and yielded in the order of the Model rooms such that the result is identical
+    to translating the rooms in serial. On platforms that cannot fork processes
+    (eg. Windows), the rooms are translated in the current process.
+
+    Args:
+        model: The honeybee Model to be translated, which should already
+            be in Meters and have all other pre-translation edits applied.
+        mixing_faces: A set of Face identifiers for which cross mixing objects
+            should be written.
+        workers: An integer for the number of processes to use.
+    """
+    global _WORKER_ROOMS, _WORKER_MIXING_FACES
+    try:
+        import multiprocessing
+        fork_context = multiprocessing.get_context('fork')
+    except (ImportError, AttributeError, ValueError):  # forking is not available
+        for room in model.rooms:
+            yield _room_geometry_to_idf(room, mixing_faces)
+        return
+
+    room_count = len(model.rooms)
+    chunk_size = int(math.ceil(room_count / float(workers * 4)))
+    room_ranges = [(i, min(i + chunk_size, room_count))
+                   for i in xrange(0, room_count, chunk_size)]
+    _WORKER_ROOMS, _WORKER_MIXING_FACES = model.rooms, mixing_faces
+    try:
+        pool = fork_context.Pool(workers)
+    finally:
+        _WORKER_ROOMS, _WORKER_MIXING_FACES = None, None
+    try:
+        for chunk_strs in pool.imap(_room_geometry_chunk_to_idf, room_ranges):
+            yield chunk_strs
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 """___________gbXML TRANSLATORS___________"""
 
 
@@ -1689,148 +1887,495 @@ def model_to_gbxml_element(
             that is specified in the XML header (eg. "5.00"). If None, this
             will default to the latest version.
     """
-    # duplicate model to avoid mutating it as we edit it for energy simulation
-    original_model = model
-    model = model.duplicate()
-    # scale the model if the units are not meters
-    if ip_units:
-        model.convert_to_units('Feet')
-        scale_fac = conversion_factor_to_meters('Feet')
-    else:
-        model.convert_to_units('Meters')
-        scale_fac = 1
-    # as a good practice, remove degenerate geometry within model tolerance
-    tol = model.tolerance
-    decimal_count, _ = rounding_tolerance(tol)
-    try:
-        model.remove_degenerate_geometry(tol)
-    except ValueError:
-        error = 'Failed to remove degenerate Rooms.\nYour Model units system is: {}. ' \
-            'Is this correct?'.format(original_model.units)
-        raise ValueError(error)
-    if triangulate_non_planar:
-        model.triangulate_non_planar_quads(tol)
-
-    # auto-assign stories if there are none
-    if len(model.stories) == 0 and len(model.rooms) != 0:
-        model.assign_stories_by_floor_height()
-
-    # rename the faces, apertures, and doors if requested
-    if face_rename_format:
-        for room in model.rooms:
-            room.rename_faces_by_attribute(face_rename_format)
-    if subface_rename_format:
-        for room in model.rooms:
-            room.rename_apertures_by_attribute(subface_rename_format)
-            room.rename_doors_by_attribute(subface_rename_format)
-    # ensure all display_names are unique because some gbXML interfaces require this
-    model.assign_unique_names()
-    # reset the IDs to be derived from the display_names if requested
-    if reset_geometry_ids:
-        model.reset_ids()
-    if reset_resource_ids:
-        model.properties.energy.reset_resource_ids()
-
-    # ensure that all identifiers are legal IDs for XML tags
-    for room in model.rooms:
-        room.identifier = clean_xml_tag_string(room.identifier)
-        for face in room.faces:
-            face.identifier = clean_xml_tag_string(face.identifier)
-            fbc = face.boundary_condition
-            if isinstance(fbc, Surface):
-                sbc_objs = tuple(clean_xml_tag_string(obj) for obj in
-                                 fbc.boundary_condition_objects)
-                face.boundary_condition = Surface(sbc_objs)
-            for sf in face.sub_faces:
-                sf.identifier = clean_xml_tag_string(sf.identifier)
-                fbc = sf.boundary_condition
-                if isinstance(fbc, Surface):
-                    sbc_objs = tuple(clean_xml_tag_string(obj) for obj in
-                                     fbc.boundary_condition_objects)
-                    sf.boundary_condition = Surface(sbc_objs, True)
+    writer = _XMLTreeWriter()
+    _write_model_gbxml(
+        writer, model, ip_units, include_shell_geometry, include_space_boundaries,
+        interior_face_type, ground_face_type, face_rename_format, subface_rename_format,
+        reset_geometry_ids, reset_resource_ids,
+        triangulate_subfaces, triangulate_non_planar, rect_geo_format, explicit_holes,
+        total_ventilation, program_name, program_version, gbxml_schema_version
+    )
+    return writer.root
 
-    # resolve the properties across zones
-    zone_name_dict = {}
-    for r in model.rooms:
-        if r._zone is None:
-            zone_name_dict[r.identifier] = r.display_name
-        else:
-            zone_name_dict[r.identifier] = r.zone
-    for room in model.rooms:  # set all zone IDs to be acceptable in gbXML
-        room.zone = clean_xml_tag_string(room.zone)
-    single_zones, zone_dict = model.properties.energy.resolve_zones()
 
-    # depending on the unit system, set the units for the file
-    if not ip_units:
-        t_units, result_units = 'C', 'true'
-        l_units, a_units, v_units = 'Meters', 'SquareMeters', 'CubicMeters'
-    else:
-        t_units, result_units = 'F', 'false'
-        l_units, a_units, v_units = 'Feet', 'SquareFeet', 'CubicFeet'
+def model_to_gbxml(
+    model, ip_units=False, include_shell_geometry=False, include_space_boundaries=False,
+    interior_face_type='InteriorFloor', ground_face_type='AutoAssign',
+    face_rename_format=None, subface_rename_format=None,
+    reset_geometry_ids=False, reset_resource_ids=False,
+    triangulate_subfaces=False, triangulate_non_planar=True,
+    rect_geo_format='BoundingRectangle', explicit_holes=False,
+    total_ventilation=True, program_name=None, program_version=None,
+    gbxml_schema_version=None, indent=True
+):
+    """Get a gbXML string for a Model.
 
-    # set the gbXML schema version in the header if specified
-    SCHEMA_VERSIONS = (
-        '0.35', '0.36', '0.37', '5.00', '5.01', '5.10', '5.11', '5.12',
-        '6.00', '6.01', '7.03', '8.01'
-    )
-    now_ver = SCHEMA_VERSIONS[-1]
-    if gbxml_schema_version is not None and gbxml_schema_version != now_ver:
-        if gbxml_schema_version not in SCHEMA_VERSIONS:
-            raise ValueError(
-                'The specified gbXML schema version "{}" is not recognized. '
-                'Please choose from the following: {}'.format(
-                    gbxml_schema_version, ', '.join(SCHEMA_VERSIONS)
-                )
-            )
-    gbxml_version = now_ver if gbxml_schema_version is None else gbxml_schema_version
+    Args:
+        model: A honeybee Model for which a gbXML text string will be returned.
+        ip_units: A boolean to note whether the geometry, space loads, and
+            construction properties are reported in IP units (True) or SI
+            units (False). (Default: False).
+        include_shell_geometry: Boolean for whether shell geometry should be included vs.
+            just the minimal required non-manifold geometry. (Default: False).
+        include_space_boundaries: Boolean for whether space boundaries should be included
+             vs. just the minimal required non-manifold geometry. (Default: False).
+        interior_face_type: Text string for the type to be used for all interior
+            floor/ceiling faces. (Default: InteriorFloor). Choose from the following.
 
-    # create the ElementTree that holds everything
-    xsd_template = 'http://gbxml.org/schema/{}/GreenBuildingXML_Ver{}.xsd'
-    xsd_url = xsd_template.format(gbxml_version.replace('.', '-'), gbxml_version)
-    gbxml_attr = {
-        'xmlns': 'http://www.gbxml.org/schema',
-        'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
-        'xsi:schemaLocation': 'http://www.gbxml.org/schema {}'.format(xsd_url),
-        'temperatureUnit': t_units,
-        'lengthUnit': l_units,
-        'areaUnit': a_units,
-        'volumeUnit': v_units,
-        'useSIUnitsForResults': result_units,
-        'version': gbxml_version,
-        'SurfaceReferenceLocation': 'Centerline'
-    }
-    gbxml_root = ET.Element('gbXML', gbxml_attr)
+            * InteriorFloor
+            * Ceiling
 
-    # create the campus and building element
-    xml_campus = ET.SubElement(gbxml_root, 'Campus', id='Facility')
-    xml_campus_name = ET.SubElement(xml_campus, 'Name')
-    xml_campus_name.text = 'Facility'
-    xml_bldg = ET.SubElement(xml_campus, 'Building')
-    xml_bldg_name = ET.SubElement(xml_bldg, 'Name')
-    xml_bldg_name.text = str(model.display_name)
-    xml_floor_area = ET.SubElement(xml_bldg, 'Area')
-    xml_floor_area.text = str(round(model.floor_area)) \
-        if ip_units else str(round(model.floor_area, 1))
+        ground_face_type: Text string for the type to be used for all ground-contact
+            floor faces. If AutoAssign, the ground types will be SlabOnGrade for floors
+            belonging to rooms with any above-ground walls and UndergroundSlab
+            for floors in rooms with all underground walls. Choose from the following.
 
-    # write all of the rooms into the gbXML as spaces
-    story_dict, xml_rooms = OrderedDict(), []
-    for room in model.rooms:
-        xml_room = room_to_gbxml_element(
-            room, ip_units, include_shell_geometry, include_space_boundaries,
-            tol, explicit_holes, xml_bldg
-        )
-        xml_rooms.append(xml_room)
-        try:
-            story_dict[room.story].append(room)
-        except KeyError:
-            story_dict[room.story] = [room]
+            * AutoAssign
+            * UndergroundSlab
+            * SlabOnGrade
+            * RaisedFloor
 
-    # add spaces for unassigned shades if they exist in the model
-    detached_shades, detached_sms, attached_shades, attached_sms = [], [], [], []
-    for face in model.orphaned_faces:
-        detached_shades.append(face)
-    for aperture in model.orphaned_apertures:
-        detached_shades.append(aperture)
+        face_rename_format: An optional text string for the pattern with which
+            faces will be renamed. Any property on the honeybee Face class may be
+            used (eg. gbxml_str) and each property should be put in curly brackets.
+            Nested properties can be specified by using "." to denote nesting levels
+            (eg. properties.energy.construction.display_name). Functions that
+            return string outputs can also be passed here as long as these
+            functions defaults specified for all arguments.
+        subface_rename_format: An optional text string for the pattern with which
+            apertures and doors will be renamed. Any property that exists on both
+            the honeybee Aperture and honeybee Door class may be used (eg. gbxml_str)
+            and each property should be put in curly brackets. Nested
+            properties can be specified by using "." to denote nesting levels
+            (eg. properties.energy.construction.display_name). Functions that
+            return string outputs can also be passed here as long as these
+            functions defaults specified for all arguments.
+        reset_geometry_ids: Boolean to note whether a cleaned version of geometry
+            display names should be used for the IDs that appear within
+            the gbXML file. Using this flag will affect all Rooms, Faces,
+            Apertures, Doors, and Shades. It will generally result in more
+            read-able IDs in the gbXML file but this means that it will not be
+            easy to map results back to the input Model. Cases of duplicate IDs
+            resulting from non-unique names will be resolved by adding integers
+            to the ends of the new IDs that are derived from the name. (Default: False).
+        reset_resource_ids: Boolean to note whether a cleaned version of all
+            resource display names should be used for the IDs that appear within
+            the gbXML file. Using this flag will affect all Materials,
+            Constructions, ConstructionSets, Schedules, Loads, and ProgramTypes.
+            It will generally result in more read-able names for the resources
+            in the gbXML file. Cases of duplicate IDs resulting from non-unique
+            names will be resolved by adding integers to the ends of the new
+            IDs that are derived from the name. (Default: False).
+        triangulate_non_planar: Boolean to note whether any non-planar
+            orphaned geometry in the model should be triangulated.
+            This can be helpful because OpenStudio simply raises an error when
+            it encounters non-planar geometry, which would hinder the ability
+            to save files that are to be corrected later. (Default: False).
+        triangulate_subfaces: Boolean to note whether sub-faces (including
+            Apertures and Doors) should be triangulated if they have more
+            than 4 sides (True) or whether they should be left as they are (False).
+            This triangulation is necessary when exporting directly to EnergyPlus
+            since it cannot accept sub-faces with more than 4 vertices. (Default: False).
+        rect_geo_format: Text string to note how the rectangular geometry for
+            all Surfaces is written into the gbXML. BoundingRectangle sets the
+            width and height of the rectangular geometry using the bounding
+            rectangle around the geometry, which results in an overestimated
+            area for non-rectangular geo. SimpleArea will set the rectangle width
+            always equal to geometry area and the height always equal to one,
+            ensuring accurate areas and making it easy to check the geometry
+            area in the gbXML. SimpleAreaForNonRectOnly will report the width and
+            height of rectangular Face3D correctly but use simpler areas
+            for non-rectangular geometry. (Default: BoundingRectangle). Choose
+            from the following.
+
+            * BoundingRectangle
+            * SimpleArea
+            * SimpleAreaForNonRectOnly
+
+        explicit_holes: Boolean to note whether holes in Surfaces should be
+            represented explicitly with their own PolyLoop or the hole and boundary
+            should be collapsed into a single PolyLoop that winds inwards to
+            cut out the holes. (Default: False).
+        total_ventilation: Boolean to note whether outdoor air ventilation values
+            in the gbXML are written as a single total OAFlowPerZone (True)
+            or ventilation criteria are written as separate criteria (False).
+            That is, separate specifications for OAFlowPerPerson, OAFlowPerArea,
+            etc. Note that the total ventilation accounts for the ventilation
+            effectiveness while the individual flows do not. (Default: True).
+        program_name: Optional text to set the name of the software that will
+            appear under the programId and ProductName tags of the DocumentHistory
+            section. This can be set things like "Ladybug Tools" or "Pollination"
+            or some other software in which this gbXML export capability is being
+            run. If None, the "OpenStudio" will be used. (Default: None).
+        program_version: Optional text to set the version of the software that
+            will appear under the DocumentHistory section. If None, and the
+            program_name is also unspecified, only the version of OpenStudio will
+            appear. Otherwise, this will default to "0.0.0" given that the version
+            field is required. (Default: None).
+        gbxml_schema_version: Optional text to set the version of the gbXML schema
+            that is specified in the XML header (eg. "5.00"). If None, this
+            will default to the latest version.
+        indent: Boolean to note whether the XML should be indented to make it
+            read-able. Setting this to False results in a smaller string that
+            is faster to write. (Default: True).
+    """
+    gbxml_strs = []
+    writer = _XMLStreamWriter(gbxml_strs.append, indent)
+    _write_model_gbxml(
+        writer, model, ip_units, include_shell_geometry, include_space_boundaries,
+        interior_face_type, ground_face_type, face_rename_format, subface_rename_format,
+        reset_geometry_ids, reset_resource_ids,
+        triangulate_subfaces, triangulate_non_planar, rect_geo_format, explicit_holes,
+        total_ventilation, program_name, program_version, gbxml_schema_version
+    )
+    return ''.join(gbxml_strs)
+
+
+def model_to_gbxml_stream(
+    model, file_obj, ip_units=False, include_shell_geometry=False,
+    include_space_boundaries=False, interior_face_type='InteriorFloor',
+    ground_face_type='AutoAssign', face_rename_format=None, subface_rename_format=None,
+    reset_geometry_ids=False, reset_resource_ids=False,
+    triangulate_subfaces=False, triangulate_non_planar=True,
+    rect_geo_format='BoundingRectangle', explicit_holes=False,
+    total_ventilation=True, program_name=None, program_version=None,
+    gbxml_schema_version=None, indent=True
+):
+    """Write a gbXML representation of a Model directly to a file object.
+
+    The text written to the file is identical to that returned from model_to_gbxml
+    but each Space, Surface, Construction and Zone element is written to the file
+    as soon as it is produced rather than being collected into an ElementTree
+    for the whole Model. So this method is preferable for large models where
+    the memory needed to hold the whole ElementTree is significant.
+
+    Args:
+        model: A honeybee Model for which a gbXML representation will be written.
+        file_obj: A writable file object (or any object with a write method that
+            accepts text) to which the gbXML text will be written.
+        ip_units: A boolean to note whether the geometry, space loads, and
+            construction properties are reported in IP units (True) or SI
+            units (False). (Default: False).
+        include_shell_geometry: Boolean for whether shell geometry should be included vs.
+            just the minimal required non-manifold geometry. (Default: False).
+        include_space_boundaries: Boolean for whether space boundaries should be included
+             vs. just the minimal required non-manifold geometry. (Default: False).
+        interior_face_type: Text string for the type to be used for all interior
+            floor/ceiling faces. (Default: InteriorFloor). Choose from the following.
+
+            * InteriorFloor
+            * Ceiling
+
+        ground_face_type: Text string for the type to be used for all ground-contact
+            floor faces. If AutoAssign, the ground types will be SlabOnGrade for floors
+            belonging to rooms with any above-ground walls and UndergroundSlab
+            for floors in rooms with all underground walls. Choose from the following.
+
+            * AutoAssign
+            * UndergroundSlab
+            * SlabOnGrade
+            * RaisedFloor
+
+        face_rename_format: An optional text string for the pattern with which
+            faces will be renamed. Any property on the honeybee Face class may be
+            used (eg. gbxml_str) and each property should be put in curly brackets.
+            Nested properties can be specified by using "." to denote nesting levels
+            (eg. properties.energy.construction.display_name). Functions that
+            return string outputs can also be passed here as long as these
+            functions defaults specified for all arguments.
+        subface_rename_format: An optional text string for the pattern with which
+            apertures and doors will be renamed. Any property that exists on both
+            the honeybee Aperture and honeybee Door class may be used (eg. gbxml_str)
+            and each property should be put in curly brackets. Nested
+            properties can be specified by using "." to denote nesting levels
+            (eg. properties.energy.construction.display_name). Functions that
+            return string outputs can also be passed here as long as these
+            functions defaults specified for all arguments.
+        reset_geometry_ids: Boolean to note whether a cleaned version of geometry
+            display names should be used for the IDs that appear within
+            the gbXML file. Using this flag will affect all Rooms, Faces,
+            Apertures, Doors, and Shades. It will generally result in more
+            read-able IDs in the gbXML file but this means that it will not be
+            easy to map results back to the input Model. Cases of duplicate IDs
+            resulting from non-unique names will be resolved by adding integers
+            to the ends of the new IDs that are derived from the name. (Default: False).
+        reset_resource_ids: Boolean to note whether a cleaned version of all
+            resource display names should be used for the IDs that appear within
+            the gbXML file. Using this flag will affect all Materials,
+            Constructions, ConstructionSets, Schedules, Loads, and ProgramTypes.
+            It will generally result in more read-able names for the resources
+            in the gbXML file. Cases of duplicate IDs resulting from non-unique
+            names will be resolved by adding integers to the ends of the new
+            IDs that are derived from the name. (Default: False).
+        triangulate_non_planar: Boolean to note whether any non-planar
+            orphaned geometry in the model should be triangulated.
+            This can be helpful because OpenStudio simply raises an error when
+            it encounters non-planar geometry, which would hinder the ability
+            to save files that are to be corrected later. (Default: False).
+        triangulate_subfaces: Boolean to note whether sub-faces (including
+            Apertures and Doors) should be triangulated if they have more
+            than 4 sides (True) or whether they should be left as they are (False).
+            This triangulation is necessary when exporting directly to EnergyPlus
+            since it cannot accept sub-faces with more than 4 vertices. (Default: False).
+        rect_geo_format: Text string to note how the rectangular geometry for
+            all Surfaces is written into the gbXML. BoundingRectangle sets the
+            width and height of the rectangular geometry using the bounding
+            rectangle around the geometry, which results in an overestimated
+            area for non-rectangular geo. SimpleArea will set the rectangle width
+            always equal to geometry area and the height always equal to one,
+            ensuring accurate areas and making it easy to check the geometry
+            area in the gbXML. SimpleAreaForNonRectOnly will report the width and
+            height of rectangular Face3D correctly but use simpler areas
+            for non-rectangular geometry. (Default: BoundingRectangle). Choose
+            from the following.
+
+            * BoundingRectangle
+            * SimpleArea
+            * SimpleAreaForNonRectOnly
+
+        explicit_holes: Boolean to note whether holes in Surfaces should be
+            represented explicitly with their own PolyLoop or the hole and boundary
+            should be collapsed into a single PolyLoop that winds inwards to
+            cut out the holes. (Default: False).
+        total_ventilation: Boolean to note whether outdoor air ventilation values
+            in the gbXML are written as a single total OAFlowPerZone (True)
+            or ventilation criteria are written as separate criteria (False).
+            That is, separate specifications for OAFlowPerPerson, OAFlowPerArea,
+            etc. Note that the total ventilation accounts for the ventilation
+            effectiveness while the individual flows do not. (Default: True).
+        program_name: Optional text to set the name of the software that will
+            appear under the programId and ProductName tags of the DocumentHistory
+            section. This can be set things like "Ladybug Tools" or "Pollination"
+            or some other software in which this gbXML export capability is being
+            run. If None, the "OpenStudio" will be used. (Default: None).
+        program_version: Optional text to set the version of the software that
+            will appear under the DocumentHistory section. If None, and the
+            program_name is also unspecified, only the version of OpenStudio will
+            appear. Otherwise, this will default to "0.0.0" given that the version
+            field is required. (Default: None).
+        gbxml_schema_version: Optional text to set the version of the gbXML schema
+            that is specified in the XML header (eg. "5.00"). If None, this
+            will default to the latest version.
+        indent: Boolean to note whether the XML should be indented to make it
+            read-able. Setting this to False results in a smaller string that
+            is faster to write. (Default: True).
+
+    Usage:
+
+    .. code-block:: python
+
+        from honeybee.model import Model
+        from honeybee.room import Room
+        from honeybee_energy.lib.programtypes import office_program
+        from honeybee_energy.writer import model_to_gbxml_stream
+
+        room = Room.from_box('Tiny House Zone', 5, 10, 3)
+        room.properties.energy.program_type = office_program
+        model = Model('Tiny House', [room])
+
+        with open('C:/ladybug/in.gbxml', 'w') as gbxml_file:
+            model_to_gbxml_stream(model, gbxml_file)
+    """
+    writer = _XMLStreamWriter(file_obj.write, indent)
+    _write_model_gbxml(
+        writer, model, ip_units, include_shell_geometry, include_space_boundaries,
+        interior_face_type, ground_face_type, face_rename_format, subface_rename_format,
+        reset_geometry_ids, reset_resource_ids,
+        triangulate_subfaces, triangulate_non_planar, rect_geo_format, explicit_holes,
+        total_ventilation, program_name, program_version, gbxml_schema_version
+    )
+
+
+def _write_model_gbxml(
+    writer, model, ip_units=False, include_shell_geometry=False,
+    include_space_boundaries=False, interior_face_type='InteriorFloor',
+    ground_face_type='AutoAssign', face_rename_format=None, subface_rename_format=None,
+    reset_geometry_ids=False, reset_resource_ids=False,
+    triangulate_subfaces=False, triangulate_non_planar=True,
+    rect_geo_format='BoundingRectangle', explicit_holes=False,
+    total_ventilation=True, program_name=None, program_version=None,
+    gbxml_schema_version=None
+):
+    """Write the elements of a gbXML representing a Model using an XML writer.
+
+    Each Space, Surface, Construction and Zone element is produced separately
+    and is given to the writer as soon as it is complete. So the writer can
+    either assemble them into an ElementTree or write them to a file.
+
+    Args:
+        writer: An _XMLTreeWriter or _XMLStreamWriter to which the gbXML elements
+            will be written.
+        model: A honeybee Model for which the gbXML will be written.
+        ip_units: A boolean to note whether the geometry, space loads, and
+            construction properties are reported in IP units (True) or SI
+            units (False). (Default: False).
+
+    All other arguments are the same as those of model_to_gbxml_element.
+    """
+    # duplicate model to avoid mutating it as we edit it for energy simulation
+    original_model = model
+    model = model.duplicate()
+    # scale the model if the units are not meters
+    if ip_units:
+        model.convert_to_units('Feet')
+        scale_fac = conversion_factor_to_meters('Feet')
+    else:
+        model.convert_to_units('Meters')
+        scale_fac = 1
+    # as a good practice, remove degenerate geometry within model tolerance
+    tol = model.tolerance
+    decimal_count, _ = rounding_tolerance(tol)
+    try:
+        model.remove_degenerate_geometry(tol)
+    except ValueError:
+        error = 'Failed to remove degenerate Rooms.\nYour Model units system is: {}. ' \
+            'Is this correct?'.format(original_model.units)
+        raise ValueError(error)
+    if triangulate_non_planar:
+        model.triangulate_non_planar_quads(tol)
+
+    # auto-assign stories if there are none
+    if len(model.stories) == 0 and len(model.rooms) != 0:
+        model.assign_stories_by_floor_height()
+
+    # rename the faces, apertures, and doors if requested
+    if face_rename_format:
+        for room in model.rooms:
+            room.rename_faces_by_attribute(face_rename_format)
+    if subface_rename_format:
+        for room in model.rooms:
+            room.rename_apertures_by_attribute(subface_rename_format)
+            room.rename_doors_by_attribute(subface_rename_format)
+    # ensure all display_names are unique because some gbXML interfaces require this
+    model.assign_unique_names()
+    # reset the IDs to be derived from the display_names if requested
+    if reset_geometry_ids:
+        model.reset_ids()
+    if reset_resource_ids:
+        model.properties.energy.reset_resource_ids()
+
+    # ensure that all identifiers are legal IDs for XML tags
+    for room in model.rooms:
+        room.identifier = clean_xml_tag_string(room.identifier)
+        for face in room.faces:
+            face.identifier = clean_xml_tag_string(face.identifier)
+            fbc = face.boundary_condition
+            if isinstance(fbc, Surface):
+                sbc_objs = tuple(clean_xml_tag_string(obj) for obj in
+                                 fbc.boundary_condition_objects)
+                face.boundary_condition = Surface(sbc_objs)
+            for sf in face.sub_faces:
+                sf.identifier = clean_xml_tag_string(sf.identifier)
+                fbc = sf.boundary_condition
+                if isinstance(fbc, Surface):
+                    sbc_objs = tuple(clean_xml_tag_string(obj) for obj in
+                                     fbc.boundary_condition_objects)
+                    sf.boundary_condition = Surface(sbc_objs, True)
+
+    # resolve the properties across zones
+    zone_name_dict = {}
+    for r in model.rooms:
+        if r._zone is None:
+            zone_name_dict[r.identifier] = r.display_name
+        else:
+            zone_name_dict[r.identifier] = r.zone
+    for room in model.rooms:  # set all zone IDs to be acceptable in gbXML
+        room.zone = clean_xml_tag_string(room.zone)
+    single_zones, zone_dict = model.properties.energy.resolve_zones()
+
+    # depending on the unit system, set the units for the file
+    if not ip_units:
+        t_units, result_units = 'C', 'true'
+        l_units, a_units, v_units = 'Meters', 'SquareMeters', 'CubicMeters'
+    else:
+        t_units, result_units = 'F', 'false'
+        l_units, a_units, v_units = 'Feet', 'SquareFeet', 'CubicFeet'
+
+    # set the gbXML schema version in the header if specified
+    SCHEMA_VERSIONS = (
+        '0.35', '0.36', '0.37', '5.00', '5.01', '5.10', '5.11', '5.12',
+        '6.00', '6.01', '7.03', '8.01'
+    )
+    now_ver = SCHEMA_VERSIONS[-1]
+    if gbxml_schema_version is not None and gbxml_schema_version != now_ver:
+        if gbxml_schema_version not in SCHEMA_VERSIONS:
+            raise ValueError(
+                'The specified gbXML schema version "{}" is not recognized. '
+                'Please choose from the following: {}'.format(
+                    gbxml_schema_version, ', '.join(SCHEMA_VERSIONS)
+                )
+            )
+    gbxml_version = now_ver if gbxml_schema_version is None else gbxml_schema_version
+
+    # create the root element that holds everything
+    xsd_template = 'http://gbxml.org/schema/{}/GreenBuildingXML_Ver{}.xsd'
+    xsd_url = xsd_template.format(gbxml_version.replace('.', '-'), gbxml_version)
+    gbxml_attr = {
+        'xmlns': 'http://www.gbxml.org/schema',
+        'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+        'xsi:schemaLocation': 'http://www.gbxml.org/schema {}'.format(xsd_url),
+        'temperatureUnit': t_units,
+        'lengthUnit': l_units,
+        'areaUnit': a_units,
+        'volumeUnit': v_units,
+        'useSIUnitsForResults': result_units,
+        'version': gbxml_version,
+        'SurfaceReferenceLocation': 'Centerline'
+    }
+    writer.start('gbXML', gbxml_attr)
+
+    # create the campus and building element
+    writer.start('Campus', {'id': 'Facility'})
+    xml_campus_name = ET.Element('Name')
+    xml_campus_name.text = 'Facility'
+    writer.write(xml_campus_name)
+    writer.start('Building', {})
+    xml_bldg_name = ET.Element('Name')
+    xml_bldg_name.text = str(model.display_name)
+    writer.write(xml_bldg_name)
+    xml_floor_area = ET.Element('Area')
+    xml_floor_area.text = str(round(model.floor_area)) \
+        if ip_units else str(round(model.floor_area, 1))
+    writer.write(xml_floor_area)
+
+    # find the room faces to be written while ensuring interior faces are not repeated
+    story_dict, adj_to_ignore, gbxml_faces = OrderedDict(), {}, []
+    for room in model.rooms:
+        try:
+            story_dict[room.story].append(room)
+        except KeyError:
+            story_dict[room.story] = [room]
+        for face in room.faces:
+            fbc = face.boundary_condition
+            if isinstance(fbc, Surface):
+                if face.identifier in adj_to_ignore:
+                    continue
+                if isinstance(face.type, RoofCeiling) and interior_face_type == 'InteriorFloor':
+                    continue
+                elif isinstance(face.type, Floor) and interior_face_type == 'Ceiling':
+                    continue
+                adj_to_ignore[fbc.boundary_condition_object] = face.identifier
+            gbxml_faces.append(face)
+
+    # write all of the rooms into the gbXML as spaces
+    for room in model.rooms:
+        xml_room = room_to_gbxml_element(
+            room, ip_units, include_shell_geometry, include_space_boundaries,
+            tol, explicit_holes
+        )
+        if include_space_boundaries:  # reference the surfaces that are written
+            for xml_sb in xml_room.findall('SpaceBoundary'):
+                srf_id = xml_sb.get('surfaceIdRef')
+                if srf_id in adj_to_ignore:
+                    xml_sb.set('surfaceIdRef', adj_to_ignore[srf_id])
+        writer.write(xml_room)
+
+    # add spaces for unassigned shades if they exist in the model
+    detached_shades, detached_sms, attached_shades, attached_sms = [], [], [], []
+    for face in model.orphaned_faces:
+        detached_shades.append(face)
+    for aperture in model.orphaned_apertures:
+        detached_shades.append(aperture)
     for door in model.orphaned_doors:
         detached_shades.append(door)
     for shade in model.orphaned_shades:
@@ -1844,56 +2389,39 @@ def model_to_gbxml_element(
         else:
             attached_sms.append(shade_mesh)
     if len(attached_shades) != 0 or len(attached_sms) != 0:
-        xml_shd_space = ET.SubElement(xml_bldg, 'Space', id='Attached_Shades')
+        xml_shd_space = ET.Element('Space', id='Attached_Shades')
         xml_shd_name = ET.SubElement(xml_shd_space, 'Name')
         xml_shd_name.text = 'Attached Shades'
+        writer.write(xml_shd_space)
     if len(detached_shades) != 0 or len(detached_sms) != 0:
-        xml_shd_space = ET.SubElement(xml_bldg, 'Space', id='Detached_Shades')
+        xml_shd_space = ET.Element('Space', id='Detached_Shades')
         xml_shd_name = ET.SubElement(xml_shd_space, 'Name')
         xml_shd_name.text = 'Detached Shades'
+        writer.write(xml_shd_space)
 
     # get the stories of the model and write them into the gbXML
     for story_name, story_rooms in story_dict.items():
         elevation = min(r.min.z for r in story_rooms)
-        xml_story = ET.SubElement(
-            xml_bldg, 'BuildingStorey', id=clean_xml_tag_string(story_name)
-        )
+        xml_story = ET.Element('BuildingStorey', id=clean_xml_tag_string(story_name))
         xml_story_name = ET.SubElement(xml_story, 'Name')
         xml_story_name.text = story_name
         xml_story_elev = ET.SubElement(xml_story, 'Level')
         xml_story_elev.text = str(round(elevation, decimal_count))
+        writer.write(xml_story)
+    writer.end()  # close the Building element
 
     # all of the room faces and openings to the gbxml ad non-manifold geometry
-    adj_to_ignore = {}
-    for room in model.rooms:
-        for face in room.faces:
-            # ensure that interior surfaces are not added twice
-            fbc = face.boundary_condition
-            if isinstance(fbc, Surface):
-                if face.identifier in adj_to_ignore:
-                    continue
-                if isinstance(face.type, RoofCeiling) and interior_face_type == 'InteriorFloor':
-                    continue
-                elif isinstance(face.type, Floor) and interior_face_type == 'Ceiling':
-                    continue
-                adj_to_ignore[fbc.boundary_condition_object] = face.identifier
-            # add the face element to the gbxml
-            xml_face = face_to_gbxml_element(
-                face, tolerance=tol, rect_geo_format=rect_geo_format,
-                explicit_holes=explicit_holes, campus_element=xml_campus
-            )
-            # if the floor type was specified, overwrite it
-            if ground_face_type != 'AutoAssign' and isinstance(fbc, Ground):
-                if isinstance(face.type, Floor):
-                    xml_face.set('surfaceType', ground_face_type)
-
-    # if space boundaries were requested, loop through adj_to_ignore and replace them
-    if include_space_boundaries:
-        for xml_room in xml_rooms:
-            for xml_sb in xml_room.findall('SpaceBoundary'):
-                srf_id = xml_sb.get('surfaceIdRef')
-                if srf_id in adj_to_ignore:
-                    xml_sb.set('surfaceIdRef', adj_to_ignore[srf_id])
+    for face in gbxml_faces:
+        xml_face = face_to_gbxml_element(
+            face, tolerance=tol, rect_geo_format=rect_geo_format,
+            explicit_holes=explicit_holes
+        )
+        # if the floor type was specified, overwrite it
+        if ground_face_type != 'AutoAssign' and \
+                isinstance(face.boundary_condition, Ground):
+            if isinstance(face.type, Floor):
+                xml_face.set('surfaceType', ground_face_type)
+        writer.write(xml_face)
 
     # add all of the shade geometries to the gbxml
     room_shades = []
@@ -1907,10 +2435,14 @@ def model_to_gbxml_element(
                 room_shades.extend(dr._outdoor_shades)
     for shade in room_shades + attached_shades + detached_shades:
         shade.identifier = clean_xml_tag_string(shade.identifier)
-        shade_to_gbxml_element(shade, tol, rect_geo_format, explicit_holes, xml_campus)
+        writer.write(
+            shade_to_gbxml_element(shade, tol, rect_geo_format, explicit_holes))
     for sm in attached_sms + detached_sms:
         sm.identifier = clean_xml_tag_string(sm.identifier)
-        shade_mesh_to_gbxml_element(sm, tol, rect_geo_format, explicit_holes, xml_campus)
+        for xml_shd in shade_mesh_to_gbxml_element(
+                sm, tol, rect_geo_format, explicit_holes):
+            writer.write(xml_shd)
+    writer.end()  # close the Campus element
 
     # get the default generic construction set
     # must be imported here to avoid circular imports
@@ -1919,27 +2451,31 @@ def model_to_gbxml_element(
     # add the construction objects and window types to the gbxml
     if len(attached_shades) != 0 or len(attached_sms) != 0 or \
             len(detached_shades) != 0 or len(detached_sms) != 0:
-        xml_shd_con = ET.SubElement(gbxml_root, 'Construction')
+        xml_shd_con = ET.Element('Construction')
         xml_shd_con.set('id', 'Shading_Surface_Without_Construction')
         xml_shd_con_name = ET.SubElement(xml_shd_con, 'Name')
         xml_shd_con_name.text = 'Shading Surface Without Construction'
+        writer.write(xml_shd_con)
     materials = []
     all_constrs = model.properties.energy.constructions + \
         generic_construction_set.constructions_unique
     for constr in set(all_constrs):
+        xml_parent = ET.Element('gbXML')  # temporary parent for the construction
         try:
             if constr.__class__.__name__ == 'OpaqueConstruction':
                 materials.extend(constr.materials)
             try:  # first assume it is a window construction
-                constr.to_gbxml_element(ip_units=ip_units, parent_element=gbxml_root)
+                constr.to_gbxml_element(ip_units=ip_units, parent_element=xml_parent)
             except TypeError:  # opaque or air boundary construction
-                constr.to_gbxml_element(parent_element=gbxml_root)
+                constr.to_gbxml_element(parent_element=xml_parent)
         except AttributeError:  # ShadeConstruction; no need to write it
             pass
+        for xml_constr in xml_parent:
+            writer.write(xml_constr)
 
     # add the material objects to the gbxml
     for mat in set(materials):
-        mat.to_gbxml_element(ip_units=ip_units, parent_element=gbxml_root)
+        writer.write(mat.to_gbxml_element(ip_units=ip_units))
 
     # add the zone information to the gbxml
     for room in single_zones:
@@ -1947,7 +2483,7 @@ def model_to_gbxml_element(
         zone_dict[room.zone] = [(room,), None, e_prop.setpoint, e_prop.ventilation]
     for zone_id, zone_data in zone_dict.items():
         rooms, _, set_pt, vent = zone_data
-        xml_zone = ET.SubElement(gbxml_root, 'Zone', id=zone_id)
+        xml_zone = ET.Element('Zone', id=zone_id)
         xml_zone_name = ET.SubElement(xml_zone, 'Name')
         xml_zone_name.text = zone_name_dict[rooms[0].identifier]
 
@@ -2025,12 +2561,13 @@ def model_to_gbxml_element(
                     flow_element = ET.SubElement(xml_zone, 'OAFlowPerZone')
                     flow_element.set('unit', flow_units)
                     flow_element.text = str(round(flow, 3))
+        writer.write(xml_zone)
 
     # add the document history to the gbxml
     program_name = 'Ladybug Tools Python SDK' \
         if program_name is None else program_name
     program_version = 'Unknown' if program_version is None else program_version
-    xml_history = ET.SubElement(gbxml_root, 'DocumentHistory')
+    xml_history = ET.Element('DocumentHistory')
     prog_id = clean_xml_tag_string(program_name).lower()
     try:
         now_date = str(datetime.now().astimezone().isoformat(timespec='seconds'))
@@ -2056,142 +2593,94 @@ def model_to_gbxml_element(
     xml_f_name.text = 'Unknown'
     xml_l_name = ET.SubElement(xml_person, 'LastName')
     xml_l_name.text = 'Unknown'
+    writer.write(xml_history)
+    writer.end()  # close the gbXML element
 
-    return gbxml_root
 
+class _XMLTreeWriter(object):
+    """Assemble XML elements given to an XML writer into an ElementTree.
 
-def model_to_gbxml(
-    model, ip_units=False, include_shell_geometry=False, include_space_boundaries=False,
-    interior_face_type='InteriorFloor', ground_face_type='AutoAssign',
-    face_rename_format=None, subface_rename_format=None,
-    reset_geometry_ids=False, reset_resource_ids=False,
-    triangulate_subfaces=False, triangulate_non_planar=True,
-    rect_geo_format='BoundingRectangle', explicit_holes=False,
-    total_ventilation=True, program_name=None, program_version=None,
-    gbxml_schema_version=None
-):
-    """Get a gbXML string for a Model.
+    Properties:
+        * root
+    """
 
-    Args:
-        model: A honeybee Model for which a gbXML text string will be returned.
-        ip_units: A boolean to note whether the geometry, space loads, and
-            construction properties are reported in IP units (True) or SI
-            units (False). (Default: False).
-        include_shell_geometry: Boolean for whether shell geometry should be included vs.
-            just the minimal required non-manifold geometry. (Default: False).
-        include_space_boundaries: Boolean for whether space boundaries should be included
-             vs. just the minimal required non-manifold geometry. (Default: False).
-        interior_face_type: Text string for the type to be used for all interior
-            floor/ceiling faces. (Default: InteriorFloor). Choose from the following.
+    def __init__(self):
+        self.root = None
+        self._open_elements = []
 
-            * InteriorFloor
-            * Ceiling
+    def start(self, tag, attrib):
+        """Open a new element with a tag and attributes to which elements are added."""
+        if len(self._open_elements) == 0:
+            element = ET.Element(tag, attrib)
+            self.root = element
+        else:
+            element = ET.SubElement(self._open_elements[-1], tag, attrib)
+        self._open_elements.append(element)
 
-        ground_face_type: Text string for the type to be used for all ground-contact
-            floor faces. If AutoAssign, the ground types will be SlabOnGrade for floors
-            belonging to rooms with any above-ground walls and UndergroundSlab
-            for floors in rooms with all underground walls. Choose from the following.
+    def write(self, element):
+        """Add a complete element to the element that is currently open."""
+        self._open_elements[-1].append(element)
 
-            * AutoAssign
-            * UndergroundSlab
-            * SlabOnGrade
-            * RaisedFloor
+    def end(self):
+        """Close the element that is currently open."""
+        self._open_elements.pop()
 
-        face_rename_format: An optional text string for the pattern with which
-            faces will be renamed. Any property on the honeybee Face class may be
-            used (eg. gbxml_str) and each property should be put in curly brackets.
-            Nested properties can be specified by using "." to denote nesting levels
-            (eg. properties.energy.construction.display_name). Functions that
-            return string outputs can also be passed here as long as these
-            functions defaults specified for all arguments.
-        subface_rename_format: An optional text string for the pattern with which
-            apertures and doors will be renamed. Any property that exists on both
-            the honeybee Aperture and honeybee Door class may be used (eg. gbxml_str)
-            and each property should be put in curly brackets. Nested
-            properties can be specified by using "." to denote nesting levels
-            (eg. properties.energy.construction.display_name). Functions that
-            return string outputs can also be passed here as long as these
-            functions defaults specified for all arguments.
-        reset_geometry_ids: Boolean to note whether a cleaned version of geometry
-            display names should be used for the IDs that appear within
-            the gbXML file. Using this flag will affect all Rooms, Faces,
-            Apertures, Doors, and Shades. It will generally result in more
-            read-able IDs in the gbXML file but this means that it will not be
-            easy to map results back to the input Model. Cases of duplicate IDs
-            resulting from non-unique names will be resolved by adding integers
-            to the ends of the new IDs that are derived from the name. (Default: False).
-        reset_resource_ids: Boolean to note whether a cleaned version of all
-            resource display names should be used for the IDs that appear within
-            the gbXML file. Using this flag will affect all Materials,
-            Constructions, ConstructionSets, Schedules, Loads, and ProgramTypes.
-            It will generally result in more read-able names for the resources
-            in the gbXML file. Cases of duplicate IDs resulting from non-unique
-            names will be resolved by adding integers to the ends of the new
-            IDs that are derived from the name. (Default: False).
-        triangulate_non_planar: Boolean to note whether any non-planar
-            orphaned geometry in the model should be triangulated.
-            This can be helpful because OpenStudio simply raises an error when
-            it encounters non-planar geometry, which would hinder the ability
-            to save files that are to be corrected later. (Default: False).
-        triangulate_subfaces: Boolean to note whether sub-faces (including
-            Apertures and Doors) should be triangulated if they have more
-            than 4 sides (True) or whether they should be left as they are (False).
-            This triangulation is necessary when exporting directly to EnergyPlus
-            since it cannot accept sub-faces with more than 4 vertices. (Default: False).
-        rect_geo_format: Text string to note how the rectangular geometry for
-            all Surfaces is written into the gbXML. BoundingRectangle sets the
-            width and height of the rectangular geometry using the bounding
-            rectangle around the geometry, which results in an overestimated
-            area for non-rectangular geo. SimpleArea will set the rectangle width
-            always equal to geometry area and the height always equal to one,
-            ensuring accurate areas and making it easy to check the geometry
-            area in the gbXML. SimpleAreaForNonRectOnly will report the width and
-            height of rectangular Face3D correctly but use simpler areas
-            for non-rectangular geometry. (Default: BoundingRectangle). Choose
-            from the following.
 
-            * BoundingRectangle
-            * SimpleArea
-            * SimpleAreaForNonRectOnly
+class _XMLStreamWriter(object):
+    """Write XML elements to a text output as soon as they are given to an XML writer.
 
-        explicit_holes: Boolean to note whether holes in Surfaces should be
-            represented explicitly with their own PolyLoop or the hole and boundary
-            should be collapsed into a single PolyLoop that winds inwards to
-            cut out the holes. (Default: False).
-        total_ventilation: Boolean to note whether outdoor air ventilation values
-            in the gbXML are written as a single total OAFlowPerZone (True)
-            or ventilation criteria are written as separate criteria (False).
-            That is, separate specifications for OAFlowPerPerson, OAFlowPerArea,
-            etc. Note that the total ventilation accounts for the ventilation
-            effectiveness while the individual flows do not. (Default: True).
-        program_name: Optional text to set the name of the software that will
-            appear under the programId and ProductName tags of the DocumentHistory
-            section. This can be set things like "Ladybug Tools" or "Pollination"
-            or some other software in which this gbXML export capability is being
-            run. If None, the "OpenStudio" will be used. (Default: None).
-        program_version: Optional text to set the version of the software that
-            will appear under the DocumentHistory section. If None, and the
-            program_name is also unspecified, only the version of OpenStudio will
-            appear. Otherwise, this will default to "0.0.0" given that the version
-            field is required. (Default: None).
-        gbxml_schema_version: Optional text to set the version of the gbXML schema
-            that is specified in the XML header (eg. "5.00"). If None, this
-            will default to the latest version.
+    The text is identical to that of the ElementTree assembled by the _XMLTreeWriter
+    (including the indentation when indent is True) but only one complete
+    element is held in memory at a time.
+
+    Args:
+        write: A function that accepts text, such as the write method of
+            a file object.
+        indent: Boolean to note whether the XML should be indented.
     """
-    # create the XML string
-    xml_root = model_to_gbxml_element(
-        model, ip_units, include_shell_geometry, include_space_boundaries,
-        interior_face_type, ground_face_type, face_rename_format, subface_rename_format,
-        reset_geometry_ids, reset_resource_ids,
-        triangulate_subfaces, triangulate_non_planar, rect_geo_format, explicit_holes,
-        total_ventilation, program_name, program_version, gbxml_schema_version
-    )
-    try:  # try to indent the XML to make it read-able
-        ET.indent(xml_root)
-        return ET.tostring(xml_root, encoding='unicode', xml_declaration=True)
-    except AttributeError:  # we are in Python 2 and no indent is available
-        _et_indent(xml_root)
-        return ET.tostring(xml_root)
+
+    def __init__(self, write, indent=True):
+        self._write = write
+        self._indent = indent
+        self._space = '  ' if hasattr(ET, 'indent') else '    '
+        self._open_tags = []
+        self._write("<?xml version='1.0' encoding='utf-8'?>\n")
+
+    def start(self, tag, attrib):
+        """Open a new element with a tag and attributes to which elements are added."""
+        start_tag = _xml_element_string(ET.Element(tag, attrib))
+        self._write(self._line_start() + start_tag[:-3] + '>')
+        self._open_tags.append(tag)
+
+    def write(self, element):
+        """Write a complete element inside the element that is currently open."""
+        if self._indent:
+            try:
+                ET.indent(element, self._space, len(self._open_tags))
+            except AttributeError:  # we are in Python 2 and no indent is available
+                _et_indent(element, len(self._open_tags))
+        element.tail = None
+        self._write(self._line_start() + _xml_element_string(element))
+
+    def end(self):
+        """Close the element that is currently open."""
+        tag = self._open_tags.pop()
+        line_start = '\n' + self._space * len(self._open_tags) if self._indent else ''
+        self._write(line_start + '</{}>'.format(tag))
+
+    def _line_start(self):
+        """Get the text that starts a new line inside the element that is open."""
+        if not self._indent or len(self._open_tags) == 0:
+            return ''
+        return '\n' + self._space * len(self._open_tags)
+
+
+def _xml_element_string(element):
+    """Get the text of an XML element."""
+    try:
+        return ET.tostring(element, encoding='unicode')
+    except LookupError:  # we are in Python 2 and unicode is not an encoding
+        return ET.tostring(element)
 
 
 def shade_to_gbxml(
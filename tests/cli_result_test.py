@@ -4,12 +4,17 @@ from honeybee_energy.cli.result import data_by_output, available_results_info, \
     data_by_outputs, output_csv, zone_sizes, component_sizes, available_results, \
     available_run_period_info, all_available_info, output_csv_queryable, \
     tabular_data, tabular_metadata, load_balance, energy_use_intensity, \
-    carbon_emission_intensity
+    carbon_emission_intensity, output_columnar
 from ladybug.sql import ZoneSize, ComponentSize
 from ladybug.datacollection import HourlyContinuousCollection
+from ladybug.futil import nukedir
 
 import json
 import os
+import gzip
+import shutil
+import sqlite3
+import zipfile
 
 
 def test_available_results():
@@ -103,6 +108,31 @@ def test_energy_use_intensity():
     assert 'total_energy' in result_dict
 
 
+def test_energy_use_intensity_workers():
+    """Test the energy_use_intensity command with several files and workers."""
+    runner = CliRunner()
+    sql_paths = ['./tests/result/sub_folder', './tests/result/triangulated',
+                 './tests/result/eplusout_dday_runper.sql']
+
+    result = runner.invoke(energy_use_intensity, sql_paths)
+    assert result.exit_code == 0
+    serial_dict = json.loads(result.output)
+    result = runner.invoke(energy_use_intensity, sql_paths + ['--workers', '2'])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == serial_dict
+    assert 'errors' not in serial_dict
+
+    bad_path = './tests/result/eplusout_hourly.sql'  # older EnergyPlus version
+    result = runner.invoke(energy_use_intensity, sql_paths + [bad_path, '-w', '2'])
+    assert result.exit_code == 0
+    result_dict = json.loads(result.output)
+    assert result_dict['eui'] == serial_dict['eui']
+    assert len(result_dict['errors']) == 1
+
+    result = runner.invoke(energy_use_intensity, [bad_path])
+    assert result.exit_code == 1
+
+
 def test_carbon_emission_intensity():
     """Test the energy_use_intensity command."""
     runner = CliRunner()
@@ -251,6 +281,103 @@ def test_output_csv_queryable():
     os.remove(expected_face_file)
 
 
+def test_output_csv_queryable_stream():
+    """Test the output_csv_queryable command with streaming and gzip."""
+    runner = CliRunner()
+    sql_path = './tests/result/triangulated/eplusout.sql'
+    model_path = './tests/result/triangulated/TriangleModel.json'
+    out_names = [
+        'Zone Ideal Loads Supply Air Total Cooling Energy',
+        'Surface Inside Face Temperature',
+        'Surface Window Heat Loss Energy'
+    ]
+    base_folder = './tests/result/csv_queryable'
+    stream_folder = './tests/result/csv_queryable_stream'
+
+    result = runner.invoke(output_csv_queryable,
+                           [sql_path, model_path, 'RUN PERIOD 1'] + out_names +
+                           ['--folder', base_folder])
+    assert result.exit_code == 0
+    base_col_names = json.loads(result.output)
+    result = runner.invoke(output_csv_queryable,
+                           [sql_path, model_path, 'RUN PERIOD 1'] + out_names +
+                           ['--folder', stream_folder, '--stream', '--gzip'])
+    assert result.exit_code == 0
+    col_names = json.loads(result.output)
+    assert col_names == base_col_names
+
+    for file_name in ('eplusout_room', 'eplusout_face'):
+        base_file = os.path.join(base_folder, '{}.csv'.format(file_name))
+        stream_file = os.path.join(stream_folder, '{}.csv.gz'.format(file_name))
+        assert os.path.isfile(stream_file)
+        with open(base_file) as b_file:
+            base_rows = b_file.readlines()
+        with gzip.open(stream_file, 'rt') as s_file:
+            stream_rows = s_file.readlines()
+        assert stream_rows[0] == base_rows[0]
+        assert sorted(stream_rows[1:]) == sorted(base_rows[1:])
+
+    # check that an index on ReportData does not change the order of the rows
+    index_sql = os.path.join(stream_folder, 'eplusout.sql')
+    shutil.copyfile(sql_path, index_sql)
+    conn = sqlite3.connect(index_sql)
+    conn.execute('CREATE INDEX rdd_index ON ReportData(ReportDataDictionaryIndex)')
+    conn.commit()
+    conn.close()
+    result = runner.invoke(output_csv_queryable,
+                           [index_sql, model_path, 'RUN PERIOD 1'] + out_names +
+                           ['--folder', base_folder, '--stream'])
+    assert result.exit_code == 0
+    for file_name in ('eplusout_room', 'eplusout_face'):
+        with open(os.path.join(base_folder, '{}.csv'.format(file_name))) as i_file:
+            index_rows = i_file.readlines()
+        with gzip.open(os.path.join(stream_folder, '{}.csv.gz'.format(file_name)),
+                       'rt') as s_file:
+            assert index_rows == s_file.readlines()
+    nukedir(base_folder, True)
+    nukedir(stream_folder, True)
+
+
+def test_output_columnar():
+    """Test the output_columnar command."""
+    runner = CliRunner()
+    sql_path = './tests/result/triangulated/eplusout.sql'
+    model_path = './tests/result/triangulated/TriangleModel.json'
+    out_names = [
+        'Zone Ideal Loads Supply Air Total Cooling Energy',
+        'Surface Inside Face Temperature',
+        'Surface Window Heat Loss Energy'
+    ]
+    folder = './tests/result/columnar'
+
+    result = runner.invoke(output_columnar,
+                           [sql_path, model_path, 'RUN PERIOD 1'] + out_names +
+                           ['--format', 'NPZ', '--folder', folder])
+    assert result.exit_code == 0
+    col_names = json.loads(result.output)
+    assert col_names['eplusout_room'][5:] == [
+        'identifier', 'zone', 'multiplier', 'floor_area',
+        'zone_ideal_loads_supply_air_total_cooling_energy']
+    assert col_names['eplusout_face'][5:] == [
+        'identifier', 'room', 'area', 'surface_inside_face_temperature',
+        'surface_window_heat_loss_energy']
+
+    for file_name in ('eplusout_room', 'eplusout_face'):
+        npz_file = os.path.join(folder, '{}.npz'.format(file_name))
+        with zipfile.ZipFile(npz_file) as npz:
+            assert npz.namelist() == \
+                ['{}.npy'.format(col) for col in col_names[file_name]]
+            npy_data = npz.read('{}.npy'.format(col_names[file_name][-1]))
+            assert npy_data.startswith(b'\x93NUMPY')
+            assert b"'descr': '<f8'" in npy_data[:128]
+
+    result = runner.invoke(output_columnar,
+                           [sql_path, model_path, 'RUN PERIOD 1'] + out_names +
+                           ['--format', 'CSV', '--folder', folder])
+    assert result.exit_code == 1
+    nukedir(folder, True)
+
+
 def test_zone_sizes():
     """Test the zone_sizes command."""
     runner = CliRunner()
@@ -1,10 +1,12 @@
 """Test cli simulate module."""
 from click.testing import CliRunner
-from honeybee_energy.cli.simulate import simulate_model_cli, simulate_osm, simulate_idf
+from honeybee_energy.cli.simulate import simulate_model_cli, simulate_osm, simulate_idf, \
+    simulate_batch, simulate_orientation_study
 from honeybee.config import folders
 from ladybug.futil import nukedir
 
 import os
+import json
 
 
 def test_simulate_idf():
@@ -75,3 +77,43 @@ def test_simulate_model_cli_with_osm():
     output_sql = os.path.join(folder, 'openstudio', 'run', 'eplusout.sql')
     assert os.path.isfile(output_sql)
     nukedir(folder)
+
+
+def test_simulate_batch():
+    runner = CliRunner()
+    folder = os.path.join(folders.default_simulation_folder, 'test_cli_batch')
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    jobs_file = os.path.join(folder, 'batch_jobs.json')
+    jobs = [
+        {'idf': os.path.abspath('./tests/idf/test_shoe_box.idf'),
+         'epw': os.path.abspath('./tests/epw/chicago.epw'),
+         'folder': os.path.join(folder, 'job_{}'.format(i))} for i in range(2)
+    ]
+    try:
+        with open(jobs_file, 'w') as f:
+            json.dump(jobs, f)
+        result = runner.invoke(simulate_batch, [jobs_file, '--workers', '2'])
+        assert result.exit_code == 0
+        summary = json.loads(result.output)
+        assert len(summary) == 2
+        assert all(job['success'] for job in summary)
+        assert all(os.path.isfile(job['sql']) for job in summary)
+    finally:
+        nukedir(folder, True)
+
+
+def test_simulate_orientation_study():
+    runner = CliRunner()
+    input_model = './tests/json/ShoeBox.json'
+    input_epw = './tests/simulation/chicago.epw'
+    folder = os.path.join(folders.default_simulation_folder, 'test_cli_orientation')
+
+    in_args = [input_model, input_epw, '0', '90', '180', '270', '--start-north', '100',
+               '--folder', folder, '--workers', '2']
+    result = runner.invoke(simulate_orientation_study, in_args)
+    assert result.exit_code == 0
+    summary = json.loads(result.output)
+    assert [job['north_angle'] for job in summary] == [100, 190, 280, 10]
+    assert all(os.path.isfile(job['sql']) for job in summary)
+    nukedir(folder, True)
@@ -46,6 +46,9 @@ def test_model_to_idf():
     assert os.path.isfile(output_hb_model)
     os.remove(output_hb_model)
 
+    result = runner.invoke(model_to_idf_cli, [input_hb_model, '--workers', '2'])
+    assert result.exit_code == 0
+
 
 def test_model_to_gbxml():
     runner = CliRunner()
@@ -58,6 +61,23 @@ def test_model_to_gbxml():
     assert result.exit_code == 0
 
 
+
+def test_model_to_gbxml_output_file():
+    runner = CliRunner()
+    input_hb_model = './tests/json/ShoeBox.json'
+    output_gbxml = './tests/json/ShoeBox.gbxml'
+
+    in_args = [input_hb_model, '--no-indent', '--output-file', output_gbxml]
+    result = runner.invoke(model_to_gbxml_cli, in_args)
+    assert result.exit_code == 0
+    assert os.path.isfile(output_gbxml)
+    with open(output_gbxml) as gbxml_file:
+        gbxml_lines = gbxml_file.readlines()
+    assert len(gbxml_lines) == 2
+    assert gbxml_lines[1].startswith('<gbXML')
+    assert gbxml_lines[1].endswith('</gbXML>')
+    os.remove(output_gbxml)
+
 def test_model_to_trace_gbxml():
     runner = CliRunner()
     input_hb_model = './tests/json/ShoeBox.json'
@@ -225,6 +245,15 @@ def test_model_occ_schedules():
     assert len(list(occ_dict['schedules'].values())[0]) == len(a_per)
 
 
+def test_model_occ_schedules_not_model(caplog):
+    runner = CliRunner()
+    input_json = './tests/json/program_type_office.json'
+
+    result = runner.invoke(model_occ_schedules, [input_json])
+    assert result.exit_code == 1
+    assert 'Expected Model dictionary. Got ProgramType.' in caplog.text
+
+
 def test_model_trans_schedules():
     runner = CliRunner()
     input_model = './tests/json/shade_trans_model.hbjson'
@@ -1,5 +1,7 @@
 """Test the validate group."""
 import sys
+import os
+import json
 
 from click.testing import CliRunner
 from honeybee_energy.cli.validate import validate_model_properties, validate_sim_par, \
@@ -15,6 +17,25 @@ def test_validate_model_properties():
         assert result.exit_code == 0
 
 
+def test_validate_model_properties_unassigned_invalid():
+    input_json = './tests/json/model_5vertex_sub_faces_interior.hbjson'
+    with open(input_json) as inf:
+        model_dict = json.load(inf)
+    bad_mat = {
+        'type': 'EnergyMaterial', 'identifier': 'Unassigned Invalid Material',
+        'thickness': -5, 'conductivity': 1, 'density': 1000, 'specific_heat': 900
+    }
+    model_dict['properties']['energy']['materials'].append(bad_mat)
+    invalid_json = './tests/json/model_unassigned_invalid_material.hbjson'
+    with open(invalid_json, 'w') as outf:
+        json.dump(model_dict, outf)
+    if (sys.version_info >= (3, 7)):
+        runner = CliRunner()
+        result = runner.invoke(validate_model_properties, [invalid_json])
+        assert result.exit_code != 0
+    os.remove(invalid_json)
+
+
 def test_validate_model_basic():
     input_sim_par = './tests/json/simulation_par_detailed.json'
     if (sys.version_info >= (3, 7)):
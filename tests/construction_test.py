@@ -12,6 +12,10 @@ from honeybee_energy.construction.windowshade import WindowConstructionShade
 from honeybee_energy.construction.dynamic import WindowConstructionDynamic
 from honeybee_energy.construction.shade import ShadeConstruction
 from honeybee_energy.construction.air import AirBoundaryConstruction
+from honeybee_energy.construction.thermal import thermal_properties_batch
+from honeybee_energy.lib.constructions import opaque_construction_by_identifier, \
+    window_construction_by_identifier, shade_construction_by_identifier, \
+    OPAQUE_CONSTRUCTIONS, WINDOW_CONSTRUCTIONS, SHADE_CONSTRUCTIONS
 from honeybee_energy.schedule.ruleset import ScheduleRuleset
 
 import pytest
@@ -422,6 +426,33 @@ def test_window_temperature_profile():
     assert temperatures2[1] > temperatures3[1]
 
 
+def test_window_solver_cache():
+    """Test that window solver results are cached while the construction is locked."""
+    clear_glass = EnergyWindowMaterialGlazing(
+        'Clear Glass', 0.005715, 0.770675, 0.07, 0.8836, 0.0804,
+        0, 0.84, 0.84, 1.0)
+    gap = EnergyWindowMaterialGas('air gap', thickness=0.0127)
+    double_clear = WindowConstruction(
+        'Double Clear Window', [clear_glass, gap, clear_glass])
+    u_factor, shgc = double_clear.u_factor, double_clear.shgc
+    temperatures, r_values = double_clear.temperature_profile()
+    assert len(double_clear._solver_cache) == 0
+
+    double_clear.lock()
+    assert double_clear.u_factor == u_factor
+    assert double_clear.shgc == shgc
+    assert double_clear.temperature_profile() == (temperatures, r_values)
+    assert len(double_clear._solver_cache) != 0
+    temps_locked, _ = double_clear.temperature_profile()
+    temps_locked[0] = 100  # editing the result should not edit the cache
+    assert double_clear.temperature_profile()[0] == temperatures
+
+    double_clear.unlock()
+    assert len(double_clear._solver_cache) == 0
+    gap.gas_type = 'Argon'
+    assert double_clear.u_factor < u_factor
+
+
 def test_window_construction_init_from_idf_file():
     """Test the initialization of WindowConstruction from file."""
     lbnl_window_idf_file = './tests/idf/GlzSys_Triple Clear_Avg.idf'
@@ -1072,3 +1103,81 @@ def test_air_dict_methods(userdatadict):
     assert night_flush_constr == new_constr
     assert constr_dict == new_constr.to_dict()
     assert night_flush_constr.user_data == new_constr.user_data
+
+
+def test_thermal_properties_batch():
+    """Test the thermal_properties_batch method with several construction types."""
+    concrete = EnergyMaterial('Concrete', 0.15, 2.31, 2322, 832)
+    insulation = EnergyMaterialNoMass('Insulation R-3', 3, 'MediumSmooth')
+    wall_gap = EnergyMaterial('Wall Air Gap', 0.1, 0.67, 1.2925, 1006.1)
+    gypsum = EnergyMaterial('Gypsum', 0.0127, 0.16, 784.9, 830, 'MediumRough')
+    wall = OpaqueConstruction(
+        'Wall', [concrete, insulation, wall_gap, gypsum])
+    wall_dup = OpaqueConstruction(
+        'Wall Duplicate', [concrete, insulation, wall_gap, gypsum])
+    lowe_glass = EnergyWindowMaterialGlazing(
+        'Low-e Glass', 0.00318, 0.4517, 0.359, 0.714, 0.207,
+        0, 0.84, 0.046578, 1.0)
+    clear_glass = EnergyWindowMaterialGlazing(
+        'Clear Glass', 0.005715, 0.770675, 0.07, 0.8836, 0.0804,
+        0, 0.84, 0.84, 1.0)
+    gap = EnergyWindowMaterialGas('air gap', thickness=0.0127)
+    window = WindowConstruction('Double Low-E', [lowe_glass, gap, clear_glass])
+    shade_mat = EnergyWindowMaterialShade(
+        'Low-e Diffusing Shade', 0.005, 0.15, 0.5, 0.25, 0.5, 0, 0.4,
+        0.2, 0.1, 0.75, 0.25)
+    window_shade = WindowConstructionShade(
+        'Double Low-E Inside Shade', window, shade_mat, 'Interior')
+
+    conditions = [(-18, 21), (32, 24, 3.35, 783), (0, 20, 2, 0, 2.0, 45.0, 100000)]
+    constrs = [wall, window, wall_dup, window_shade]
+    results = thermal_properties_batch(constrs, conditions)
+    assert len(results) == 4
+    assert [res['identifier'] for res in results] == \
+        [constr.identifier for constr in constrs]
+    for constr, res in zip(constrs[:2], results[:2]):
+        assert res['u_factor'] == pytest.approx(constr.u_factor, rel=1e-9)
+        assert res['thickness'] == pytest.approx(constr.thickness, rel=1e-9)
+        assert len(res['condition_u_factors']) == 3
+        for cond, u_fac in zip(conditions, res['condition_u_factors']):
+            r_values = constr.temperature_profile(*cond)[1]
+            assert u_fac == pytest.approx(1 / sum(r_values), rel=1e-9)
+    assert results[0]['shgc'] is None
+    assert results[1]['shgc'] == pytest.approx(window.shgc, rel=1e-9)
+    assert results[1]['visible_transmittance'] == \
+        pytest.approx(window.visible_transmittance, rel=1e-9)
+    assert results[2]['u_factor'] == results[0]['u_factor']
+    assert results[2]['condition_u_factors'] is not results[0]['condition_u_factors']
+    assert results[3]['shgc'] == pytest.approx(window_shade.shgc, rel=1e-9)
+    assert results[3]['condition_u_factors'] == [None] * 3
+
+    results = thermal_properties_batch([window])
+    assert results[0]['condition_u_factors'][0] == \
+        pytest.approx(1 / sum(window.temperature_profile()[1]), rel=1e-9)
+    results = thermal_properties_batch(
+        [ShadeConstruction('Shade'), AirBoundaryConstruction('Air Boundary')],
+        conditions)
+    for res in results:
+        assert res['u_factor'] is None
+        assert res['thickness'] is None
+        assert res['condition_u_factors'] == [None] * 3
+    with pytest.raises(ValueError):
+        thermal_properties_batch([concrete])
+
+
+def test_thermal_properties_batch_library():
+    """Test the thermal_properties_batch method with the full construction library."""
+    constrs = [opaque_construction_by_identifier(c_id)
+               for c_id in OPAQUE_CONSTRUCTIONS]
+    constrs.extend(window_construction_by_identifier(c_id)
+                   for c_id in WINDOW_CONSTRUCTIONS)
+    constrs.extend(shade_construction_by_identifier(c_id)
+                   for c_id in SHADE_CONSTRUCTIONS)
+    results = thermal_properties_batch(constrs)
+    assert len(results) == len(constrs)
+    for constr, res in zip(constrs, results):
+        assert res['identifier'] == constr.identifier
+        if isinstance(constr, (OpaqueConstruction, WindowConstruction)):
+            assert res['u_factor'] == pytest.approx(constr.u_factor, rel=1e-9)
+        elif isinstance(constr, (ShadeConstruction, AirBoundaryConstruction)):
+            assert res['u_factor'] is None
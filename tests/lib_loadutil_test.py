@@ -0,0 +1,48 @@
+# coding=utf-8
+from honeybee_energy.lib._loadutil import LazyStandardsDict, load_json_file
+from honeybee_energy.lib.schedules import schedule_by_identifier
+import honeybee_energy.lib.schedules as sch_lib
+import honeybee_energy.lib.programtypes as prog_lib
+
+import os
+import json
+
+
+def test_lazy_standards_dict():
+    """Test that LazyStandardsDict only parses its files when it is used."""
+    json_file = './tests/json/lazy_standards_lib.json'
+    with open(json_file, 'w') as f:
+        json.dump({'Object A': {'value': 1}, 'Object B': {'value': 2}}, f)
+
+    lazy_dict = LazyStandardsDict()
+    lazy_dict.add_file(json_file)
+    assert not lazy_dict.loaded
+    assert lazy_dict.json_files == (json_file,)
+    assert 'Object A' in lazy_dict
+    assert lazy_dict.loaded
+    assert len(lazy_dict) == 2
+    assert lazy_dict['Object B']['value'] == 2
+    assert sorted(lazy_dict.keys()) == ['Object A', 'Object B']
+    assert lazy_dict == {'Object A': {'value': 1}, 'Object B': {'value': 2}}
+
+    other_dict = LazyStandardsDict([json_file])
+    assert other_dict.get('Object C') is None
+    assert dict(other_dict) == dict(lazy_dict)
+
+    os.remove(json_file)
+
+
+def test_lazy_library_identifiers():
+    """Test that the library identifiers are available from the lazy library."""
+    assert 'Generic Office Occupancy' in sch_lib.SCHEDULES
+    assert 'Generic Office Program' in prog_lib.PROGRAM_TYPES
+    for sch_id in sch_lib.SCHEDULES[-3:]:
+        assert schedule_by_identifier(sch_id).identifier == sch_id
+
+
+def test_load_json_file(tmpdir):
+    """Test that load_json_file parses a library JSON file."""
+    json_file = str(tmpdir.join('standards_lib.json'))
+    with open(json_file, 'w') as f:
+        json.dump({'Object A': {'value': 1}}, f)
+    assert load_json_file(json_file) == {'Object A': {'value': 1}}
@@ -43,6 +43,25 @@ def test_gas_properties_at_temperature():
     assert air.prandtl_at_temperature(223) == pytest.approx(0.74099, rel=1e-2)
 
 
+def test_gas_u_value_cache():
+    """Test that cached gas U-values respond to changes in the gas properties."""
+    gap = EnergyWindowMaterialGas('Gap', 0.0125, 'Air')
+    air_u = gap.u_value_at_angle(10, 0.84, 0.84, 1.0, 90, 273.15)
+    assert gap.u_value_at_angle(10, 0.84, 0.84, 1.0, 90, 273.15) == air_u
+    assert gap.u_value(10, 0.84, 0.84, 1.0, 273.15) == pytest.approx(air_u, rel=1e-9)
+
+    gap.gas_type = 'Argon'
+    assert gap.u_value_at_angle(10, 0.84, 0.84, 1.0, 90, 273.15) < air_u
+    gap.gas_type = 'Air'
+    gap.thickness = 0.006
+    assert gap.u_value_at_angle(10, 0.84, 0.84, 1.0, 90, 273.15) != air_u
+
+    mixture = EnergyWindowMaterialGasMixture('Mix', 0.0125, ('Air', 'Argon'), (0.5, 0.5))
+    mix_u = mixture.u_value_at_angle(10, 0.84, 0.84, 1.0, 90, 273.15)
+    mixture.gas_fractions = (0.1, 0.9)
+    assert mixture.u_value_at_angle(10, 0.84, 0.84, 1.0, 90, 273.15) < mix_u
+
+
 def test_gas_invalid():
     """Test EnergyWindowMaterialGlazing objects with invalid properties."""
     air = EnergyWindowMaterialGas('Air Gap', 0.0125, 'Air')
@@ -1,6 +1,7 @@
 """Tests the features that honeybee_energy adds to honeybee_core Model."""
 import random
 import json
+import io
 import pytest
 
 from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D, \
@@ -17,6 +18,7 @@ from honeybee.boundarycondition import boundary_conditions, Ground, Outdoors
 from honeybee.facetype import face_types
 
 from honeybee_energy.properties.model import ModelEnergyProperties
+from honeybee_energy.writer import model_to_idf_stream, model_to_gbxml_stream
 from honeybee_energy.constructionset import ConstructionSet
 from honeybee_energy.construction.opaque import OpaqueConstruction
 from honeybee_energy.construction.window import WindowConstruction
@@ -85,6 +87,41 @@ def test_energy_properties():
     assert len(model.properties.energy.program_types) == 1
 
 
+def test_energy_properties_resource_cache():
+    """Test that the resource cache gives the same resources as a fresh collection."""
+    room = Room.from_box('Tiny_House_Zone', 5, 10, 3)
+    room.properties.energy.program_type = office_program
+    room.properties.energy.add_default_ideal_air()
+    room[3].apertures_by_ratio(0.4, 0.01)
+    room[3].apertures[0].overhang(0.5, indoor=False)
+    fritted_glass_trans = ScheduleRuleset.from_constant_value(
+        'Fritted Glass', 0.5, schedule_types.fractional)
+    room[3].apertures[0].outdoor_shades[0].properties.energy.transmittance_schedule = \
+        fritted_glass_trans
+    room[0].properties.energy.construction = generic_interior_floor
+    model = Model('Tiny_House', [room])
+    model_props = model.properties.energy
+
+    resource_props = ('materials', 'constructions', 'construction_sets',
+                      'schedule_type_limits', 'schedules', 'shade_schedules',
+                      'room_schedules', 'program_types', 'hvacs', 'shws')
+    base_ids = [sorted(r.identifier for r in getattr(model_props, prop))
+                for prop in resource_props]
+    assert model_props._start_resource_cache()
+    assert not model_props._start_resource_cache()
+    for i in range(2):
+        cached_ids = [sorted(r.identifier for r in getattr(model_props, prop))
+                      for prop in resource_props]
+        assert cached_ids == base_ids
+    model_props._stop_resource_cache()
+    assert model_props._resource_cache is None
+
+    room[1].properties.energy.construction = generic_exterior_wall
+    model.to_dict()
+    assert model_props._resource_cache is None
+    assert len(model_props.face_constructions) == 2
+
+
 def test_window_construction_by_orientation():
     """Test the window_construction_by_orientation method."""
     room = Room.from_box('Tiny_House_Zone', 5, 10, 3)
@@ -844,6 +881,64 @@ def test_load_properties_from_dict_prioritize_abridged():
     assert len(con_set_updated.wall_set.exterior_construction.materials) == 1
 
 
+def test_load_properties_from_dict_lazy():
+    """Test the Model load_properties_from_dict method with lazy loading."""
+    input_props = './tests/json/update_construction_set.json'
+    with open(input_props, 'r') as inf:
+        data = json.load(inf)
+
+    eager_res = ModelEnergyProperties.load_properties_from_dict(data)
+    lazy_res = ModelEnergyProperties.load_properties_from_dict(data, lazy=True)
+    materials, constructions, construction_sets = lazy_res[:3]
+    con_set_id = data['properties']['energy']['construction_sets'][0]['identifier']
+    mat_id = data['properties']['energy']['materials'][0]['identifier']
+    assert dict.__len__(construction_sets) == 0
+    assert con_set_id in construction_sets
+    assert dict.__len__(construction_sets) == 1
+    assert construction_sets[con_set_id].identifier == con_set_id
+    assert materials.get(mat_id).identifier == mat_id
+    assert materials.get('NotAMaterial') is None
+    assert 'NotAMaterial' not in materials
+    with pytest.raises(KeyError):
+        constructions['NotAConstruction']
+    for e_res, l_res in zip(eager_res, lazy_res):
+        assert list(l_res.keys()) == list(e_res.keys())
+        assert len(l_res) == len(e_res)
+        for res_id, res_obj in l_res.items():
+            assert res_obj == e_res[res_id]
+
+    # check that invalid resources are only reported when they are accessed
+    data['properties']['energy']['materials'].append(
+        {'type': 'EnergyMaterial', 'identifier': 'Invalid Material'})
+    with pytest.raises(ValueError):
+        ModelEnergyProperties.load_properties_from_dict(data)
+    materials = ModelEnergyProperties.load_properties_from_dict(data, lazy=True)[0]
+    assert materials[mat_id].identifier == mat_id
+    with pytest.raises(ValueError):
+        materials['Invalid Material']
+    materials = ModelEnergyProperties.load_properties_from_dict(
+        data, skip_invalid=True, lazy=True)[0]
+    assert 'Invalid Material' not in materials
+    assert len(materials) == len(eager_res[0])
+
+
+def test_apply_properties_from_dict_lazy():
+    """Test that only lazy application of properties skips unassigned resources."""
+    room = Room.from_box('TinyHouseZone', 5, 10, 3)
+    model = Model('TinyHouse', [room])
+    bad_mat = EnergyMaterial('Invalid Material', 0.1, 1, 1000, 900).to_dict()
+    bad_mat['thickness'] = -5
+    model_dict = model.to_dict()
+    model_dict['properties']['energy']['materials'].append(bad_mat)
+
+    with pytest.raises(Exception):
+        Model.from_dict(model_dict)
+
+    new_model = Model(model.identifier, [Room.from_dict(model_dict['rooms'][0])])
+    new_model.properties.energy.apply_properties_from_dict(model_dict, lazy=True)
+    assert new_model.to_dict() == model.to_dict()
+
+
 def test_filter_dict_by_identifiers():
     """Test the filter_dict_by_identifiers method."""
     first_floor = Room.from_box('FirstFloor', 10, 10, 3, origin=Point3D(0, 0, 0))
@@ -911,6 +1006,73 @@ def test_filter_dict_by_identifiers_construction():
     assert len(filtered_e_props['materials']) == 14
 
 
+def test_resolve_zones():
+    """Test that resolve_zones resolves each unique zone composition once."""
+    heat_setpt = office_program.setpoint.duplicate()
+    heat_setpt.identifier = 'Warm Setpoints'
+    heat_setpt.heating_schedule = ScheduleRuleset.from_constant_value(
+        'Warm Heating', 23, office_program.setpoint.heating_schedule.schedule_type_limit)
+    high_vent = office_program.ventilation.duplicate()
+    high_vent.identifier = 'High Ventilation'
+    high_vent.flow_per_area = office_program.ventilation.flow_per_area * 3
+
+    def zoned_model():
+        rooms = []
+        for i in range(6):
+            room = Room.from_box('Room{}'.format(i), 5, 5, 3, origin=Point3D(i * 5, 0, 0))
+            room.properties.energy.program_type = office_program
+            room.zone = 'Zone{}'.format(i // 2)
+            rooms.append(room)
+        for room in rooms[1:4:2]:
+            room.properties.energy.setpoint = heat_setpt
+        rooms[5].properties.energy.ventilation = high_vent
+        return Model('ZonedRooms', rooms)
+
+    model = zoned_model()
+    single_zones, zone_dict = model.properties.energy.resolve_zones()
+    assert single_zones == []
+    assert list(zone_dict.keys()) == ['Zone0', 'Zone1', 'Zone2']
+    rooms_0, _, set_pt_0, vent_0 = zone_dict['Zone0']
+    rooms_1, _, set_pt_1, vent_1 = zone_dict['Zone1']
+    rooms_2, _, set_pt_2, vent_2 = zone_dict['Zone2']
+    assert set_pt_0.identifier == 'Zone0_SetPt'
+    assert set_pt_0 is set_pt_1
+    assert set_pt_0.heating_setpoint == 23
+    assert set_pt_2 is office_program.setpoint
+    assert vent_0 is vent_1 is office_program.ventilation
+    assert vent_2.identifier == 'Zone2_Vent'
+    assert vent_2.flow_per_area == pytest.approx(
+        office_program.ventilation.flow_per_area * 2, rel=1e-9)
+    for room in rooms_0 + rooms_1:
+        assert room.properties.energy.setpoint is set_pt_0
+    for room in rooms_2:
+        assert room.properties.energy.ventilation is vent_2
+
+    model = zoned_model()
+    _, zone_dict = model.properties.energy.resolve_zones(workers=2)
+    assert zone_dict['Zone0'][2] == set_pt_0
+    assert zone_dict['Zone0'][2] is zone_dict['Zone1'][2]
+    assert zone_dict['Zone2'][3] == vent_2
+
+
+def test_resolve_zones_mixed_setpoint():
+    """Test that resolve_zones assigns the zone setpoint to rooms without one."""
+    room_1 = Room.from_box('Room1', 5, 5, 3)
+    room_1.properties.energy.setpoint = office_program.setpoint
+    room_2 = Room.from_box('Room2', 5, 5, 3, origin=Point3D(5, 0, 0))
+    assert room_2.properties.energy.setpoint is None
+    for room in (room_1, room_2):
+        room.zone = 'Zone'
+    model = Model('MixedSetpoints', [room_1, room_2])
+
+    _, zone_dict = model.properties.energy.resolve_zones()
+    rooms, _, set_pt, vent = zone_dict['Zone']
+    assert set_pt is office_program.setpoint
+    assert vent is None
+    for room in rooms:
+        assert room.properties.energy.setpoint is office_program.setpoint
+
+
 def test_writer_to_idf():
     """Test the Model to.idf method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -1027,6 +1189,45 @@ def test_writer_to_idf_space_vs_zone():
     """
 
 
+def test_writer_to_idf_stream():
+    """Test that model_to_idf_stream writes the same objects as model_to_idf."""
+    first_floor = Room.from_box('FirstFloor', 10, 10, 3, origin=Point3D(0, 0, 0))
+    second_floor = Room.from_box('SecondFloor', 10, 10, 3, origin=Point3D(0, 0, 3))
+    for room in (first_floor, second_floor):
+        room.properties.energy.program_type = office_program
+        room.properties.energy.add_default_ideal_air()
+        for face in room[1:5]:
+            face.apertures_by_ratio(0.2, 0.01)
+    Room.solve_adjacency([first_floor, second_floor], 0.01)
+    model = Model('TwoStoryHouse', [first_floor, second_floor])
+
+    idf_string = model.to_idf()
+    idf_file = io.StringIO()
+    model_to_idf_stream(model, idf_file)
+    stream_string = idf_file.getvalue()
+
+    assert stream_string == idf_string
+
+
+def test_writer_to_idf_workers():
+    """Test that translating room geometry in parallel gives an identical IDF."""
+    rooms = []
+    for i in range(6):
+        room = Room.from_box('Room{}'.format(i), 5, 5, 3, origin=Point3D(i * 5, 0, 0))
+        room.properties.energy.program_type = office_program
+        room.properties.energy.add_default_ideal_air()
+        room[1].apertures_by_ratio(0.4, 0.01)
+        rooms.append(room)
+    Room.solve_adjacency(rooms, 0.01)
+    rooms[2][2].type = face_types.air_boundary
+    rooms[3][4].type = face_types.air_boundary
+    model = Model('RowOfRooms', rooms)
+
+    idf_string = model.to_idf()
+    assert idf_string.count('_CrossMixing') == 1
+    assert model.to_idf(workers=3) == idf_string
+
+
 def test_writer_to_gbxml():
     """Test the Model to.gbxml method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -1091,6 +1292,40 @@ def test_writer_to_gbxml():
     assert len(gbxml_string) != 0
 
 
+def test_writer_to_gbxml_stream():
+    """Test that model_to_gbxml_stream writes the same gbXML as model_to_gbxml."""
+    first_floor = Room.from_box('FirstFloor', 10, 10, 3, origin=Point3D(0, 0, 0))
+    second_floor = Room.from_box('SecondFloor', 10, 10, 3, origin=Point3D(0, 0, 3))
+    for room in (first_floor, second_floor):
+        room.properties.energy.program_type = office_program
+        room.properties.energy.add_default_ideal_air()
+        for face in room[1:5]:
+            face.apertures_by_ratio(0.2, 0.01)
+    first_floor[1].apertures[0].overhang(0.5, indoor=False)
+    Room.solve_adjacency([first_floor, second_floor], 0.01)
+    tree_canopy_geo = Face3D.from_regular_polygon(
+        6, 2, Plane(Vector3D(0, 0, 1), Point3D(5, -3, 4)))
+    tree_canopy = Shade('TreeCanopy', tree_canopy_geo, is_detached=True)
+    model = Model('TwoStoryHouse', [first_floor, second_floor],
+                  orphaned_shades=[tree_canopy])
+
+    def gbxml_lines(gbxml_str):  # remove the line with the time of creation
+        return [line for line in gbxml_str.split('\n') if 'CreatedBy' not in line]
+
+    for full_geo in (False, True):
+        gbxml_string = model.to_gbxml(
+            include_shell_geometry=full_geo, include_space_boundaries=full_geo)
+        gbxml_file = io.StringIO()
+        model_to_gbxml_stream(
+            model, gbxml_file,
+            include_shell_geometry=full_geo, include_space_boundaries=full_geo)
+        assert gbxml_lines(gbxml_file.getvalue()) == gbxml_lines(gbxml_string)
+
+    compact_string = model.to_gbxml(indent=False)
+    assert len(compact_string.split('\n')) == 2
+    assert len(compact_string) < len(gbxml_string)
+
+
 def test_energy_ventilation_simulation_properties():
     """Test the existence of the ventilation simulation control properties."""
     room = Room.from_box('Tiny_House_Zone', 5, 10, 3)
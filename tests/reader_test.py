@@ -0,0 +1,33 @@
+# coding=utf-8
+from honeybee_energy.reader import parse_idf_string, idf_objects_by_type, \
+    idf_objects_of_type
+
+import pytest
+
+
+def test_parse_idf_string():
+    """Test the parse_idf_string method."""
+    idf_str = 'ScheduleTypeLimits,\n Fractional, !- name\n 0, !- lower\n' \
+        ' 1, !- upper\n Continuous;  !- numeric type'
+    ep_fields = parse_idf_string(idf_str, 'ScheduleTypeLimits,')
+    assert ep_fields == ['Fractional', '0', '1', 'Continuous']
+
+    with pytest.raises(AssertionError):
+        parse_idf_string(idf_str, 'Schedule:Day:Interval,')
+    with pytest.raises(AssertionError):
+        parse_idf_string('{}\n\n{}'.format(idf_str, idf_str))
+
+
+def test_idf_objects_by_type():
+    """Test the idf_objects_by_type and idf_objects_of_type methods."""
+    office_sched_idf = './tests/idf/OfficeOccupancySchedule.idf'
+    idf_objects = idf_objects_by_type(office_sched_idf)
+
+    type_strs = idf_objects_of_type(idf_objects, ('scheduletypelimits',))
+    assert len(type_strs) == 1
+    assert '!' not in type_strs[0]
+    assert parse_idf_string(type_strs[0]) == ['Fractional', '0', '1', 'Continuous']
+    assert len(idf_objects_of_type(idf_objects, ('Schedule:Day:Interval',))) == 5
+    assert len(idf_objects_of_type(idf_objects, ('Schedule:Year',))) == 1
+    assert len(idf_objects_of_type(idf_objects, ('Schedule:Day:',))) == 5
+    assert len(idf_objects_of_type(idf_objects, ('Schedule:Day:List',))) == 0
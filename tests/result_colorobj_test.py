@@ -275,3 +275,24 @@ def test_load_balance_rooms():
 
     load_colls_norm_storage = load_bal_obj.load_balance_terms(True, True)
     assert len(load_colls_norm_storage) == len(load_colls) + 1
+
+
+def test_load_balance_data_from_sql():
+    """Test that the single-pass SQL loader matches the SQLiteResult collections."""
+    output_names = (LoadBalance.COOLING, LoadBalance.LIGHTING,
+                    LoadBalance.OPAQUE_ENERGY_FLOW, 'Not An Output')
+    for sql_path in ('./tests/result/triangulated/eplusout.sql',
+                     './tests/result/eplusout_dday_runper.sql'):
+        sql_obj = SQLiteResult(sql_path)
+        all_data = LoadBalance._data_collections_by_output_names(
+            sql_obj, output_names)
+        assert len(all_data) == len(output_names)
+        assert all_data[-1] == []
+        for out_name, data in zip(output_names[:-1], all_data):
+            sql_data = sql_obj.data_collections_by_output_name(out_name)
+            assert len(data) == len(sql_data)
+            for coll, sql_coll in zip(data, sql_data):
+                assert coll.header.metadata == sql_coll.header.metadata
+                assert coll.header.analysis_period == \
+                    sql_coll.header.analysis_period
+                assert coll.values == sql_coll.values
@@ -0,0 +1,128 @@
+# coding=utf-8
+from honeybee_energy.result.match import match_rooms_to_data, match_faces_to_data, \
+    ResultIndex
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.shade import Shade
+from ladybug_geometry.geometry3d.pointvector import Point3D
+from ladybug.sql import SQLiteResult
+from ladybug.datacollection import HourlyContinuousCollection
+from ladybug.datatype.energy import Energy
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.header import Header
+
+import json
+import pytest
+
+
+def _zone_data(zone_ids, key='Zone'):
+    """Get a list of hourly data collections for a list of zone identifiers."""
+    data = []
+    for i, z_id in enumerate(zone_ids):
+        metadata = {'type': 'Zone Lights Electric Energy', key: z_id}
+        head = Header(Energy(), 'kWh', AnalysisPeriod(1, 1, 0, 1, 1, 23), metadata)
+        data.append(HourlyContinuousCollection(head, [i] * 24))
+    return data
+
+
+def test_result_index_init():
+    """Test the initialization of ResultIndex and basic properties."""
+    model_json = './tests/result/triangulated/TriangleModel.json'
+    with open(model_json, 'r') as fp:
+        model_data = json.load(fp)
+    model = Model.from_dict(model_data)
+
+    result_index = ResultIndex.from_model(model)
+    str(result_index)
+    assert result_index.rooms == tuple(model.rooms)
+    assert len(result_index.faces) == len(model.faces)
+
+    empty_index = ResultIndex()
+    assert empty_index.rooms == ()
+    assert empty_index.faces == ()
+
+    shd = Shade.from_vertices(
+        'Awning', [[0, 0, 3], [1, 0, 3], [1, 1, 3], [0, 1, 3]])
+    with pytest.raises(ValueError):
+        ResultIndex(faces=[shd])
+
+
+def test_result_index_match_rooms():
+    """Test the matching of Rooms in a ResultIndex to zone data."""
+    rooms = []
+    for i in range(6):
+        room = Room.from_box(
+            'Residence_{}'.format(i + 1), 3, 6, 3.2, origin=Point3D(3 * i, 0, 0))
+        room.zone = 'Zone_{}'.format(i // 2)
+        room.multiplier = 2
+        rooms.append(room)
+    data = _zone_data(['ZONE_2', 'ZONE_0', 'ZONE_1', 'ZONE_0'])
+    result_index = ResultIndex(rooms)
+
+    matched = result_index.match_rooms(data)
+    assert matched == match_rooms_to_data(data, rooms)
+    assert len(matched) == 6
+    assert matched[0][1] is data[1]  # the first matching collection is used
+    assert matched[5][1] is data[0]
+    assert all(tup[2] == 0.5 for tup in matched)
+
+    matched = result_index.match_rooms(data, invert_multiplier=True)
+    assert matched == match_rooms_to_data(data, rooms, invert_multiplier=True)
+    assert all(tup[2] == 1 for tup in matched)
+    matched = result_index.match_rooms(data, True, zone_correct_mult=False)
+    assert all(tup[2] == 2 for tup in matched)
+
+    space_data = _zone_data(['RESIDENCE_2_SPACE', 'RESIDENCE_5_SPACE'])
+    matched = result_index.match_rooms(space_data, space_based=True)
+    assert matched == match_rooms_to_data(space_data, rooms, space_based=True)
+    assert [tup[0] for tup in matched] == [rooms[1], rooms[4]]
+
+    sys_data = _zone_data(['ZONE_1 IDEAL LOADS AIR SYSTEM'], 'System')
+    matched = result_index.match_rooms(sys_data)
+    assert matched == match_rooms_to_data(sys_data, rooms)
+    assert [tup[0] for tup in matched] == [rooms[2], rooms[3]]
+    assert all(tup[2] == 1 for tup in matched)
+
+
+def test_result_index_match_faces():
+    """Test the matching of Faces in a ResultIndex to triangulated surface data."""
+    model_json = './tests/result/triangulated/TriangleModel.json'
+    with open(model_json, 'r') as fp:
+        model_data = json.load(fp)
+    model = Model.from_dict(model_data)
+    sql_obj = SQLiteResult('./tests/result/triangulated/eplusout.sql')
+    result_index = ResultIndex(faces=model.rooms[0].faces)
+
+    data_colls = sql_obj.data_collections_by_output_name(
+        'Surface Inside Face Temperature')
+    matched = result_index.match_faces(data_colls)
+    assert len(matched) == 8
+    base_matched = match_faces_to_data(data_colls, model.rooms[0].faces)
+    assert [tup[0] for tup in matched] == [tup[0] for tup in base_matched]
+    assert [tup[1].values for tup in matched] == [tup[1].values for tup in base_matched]
+
+    data_colls = sql_obj.data_collections_by_output_name(
+        'Surface Window Heat Loss Energy')
+    assert len(result_index.match_faces(data_colls)) == 1
+
+
+def test_result_index_large_model():
+    """Test that many data collections can be matched to a large number of objects."""
+    room_count = 2000
+    rooms = [Room.from_box('Room_{}'.format(i), 3, 3, 3, origin=Point3D(3 * i, 0, 0))
+             for i in range(room_count)]
+    zone_data = _zone_data(['ROOM_{}'.format(i) for i in reversed(range(room_count))])
+    faces = [face for room in rooms for face in room.faces]
+    srf_data = _zone_data([face.identifier.upper() for face in reversed(faces)],
+                          'Surface')
+    result_index = ResultIndex(rooms, faces)
+
+    matched = result_index.match_rooms(zone_data)
+    assert len(matched) == room_count
+    assert all(tup[1].header.metadata['Zone'] == tup[0].identifier.upper()
+               for tup in matched)
+    matched = result_index.match_faces(srf_data)
+    assert len(matched) == room_count * 6
+    assert all(tup[1].header.metadata['Surface'] == tup[0].identifier.upper()
+               for tup in matched)
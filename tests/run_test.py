@@ -1,6 +1,6 @@
 # coding=utf-8
 from honeybee_energy.run import to_openstudio_sim_folder, run_idf, \
-    prepare_idf_for_simulation
+    prepare_idf_for_simulation, run_idf_batch, run_orientation_study
 from honeybee_energy.result.err import Err
 from honeybee_energy.lib.programtypes import office_program
 from honeybee_energy.lib.materials import clear_glass, air_gap
@@ -414,3 +414,51 @@ def test_pv_generation():
         'Facility Total Produced Electricity Energy')
     assert len(gen_elec_data) == 1
     assert sum(gen_elec_data[0].values) > 0
+
+
+def test_run_idf_batch():
+    """Test the run_idf_batch method with several IDFs in the same folder."""
+    folder = os.path.join(folders.default_simulation_folder, 'test_batch')
+    with open('./tests/idf/test_shoe_box.idf') as idf_file:
+        idf_str = idf_file.read()
+    idfs = []
+    for i in range(3):
+        idf = os.path.join(folder, 'shoe_box_{}.idf'.format(i))
+        write_to_file(idf, idf_str, True)
+        idfs.append(idf)
+
+    epw_file = './tests/simulation/chicago.epw'
+    jobs = [(idf, epw_file) for idf in idfs]
+    results = run_idf_batch(jobs, max_workers=2)
+
+    assert len(results) == 3
+    for idf, result in zip(idfs, results):
+        assert result['idf'] == idf
+        assert result['in_idf'] == os.path.join(result['directory'], 'in.idf')
+        assert result['success']
+        assert os.path.isfile(result['sql'])
+    assert len(set(result['directory'] for result in results)) == 3
+    nukedir(folder, True)
+
+
+def test_run_orientation_study():
+    """Test the run_orientation_study method."""
+    model = Model.from_file('./tests/json/ShoeBox.json')
+    folder = os.path.join(folders.default_simulation_folder, 'test_orientation')
+    epw_file = './tests/simulation/chicago.epw'
+    north_angles = [0, 90, 22.5]
+    with pytest.raises(ValueError):
+        run_orientation_study(model, [0, 90, -270], folder, epw_file)
+    results = run_orientation_study(model, north_angles, folder, epw_file,
+                                    max_workers=2)
+
+    assert len(results) == 3
+    for angle, result in zip(north_angles, results):
+        assert result['north_angle'] == angle
+        assert result['success']
+        assert os.path.isfile(result['sql'])
+        with open(result['in_idf']) as idf_file:
+            sim_par = SimulationParameter.from_idf(idf_file.read())
+        assert sim_par.north_angle == angle
+    assert os.path.basename(results[2]['directory']) == 'north_22.5'
+    nukedir(folder, True)
@@ -88,6 +88,34 @@ def test_schedule_day_values_at_timestep():
     assert half_hour_vals[34] == 0
 
 
+def test_schedule_day_values_at_timestep_edits():
+    """Test that values_at_timestep updates after the ScheduleDay is edited."""
+    simple_office = ScheduleDay('Simple Office Occupancy', [0, 1, 0],
+                                [Time(0, 0), Time(9, 0), Time(17, 0)])
+    hourly_vals = simple_office.values_at_timestep()
+    hourly_vals[9] = 5  # editing the returned list should not affect the schedule
+    assert simple_office.values_at_timestep()[9] == 1
+
+    simple_office.lock()
+    assert simple_office.values_at_timestep(2)[18] == 1
+    simple_office.unlock()
+
+    simple_office.replace_value(1, 0.5)
+    assert simple_office.values_at_timestep()[9] == 0.5
+    assert simple_office.values_at_timestep(2)[18] == 0.5
+    simple_office.add_value(0.25, Time(12, 0))
+    assert simple_office.values_at_timestep()[12] == 0.25
+    simple_office.remove_value(2)
+    assert simple_office.values_at_timestep()[12] == 0.5
+    simple_office.values = [0, 1, 0]
+    assert simple_office.values_at_timestep()[9] == 1
+    simple_office.times = [Time(0, 0), Time(8, 0), Time(17, 0)]
+    step_vals = simple_office.values_at_timestep()
+    assert step_vals[8] == 1
+    simple_office.interpolate = True
+    assert simple_office.values_at_timestep() != step_vals
+
+
 def test_schedule_day_values_at_timestep_ep_result():
     """Test the ScheduleDay values_at_timestep methods against EP output."""
     simple_office = ScheduleDay(
@@ -124,6 +124,41 @@ def test_schedule_ruleset_values():
     assert len(sch_week_vals_10_min) == 24 * 7 * 6
 
 
+def test_schedule_ruleset_values_rule_changes():
+    """Test the ScheduleRuleset values method with holidays and edited rules."""
+    weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
+                                 [Time(0, 0), Time(9, 0), Time(17, 0)])
+    summer_office = ScheduleDay('Summer Office Occupancy', [0, 0.5, 0],
+                                [Time(0, 0), Time(9, 0), Time(17, 0)])
+    holiday_office = ScheduleDay('Holiday Office Occupancy', [0.1])
+    summer_rule = ScheduleRule(summer_office, start_date=Date(6, 1),
+                               end_date=Date(8, 31))
+    summer_rule.apply_weekday = True
+    schedule = ScheduleRuleset('Office Occupancy', weekday_office, [summer_rule],
+                               schedule_types.fractional, holiday_office)
+    weekday_vals = weekday_office.values_at_timestep()
+    summer_vals = summer_office.values_at_timestep()
+
+    hol = [Date(7, 4)]
+    vals = schedule.values(holidays=hol)
+    assert vals[24 * 184:24 * 185] == holiday_office.values_at_timestep()
+    assert vals[24 * 185:24 * 186] == summer_vals
+    assert schedule.values(holidays=hol) == vals
+    leap_vals = schedule.values(start_date=Date(6, 1), leap_year=True)
+    assert leap_vals[24:48] == summer_vals
+    assert len(leap_vals) == 24 * 214
+
+    # editing the rule after values have been computed should update the values
+    summer_rule.start_date = Date(9, 1)
+    summer_rule.end_date = Date(5, 31)
+    assert summer_rule.is_reversed
+    vals = schedule.values()
+    assert vals[24 * 185:24 * 186] == weekday_vals
+    assert vals[24:48] == summer_vals
+    summer_rule.apply_weekday = False
+    assert schedule.values()[24:48] == weekday_vals
+
+
 def test_schedule_ruleset_data_collection():
     """Test the ScheduleRuleset data_collection method."""
     weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
@@ -566,6 +601,48 @@ def test_schedule_ruleset_min_schedules():
     assert (len(office_max.schedule_rules)) == 1
 
 
+def test_schedule_ruleset_max_min_schedules_date_range():
+    """Test the max_schedules and min_schedules methods over a date range."""
+    weekday_school = ScheduleDay('Weekday School Year', [0.1, 1, 0.1],
+                                 [Time(0, 0), Time(8, 0), Time(17, 0)])
+    weekend_school = ScheduleDay('Weekend School Year', [0.1])
+    weekday_summer = ScheduleDay('Weekday Summer', [0, 0.5, 0],
+                                 [Time(0, 0), Time(9, 0), Time(17, 0)])
+    weekend_summer = ScheduleDay('Weekend Summer', [0])
+
+    summer_weekday_rule = ScheduleRule(
+        weekday_summer, start_date=Date(7, 1), end_date=Date(9, 1))
+    summer_weekday_rule.apply_weekday = True
+    summer_weekend_rule = ScheduleRule(
+        weekend_summer, start_date=Date(7, 1), end_date=Date(9, 1))
+    summer_weekend_rule.apply_weekend = True
+    school_weekend_rule = ScheduleRule(weekend_school)
+    school_weekend_rule.apply_weekend = True
+
+    all_rules = [summer_weekday_rule, summer_weekend_rule, school_weekend_rule]
+    school_schedule = ScheduleRuleset(
+        'School Occupancy', weekday_school, all_rules, schedule_types.fractional)
+    lobby_schedule = ScheduleRuleset.from_constant_value(
+        'Lobby Occupancy', 0.1, schedule_types.fractional)
+
+    school_max = ScheduleRuleset.max_schedules(
+        'School Max', [school_schedule, lobby_schedule])
+    week_vals = school_max.values(end_date=Date(1, 7))
+    assert week_vals[:24] == [0.1] * 24
+    assert week_vals[24:48] == [0.1] * 8 + [1.0] * 9 + [0.1] * 7
+    week_vals = school_max.values(start_date=Date(7, 1), end_date=Date(7, 7))
+    assert week_vals[:24] == [0.1] * 24
+    assert week_vals[24:48] == [0.1] * 9 + [0.5] * 8 + [0.1] * 7
+
+    school_min = ScheduleRuleset.min_schedules(
+        'School Min', [school_schedule, lobby_schedule])
+    week_vals = school_min.values(end_date=Date(1, 7))
+    assert week_vals[:48] == [0.1] * 48
+    week_vals = school_min.values(start_date=Date(7, 1), end_date=Date(7, 7))
+    assert week_vals[:24] == [0] * 24
+    assert week_vals[24:48] == [0] * 9 + [0.1] * 8 + [0] * 7
+
+
 def test_schedule_ruleset_reversed():
     """Test the to_idf method with a reversed rule."""
     rev_sch_file = 'tests/json/reversed_sch_ruleset.json'
@@ -2,6 +2,7 @@
 
 from honeybee.model import Model
 from honeybee.room import Room
+from honeybee.face import Face
 from honeybee.door import Door
 from honeybee.boundarycondition import Surface, Outdoors
 from honeybee.facetype import face_types
@@ -335,6 +336,75 @@ def test_afn_multizone_air_boundary():
     assert nface1_crack.flow_exponent == 0.5
 
 
+def test_afn_face_areas():
+    """Test that the bulk face areas match the areas of the faces."""
+    bound_pts = [Point3D(0, 0, 0), Point3D(10, 0, 0), Point3D(10, 0, 5),
+                 Point3D(0, 0, 5)]
+    hole_pts = [[Point3D(2, 0, 1), Point3D(4, 0, 1), Point3D(4, 0, 3),
+                 Point3D(2, 0, 3)]]
+    holed_face = Face3D(bound_pts, holes=hole_pts)
+    room = Room.from_box('TestRoom', 10, 10, 3)
+    room[1].apertures_by_ratio(0.4, 0.01)
+    ref_room = room.duplicate()
+    sub_faces = list(room.faces) + list(room[1].apertures)
+    ref_areas = [f.area for f in ref_room.faces] + [room[1].apertures[0].area]
+    face_areas = afn._face_areas(sub_faces)
+    assert face_areas == pytest.approx(ref_areas, abs=1e-10)
+    assert afn._face_areas(sub_faces) == face_areas
+    holed_face = Face('HoledFace', holed_face)
+    assert afn._face_areas([holed_face])[0] == pytest.approx(46, abs=1e-10)
+    assert afn._face_areas([]) == []
+
+
+def test_afn_generate_matches_per_room():
+    """Test that generating the AFN for all rooms matches the per-room methods."""
+    rooms = []
+    for i in range(3):
+        for j in range(2):
+            room = Room.from_box('Room_{}_{}'.format(i, j), 5, 5, 3,
+                                 origin=Point3D(i * 5, j * 5, 0))
+            room.properties.energy.program_type = prog_type_lib.office_program
+            rooms.append(room)
+    rooms[0].properties.energy.program_type = prog_type_lib.plenum_program
+    Room.solve_adjacency(rooms, 0.01)
+    for room in rooms:
+        for face in room.faces:
+            if isinstance(face.boundary_condition, Outdoors):
+                face.apertures_by_ratio(0.3, 0.01)
+
+    afn.generate(rooms)
+    gen_cracks = [f.properties.energy.vent_crack.flow_coefficient
+                  for room in rooms for f in room.faces
+                  if f.properties.energy.vent_crack is not None]
+    gen_openings = [ap.properties.energy.vent_opening.flow_coefficient_closed
+                    for room in rooms for ap in room.apertures]
+
+    rho = afn._air_density_from_pressure()
+    int_cracks = CRACK_TEMPLATE_DATA['internal_medium_cracks']
+    ext_cracks = CRACK_TEMPLATE_DATA['external_medium_cracks']
+    for room in rooms:
+        ext_faces, int_faces = room.properties.energy.envelope_components_by_type()
+        if room.properties.energy.infiltration is not None:
+            room.properties.energy.exterior_afn_from_infiltration_load(
+                ext_faces, air_density=rho)
+        else:
+            afn._exterior_afn(ext_faces, ext_cracks)
+        afn._interior_afn(int_faces, int_cracks, rho)
+    room_cracks = [f.properties.energy.vent_crack.flow_coefficient
+                   for room in rooms for f in room.faces
+                   if f.properties.energy.vent_crack is not None]
+    room_openings = [ap.properties.energy.vent_opening.flow_coefficient_closed
+                     for room in rooms for ap in room.apertures]
+
+    assert len(gen_cracks) == len(room_cracks) == 6 * 5
+    assert gen_cracks == pytest.approx(room_cracks, abs=1e-10)
+    assert gen_openings == pytest.approx(room_openings, abs=1e-10)
+    plenum_wall = rooms[0].properties.energy.envelope_components_by_type()[0][0][0]
+    assert plenum_wall.properties.energy.vent_crack.flow_coefficient == \
+        pytest.approx(ext_cracks['wall_flow_cof'] * (
+            plenum_wall.area - plenum_wall.apertures[0].area), abs=1e-10)
+
+
 def test_compute_bounding_box_extents_simple():
     """Test the bounding box extents calculation of ladybug_geometry."""
     # South Room 1: 20 x 6 x 3